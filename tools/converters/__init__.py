@@ -8,11 +8,13 @@ Available converters:
 - md_to_docx: Convert Markdown to professional DOCX
 - docx_to_md: Convert DOCX to version-control-friendly Markdown
 - data_to_html: Convert JSON/CSV data to interactive HTML dashboards
+- portfolio_to_html: Combine many project score files into one portfolio dashboard
 """
 
 from .md_to_docx import convert_md_to_docx, MarkdownToDocxConverter
 from .docx_to_md import convert_docx_to_md, DocxToMarkdownConverter
 from .data_to_html import convert_data_to_html, DataToHtmlConverter
+from .portfolio_to_html import convert_portfolio_to_html, PortfolioDashboardConverter
 
 __all__ = [
     'convert_md_to_docx',
@@ -20,5 +22,7 @@ __all__ = [
     'convert_docx_to_md',
     'DocxToMarkdownConverter',
     'convert_data_to_html',
-    'DataToHtmlConverter'
+    'DataToHtmlConverter',
+    'convert_portfolio_to_html',
+    'PortfolioDashboardConverter'
 ]
@@ -13,6 +13,7 @@ Supports:
 
 Usage:
     python data_to_html.py --input data.yaml --type scores --output dashboard.html
+    python data_to_html.py --input interviews.csv --rows-per-page 5000
 """
 
 import argparse
@@ -20,14 +21,17 @@ import json
 import csv
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Callable, Tuple
 from datetime import datetime
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.constants import ScoreThresholds, VIANEO_DIMENSIONS
-from core.utils import format_date
+from core.utils import format_date, extract_dimension_scores
+from core.html_writer import HtmlWriter, escape_html
 
 
 # =============================================================================
@@ -122,6 +126,8 @@ BASE_TEMPLATE = """<!DOCTYPE html>
             transition: width 0.3s;
         }}
         .meta {{ color: var(--gray); font-size: 0.875rem; margin-bottom: 1rem; }}
+        .pagination {{ display: flex; gap: 1rem; justify-content: center; margin: 1rem 0; }}
+        .pagination a {{ color: var(--secondary); text-decoration: none; font-weight: 600; }}
         footer {{ text-align: center; padding: 2rem; color: var(--gray); font-size: 0.875rem; }}
     </style>
 </head>
@@ -136,6 +142,10 @@ BASE_TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
+# Head and tail of BASE_TEMPLATE, for writing a page incrementally
+BASE_TEMPLATE_HEAD, _BASE_TEMPLATE_TAIL = BASE_TEMPLATE.split("{content}")
+BASE_TEMPLATE_TAIL = _BASE_TEMPLATE_TAIL.format()
+
 SCORE_CARD_TEMPLATE = """
 <div class="score-card {score_class}">
     <div class="value">{score:.1f}</div>
@@ -155,48 +165,72 @@ class DataToHtmlConverter:
     def __init__(self, data: Dict[str, Any]):
         self.data = data
 
+    # -------------------------------------------------------------------------
+    # String API
+    # -------------------------------------------------------------------------
+
     def generate_scores_dashboard(self) -> str:
         """Generate dimension scores dashboard."""
-        scores = self.data.get('dimension_scores', self.data.get('scores', {}))
+        return self._render(self.write_scores_dashboard)
+
+    def generate_evidence_dashboard(self) -> str:
+        """Generate evidence quality dashboard."""
+        return self._render(self.write_evidence_dashboard)
+
+    def generate_needs_matrix(self) -> str:
+        """Generate needs qualification matrix visualization."""
+        return self._render(self.write_needs_matrix)
+
+    def generate_generic_table(self) -> str:
+        """Generate generic table from data."""
+        return self._render(self.write_generic_table)
+
+    # -------------------------------------------------------------------------
+    # Writer API
+    # -------------------------------------------------------------------------
+
+    def write_dashboard(self, visualization_type: str, writer: HtmlWriter) -> None:
+        """
+        Write a complete dashboard page to an HtmlWriter.
+
+        Args:
+            visualization_type: 'scores', 'evidence', 'needs', or 'table'
+            writer: Destination writer (buffered or streaming)
+        """
+        write_methods = {
+            'scores': self.write_scores_dashboard,
+            'evidence': self.write_evidence_dashboard,
+            'needs': self.write_needs_matrix,
+        }
+        write_methods.get(visualization_type, self.write_generic_table)(writer)
+
+    def write_scores_dashboard(self, writer: HtmlWriter) -> None:
+        """Write dimension scores dashboard."""
+        self._write_head(writer, "VIANEO Dimension Scores")
+        writer.raw("""
+        <div class="card">
+            <h2>Dimension Scores</h2>
+            <div class="grid grid-5">
+                """)
 
         # Build score cards
-        cards_html = []
+        extracted = extract_dimension_scores(self.data)
         for dim_key, dim_info in VIANEO_DIMENSIONS.items():
-            score = 0.0
-            if dim_key in scores:
-                score = float(scores[dim_key])
-            elif dim_info['name'] in scores:
-                score = float(scores[dim_info['name']])
-            elif 'dimension_scores' in self.data:
-                for d in self.data['dimension_scores']:
-                    if d.get('name', '').lower() == dim_key:
-                        score = float(d.get('score', 0))
-                        break
-
-            status = ScoreThresholds.get_status_keyword(score)
-            score_class = self._get_score_class(score)
-
-            cards_html.append(SCORE_CARD_TEMPLATE.format(
+            score = extracted.get(dim_key, 0.0)
+
+            writer.raw(SCORE_CARD_TEMPLATE.format(
                 score=score,
-                dimension=dim_info['name'],
-                status=status,
-                score_class=score_class
+                dimension=escape_html(dim_info['name']),
+                status=ScoreThresholds.get_status_keyword(score),
+                score_class=self._get_score_class(score)
             ))
 
         # Calculate overall
-        all_scores = []
-        for dim_key in VIANEO_DIMENSIONS.keys():
-            if dim_key in scores:
-                all_scores.append(float(scores[dim_key]))
-
+        all_scores = list(extracted.values())
         overall = sum(all_scores) / len(all_scores) if all_scores else 0
         overall_status = ScoreThresholds.get_status_keyword(overall)
 
-        content = f"""
-        <div class="card">
-            <h2>Dimension Scores</h2>
-            <div class="grid grid-5">
-                {''.join(cards_html)}
+        writer.raw(f"""
             </div>
         </div>
         <div class="card">
@@ -207,32 +241,31 @@ class DataToHtmlConverter:
                 <div class="status">{overall_status}</div>
             </div>
         </div>
-        """
-
-        return self._wrap_html("VIANEO Dimension Scores", content)
+        """)
+        self._write_tail(writer)
 
-    def generate_evidence_dashboard(self) -> str:
-        """Generate evidence quality dashboard."""
+    def write_evidence_dashboard(self, writer: HtmlWriter) -> None:
+        """Write evidence quality dashboard, streaming one table row at a time."""
         evidence = self.data.get('evidence_log', [])
 
         # Count by quality
         quality_counts = {i: 0 for i in range(1, 6)}
-        section_counts = {}
-
         for e in evidence:
             q = e.get('quality_rating', 1)
             quality_counts[q] = quality_counts.get(q, 0) + 1
 
-            s = e.get('section', 'Unknown')
-            section_counts[s] = section_counts.get(s, 0) + 1
+        self._write_head(writer, "VIANEO Evidence Dashboard")
+        writer.raw("""
+        <div class="card">
+            <h2>Evidence Quality Distribution</h2>
+            """)
 
         # Quality distribution
-        quality_html = ""
         for q in range(5, 0, -1):
             count = quality_counts.get(q, 0)
             pct = (count / len(evidence) * 100) if evidence else 0
             color = "#28a745" if q >= 4 else "#ffc107" if q >= 3 else "#dc3545"
-            quality_html += f"""
+            writer.raw(f"""
             <div style="margin-bottom: 0.5rem;">
                 <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
                     <span>Quality {q}</span>
@@ -242,28 +275,9 @@ class DataToHtmlConverter:
                     <div class="progress-fill" style="width: {pct}%; background: {color};"></div>
                 </div>
             </div>
-            """
+            """)
 
-        # Evidence table
-        table_rows = ""
-        for e in evidence:
-            q = e.get('quality_rating', 1)
-            badge_class = "badge-green" if q >= 4 else "badge-yellow" if q >= 3 else "badge-red"
-            table_rows += f"""
-            <tr>
-                <td>{e.get('id', '')}</td>
-                <td>{e.get('section', '')}</td>
-                <td>{e.get('source_type', '')}</td>
-                <td><span class="badge {badge_class}">{q}/5</span></td>
-                <td>{e.get('description', '')[:100]}</td>
-                <td>{e.get('date', '')}</td>
-            </tr>
-            """
-
-        content = f"""
-        <div class="card">
-            <h2>Evidence Quality Distribution</h2>
-            {quality_html}
+        writer.raw(f"""
             <p style="margin-top: 1rem; color: var(--gray);">
                 Total: {len(evidence)} evidence entries
             </p>
@@ -282,63 +296,91 @@ class DataToHtmlConverter:
                     </tr>
                 </thead>
                 <tbody>
-                    {table_rows}
+                    """)
+
+        # Evidence table
+        cell = "\n                "
+        for e in evidence:
+            q = e.get('quality_rating', 1)
+            badge_class = "badge-green" if q >= 4 else "badge-yellow" if q >= 3 else "badge-red"
+            writer.raw("\n            <tr>" + cell)
+            writer.element("td", e.get('id', ''))
+            writer.raw(cell)
+            writer.element("td", e.get('section', ''))
+            writer.raw(cell)
+            writer.element("td", e.get('source_type', ''))
+            writer.raw(f'{cell}<td><span class="badge {badge_class}">')
+            writer.text(q)
+            writer.raw("/5</span></td>" + cell)
+            writer.element("td", str(e.get('description', ''))[:100])
+            writer.raw(cell)
+            writer.element("td", e.get('date', ''))
+            writer.raw("\n            </tr>\n            ")
+
+        writer.raw("""
                 </tbody>
             </table>
         </div>
-        """
+        """)
+        self._write_tail(writer)
 
-        return self._wrap_html("VIANEO Evidence Dashboard", content)
-
-    def generate_needs_matrix(self) -> str:
-        """Generate needs qualification matrix visualization."""
+    def write_needs_matrix(self, writer: HtmlWriter) -> None:
+        """Write needs qualification matrix visualization."""
         needs = self.data.get('needs', [])
         requesters = self.data.get('requesters', [])
 
         if not needs or not requesters:
-            return self._wrap_html("Needs Matrix", "<p>No needs data available</p>")
+            self._write_head(writer, "Needs Matrix")
+            writer.raw("<p>No needs data available</p>")
+            self._write_tail(writer)
+            return
+
+        requester_names = [
+            r if isinstance(r, str) else r.get('name', '')
+            for r in requesters
+        ]
+
+        self._write_head(writer, "VIANEO Needs Matrix")
+        writer.raw("""
+        <div class="card">
+            <h2>Needs Qualification Matrix</h2>
+            <table>
+                <thead>""")
 
-        # Build matrix header
-        header = "<th>Need</th>"
-        for r in requesters:
-            name = r if isinstance(r, str) else r.get('name', '')
-            header += f"<th>{name}</th>"
+        # Matrix header
+        writer.row(["Need"] + requester_names, cell_tag="th")
+        writer.raw("</thead>\n                <tbody>")
 
-        # Build matrix rows
-        rows = ""
+        # Matrix rows
         for need in needs:
             need_text = need if isinstance(need, str) else need.get('statement', '')
-            row = f"<td>{need_text}</td>"
+            writer.raw("<tr>")
+            writer.element("td", need_text)
 
-            for r in requesters:
+            for r_name in requester_names:
                 # Check for rating data
                 rating = ""
                 if isinstance(need, dict) and 'ratings' in need:
-                    r_name = r if isinstance(r, str) else r.get('name', '')
                     rating = need['ratings'].get(r_name, '')
 
                 if rating:
                     badge_class = "badge-green" if rating == "High" else "badge-yellow"
-                    row += f"<td><span class='badge {badge_class}'>{rating}</span></td>"
+                    writer.raw(f"<td><span class='badge {badge_class}'>")
+                    writer.text(rating)
+                    writer.raw("</span></td>")
                 else:
-                    row += "<td>-</td>"
+                    writer.raw("<td>-</td>")
 
-            rows += f"<tr>{row}</tr>"
+            writer.raw("</tr>")
 
-        content = f"""
-        <div class="card">
-            <h2>Needs Qualification Matrix</h2>
-            <table>
-                <thead><tr>{header}</tr></thead>
-                <tbody>{rows}</tbody>
+        writer.raw("""</tbody>
             </table>
         </div>
-        """
-
-        return self._wrap_html("VIANEO Needs Matrix", content)
+        """)
+        self._write_tail(writer)
 
-    def generate_generic_table(self) -> str:
-        """Generate generic table from data."""
+    def write_generic_table(self, writer: HtmlWriter) -> None:
+        """Write generic table from data."""
         # Try to find tabular data
         table_data = None
         for key in ['data', 'items', 'rows', 'records']:
@@ -350,29 +392,69 @@ class DataToHtmlConverter:
             table_data = [self.data] if isinstance(self.data, dict) else self.data
 
         if not table_data or not isinstance(table_data[0], dict):
-            return self._wrap_html("Data Table", "<p>No tabular data found</p>")
+            self._write_head(writer, "Data Table")
+            writer.raw("<p>No tabular data found</p>")
+            self._write_tail(writer)
+            return
 
         # Get columns
         columns = list(table_data[0].keys())
 
-        # Build table
-        header = "".join(f"<th>{col}</th>" for col in columns)
-        rows = ""
-        for item in table_data:
-            row = "".join(f"<td>{item.get(col, '')}</td>" for col in columns)
-            rows += f"<tr>{row}</tr>"
-
-        content = f"""
+        self.write_table_page(writer, "VIANEO Data", columns, table_data)
+
+    def write_table_page(
+        self,
+        writer: HtmlWriter,
+        title: str,
+        columns: List[str],
+        rows: Iterable[Dict[str, Any]],
+        heading: str = "Data Table",
+        navigation: Optional[Callable[[], str]] = None
+    ) -> int:
+        """
+        Write a table page, consuming rows lazily.
+
+        Args:
+            writer: Destination writer
+            title: Page title
+            columns: Column names (header order)
+            rows: Iterable of row dicts; read once, never materialized
+            heading: Card heading above the table
+            navigation: Optional callable returning navigation markup. It is
+                called after the rows are written, so it may depend on
+                whether the row source has more data.
+
+        Returns:
+            Number of rows written
+        """
+        self._write_head(writer, title)
+        writer.raw("""
         <div class="card">
-            <h2>Data Table</h2>
+            <h2>""")
+        writer.text(heading)
+        writer.raw("""</h2>
             <table>
-                <thead><tr>{header}</tr></thead>
-                <tbody>{rows}</tbody>
+                <thead>""")
+        writer.row(columns, cell_tag="th")
+        writer.raw("</thead>\n                <tbody>")
+
+        count = 0
+        for item in rows:
+            writer.row(item.get(col, '') for col in columns)
+            count += 1
+
+        writer.raw("""</tbody>
             </table>
         </div>
-        """
+        """)
+        if navigation is not None:
+            writer.raw(navigation())
+        self._write_tail(writer)
+        return count
 
-        return self._wrap_html("VIANEO Data", content)
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
 
     def _get_score_class(self, score: float) -> str:
         """Get CSS class for score value."""
@@ -383,13 +465,143 @@ class DataToHtmlConverter:
         else:
             return "score-red"
 
-    def _wrap_html(self, title: str, content: str) -> str:
-        """Wrap content in base HTML template."""
-        return BASE_TEMPLATE.format(
-            title=title,
-            generated_date=format_date(),
-            content=content
-        )
+    def _render(self, write_method) -> str:
+        """Run a write_* method against an in-memory writer."""
+        writer = HtmlWriter()
+        write_method(writer)
+        return writer.getvalue()
+
+    def _write_head(self, writer: HtmlWriter, title: str) -> None:
+        """Write the base template up to the content placeholder."""
+        writer.raw(BASE_TEMPLATE_HEAD.format(
+            title=escape_html(title),
+            generated_date=format_date()
+        ))
+
+    def _write_tail(self, writer: HtmlWriter) -> None:
+        """Write the base template after the content placeholder."""
+        writer.raw(BASE_TEMPLATE_TAIL)
+
+
+# =============================================================================
+# STREAMING CSV
+# =============================================================================
+
+@contextmanager
+def iter_csv_rows(input_path: Path) -> Iterator[Tuple[List[str], Iterator[Dict[str, str]]]]:
+    """
+    Open a CSV file for lazy row-by-row reading.
+
+    The file stays open for the body of the with block and is closed on
+    every exit path, including errors while reading the header.
+
+    Args:
+        input_path: Path to CSV file
+
+    Yields:
+        Tuple of (column names, row iterator)
+    """
+    with open(input_path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        yield list(reader.fieldnames or []), iter(reader)
+
+
+def _page_filename(output_path: Path, page: int) -> str:
+    """File name of a numbered page next to the index page."""
+    return f"{output_path.stem}_page_{page:04d}{output_path.suffix}"
+
+
+def _pagination_html(output_path: Path, page: int, has_next: bool) -> str:
+    """Navigation links for a numbered page."""
+    links = []
+    if page > 1:
+        links.append(f'<a href="{escape_html(_page_filename(output_path, page - 1))}">&larr; Previous</a>')
+    links.append(f'<a href="{escape_html(output_path.name)}">Index</a>')
+    links.append(f'<span>Page {page}</span>')
+    if has_next:
+        links.append(f'<a href="{escape_html(_page_filename(output_path, page + 1))}">Next &rarr;</a>')
+    return '<nav class="pagination">' + ''.join(links) + '</nav>'
+
+
+def write_paginated_csv(
+    input_path: Path,
+    output_path: Path,
+    rows_per_page: int
+) -> List[Path]:
+    """
+    Stream a CSV file into paginated HTML table pages plus an index page.
+
+    Pages are written as <stem>_page_0001.html, ... next to output_path,
+    which becomes the index. Only one page of rows is in flight at a time.
+
+    Args:
+        input_path: Path to CSV file
+        output_path: Path for the index HTML page
+        rows_per_page: Maximum rows per page
+
+    Returns:
+        List of written paths (index first)
+    """
+    if rows_per_page < 1:
+        raise ValueError("rows_per_page must be at least 1")
+
+    output_path = Path(output_path)
+    converter = DataToHtmlConverter({})
+
+    page_ranges = []
+    written = []
+    first_row = 1
+    with iter_csv_rows(input_path) as (columns, rows):
+        pending = next(rows, None)
+        while pending is not None:
+            page = len(page_ranges) + 1
+            page_rows = chain([pending], islice(rows, rows_per_page - 1))
+            state = {}
+
+            def navigation() -> str:
+                # Peek one row ahead to decide whether a next page exists
+                state['pending'] = next(rows, None)
+                return _pagination_html(output_path, page, state['pending'] is not None)
+
+            page_path = output_path.with_name(_page_filename(output_path, page))
+            with open(page_path, 'w', encoding='utf-8') as f:
+                count = converter.write_table_page(
+                    HtmlWriter(f),
+                    f"VIANEO Data - Page {page}",
+                    columns,
+                    page_rows,
+                    heading=f"Data Table - Page {page}",
+                    navigation=navigation
+                )
+            page_ranges.append((page_path, first_row, first_row + count - 1))
+            written.append(page_path)
+            first_row += count
+            pending = state['pending']
+
+    # Index page
+    with open(output_path, 'w', encoding='utf-8') as f:
+        writer = HtmlWriter(f)
+        converter._write_head(writer, "VIANEO Data")
+        writer.raw(f"""
+        <div class="card">
+            <h2>Data Pages</h2>
+            <p>{first_row - 1} rows across {len(page_ranges)} pages ({rows_per_page} rows per page)</p>
+            <table>
+                <thead><tr><th>Page</th><th>Rows</th></tr></thead>
+                <tbody>""")
+        for page, (page_path, start, end) in enumerate(page_ranges, 1):
+            writer.raw("<tr><td>")
+            writer.element("a", f"Page {page}", {"href": page_path.name})
+            writer.raw("</td>")
+            writer.element("td", f"{start}-{end}")
+            writer.raw("</tr>\n")
+        writer.raw("""</tbody>
+            </table>
+        </div>
+        """)
+        converter._write_tail(writer)
+
+    return [output_path] + written
 
 
 # =============================================================================
@@ -399,15 +611,21 @@ class DataToHtmlConverter:
 def convert_data_to_html(
     input_path: Path,
     output_path: Optional[Path] = None,
-    visualization_type: str = 'auto'
+    visualization_type: str = 'auto',
+    rows_per_page: Optional[int] = None
 ) -> Optional[Path]:
     """
     Convert data file to HTML dashboard.
 
+    CSV tables are streamed: rows are read lazily and written straight to
+    the output, either as a single page or, with rows_per_page, as
+    numbered pages linked from an index page at output_path.
+
     Args:
         input_path: Path to input data file (JSON/YAML/CSV)
         output_path: Path for output HTML
         visualization_type: 'scores', 'evidence', 'needs', 'table', or 'auto'
+        rows_per_page: Split CSV tables into pages of this many rows
 
     Returns:
         Output path if successful
@@ -417,6 +635,19 @@ def convert_data_to_html(
     if output_path is None:
         output_path = input_path.with_suffix('.html')
 
+    # Stream CSV tables without loading the file
+    if input_path.suffix == '.csv' and visualization_type in ['auto', 'table']:
+        if rows_per_page is not None:
+            written = write_paginated_csv(input_path, output_path, rows_per_page)
+            print(f"Generated: {output_path} ({len(written) - 1} pages)")
+            return output_path
+
+        with iter_csv_rows(input_path) as (columns, rows), \
+                open(output_path, 'w', encoding='utf-8') as f:
+            DataToHtmlConverter({}).write_table_page(HtmlWriter(f), "VIANEO Data", columns, rows)
+        print(f"Generated: {output_path}")
+        return output_path
+
     # Load data
     if input_path.suffix in ['.yaml', '.yml']:
         with open(input_path) as f:
@@ -446,19 +677,9 @@ def convert_data_to_html(
         else:
             visualization_type = 'table'
 
-    # Generate HTML
-    if visualization_type == 'scores':
-        html = converter.generate_scores_dashboard()
-    elif visualization_type == 'evidence':
-        html = converter.generate_evidence_dashboard()
-    elif visualization_type == 'needs':
-        html = converter.generate_needs_matrix()
-    else:
-        html = converter.generate_generic_table()
-
-    # Save
+    # Generate HTML, streaming straight to the output file
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+        converter.write_dashboard(visualization_type, HtmlWriter(f))
 
     print(f"Generated: {output_path}")
     return output_path
@@ -468,6 +689,17 @@ def convert_data_to_html(
 # CLI
 # =============================================================================
 
+def positive_int(value: str) -> int:
+    """argparse type for counts of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Command-line interface."""
     parser = argparse.ArgumentParser(
@@ -490,10 +722,15 @@ def main():
         default='auto',
         help='Visualization type'
     )
+    parser.add_argument(
+        '--rows-per-page',
+        type=positive_int,
+        help='Split CSV tables into pages of N rows with an index page'
+    )
 
     args = parser.parse_args()
 
-    result = convert_data_to_html(args.input, args.output, args.type)
+    result = convert_data_to_html(args.input, args.output, args.type, args.rows_per_page)
     if result:
         print(f"Success: {result}")
         return 0
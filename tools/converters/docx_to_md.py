@@ -10,9 +10,10 @@ Usage:
 """
 
 import argparse
+import io
 import re
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO, Union
 
 try:
     from docx import Document
@@ -36,12 +37,13 @@ class DocxToMarkdownConverter:
     def __init__(self):
         self.output_lines = []
 
-    def convert(self, input_path: Path) -> str:
+    def convert(self, input_path: Union[Path, bytes, BinaryIO]) -> str:
         """
         Convert DOCX to Markdown.
 
         Args:
-            input_path: Path to DOCX file
+            input_path: Path to DOCX file, the DOCX content as bytes, or
+                a readable binary stream
 
         Returns:
             Markdown content as string
@@ -49,7 +51,12 @@ class DocxToMarkdownConverter:
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx not installed")
 
-        doc = Document(str(input_path))
+        if isinstance(input_path, (bytes, bytearray)):
+            doc = Document(io.BytesIO(input_path))
+        elif hasattr(input_path, 'read'):
+            doc = Document(input_path)
+        else:
+            doc = Document(str(input_path))
         self.output_lines = []
 
         for element in doc.element.body:
@@ -11,9 +11,10 @@ Usage:
 """
 
 import argparse
+import io
 import re
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO, Union
 
 try:
     from docx import Document
@@ -30,6 +31,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.constants import DocxStyles
+from core.deterministic import save_docx
 from core.utils import clean_text
 
 
@@ -40,18 +42,25 @@ from core.utils import clean_text
 class MarkdownToDocxConverter:
     """Converts Markdown to professional DOCX format."""
 
-    def __init__(self):
+    def __init__(self, deterministic: bool = False):
+        """
+        Args:
+            deterministic: Write byte-identical DOCX for identical input
+                (see core.deterministic)
+        """
         self.styles = DocxStyles()
         self.doc = None
         self.current_list_level = 0
+        self.deterministic = deterministic
 
-    def convert(self, markdown: str, output_path: Path) -> bool:
+    def convert(self, markdown: str, output_path: Union[Path, BinaryIO]) -> bool:
         """
         Convert markdown content to DOCX.
 
         Args:
             markdown: Markdown content
-            output_path: Output DOCX file path
+            output_path: Output DOCX file path, or a writable binary
+                stream such as io.BytesIO
 
         Returns:
             True if successful
@@ -63,9 +72,24 @@ class MarkdownToDocxConverter:
         self.doc = Document()
         self._setup_document()
         self._process_markdown(markdown)
-        self.doc.save(str(output_path))
+        save_docx(self.doc, output_path, self.deterministic)
         return True
 
+    def convert_to_bytes(self, markdown: str) -> Optional[bytes]:
+        """
+        Convert markdown content to DOCX in memory.
+
+        Args:
+            markdown: Markdown content
+
+        Returns:
+            DOCX file content, or None if conversion failed
+        """
+        buffer = io.BytesIO()
+        if not self.convert(markdown, buffer):
+            return None
+        return buffer.getvalue()
+
     def _setup_document(self) -> None:
         """Set up document margins and default styles."""
         for section in self.doc.sections:
@@ -279,7 +303,8 @@ class MarkdownToDocxConverter:
 
 def convert_md_to_docx(
     input_path: Path,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    deterministic: bool = False
 ) -> Optional[Path]:
     """
     Convert Markdown file to DOCX.
@@ -287,6 +312,7 @@ def convert_md_to_docx(
     Args:
         input_path: Path to input markdown file
         output_path: Path for output DOCX (default: same name with .docx)
+        deterministic: Write byte-identical DOCX for identical input
 
     Returns:
         Output path if successful, None otherwise
@@ -301,7 +327,7 @@ def convert_md_to_docx(
         markdown = f.read()
 
     # Convert
-    converter = MarkdownToDocxConverter()
+    converter = MarkdownToDocxConverter(deterministic=deterministic)
     if converter.convert(markdown, output_path):
         print(f"Converted: {input_path} -> {output_path}")
         return output_path
@@ -329,10 +355,15 @@ def main():
         type=Path,
         help='Output DOCX file'
     )
+    parser.add_argument(
+        '--deterministic',
+        action='store_true',
+        help='Write byte-identical DOCX for identical input (honours SOURCE_DATE_EPOCH)'
+    )
 
     args = parser.parse_args()
 
-    result = convert_md_to_docx(args.input, args.output)
+    result = convert_md_to_docx(args.input, args.output, deterministic=args.deterministic)
     if result:
         print(f"Success: {result}")
         return 0
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+VIANEO Portfolio Dashboard Converter
+====================================
+
+Builds a single HTML dashboard from many project score files.
+
+Aggregates (per-dimension distributions, status keyword counts and
+threshold gap rankings) are computed once at build time and rendered as
+static HTML. Per-project rows are embedded as a compact columnar JSON
+dataset with precomputed sort orders, and the browser renders only the
+visible rows, so portfolios with thousands of evaluations stay responsive.
+
+Usage:
+    python portfolio_to_html.py --input evaluations/ --output portfolio.html
+    python portfolio_to_html.py --input a.yaml b.yaml c.json
+"""
+
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import mean, median
+from typing import Dict, Any, Optional, List, Iterable
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import ScoreThresholds, VIANEO_DIMENSIONS
+from core.utils import (
+    format_date,
+    load_data_file,
+    calculate_weighted_score,
+    extract_dimension_scores,
+)
+from core.html_writer import HtmlWriter, json_for_script
+from converters.data_to_html import BASE_TEMPLATE_HEAD, BASE_TEMPLATE_TAIL
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Status keywords in descending order (matches ScoreThresholds.get_status_keyword)
+STATUS_KEYWORDS = ["Strong", "Promising", "Developing", "Problematic", "Non-viable"]
+
+# Projects without any dimension score (counted apart, never as Non-viable)
+UNSCORED_STATUS = "Unscored"
+
+# Histogram bins over the 0-5 scale
+HISTOGRAM_EDGES = [0.0, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0]
+
+# Number of projects listed in the gap ranking card
+GAP_RANKING_SIZE = 20
+
+# Supported score file extensions when a directory is given
+PORTFOLIO_FILE_PATTERNS = ["*.yaml", "*.yml", "*.json"]
+
+PORTFOLIO_STYLES = """
+<style>
+    .dist-row { display: grid; grid-template-columns: 6rem 1fr 3rem; gap: 0.5rem; align-items: center; font-size: 0.8rem; }
+    .dist-bar { height: 10px; background: var(--secondary); border-radius: 3px; }
+    .stat-line { font-size: 0.8rem; color: var(--gray); margin-bottom: 0.5rem; }
+    .controls { display: flex; flex-wrap: wrap; gap: 1rem; align-items: center; margin-bottom: 0.75rem; font-size: 0.875rem; }
+    .controls input[type="search"], .controls input[type="number"], .controls select { padding: 0.25rem 0.5rem; }
+    .ptable-row { display: grid; grid-template-columns: 2.2fr repeat(5, 1fr) 1fr 1.2fr 0.8fr; height: 32px; align-items: center; padding: 0 0.5rem; border-bottom: 1px solid #eee; font-size: 0.8rem; }
+    .ptable-row > span { overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+    .ptable-head { font-weight: 600; color: var(--primary); background: var(--light); }
+    .ptable-head span { cursor: pointer; }
+    .pviewport { position: relative; height: 640px; overflow-y: auto; border: 1px solid #ddd; contain: strict; }
+    .pviewport .ptable-row { position: absolute; left: 0; right: 0; background: white; }
+    .cell-green { color: #155724; } .cell-yellow { color: #856404; } .cell-red { color: #721c24; font-weight: 600; }
+</style>
+"""
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class ProjectScores:
+    """Dimension scores for one project in the portfolio."""
+    project_name: str = ""
+    source: str = ""
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def weighted_score(self) -> float:
+        return calculate_weighted_score(self.scores)
+
+    @property
+    def status(self) -> str:
+        if not self.scores:
+            return UNSCORED_STATUS
+        return ScoreThresholds.get_status_keyword(self.weighted_score)
+
+    @property
+    def threshold_gap(self) -> float:
+        """Total distance below each dimension's minimum score (missing counted as 0)."""
+        return sum(
+            max(0.0, VIANEO_DIMENSIONS[dim]["min_score"] - self.scores.get(dim, 0.0))
+            for dim in VIANEO_DIMENSIONS
+        )
+
+    @property
+    def failing_dimensions(self) -> List[str]:
+        """Dimensions below their minimum, missing ones included."""
+        return [
+            dim for dim, info in VIANEO_DIMENSIONS.items()
+            if self.scores.get(dim, 0.0) < info["min_score"]
+        ]
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def collect_portfolio_files(inputs: Iterable[Path]) -> List[Path]:
+    """
+    Expand input paths into a sorted list of score files.
+
+    Args:
+        inputs: Files and/or directories
+
+    Returns:
+        Sorted, de-duplicated list of data files
+    """
+    files = set()
+    for path in inputs:
+        path = Path(path)
+        if path.is_dir():
+            for pattern in PORTFOLIO_FILE_PATTERNS:
+                files.update(path.rglob(pattern))
+        else:
+            files.add(path)
+    return sorted(files)
+
+
+def load_project_scores(path: Path) -> Optional[ProjectScores]:
+    """
+    Load one project's dimension scores.
+
+    Args:
+        path: Path to a YAML/JSON project data file
+
+    Returns:
+        ProjectScores, or None if the file has no dimension scores
+    """
+    data = load_data_file(path)
+    if not isinstance(data, dict):
+        return None
+
+    scores = extract_dimension_scores(data)
+    if not scores:
+        return None
+
+    name = (
+        data.get('project_name')
+        or data.get('company_name')
+        or data.get('project')
+        or Path(path).stem
+    )
+    return ProjectScores(project_name=str(name), source=str(path), scores=scores)
+
+
+# =============================================================================
+# CONVERTER CLASS
+# =============================================================================
+
+class PortfolioDashboardConverter:
+    """Builds the portfolio dashboard from a list of ProjectScores."""
+
+    def __init__(self, projects: List[ProjectScores], unscored: int = 0):
+        self.projects = projects
+        self.unscored = unscored  # evaluations left out for having no dimension scores
+
+    # -------------------------------------------------------------------------
+    # Aggregates
+    # -------------------------------------------------------------------------
+
+    def dimension_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-dimension count, mean, median, range, histogram and failures.
+
+        Distribution figures cover scored projects only; below_threshold
+        counts missing scores as failing, like ProjectScores.
+        """
+        stats = {}
+        for dim_key, dim_info in VIANEO_DIMENSIONS.items():
+            values = [p.scores[dim_key] for p in self.projects if dim_key in p.scores]
+            histogram = [0] * (len(HISTOGRAM_EDGES) - 1)
+            for value in values:
+                histogram[self._bin_index(value)] += 1
+            stats[dim_key] = {
+                "name": dim_info["name"],
+                "count": len(values),
+                "mean": mean(values) if values else 0.0,
+                "median": median(values) if values else 0.0,
+                "min": min(values) if values else 0.0,
+                "max": max(values) if values else 0.0,
+                "histogram": histogram,
+                "missing": len(self.projects) - len(values),
+                "below_threshold": (
+                    sum(1 for v in values if v < dim_info["min_score"])
+                    + len(self.projects) - len(values)
+                ),
+            }
+        return stats
+
+    def status_counts(self) -> Dict[str, int]:
+        """Number of projects per status keyword (by weighted score), plus unscored ones."""
+        counts = {keyword: 0 for keyword in STATUS_KEYWORDS}
+        counts[UNSCORED_STATUS] = self.unscored
+        for project in self.projects:
+            counts[project.status] += 1
+        return counts
+
+    def gap_ranking(self, limit: int = GAP_RANKING_SIZE) -> List[ProjectScores]:
+        """Projects furthest below the dimension minimums, largest gap first."""
+        ranked = [p for p in self.projects if p.threshold_gap > 0]
+        ranked.sort(key=lambda p: (-p.threshold_gap, p.project_name))
+        return ranked[:limit]
+
+    def dataset(self) -> Dict[str, Any]:
+        """
+        Build the columnar dataset embedded in the page.
+
+        Scores are stored as integer tenths (-1 for missing), and every
+        sortable column ships with a precomputed ascending permutation, so
+        the browser sorts by reading an index instead of comparing rows.
+        """
+        dims = list(VIANEO_DIMENSIONS.keys())
+        names = [p.project_name for p in self.projects]
+        weighted = [int(round(p.weighted_score * 100)) for p in self.projects]
+        gaps = [int(round(p.threshold_gap * 10)) for p in self.projects]
+        columns = {
+            dim: [int(round(p.scores[dim] * 10)) if dim in p.scores else -1 for p in self.projects]
+            for dim in dims
+        }
+
+        def order(values: List[Any]) -> List[int]:
+            return sorted(range(len(values)), key=lambda i: (values[i], names[i].lower()))
+
+        lowered = [name.lower() for name in names]
+        return {
+            "dims": dims,
+            "dimNames": [VIANEO_DIMENSIONS[d]["name"] for d in dims],
+            "minScores": [int(round(VIANEO_DIMENSIONS[d]["min_score"] * 10)) for d in dims],
+            "statusLabels": STATUS_KEYWORDS,
+            "names": names,
+            "scores": [columns[d] for d in dims],
+            "weighted": weighted,
+            "status": [
+                STATUS_KEYWORDS.index(p.status) if p.scores else -1 for p in self.projects
+            ],
+            "gap": gaps,
+            "order": {
+                "name": sorted(range(len(names)), key=lambda i: (lowered[i], i)),
+                "weighted": order(weighted),
+                "gap": order(gaps),
+                **{dim: order(columns[dim]) for dim in dims},
+            },
+        }
+
+    # -------------------------------------------------------------------------
+    # HTML
+    # -------------------------------------------------------------------------
+
+    def generate_html(self) -> str:
+        """Generate the dashboard as a string."""
+        writer = HtmlWriter()
+        self.write_html(writer)
+        return writer.getvalue()
+
+    def write_html(self, writer: HtmlWriter) -> None:
+        """Write the complete dashboard page."""
+        writer.raw(BASE_TEMPLATE_HEAD.format(
+            title="VIANEO Portfolio Dashboard",
+            generated_date=format_date()
+        ))
+        writer.raw(PORTFOLIO_STYLES)
+        self._write_summary(writer)
+        self._write_distributions(writer)
+        self._write_gap_ranking(writer)
+        self._write_project_table(writer)
+        writer.raw(BASE_TEMPLATE_TAIL)
+
+    def _write_summary(self, writer: HtmlWriter) -> None:
+        """Write portfolio size and status keyword counts."""
+        counts = self.status_counts()
+        writer.raw('<div class="card"><h2>Portfolio Summary</h2><div class="grid grid-5">')
+        for keyword in STATUS_KEYWORDS:
+            score_class = {
+                "Strong": "score-green", "Promising": "score-green",
+                "Developing": "score-yellow"
+            }.get(keyword, "score-red")
+            writer.raw(f'<div class="score-card {score_class}"><div class="value">{counts[keyword]}</div>')
+            writer.element("div", keyword, {"class": "label"})
+            writer.raw('</div>')
+        writer.raw('</div>')
+        note = f"{len(self.projects)} evaluations. Status uses the weighted overall score."
+        if counts[UNSCORED_STATUS]:
+            note += f" {UNSCORED_STATUS}: {counts[UNSCORED_STATUS]} (no dimension scores)."
+        writer.element("p", note, {"class": "meta", "style": "margin-top: 1rem;"})
+        writer.raw('</div>\n')
+
+    def _write_distributions(self, writer: HtmlWriter) -> None:
+        """Write per-dimension score histograms."""
+        stats = self.dimension_statistics()
+        writer.raw('<div class="card"><h2>Dimension Distributions</h2><div class="grid grid-3">')
+        for dim_stats in stats.values():
+            peak = max(dim_stats["histogram"]) or 1
+            writer.raw('<div>')
+            writer.element("h3", dim_stats["name"])
+            writer.element(
+                "p",
+                f"Mean {dim_stats['mean']:.2f} | Median {dim_stats['median']:.2f} | "
+                f"Range {dim_stats['min']:.1f}-{dim_stats['max']:.1f} | "
+                f"Below minimum: {dim_stats['below_threshold']}/{len(self.projects)}"
+                f" (incl. {dim_stats['missing']} missing)",
+                {"class": "stat-line"}
+            )
+            for i in range(len(HISTOGRAM_EDGES) - 2, -1, -1):
+                count = dim_stats["histogram"][i]
+                width = count / peak * 100
+                writer.raw('<div class="dist-row">')
+                writer.element("span", f"{HISTOGRAM_EDGES[i]:.1f}-{HISTOGRAM_EDGES[i + 1]:.1f}")
+                writer.raw(f'<div><div class="dist-bar" style="width: {width:.1f}%;"></div></div>')
+                writer.element("span", count)
+                writer.raw('</div>')
+            writer.raw('</div>')
+        writer.raw('</div></div>\n')
+
+    def _write_gap_ranking(self, writer: HtmlWriter) -> None:
+        """Write the largest threshold gaps."""
+        ranking = self.gap_ranking()
+        writer.raw('<div class="card"><h2>Largest Threshold Gaps</h2>')
+        if not ranking:
+            writer.raw('<p>All projects meet every dimension minimum.</p></div>\n')
+            return
+        writer.raw('<table><thead>')
+        writer.row(["Rank", "Project", "Total Gap", "Weighted Score", "Below Minimum or Missing"], cell_tag="th")
+        writer.raw('</thead><tbody>')
+        for rank, project in enumerate(ranking, 1):
+            writer.row([
+                rank,
+                project.project_name,
+                f"{project.threshold_gap:.1f}",
+                f"{project.weighted_score:.2f}",
+                ", ".join(
+                    VIANEO_DIMENSIONS[d]["name"] + (" (missing)" if d not in project.scores else "")
+                    for d in project.failing_dimensions
+                ),
+            ])
+        writer.raw('</tbody></table></div>\n')
+
+    def _write_project_table(self, writer: HtmlWriter) -> None:
+        """Write the filterable project table and its data island."""
+        dataset = json_for_script(self.dataset())
+
+        writer.raw('<div class="card"><h2>All Evaluations</h2><div class="controls">')
+        writer.raw('<input type="search" id="pf-search" placeholder="Filter by project name">')
+        writer.raw('<label>Status <select id="pf-status"><option value="-1">All</option>')
+        for index, keyword in enumerate(STATUS_KEYWORDS):
+            writer.element("option", keyword, {"value": index})
+        writer.raw('</select></label>')
+        writer.raw('<label><input type="checkbox" id="pf-gaps"> Only below a minimum or missing</label>')
+        writer.raw('<span id="pf-count"></span></div>')
+
+        writer.raw('<div class="ptable-row ptable-head" id="pf-head">')
+        writer.element("span", "Project", {"data-sort": "name"})
+        for dim_key, dim_info in VIANEO_DIMENSIONS.items():
+            writer.element("span", dim_info["name"], {"data-sort": dim_key})
+        writer.element("span", "Weighted", {"data-sort": "weighted"})
+        writer.element("span", "Status", {"data-sort": "weighted"})
+        writer.element("span", "Gap", {"data-sort": "gap"})
+        writer.raw('</div><div class="pviewport" id="pf-viewport"><div id="pf-spacer" style="position: relative;"></div></div></div>\n')
+
+        writer.raw('<script type="application/json" id="portfolio-data">')
+        writer.raw(dataset)
+        writer.raw('</script>\n')
+        writer.raw(PORTFOLIO_SCRIPT)
+
+    @staticmethod
+    def _bin_index(value: float) -> int:
+        """Histogram bin for a score (top edge inclusive)."""
+        for i in range(len(HISTOGRAM_EDGES) - 1):
+            if value < HISTOGRAM_EDGES[i + 1]:
+                return i
+        return len(HISTOGRAM_EDGES) - 2
+
+
+PORTFOLIO_SCRIPT = """<script>
+(function () {
+    const data = JSON.parse(document.getElementById('portfolio-data').textContent);
+    const n = data.names.length;
+    const ROW_HEIGHT = 32, OVERSCAN = 10;
+    const viewport = document.getElementById('pf-viewport');
+    const spacer = document.getElementById('pf-spacer');
+    const countLabel = document.getElementById('pf-count');
+    const search = document.getElementById('pf-search');
+    const statusSelect = document.getElementById('pf-status');
+    const gapsOnly = document.getElementById('pf-gaps');
+    const lowerNames = data.names.map(name => name.toLowerCase());
+
+    let sortKey = 'weighted', descending = true;
+    let visible = new Int32Array(0);
+
+    function esc(value) {
+        return String(value).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+    }
+
+    function scoreCell(tenths, min) {
+        if (tenths < 0) return '<span class="cell-red">missing</span>';
+        const cls = tenths >= 35 ? 'cell-green' : tenths >= min ? 'cell-yellow' : 'cell-red';
+        return '<span class="' + cls + '">' + (tenths / 10).toFixed(1) + '</span>';
+    }
+
+    function update() {
+        const query = search.value.trim().toLowerCase();
+        const status = Number(statusSelect.value);
+        const onlyGaps = gapsOnly.checked;
+        const order = data.order[sortKey];
+        const out = new Int32Array(n);
+        let count = 0;
+        for (let k = 0; k < n; k++) {
+            const i = order[descending ? n - 1 - k : k];
+            if (status >= 0 && data.status[i] !== status) continue;
+            if (onlyGaps && data.gap[i] === 0) continue;
+            if (query && !lowerNames[i].includes(query)) continue;
+            out[count++] = i;
+        }
+        visible = out.subarray(0, count);
+        countLabel.textContent = count + ' of ' + n + ' evaluations';
+        spacer.style.height = (count * ROW_HEIGHT) + 'px';
+        viewport.scrollTop = 0;
+        render();
+    }
+
+    function render() {
+        const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        const last = Math.min(visible.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+        let html = '';
+        for (let k = first; k < last; k++) {
+            const i = visible[k];
+            html += '<div class="ptable-row" style="top:' + (k * ROW_HEIGHT) + 'px"><span>' + esc(data.names[i]) + '</span>';
+            for (let d = 0; d < data.dims.length; d++) {
+                html += scoreCell(data.scores[d][i], data.minScores[d]);
+            }
+            html += '<span>' + (data.weighted[i] / 100).toFixed(2) + '</span>' +
+                '<span>' + (data.statusLabels[data.status[i]] || '-') + '</span>' +
+                '<span>' + (data.gap[i] / 10).toFixed(1) + '</span></div>';
+        }
+        spacer.innerHTML = html;
+    }
+
+    let pending = false;
+    viewport.addEventListener('scroll', () => {
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(() => { pending = false; render(); });
+    }, { passive: true });
+
+    document.getElementById('pf-head').addEventListener('click', (e) => {
+        const key = e.target.dataset.sort;
+        if (!key) return;
+        descending = key === sortKey ? !descending : key !== 'name';
+        sortKey = key;
+        update();
+    });
+
+    let timer = null;
+    search.addEventListener('input', () => { clearTimeout(timer); timer = setTimeout(update, 150); });
+    statusSelect.addEventListener('change', update);
+    gapsOnly.addEventListener('change', update);
+    update();
+})();
+</script>
+"""
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def convert_portfolio_to_html(
+    inputs: Iterable[Path],
+    output_path: Optional[Path] = None
+) -> Optional[Path]:
+    """
+    Build a portfolio dashboard from many project score files.
+
+    Args:
+        inputs: Score files and/or directories containing them
+        output_path: Path for output HTML (default: portfolio_dashboard.html)
+
+    Returns:
+        Output path if successful, None otherwise
+    """
+    files = collect_portfolio_files(inputs)
+    if not files:
+        print("No score files found")
+        return None
+
+    projects = []
+    unscored = 0
+    for path in files:
+        try:
+            project = load_project_scores(path)
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+            continue
+        if project is None:
+            print(f"Skipping {path}: no dimension scores")
+            unscored += 1
+            continue
+        projects.append(project)
+
+    if not projects:
+        print("No projects with dimension scores found")
+        return None
+
+    output_path = Path(output_path or "portfolio_dashboard.html")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        PortfolioDashboardConverter(projects, unscored).write_html(HtmlWriter(f))
+
+    print(f"Generated: {output_path} ({len(projects)} projects)")
+    return output_path
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Build a portfolio dashboard from many project score files"
+    )
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        nargs='+',
+        required=True,
+        help='Score files (JSON/YAML) and/or directories containing them'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='Output HTML file (default: portfolio_dashboard.html)'
+    )
+
+    args = parser.parse_args()
+
+    result = convert_portfolio_to_html(args.input, args.output)
+    if result:
+        print(f"Success: {result}")
+        return 0
+    else:
+        print("Conversion failed")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -5,3 +5,10 @@ Core utilities for VIANEO Framework Tools.
 from .constants import *
 from .utils import *
 from .validators import *
+from .html_writer import *
+from .markdown_builder import *
+from .document_model import *
+from .deterministic import *
+from .validation_memo import *
+from .write_behind import *
+from .data_cache import *
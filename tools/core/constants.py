@@ -8,6 +8,7 @@ used across the VIANEO Framework tools.
 
 from enum import Enum
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Tuple
 
 # =============================================================================
@@ -282,6 +283,14 @@ class ValidationPatterns:
     NEED_LEVEL = r"^(Critical|Important|Secondary|None)$"
 
 
+# =============================================================================
+# REPOSITORY LAYOUT
+# =============================================================================
+
+# Repository checkout holding prompts/, templates/, docs/ and tools/
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
 # =============================================================================
 # STEP DEPENDENCIES
 # =============================================================================
@@ -0,0 +1,272 @@
+"""
+VIANEO Parsed-Data Cache
+========================
+
+Binary cache of parsed YAML/JSON data files.
+
+When enabled, load_yaml() and load_json() (and therefore load_data_file())
+keep the parsed structure of every file they read as a pickle (protocol 5)
+in a cache directory, keyed on the file's path and the parser that read
+it. The next load of an unchanged file unpickles it instead of parsing
+YAML again, which for multi-megabyte sprint reports is one to two orders
+of magnitude faster.
+
+An entry is used when the source's size and mtime match what was recorded.
+If only the mtime differs (touch, fresh checkout), the content hash decides
+and the entry is refreshed. Changed files are parsed again and re-cached.
+
+Configuration (environment variable VIANEO_DATA_CACHE, read at import):
+- unset, "0" or "off": disabled (the default)
+- "1" or "on":         enabled, in $XDG_CACHE_HOME/vianeo/parsed
+                       (default ~/.cache/vianeo/parsed)
+- any other value:     enabled, using that directory
+
+or at runtime with configure_data_cache(enabled=..., directory=...).
+
+Cache entries are pickles, so they are only read from a directory owned by
+the current user and not writable by group or others, and only if the
+entry file is owned by the current user; anything else is ignored and
+counted as an error. Failing to read or write the cache never fails a
+load; the file is simply parsed.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from .write_behind import atomic_write_bytes
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Environment variable controlling the cache (see module docstring)
+DATA_CACHE_ENV = "VIANEO_DATA_CACHE"
+
+# Bump when the entry layout changes; older entries are ignored
+CACHE_FORMAT = 2
+
+PICKLE_PROTOCOL = 5
+
+_DISABLED_VALUES = {"", "0", "off", "no", "false"}
+_ENABLED_VALUES = {"1", "on", "yes", "true"}
+
+
+def default_cache_directory() -> Path:
+    """$XDG_CACHE_HOME/vianeo/parsed, or ~/.cache/vianeo/parsed."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "vianeo" / "parsed"
+
+
+def _owned_by_current_user(stat: os.stat_result) -> bool:
+    """True if the current user owns the file (always true without POSIX ids)."""
+    return not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+
+
+def is_private_directory(directory: Union[str, Path]) -> bool:
+    """True if directory exists, belongs to the current user and only they can write to it."""
+    try:
+        stat = os.stat(directory)
+    except OSError:
+        return False
+    return _owned_by_current_user(stat) and not stat.st_mode & 0o022
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class DataCacheStats:
+    """Counters for a ParsedDataCache."""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    errors: int = 0
+
+    def __str__(self) -> str:
+        return (f"{self.hits} hit(s), {self.misses} miss(es), "
+                f"{self.writes} write(s), {self.errors} error(s)")
+
+
+# =============================================================================
+# CACHE CLASS
+# =============================================================================
+
+class ParsedDataCache:
+    """
+    On-disk cache of parsed data files keyed on their resolved path and parser.
+
+    Args:
+        directory: Cache directory (default: default_cache_directory())
+        enabled: Whether load() uses the cache at all
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, enabled: bool = True):
+        self.directory = Path(directory) if directory else default_cache_directory()
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = DataCacheStats()
+
+    @classmethod
+    def from_environment(cls) -> 'ParsedDataCache':
+        """Cache configured from VIANEO_DATA_CACHE."""
+        value = os.environ.get(DATA_CACHE_ENV, "").strip()
+        if value.lower() in _DISABLED_VALUES:
+            return cls(enabled=False)
+        if value.lower() in _ENABLED_VALUES:
+            return cls()
+        return cls(directory=value)
+
+    def entry_path(self, path: Union[str, Path], parser: str) -> Path:
+        """Cache file for a source file read by the named parser."""
+        identity = f"{parser}\0{Path(path).resolve()}"
+        key = hashlib.blake2b(identity.encode('utf-8'), digest_size=16).hexdigest()
+        return self.directory / f"{key}.pickle"
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def load(self, path: Union[str, Path], parser: str, parse: Callable[[bytes], Any]) -> Any:
+        """
+        Parsed content of path, from the cache when it is still valid.
+
+        Args:
+            path: Source data file
+            parser: Name of the parser (e.g. "yaml", "json"); part of the key
+            parse: Parses the file's bytes (called on a miss)
+
+        Returns:
+            Parsed data (a fresh object on every call)
+        """
+        path = Path(path)
+        if not self.enabled:
+            with open(path, 'rb') as f:
+                return parse(f.read())
+
+        stat = path.stat()
+        entry_path = self.entry_path(path, parser)
+        entry = self._read_entry(entry_path)
+
+        if entry is not None and entry[2] == stat.st_size and entry[3] == stat.st_mtime_ns:
+            self._count("hits")
+            return entry[5]
+
+        with open(path, 'rb') as f:
+            content = f.read()
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+
+        if entry is not None and entry[2] == len(content) and entry[4] == digest:
+            data = entry[5]
+            self._count("hits")
+        else:
+            data = parse(content)
+            self._count("misses")
+        self._write_entry(entry_path, (
+            CACHE_FORMAT, str(path), len(content), stat.st_mtime_ns, digest, data
+        ))
+        return data
+
+    def _read_entry(self, entry_path: Path) -> Optional[tuple]:
+        if not self.directory.exists():
+            return None
+        if not is_private_directory(self.directory):
+            self._count("errors")
+            return None
+        try:
+            with open(entry_path, 'rb') as f:
+                if not _owned_by_current_user(os.fstat(f.fileno())):
+                    self._count("errors")
+                    return None
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._count("errors")
+            return None
+        if not isinstance(entry, tuple) or len(entry) != 6 or entry[0] != CACHE_FORMAT:
+            return None
+        return entry
+
+    def _write_entry(self, entry_path: Path, entry: tuple) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+            if not is_private_directory(self.directory):
+                self._count("errors")
+                return
+            atomic_write_bytes(entry_path, pickle.dumps(entry, protocol=PICKLE_PROTOCOL))
+        except Exception:
+            self._count("errors")
+        else:
+            self._count("writes")
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+
+    def stats(self) -> DataCacheStats:
+        """Snapshot of the hit/miss counters."""
+        with self._lock:
+            return DataCacheStats(**vars(self._stats))
+
+    def clear(self) -> int:
+        """
+        Delete all cache entries and reset the counters.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        if self.directory.is_dir():
+            for entry_path in self.directory.glob("*.pickle"):
+                try:
+                    entry_path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        with self._lock:
+            self._stats = DataCacheStats()
+        return removed
+
+
+# =============================================================================
+# SHARED CACHE
+# =============================================================================
+
+DATA_CACHE = ParsedDataCache.from_environment()
+
+
+def configure_data_cache(
+    enabled: Optional[bool] = None,
+    directory: Optional[Union[str, Path]] = None
+) -> ParsedDataCache:
+    """
+    Turn the shared cache on/off and/or move it to another directory.
+
+    Args:
+        enabled: New on/off state (None keeps the current one)
+        directory: New cache directory (None keeps the current one)
+
+    Returns:
+        The shared cache
+    """
+    if enabled is not None:
+        DATA_CACHE.enabled = enabled
+    if directory is not None:
+        DATA_CACHE.directory = Path(directory)
+    return DATA_CACHE
+
+
+def data_cache_stats() -> DataCacheStats:
+    """Hit/miss statistics of the shared cache."""
+    return DATA_CACHE.stats()
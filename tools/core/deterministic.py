@@ -0,0 +1,168 @@
+"""
+VIANEO Deterministic DOCX Output
+================================
+
+Rewrites DOCX packages so that identical content always produces identical
+bytes. python-docx stamps every zip entry with the current time; this
+module fixes entry timestamps, ordering, permissions and compression
+level, and normalizes the core document properties, so unchanged reports
+hash identically and sync tools only transfer real changes.
+
+The timestamp honours the SOURCE_DATE_EPOCH convention used by
+reproducible-build tooling and otherwise defaults to 1980-01-01, the
+earliest date a zip entry can carry.
+"""
+
+import io
+import os
+import re
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Earliest timestamp representable in a zip entry (DOS date format)
+ZIP_EPOCH = datetime(1980, 1, 1, tzinfo=timezone.utc)
+
+# Compression level used for every entry (zlib default)
+DETERMINISTIC_COMPRESSLEVEL = 6
+
+# OOXML consumers expect the content types part first
+CONTENT_TYPES_ENTRY = '[Content_Types].xml'
+CORE_PROPERTIES_ENTRY = 'docProps/core.xml'
+
+
+# =============================================================================
+# TIMESTAMP
+# =============================================================================
+
+def source_date_epoch() -> datetime:
+    """
+    Return the timestamp to embed in deterministic output.
+
+    Uses the SOURCE_DATE_EPOCH environment variable (seconds since
+    1970-01-01 UTC) when set and valid, clamped to ZIP_EPOCH.
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    value = os.environ.get('SOURCE_DATE_EPOCH', '').strip()
+    if value:
+        try:
+            stamp = datetime.fromtimestamp(int(value), tz=timezone.utc)
+            return max(stamp, ZIP_EPOCH)
+        except (ValueError, OverflowError, OSError):
+            pass
+    return ZIP_EPOCH
+
+
+# =============================================================================
+# NORMALIZATION
+# =============================================================================
+
+def normalize_core_properties(xml: bytes, timestamp: datetime) -> bytes:
+    """
+    Pin the created/modified dates and revision in docProps/core.xml.
+
+    Args:
+        xml: core.xml content
+        timestamp: Date to write into dcterms:created and dcterms:modified
+
+    Returns:
+        Normalized core.xml content
+    """
+    text = xml.decode('utf-8')
+    stamp = timestamp.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    for tag in ('dcterms:created', 'dcterms:modified'):
+        text = re.sub(
+            rf'(<{tag}\b[^>]*>)[^<]*(</{tag}>)',
+            rf'\g<1>{stamp}\g<2>',
+            text
+        )
+    text = re.sub(r'<cp:revision>[^<]*</cp:revision>', '<cp:revision>1</cp:revision>', text)
+    text = re.sub(r'<cp:lastPrinted\b[^>]*>[^<]*</cp:lastPrinted>|<cp:lastPrinted\b[^>]*/>', '', text)
+    return text.encode('utf-8')
+
+
+def normalize_docx_bytes(content: bytes, timestamp: Optional[datetime] = None) -> bytes:
+    """
+    Rewrite a DOCX package into its deterministic form.
+
+    Entries are written with [Content_Types].xml first and the rest in
+    sorted order, one fixed timestamp, fixed permissions and a fixed
+    deflate level. Entry contents are unchanged apart from the core
+    properties dates.
+
+    Args:
+        content: DOCX file content
+        timestamp: Timestamp to embed (default: source_date_epoch())
+
+    Returns:
+        Normalized DOCX file content
+    """
+    timestamp = timestamp or source_date_epoch()
+    date_time = timestamp.astimezone(timezone.utc).timetuple()[:6]
+
+    with zipfile.ZipFile(io.BytesIO(content)) as source:
+        names = source.namelist()
+        entries = {name: source.read(name) for name in names}
+
+    ordered = sorted(names, key=lambda name: (name != CONTENT_TYPES_ENTRY, name))
+    if CORE_PROPERTIES_ENTRY in entries:
+        entries[CORE_PROPERTIES_ENTRY] = normalize_core_properties(
+            entries[CORE_PROPERTIES_ENTRY], timestamp
+        )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as target:
+        for name in ordered:
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 0
+            info.external_attr = 0
+            target.writestr(info, entries[name], compresslevel=DETERMINISTIC_COMPRESSLEVEL)
+    return buffer.getvalue()
+
+
+def normalize_docx_file(path: Union[str, Path], timestamp: Optional[datetime] = None) -> Path:
+    """
+    Normalize a DOCX file in place.
+
+    Args:
+        path: DOCX file to rewrite
+        timestamp: Timestamp to embed (default: source_date_epoch())
+
+    Returns:
+        The path
+    """
+    path = Path(path)
+    path.write_bytes(normalize_docx_bytes(path.read_bytes(), timestamp))
+    return path
+
+
+def save_docx(doc: Any, target: Union[str, Path, BinaryIO], deterministic: bool = False) -> None:
+    """
+    Save a python-docx Document to a path or a writable binary stream.
+
+    Args:
+        doc: The python-docx Document object
+        target: File path, or any object with a write() method
+        deterministic: Write the normalized package (see normalize_docx_bytes)
+    """
+    if deterministic:
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        content = normalize_docx_bytes(buffer.getvalue())
+        if hasattr(target, 'write'):
+            target.write(content)
+        else:
+            Path(target).write_bytes(content)
+    elif hasattr(target, 'write'):
+        doc.save(target)
+    else:
+        doc.save(str(target))
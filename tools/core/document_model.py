@@ -0,0 +1,601 @@
+"""
+VIANEO Document Model
+=====================
+
+Format-neutral document tree shared by the document generators.
+
+A generator walks its data once and builds a DocumentModel of headings,
+paragraphs (styled runs), label/value fields, lists, tables, rules and
+spacers.
+Renderers then turn the same tree into Markdown, HTML or DOCX, so the
+layout is written once and each output format costs only a cheap walk.
+
+Example:
+    doc = DocumentModel(title="Alpha: Diagnostic")
+    doc.heading(doc.title, level=0)
+    doc.fields([("Date", "2025-01-15")])
+    doc.heading("Strengths", level=2)     # '### Strengths' in Markdown
+    doc.paragraph("Strong founding team.")
+    doc.table(["Dimension", "Score"], [[bold("Legitimacy"), "4.2/5"]])
+
+    markdown = render_markdown(doc)
+    page = render_html(doc)
+    docx_document = render_docx(doc)   # python-docx Document
+"""
+
+import importlib.util
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from .constants import DocxStyles
+from .html_writer import HtmlWriter, escape_html
+from .markdown_builder import MarkdownBuilder
+
+
+# =============================================================================
+# NODES
+# =============================================================================
+
+@dataclass
+class Run:
+    """A span of text with inline styling."""
+    text: str
+    bold: bool = False
+    italic: bool = False
+    color: Optional[str] = None  # hex without '#'
+    size: Optional[int] = None   # points (DOCX); overrides the paragraph style
+
+
+@dataclass
+class Heading:
+    """
+    A heading; level 0 is the document title.
+
+    Markdown and HTML shift levels by one (title '#', level 1 '##'),
+    DOCX uses the level as its heading style.
+    """
+    kind: ClassVar[str] = "heading"
+    text: str
+    level: int = 1
+    color: Optional[str] = None
+
+
+@dataclass
+class Paragraph:
+    """
+    A paragraph of runs.
+
+    style: 'body' (body font, size and color), 'metadata' (small gray)
+    or 'plain' (only what the runs set).
+    """
+    kind: ClassVar[str] = "paragraph"
+    runs: List[Run]
+    style: str = "body"
+
+
+@dataclass
+class Fields:
+    """
+    Label/value lines ("Date: 2025-01-15").
+
+    Compact fields are consecutive lines in Markdown; otherwise each is
+    its own paragraph.
+    """
+    kind: ClassVar[str] = "fields"
+    items: List[Tuple[str, str]]
+    compact: bool = True
+
+
+@dataclass
+class ListBlock:
+    """A bulleted or numbered list."""
+    kind: ClassVar[str] = "list"
+    items: List[List[Run]]
+    ordered: bool = False
+
+
+@dataclass
+class Cell:
+    """
+    A table cell; fill is a background hex color without '#'.
+
+    A highlight cell (e.g. a shaded score) is bold in DOCX and HTML; its
+    Markdown text stays plain so score tables remain machine-readable.
+    """
+    runs: List[Run]
+    fill: Optional[str] = None
+    align: Optional[str] = None  # None or "center"
+    highlight: bool = False
+
+
+@dataclass
+class Table:
+    """A table with a header row; widths are in inches."""
+    kind: ClassVar[str] = "table"
+    headers: List[str]
+    rows: List[List[Cell]]
+    widths: Optional[List[float]] = None
+
+
+@dataclass
+class Rule:
+    """A section separator ('---' in Markdown, <hr> in HTML; none in DOCX)."""
+    kind: ClassVar[str] = "rule"
+
+
+@dataclass
+class Spacer:
+    """Vertical space: an empty paragraph in DOCX, nothing in Markdown or HTML."""
+    kind: ClassVar[str] = "spacer"
+
+
+Node = Union[Heading, Paragraph, Fields, ListBlock, Table, Rule, Spacer]
+
+# Inline content accepted by the builder methods
+Inline = Union[str, Run, Sequence[Run]]
+CellValue = Union[Inline, Cell]
+
+
+def bold(text: Any) -> Run:
+    """A bold run."""
+    return Run(str(text), bold=True)
+
+
+def italic(text: Any) -> Run:
+    """An italic run."""
+    return Run(str(text), italic=True)
+
+
+def to_runs(content: Inline) -> List[Run]:
+    """Normalize inline content (text, a run, or runs) to a list of runs."""
+    if isinstance(content, Run):
+        return [content]
+    if isinstance(content, (list, tuple)):
+        return list(content)
+    return [Run("" if content is None else str(content))]
+
+
+def to_cell(value: CellValue) -> Cell:
+    """Normalize a table cell value to a Cell."""
+    return value if isinstance(value, Cell) else Cell(to_runs(value))
+
+
+def plain_text(runs: Iterable[Run]) -> str:
+    """Concatenated text of runs, without styling."""
+    return "".join(run.text for run in runs)
+
+
+# =============================================================================
+# DOCUMENT
+# =============================================================================
+
+@dataclass
+class DocumentModel:
+    """
+    Ordered list of document nodes with builder methods.
+
+    Builder methods return the model so calls can be chained.
+    """
+    title: str = ""
+    nodes: List[Node] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(self, node: Node) -> 'DocumentModel':
+        """Append a node."""
+        self.nodes.append(node)
+        return self
+
+    def heading(self, text: str, level: int = 1, color: Optional[str] = None) -> 'DocumentModel':
+        """Append a heading (level 0 = title)."""
+        return self.add(Heading(text, level, color))
+
+    def paragraph(self, *content: Inline, style: str = "body") -> 'DocumentModel':
+        """Append a paragraph; each argument is text, a run, or a list of runs."""
+        runs = [run for part in content for run in to_runs(part)]
+        return self.add(Paragraph(runs, style))
+
+    def fields(self, items: Iterable[Tuple[str, Any]], compact: bool = True) -> 'DocumentModel':
+        """Append label/value lines."""
+        return self.add(Fields([(label, "" if value is None else str(value)) for label, value in items], compact))
+
+    def bullets(self, items: Iterable[Inline]) -> 'DocumentModel':
+        """Append a bulleted list."""
+        return self.add(ListBlock([to_runs(item) for item in items], ordered=False))
+
+    def numbered(self, items: Iterable[Inline]) -> 'DocumentModel':
+        """Append a numbered list."""
+        return self.add(ListBlock([to_runs(item) for item in items], ordered=True))
+
+    def table(
+        self,
+        headers: Sequence[str],
+        rows: Iterable[Iterable[CellValue]],
+        widths: Optional[Sequence[float]] = None
+    ) -> 'DocumentModel':
+        """
+        Append a table.
+
+        Args:
+            headers: Column headers
+            rows: Rows of cell values (text, runs or Cell)
+            widths: Optional column widths in inches (DOCX)
+        """
+        return self.add(Table(
+            list(headers),
+            [[to_cell(value) for value in row] for row in rows],
+            list(widths) if widths else None
+        ))
+
+    def rule(self) -> 'DocumentModel':
+        """Append a section separator."""
+        return self.add(Rule())
+
+    def spacer(self) -> 'DocumentModel':
+        """Append vertical space (DOCX only)."""
+        return self.add(Spacer())
+
+
+# =============================================================================
+# RENDERERS
+# =============================================================================
+
+class DocumentRenderer:
+    """
+    Base renderer: dispatches each node to render_<node.kind>().
+
+    Subclasses implement one method per node kind and finish() to
+    return the output.
+    """
+
+    def render(self, model: DocumentModel) -> Any:
+        """Render every node of a model and return finish()."""
+        for node in model:
+            handler = getattr(self, f"render_{node.kind}", None)
+            if handler is None:
+                raise ValueError(f"{type(self).__name__} cannot render '{node.kind}' nodes")
+            handler(node)
+        return self.finish()
+
+    def finish(self) -> Any:
+        return None
+
+
+class MarkdownRenderer(DocumentRenderer):
+    """Renders a model to Markdown (blocks separated by one blank line)."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.md = MarkdownBuilder(stream)
+        self._started = False
+
+    def _block(self) -> MarkdownBuilder:
+        if self._started:
+            self.md.blank()
+        self._started = True
+        return self.md
+
+    @staticmethod
+    def inline(runs: Iterable[Run]) -> str:
+        """Markdown for runs; markers hug the text so '**Label:** value' stays valid."""
+        parts = []
+        for run in runs:
+            text = run.text
+            marker = ("**" if run.bold else "") + ("*" if run.italic else "")
+            core = text.strip()
+            if marker and core:
+                lead = text[:len(text) - len(text.lstrip())]
+                trail = text[len(text.rstrip()):]
+                text = f"{lead}{marker}{core}{marker[::-1]}{trail}"
+            parts.append(text)
+        return "".join(parts)
+
+    def render_heading(self, node: Heading) -> None:
+        self._block().line(f"{'#' * min(node.level + 1, 6)} {node.text}")
+
+    def render_paragraph(self, node: Paragraph) -> None:
+        self._block().line(self.inline(node.runs))
+
+    def render_fields(self, node: Fields) -> None:
+        if not node.items:
+            return
+        if node.compact:
+            self._block()
+        for index, (label, value) in enumerate(node.items):
+            if index and not node.compact:
+                self.md.blank()
+            elif not node.compact:
+                self._block()
+            self.md.line(f"**{label}:** {value}")
+
+    def render_list(self, node: ListBlock) -> None:
+        # An empty list still takes its block, leaving an empty line
+        items = (self.inline(runs) for runs in node.items)
+        if node.ordered:
+            self._block().numbered(items)
+        else:
+            self._block().bullets(items)
+
+    def render_table(self, node: Table) -> None:
+        self._block().table(node.headers, ([self.inline(cell.runs) for cell in row] for row in node.rows))
+
+    def render_rule(self, node: Rule) -> None:
+        self._block().line("---")
+
+    def render_spacer(self, node: Spacer) -> None:
+        pass
+
+    def finish(self) -> Optional[str]:
+        return None if self.md.is_streaming else self.md.build()
+
+
+HTML_PAGE_STYLE = f"""body {{ font-family: {DocxStyles.FONT_FAMILY}, Arial, sans-serif; color: #{DocxStyles.BODY_GRAY}; max-width: 860px; margin: 2rem auto; line-height: 1.6; }}
+h1, h2 {{ color: #{DocxStyles.PRIMARY_BLUE}; }}
+h3, h4 {{ color: #{DocxStyles.MEDIUM_GRAY}; }}
+.metadata {{ color: #{DocxStyles.LIGHT_GRAY}; font-size: 0.85rem; margin: 0.2rem 0; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #{DocxStyles.TABLE_BORDER}; padding: 0.4rem 0.6rem; text-align: left; }}
+th {{ background: #{DocxStyles.TABLE_HEADER_BG}; text-align: center; }}
+.center {{ text-align: center; }}"""
+
+
+class HtmlRenderer(DocumentRenderer):
+    """Renders a model to HTML (a standalone page unless standalone=False)."""
+
+    def __init__(self, stream: Optional[TextIO] = None, standalone: bool = True, title: str = ""):
+        self.html = HtmlWriter(stream)
+        self.standalone = standalone
+        self.title = title
+
+    def render(self, model: DocumentModel) -> Optional[str]:
+        if self.standalone:
+            self.html.raw('<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n')
+            self.html.element("title", self.title or model.title).raw("\n")
+            self.html.raw(f"<style>\n{HTML_PAGE_STYLE}\n</style>\n</head>\n<body>\n")
+        return super().render(model)
+
+    @staticmethod
+    def inline(runs: Iterable[Run]) -> str:
+        """Escaped HTML for runs."""
+        parts = []
+        for run in runs:
+            text = escape_html(run.text)
+            if run.italic:
+                text = f"<em>{text}</em>"
+            if run.bold:
+                text = f"<strong>{text}</strong>"
+            if run.color:
+                text = f'<span style="color:#{escape_html(run.color)}">{text}</span>'
+            parts.append(text)
+        return "".join(parts)
+
+    def render_heading(self, node: Heading) -> None:
+        level = min(node.level + 1, 6)
+        style = f' style="color:#{escape_html(node.color)}"' if node.color else ""
+        self.html.raw(f"<h{level}{style}>{escape_html(node.text)}</h{level}>\n")
+
+    def render_paragraph(self, node: Paragraph) -> None:
+        css = ' class="metadata"' if node.style == "metadata" else ""
+        self.html.raw(f"<p{css}>{self.inline(node.runs)}</p>\n")
+
+    def render_fields(self, node: Fields) -> None:
+        for label, value in node.items:
+            self.html.raw(f'<p class="metadata"><strong>{escape_html(label)}:</strong> {escape_html(value)}</p>\n')
+
+    def render_list(self, node: ListBlock) -> None:
+        if not node.items:
+            return
+        tag = "ol" if node.ordered else "ul"
+        self.html.raw(f"<{tag}>")
+        for runs in node.items:
+            self.html.raw(f"<li>{self.inline(runs)}</li>")
+        self.html.raw(f"</{tag}>\n")
+
+    def render_table(self, node: Table) -> None:
+        self.html.raw("<table>\n<thead>")
+        self.html.row(node.headers, cell_tag="th")
+        self.html.raw("</thead>\n<tbody>\n")
+        for row in node.rows:
+            self.html.raw("<tr>")
+            for cell in row:
+                attrs = ""
+                if cell.align == "center":
+                    attrs += ' class="center"'
+                if cell.fill:
+                    attrs += f' style="background-color:#{escape_html(cell.fill.lstrip("#"))}"'
+                content = self.inline(cell.runs)
+                if cell.highlight:
+                    content = f"<strong>{content}</strong>"
+                self.html.raw(f"<td{attrs}>{content}</td>")
+            self.html.raw("</tr>\n")
+        self.html.raw("</tbody>\n</table>\n")
+
+    def render_rule(self, node: Rule) -> None:
+        self.html.raw("<hr>\n")
+
+    def render_spacer(self, node: Spacer) -> None:
+        pass
+
+    def finish(self) -> Optional[str]:
+        if self.standalone:
+            self.html.raw("</body>\n</html>\n")
+        return None if self.html.is_streaming else self.html.getvalue()
+
+
+def is_docx_renderer_available() -> bool:
+    """True when python-docx is installed."""
+    return importlib.util.find_spec("docx") is not None
+
+
+class DocxRenderer(DocumentRenderer):
+    """
+    Renders a model to a python-docx Document.
+
+    Styling follows DocxStyles: 1 inch margins, Calibri blue title and
+    headings (unless colored), Calibri gray body text, small gray metadata
+    lines, bold centered shaded table headers. python-docx is imported on
+    first use.
+
+    Raises:
+        ImportError: If python-docx is not installed
+    """
+
+    def __init__(self, styles: Optional[DocxStyles] = None):
+        import docx
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.oxml import OxmlElement
+        from docx.oxml.ns import qn
+        from docx.shared import Inches, Pt, RGBColor
+
+        self._oxml = (OxmlElement, qn)
+        self._units = (Inches, Pt, RGBColor)
+        self._center = WD_ALIGN_PARAGRAPH.CENTER
+        self.styles = styles or DocxStyles()
+        self.doc = docx.Document()
+        for section in self.doc.sections:
+            section.top_margin = section.bottom_margin = Inches(1)
+            section.left_margin = section.right_margin = Inches(1)
+
+    def _style_run(self, run: Any, font: Optional[str] = None, size: Optional[int] = None,
+                   color: Optional[str] = None) -> None:
+        _, Pt, RGBColor = self._units
+        if font:
+            run.font.name = font
+        if size:
+            run.font.size = Pt(size)
+        if color:
+            run.font.color.rgb = RGBColor.from_string(color.lstrip('#'))
+
+    def _add_runs(self, para: Any, runs: Iterable[Run], font: Optional[str] = None,
+                  size: Optional[int] = None, color: Optional[str] = None,
+                  bold: bool = False) -> None:
+        for item in runs:
+            run = para.add_run(item.text)
+            if item.bold or bold:
+                run.bold = True
+            if item.italic:
+                run.italic = True
+            self._style_run(run, font, item.size or size, item.color or color)
+
+    def _paragraph_format(self, style: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+        """(font, size, color) applied to the runs of a paragraph style."""
+        if style == "body":
+            return self.styles.FONT_FAMILY, self.styles.BODY_SIZE, self.styles.BODY_GRAY
+        if style == "metadata":
+            return None, self.styles.METADATA_SIZE, self.styles.LIGHT_GRAY
+        return None, None, None
+
+    def _shade(self, cell: Any, fill: str) -> None:
+        OxmlElement, qn = self._oxml
+        shading = OxmlElement('w:shd')
+        shading.set(qn('w:fill'), fill.lstrip('#'))
+        cell._tc.get_or_add_tcPr().append(shading)
+
+    def render_heading(self, node: Heading) -> None:
+        heading = self.doc.add_heading(node.text, level=min(node.level, 9))
+        size = self.styles.TITLE_SIZE if node.level == 0 else None
+        for run in heading.runs:
+            self._style_run(run, self.styles.FONT_FAMILY, size, node.color or self.styles.PRIMARY_BLUE)
+
+    def render_paragraph(self, node: Paragraph) -> None:
+        self._add_runs(self.doc.add_paragraph(), node.runs, *self._paragraph_format(node.style))
+
+    def render_fields(self, node: Fields) -> None:
+        for label, value in node.items:
+            self._add_runs(
+                self.doc.add_paragraph(),
+                [Run(f"{label}: ", bold=True), Run(value)],
+                *self._paragraph_format("metadata")
+            )
+
+    def render_list(self, node: ListBlock) -> None:
+        style = 'List Number' if node.ordered else 'List Bullet'
+        for runs in node.items:
+            self._add_runs(self.doc.add_paragraph(style=style), runs)
+
+    def render_table(self, node: Table) -> None:
+        Inches = self._units[0]
+        table = self.doc.add_table(rows=1, cols=len(node.headers))
+        table.style = 'Table Grid'
+        if node.widths:
+            for column, width in zip(table.columns, node.widths):
+                for cell in column.cells:
+                    cell.width = Inches(width)
+
+        for cell, header in zip(table.rows[0].cells, node.headers):
+            para = cell.paragraphs[0]
+            para.alignment = self._center
+            self._add_runs(para, [Run(header, bold=True)], size=self.styles.BODY_SIZE)
+            self._shade(cell, self.styles.TABLE_HEADER_BG)
+
+        for row in node.rows:
+            for cell, value in zip(table.add_row().cells, row):
+                para = cell.paragraphs[0]
+                if value.align == "center":
+                    para.alignment = self._center
+                self._add_runs(para, value.runs, bold=value.highlight)
+                if value.fill:
+                    self._shade(cell, value.fill)
+
+    def render_rule(self, node: Rule) -> None:
+        pass
+
+    def render_spacer(self, node: Spacer) -> None:
+        self.doc.add_paragraph()
+
+    def finish(self) -> Any:
+        return self.doc
+
+
+# Renderer classes by output format
+RENDERERS: Dict[str, type] = {
+    'md': MarkdownRenderer,
+    'html': HtmlRenderer,
+    'docx': DocxRenderer,
+}
+
+
+def render_markdown(model: DocumentModel, stream: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Render a model to Markdown.
+
+    Args:
+        model: Document model
+        stream: Optional text stream to write to instead of returning a string
+
+    Returns:
+        Markdown text, or None when writing to a stream
+    """
+    return MarkdownRenderer(stream).render(model)
+
+
+def render_html(
+    model: DocumentModel,
+    stream: Optional[TextIO] = None,
+    standalone: bool = True
+) -> Optional[str]:
+    """
+    Render a model to HTML.
+
+    Args:
+        model: Document model
+        stream: Optional text stream to write to instead of returning a string
+        standalone: Wrap the content in a styled HTML page
+
+    Returns:
+        HTML text, or None when writing to a stream
+    """
+    return HtmlRenderer(stream, standalone).render(model)
+
+
+def render_docx(model: DocumentModel, styles: Optional[DocxStyles] = None) -> Any:
+    """
+    Render a model to a python-docx Document (save it with core.deterministic.save_docx).
+
+    Raises:
+        ImportError: If python-docx is not installed
+    """
+    return DocxRenderer(styles).render(model)
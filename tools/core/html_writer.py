@@ -0,0 +1,144 @@
+"""
+VIANEO HTML Writer
+==================
+
+Incremental HTML builder used by the HTML converters.
+
+Fragments are appended to a list (joined once at the end) or written
+straight to an open text stream, so large tables are produced in linear
+time without holding intermediate copies of the whole page. Text values
+are HTML-escaped on the way in; markup is only emitted through raw().
+"""
+
+import html
+import json
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+
+# =============================================================================
+# ESCAPING
+# =============================================================================
+
+def escape_html(value: Any) -> str:
+    """
+    Escape a value for use in HTML text or a quoted attribute.
+
+    Args:
+        value: Any value; None becomes an empty string
+
+    Returns:
+        Escaped string
+    """
+    if value is None:
+        return ""
+    return html.escape(str(value), quote=True)
+
+
+def json_for_script(payload: Any) -> str:
+    """
+    Serialize a payload for embedding inside a <script> data island.
+
+    Characters that could terminate the script element or open markup
+    are emitted as unicode escapes, which JSON.parse decodes unchanged.
+    """
+    text = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    return (
+        text.replace('<', '\\u003c')
+        .replace('>', '\\u003e')
+        .replace('&', '\\u0026')
+        .replace('\u2028', '\\u2028')
+        .replace('\u2029', '\\u2029')
+    )
+
+
+# =============================================================================
+# WRITER CLASS
+# =============================================================================
+
+class HtmlWriter:
+    """
+    Append-only HTML builder.
+
+    Without a stream, fragments are collected and getvalue() joins them.
+    With a stream, every fragment is written through immediately and
+    nothing is retained.
+
+    Example:
+        writer = HtmlWriter()
+        writer.raw("<ul>")
+        for item in items:
+            writer.element("li", item)
+        writer.raw("</ul>")
+        page = writer.getvalue()
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self._stream = stream
+        self._parts: List[str] = []
+        self._write = stream.write if stream is not None else self._parts.append
+
+    @property
+    def is_streaming(self) -> bool:
+        """True when fragments go directly to a stream."""
+        return self._stream is not None
+
+    def raw(self, markup: str) -> 'HtmlWriter':
+        """Append trusted markup unchanged."""
+        self._write(markup)
+        return self
+
+    def text(self, value: Any) -> 'HtmlWriter':
+        """Append escaped text."""
+        self._write(escape_html(value))
+        return self
+
+    def element(
+        self,
+        tag: str,
+        value: Any = "",
+        attrs: Optional[Dict[str, Any]] = None
+    ) -> 'HtmlWriter':
+        """
+        Append a complete element with escaped text content.
+
+        Args:
+            tag: Element name (trusted)
+            value: Text content (escaped)
+            attrs: Optional attributes; values are escaped, None is skipped
+        """
+        self._write(f"<{tag}{self._format_attrs(attrs)}>{escape_html(value)}</{tag}>")
+        return self
+
+    def row(
+        self,
+        cells: Iterable[Any],
+        cell_tag: str = "td"
+    ) -> 'HtmlWriter':
+        """Append a table row with one escaped cell per value."""
+        self._write("<tr>")
+        for cell in cells:
+            self._write(f"<{cell_tag}>{escape_html(cell)}</{cell_tag}>")
+        self._write("</tr>")
+        return self
+
+    def getvalue(self) -> str:
+        """
+        Return the collected HTML.
+
+        Raises:
+            ValueError: If the writer streams to a file
+        """
+        if self._stream is not None:
+            raise ValueError("getvalue() is not available on a streaming HtmlWriter")
+        return "".join(self._parts)
+
+    @staticmethod
+    def _format_attrs(attrs: Optional[Dict[str, Any]]) -> str:
+        """Format an attribute dict as escaped, quoted attributes."""
+        if not attrs:
+            return ""
+        return "".join(
+            f' {name}="{escape_html(value)}"'
+            for name, value in attrs.items()
+            if value is not None
+        )
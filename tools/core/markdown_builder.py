@@ -0,0 +1,147 @@
+"""
+VIANEO Markdown Builder
+=======================
+
+Incremental Markdown builder shared by the document generators.
+
+Fragments are appended to a list and joined once by build(), or written
+straight to an open text stream, so output size grows linearly with the
+input instead of re-copying one ever-growing string.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence, TextIO
+
+
+class MarkdownBuilder:
+    """
+    Append-only Markdown builder.
+
+    Without a stream, fragments are collected and build() joins them.
+    With a stream, every fragment is written through immediately.
+
+    Example:
+        md = MarkdownBuilder()
+        md.heading("Key Features", level=3)
+        md.numbered(features)
+        md.table(["Metric", "Target"], [[m.name, m.target] for m in metrics])
+        text = md.build()
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self._stream = stream
+        self._parts: List[str] = []
+        self._write = stream.write if stream is not None else self._parts.append
+
+    # -------------------------------------------------------------------------
+    # Text
+    # -------------------------------------------------------------------------
+
+    def text(self, text: str) -> 'MarkdownBuilder':
+        """Append text exactly as given."""
+        self._write(text)
+        return self
+
+    def line(self, text: str = "") -> 'MarkdownBuilder':
+        """Append text followed by a newline."""
+        self._write(f"{text}\n")
+        return self
+
+    def blank(self) -> 'MarkdownBuilder':
+        """Append an empty line."""
+        self._write("\n")
+        return self
+
+    def paragraph(self, text: str) -> 'MarkdownBuilder':
+        """Append text followed by a blank line."""
+        self._write(f"{text}\n\n")
+        return self
+
+    # -------------------------------------------------------------------------
+    # Block elements
+    # -------------------------------------------------------------------------
+
+    def heading(self, text: str, level: int = 2) -> 'MarkdownBuilder':
+        """Append a heading followed by a blank line."""
+        self._write(f"{'#' * level} {text}\n\n")
+        return self
+
+    def rule(self) -> 'MarkdownBuilder':
+        """Append a horizontal rule followed by a blank line."""
+        self._write("---\n\n")
+        return self
+
+    def bullets(self, items: Iterable[Any], marker: str = "-") -> 'MarkdownBuilder':
+        """Append one bullet line per item."""
+        for item in items:
+            self._write(f"{marker} {item}\n")
+        return self
+
+    def numbered(self, items: Iterable[Any], start: int = 1) -> 'MarkdownBuilder':
+        """Append one numbered line per item."""
+        for i, item in enumerate(items, start):
+            self._write(f"{i}. {item}\n")
+        return self
+
+    # -------------------------------------------------------------------------
+    # Tables
+    # -------------------------------------------------------------------------
+
+    def table_header(
+        self,
+        headers: Sequence[str],
+        separator: Optional[str] = None
+    ) -> 'MarkdownBuilder':
+        """
+        Append a table header row and separator row.
+
+        Args:
+            headers: Column headers
+            separator: Separator row to use verbatim; by default each
+                column gets dashes matching the padded header width
+        """
+        if separator is None:
+            separator = "|" + "|".join("-" * (len(h) + 2) for h in headers) + "|"
+        self._write("| " + " | ".join(headers) + " |\n")
+        self._write(separator + "\n")
+        return self
+
+    def table_row(self, cells: Iterable[Any]) -> 'MarkdownBuilder':
+        """Append one table row."""
+        self._write("| " + " | ".join(str(cell) for cell in cells) + " |\n")
+        return self
+
+    def table(
+        self,
+        headers: Sequence[str],
+        rows: Iterable[Iterable[Any]],
+        separator: Optional[str] = None
+    ) -> 'MarkdownBuilder':
+        """Append a complete table (rows may be a lazy iterable)."""
+        self.table_header(headers, separator)
+        for row in rows:
+            self.table_row(row)
+        return self
+
+    # -------------------------------------------------------------------------
+    # Output
+    # -------------------------------------------------------------------------
+
+    @property
+    def is_streaming(self) -> bool:
+        """True when fragments go directly to a stream."""
+        return self._stream is not None
+
+    def build(self) -> str:
+        """
+        Return the collected Markdown.
+
+        Raises:
+            ValueError: If the builder streams to a file
+        """
+        if self._stream is not None:
+            raise ValueError("build() is not available on a streaming MarkdownBuilder")
+        return "".join(self._parts)
+
+    def write_to(self, stream: TextIO) -> None:
+        """Write the collected Markdown to a stream."""
+        stream.write(self.build())
@@ -10,10 +10,11 @@ import json
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field as dataclass_field, InitVar
 
 from .constants import CharacterLimits, ScoreThresholds, ValidationPatterns
+from .data_cache import DATA_CACHE
 
 
 # =============================================================================
@@ -255,6 +256,59 @@ def calculate_weighted_score(scores: Dict[str, float]) -> float:
     return weighted_sum / total_weight
 
 
+def extract_dimension_scores(data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Extract the five dimension scores from a project data dict.
+
+    Accepts the layouts used across VIANEO data files:
+    - {"dimension_scores": {"legitimacy": 3.5, ...}} or {"scores": {...}}
+    - keys given as dimension display names ("Legitimacy")
+    - {"dimension_scores": [{"name": "Legitimacy", "score": 3.5}, ...]}
+    - {"key_findings": [{"dimension": "Legitimacy", "score": "4.7"}, ...]}
+      (executive sprint reports; scores may be text such as "4.7/5")
+
+    Scores that are empty or not numbers are left out.
+
+    Args:
+        data: Project data dict
+
+    Returns:
+        Dict mapping dimension key to score, for dimensions present
+    """
+    from .constants import VIANEO_DIMENSIONS
+
+    source = data.get('dimension_scores', data.get('scores', data.get('key_findings'))) or {}
+    result: Dict[str, float] = {}
+
+    if isinstance(source, dict):
+        for dim_key, dim_info in VIANEO_DIMENSIONS.items():
+            for key in (dim_key, dim_info['name']):
+                score = _score_value(source.get(key))
+                if score is not None:
+                    result[dim_key] = score
+                    break
+    elif isinstance(source, list):
+        for entry in source:
+            if not isinstance(entry, dict):
+                continue
+            name = str(entry.get('name', entry.get('dimension', ''))).strip().lower()
+            score = _score_value(entry.get('score'))
+            if name in VIANEO_DIMENSIONS and score is not None:
+                result.setdefault(name, score)
+
+    return result
+
+
+def _score_value(value: Any) -> Optional[float]:
+    """Numeric score from a number or text ("4.7", "4.7/5"); None otherwise."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.match(r'\s*(\d+(?:\.\d+)?)', str(value))
+    return float(match.group(1)) if match else None
+
+
 # =============================================================================
 # FILE HANDLING
 # =============================================================================
@@ -315,15 +369,13 @@ def generate_filename(
 # =============================================================================
 
 def load_yaml(path: Union[str, Path]) -> Dict[str, Any]:
-    """Load YAML file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    """Load YAML file (through the parsed-data cache, see core.data_cache)."""
+    return DATA_CACHE.load(path, "yaml", lambda content: yaml.safe_load(content.decode('utf-8')))
 
 
 def load_json(path: Union[str, Path]) -> Dict[str, Any]:
-    """Load JSON file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load JSON file (through the parsed-data cache, see core.data_cache)."""
+    return DATA_CACHE.load(path, "json", lambda content: json.loads(content.decode('utf-8')))
 
 
 def load_markdown(path: Union[str, Path]) -> str:
@@ -404,34 +456,57 @@ def extract_frontmatter(markdown: str) -> Tuple[Dict[str, Any], str]:
         return {}, markdown
 
 
-def extract_sections(markdown: str) -> Dict[str, str]:
+# Markdown ATX heading: level marker and text
+HEADING_LINE_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+
+
+@dataclass
+class MarkdownSection:
+    """A heading and the lines up to the next heading."""
+    heading: Optional[str]  # None for text before the first heading
+    level: int              # 1-6, 0 for text before the first heading
+    line: int               # 1-based line number of the heading
+    lines: List[str]        # Lines after the heading
+
+    @property
+    def content(self) -> str:
+        return '\n'.join(self.lines).strip()
+
+
+def iter_sections(markdown: str, include_preamble: bool = False) -> Iterator[MarkdownSection]:
     """
-    Extract sections from markdown by heading.
+    Split markdown into sections by heading, keeping line numbers.
 
-    Returns dict mapping heading text to section content.
+    Args:
+        markdown: Markdown text
+        include_preamble: Also yield the text before the first heading
+            (heading None, level 0, line 1) when it is not blank
+
+    Yields:
+        MarkdownSection in document order
     """
-    sections = {}
-    current_heading = None
-    current_content = []
+    current = MarkdownSection(None, 0, 1, [])
 
-    for line in markdown.split('\n'):
-        # Check for heading
-        match = re.match(r'^(#{1,6})\s+(.+)$', line)
+    for number, line in enumerate(markdown.split('\n'), 1):
+        match = HEADING_LINE_PATTERN.match(line)
         if match:
-            # Save previous section
-            if current_heading:
-                sections[current_heading] = '\n'.join(current_content).strip()
-
-            current_heading = match.group(2)
-            current_content = []
+            if current.heading is not None or (include_preamble and current.content):
+                yield current
+            current = MarkdownSection(match.group(2), len(match.group(1)), number, [])
         else:
-            current_content.append(line)
+            current.lines.append(line)
+
+    if current.heading is not None or (include_preamble and current.content):
+        yield current
 
-    # Save last section
-    if current_heading:
-        sections[current_heading] = '\n'.join(current_content).strip()
 
-    return sections
+def extract_sections(markdown: str) -> Dict[str, str]:
+    """
+    Extract sections from markdown by heading.
+
+    Returns dict mapping heading text to section content.
+    """
+    return {section.heading: section.content for section in iter_sections(markdown)}
 
 
 def extract_table(markdown: str) -> List[Dict[str, str]]:
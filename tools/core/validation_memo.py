@@ -0,0 +1,223 @@
+"""
+VIANEO Validation Memo
+======================
+
+Bounded LRU cache of field-level validation verdicts.
+
+Need statements, requester and organization names recur across projects
+and steps, and a text rule gives the same verdict for the same text every
+time. The memo keys each verdict on (rule, rule parameters, BLAKE2b digest
+of the text) and hands back a copy re-labelled with the caller's field
+name, so only the first occurrence of a text is actually checked.
+
+Hashing the text and taking the lock cost a few microseconds, so only
+rules slower than that are memoized: the vague-term check (one regex
+search per term). Character limits, solution language and quantification
+run directly.
+
+The memo is process-wide (VALIDATION_MEMO) and thread-safe. Use
+validation_memo_stats() for hit rates and configure_validation_memo(0)
+to turn caching off.
+"""
+
+import copy
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+from .utils import ValidationResult
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Default number of cached verdicts (a verdict is a few hundred bytes)
+DEFAULT_MEMO_SIZE = 8192
+
+# Digest size for text keys; 16 bytes makes collisions negligible
+TEXT_DIGEST_SIZE = 16
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class MemoStats:
+    """Counters for a ValidationMemo."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.hits}/{self.lookups} cached ({self.hit_rate:.1%}), "
+                f"{self.size}/{self.maxsize} entries, {self.evictions} evicted")
+
+
+# =============================================================================
+# MEMO CLASS
+# =============================================================================
+
+class ValidationMemo:
+    """
+    Thread-safe LRU of ValidationResult verdicts keyed on rule and text.
+
+    Args:
+        maxsize: Maximum cached verdicts (0 disables caching)
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MEMO_SIZE):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, ValidationResult]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(
+        self,
+        rule: Hashable,
+        text: str,
+        field_name: str,
+        compute: Callable[[str], ValidationResult]
+    ) -> ValidationResult:
+        """
+        Return the verdict for text under rule, computing it on a miss.
+
+        Args:
+            rule: Rule identity including its parameters, e.g. ("min_words", 5)
+            text: Validated text
+            field_name: Field name for the returned result
+            compute: Called with field_name on a miss; must not depend on
+                anything but the rule and the text
+
+        Returns:
+            A fresh ValidationResult labelled with field_name (non-string
+            text is always computed, never cached)
+        """
+        if self.maxsize <= 0 or not isinstance(text, str):
+            with self._lock:
+                self._misses += 1
+            return compute(field_name)
+
+        key = (rule, hashlib.blake2b(text.encode('utf-8'), digest_size=TEXT_DIGEST_SIZE).digest())
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if cached is not None:
+            return relabel_result(cached, field_name)
+
+        result = compute(field_name)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return relabel_result(result, field_name)
+
+    def stats(self) -> MemoStats:
+        """Snapshot of the hit/miss/eviction counters."""
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize
+            )
+
+    def clear(self) -> None:
+        """Drop all cached verdicts and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting least recently used verdicts."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
+def relabel_result(result: ValidationResult, field_name: str) -> ValidationResult:
+    """Copy a verdict under another field name (details copied deeply, so callers never share the cached ones)."""
+    return ValidationResult(
+        is_valid=result.is_valid,
+        message=result.message,
+        field_name=field_name,
+        severity=result.severity,
+        details=copy.deepcopy(result.details)
+    )
+
+
+# =============================================================================
+# SHARED MEMO
+# =============================================================================
+
+VALIDATION_MEMO = ValidationMemo()
+
+
+def validation_memo_stats() -> MemoStats:
+    """Hit-rate statistics of the shared validation memo."""
+    return VALIDATION_MEMO.stats()
+
+
+def configure_validation_memo(maxsize: int = DEFAULT_MEMO_SIZE, clear: bool = False) -> None:
+    """
+    Resize (0 disables) and optionally clear the shared validation memo.
+
+    Args:
+        maxsize: Maximum cached verdicts
+        clear: Drop cached verdicts and reset the statistics
+    """
+    if clear:
+        VALIDATION_MEMO.clear()
+    VALIDATION_MEMO.resize(maxsize)
+
+
+def memoized_rule(rule: str, memo: Optional[ValidationMemo] = None) -> Callable:
+    """
+    Decorate a text rule taking (text, field_name, *params) with the memo.
+
+    Extra positional and keyword arguments become part of the cache key.
+    The undecorated function is available as .uncached.
+
+    Args:
+        rule: Rule name used in cache keys
+        memo: Memo to use (default: VALIDATION_MEMO)
+    """
+    def decorator(func: Callable[..., ValidationResult]) -> Callable[..., ValidationResult]:
+        @functools.wraps(func)
+        def wrapper(text: str, field_name: str, *args, **kwargs) -> ValidationResult:
+            key = (rule, args, tuple(sorted(kwargs.items())))
+            return (memo or VALIDATION_MEMO).get_or_compute(
+                key, text, field_name,
+                lambda name: func(text, name, *args, **kwargs)
+            )
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
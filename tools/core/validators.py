@@ -24,6 +24,7 @@ from .utils import (
     extract_table,
     extract_sections
 )
+from .validation_memo import memoized_rule
 
 
 # =============================================================================
@@ -274,6 +275,7 @@ def validate_quantification(text: str, field_name: str, min_numbers: int = 2) ->
         )
 
 
+@memoized_rule("no_vague_terms")
 def validate_no_vague_terms(text: str, field_name: str) -> ValidationResult:
     """Validate text doesn't use vague terms."""
     vague_terms = [
@@ -0,0 +1,240 @@
+"""
+VIANEO Write-Behind Output Queue
+================================
+
+Bounded queue that moves finished output bytes to disk on dedicated writer
+threads, so batch runs keep rendering the next project while slow (e.g.
+network-mounted) output directories catch up.
+
+Each file is written to a temporary file in the destination directory and
+moved into place with os.replace(), so readers never see a partially
+written document. When the queue is full, submit() blocks, which caps the
+memory held by pending outputs.
+
+Usage:
+    with WriteBehindQueue(max_pending=32) as writer:
+        for project in projects:
+            generate_diagnostic(input_path=project, writer=writer)
+    # all files are on disk here; WriteBehindError is raised if any write failed
+"""
+
+import os
+import queue
+import stat
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List, Tuple, Union
+
+
+# =============================================================================
+# ATOMIC WRITES
+# =============================================================================
+
+def _process_umask() -> int:
+    """The process umask (os.umask can only be read by setting it)."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask() changes process state, which is unsafe
+# while writer threads are running
+_UMASK = _process_umask()
+
+
+def atomic_write_bytes(path: Union[str, Path], content: bytes, fsync: bool = False) -> Path:
+    """
+    Write bytes to path atomically (temp file in the same directory + rename).
+
+    The file keeps the mode of the file it replaces; new files get the
+    usual 0o666 & ~umask (mkstemp itself creates 0o600 files).
+
+    Args:
+        path: Destination file
+        content: File content
+        fsync: Flush the file to stable storage before renaming
+
+    Returns:
+        The destination path
+    """
+    path = Path(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, mode)
+        else:
+            os.chmod(temp_name, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+# =============================================================================
+# QUEUE CLASS
+# =============================================================================
+
+class WriteBehindError(Exception):
+    """One or more queued writes failed; failures holds (path, exception) pairs."""
+
+    def __init__(self, failures: List[Tuple[Path, BaseException]]):
+        self.failures = failures
+        details = "; ".join(f"{path}: {error}" for path, error in failures)
+        super().__init__(f"{len(failures)} output(s) could not be written: {details}")
+
+
+class WriteBehindQueue:
+    """
+    Bounded hand-off of finished outputs to background writer threads.
+
+    Args:
+        max_pending: Outputs that may wait for a writer before submit() blocks
+        workers: Writer threads (more help on high-latency storage)
+        fsync: fsync each file before renaming it into place
+    """
+
+    _STOP = object()
+
+    def __init__(self, max_pending: int = 32, workers: int = 2, fsync: bool = False):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.fsync = fsync
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=max_pending)
+        self._failures: List[Tuple[Path, BaseException]] = []
+        self._lock = threading.Lock()
+        # Held by submit() across its put(), so close() cannot enqueue the stop
+        # markers in between; writer threads never take it
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._run, name=f"vianeo-writer-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # -------------------------------------------------------------------------
+    # Submitting
+    # -------------------------------------------------------------------------
+
+    def submit(self, path: Union[str, Path], content: Union[bytes, str]) -> Future:
+        """
+        Queue content to be written to path.
+
+        Blocks while the queue is full. Text is encoded as UTF-8.
+
+        Args:
+            path: Destination file (its directory must exist)
+            content: File content
+
+        Returns:
+            Future resolving to the path once the file is in place
+
+        Raises:
+            ValueError: If the queue has been closed
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise ValueError("submit() on a closed WriteBehindQueue")
+            self._queue.put((Path(path), content, future))
+        return future
+
+    # -------------------------------------------------------------------------
+    # Waiting
+    # -------------------------------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of outputs not yet picked up by a writer."""
+        return self._queue.qsize()
+
+    @property
+    def failures(self) -> List[Tuple[Path, BaseException]]:
+        """(path, exception) for every write that failed so far."""
+        with self._lock:
+            return list(self._failures)
+
+    def flush(self) -> None:
+        """Block until every submitted output has been written (or failed)."""
+        self._queue.join()
+
+    def close(self) -> List[Tuple[Path, BaseException]]:
+        """
+        Write everything still queued and stop the writer threads.
+
+        Returns:
+            List of (path, exception) for failed writes
+        """
+        with self._close_lock:
+            if not self._closed:
+                self._closed = True
+                for _ in self._threads:
+                    self._queue.put(self._STOP)
+        for thread in self._threads:
+            thread.join()
+        return self.failures
+
+    def __enter__(self) -> 'WriteBehindQueue':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the queue.
+
+        Raises:
+            WriteBehindError: If any write failed (when the block itself
+                raised, the failures go to stderr and that exception wins)
+        """
+        failures = self.close()
+        if not failures:
+            return
+        if exc_type is None:
+            raise WriteBehindError(failures)
+        for path, error in failures:
+            print(f"Error writing {path}: {error}", file=sys.stderr)
+
+    # -------------------------------------------------------------------------
+    # Writer threads
+    # -------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                path, content, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    atomic_write_bytes(path, content, fsync=self.fsync)
+                except Exception as e:
+                    with self._lock:
+                        self._failures.append((path, e))
+                    future.set_exception(e)
+                else:
+                    future.set_result(path)
+            finally:
+                self._queue.task_done()
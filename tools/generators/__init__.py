@@ -10,6 +10,7 @@ Available generators:
 - generate_value_chain: Step 9 Ecosystem Value Network (HTML)
 - generate_diagnostic: Step 10 Diagnostic Comment (DOCX/MD)
 - generate_executive_sprint_report: Executive Sprint Report (DOCX/MD)
+- fill_template: Fill any Markdown template in templates/ (MD)
 """
 
 from .generate_executive_brief import generate_executive_brief
@@ -17,11 +18,16 @@ from .generate_personas import generate_personas
 from .generate_value_chain import generate_value_chain
 from .generate_diagnostic import generate_diagnostic
 from .generate_executive_sprint_report import generate_executive_sprint_report
+from .fill_template import compile_template, fill_template, fill_templates, load_template
 
 __all__ = [
     'generate_executive_brief',
     'generate_personas',
     'generate_value_chain',
     'generate_diagnostic',
-    'generate_executive_sprint_report'
+    'generate_executive_sprint_report',
+    'compile_template',
+    'fill_template',
+    'fill_templates',
+    'load_template'
 ]
@@ -6,14 +6,19 @@ Base class providing common document generation functionality
 shared across all VIANEO document generators.
 """
 
+import argparse
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Optional, List, Any, BinaryIO, Callable, Dict, Union
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.constants import DocxStyles
 from core.utils import clean_text
+from core.write_behind import WriteBehindQueue
 
 # Check for python-docx availability
 try:
@@ -28,6 +33,10 @@ except ImportError:
     Document = None
 
 
+# A DOCX destination: a file path or a writable binary stream (e.g. BytesIO)
+DocxTarget = Union[str, Path, BinaryIO]
+
+
 def is_docx_available() -> bool:
     """Check if python-docx is available for document generation."""
     return DOCX_AVAILABLE
@@ -46,6 +55,9 @@ class BaseDocumentGenerator:
     3. Use the provided helper methods for consistent styling
     """
 
+    # Write byte-identical DOCX output for identical content
+    deterministic: bool = False
+
     def __init__(self):
         """Initialize base generator with default styles."""
         self.styles = DocxStyles()
@@ -279,15 +291,32 @@ class BaseDocumentGenerator:
 
         return para
 
-    def generate_docx(self, output_path: Path) -> bool:
+    def render_docx(self, **options) -> Optional[bytes]:
+        """
+        Generate the DOCX document in memory.
+
+        Args:
+            **options: Extra keyword arguments for generate_docx()
+
+        Returns:
+            DOCX file content, or None if generation failed
+        """
+        buffer = io.BytesIO()
+        if not self.generate_docx(buffer, **options):
+            return None
+        return buffer.getvalue()
+
+    def generate_docx(self, output_path: DocxTarget) -> bool:
         """
         Generate DOCX document.
 
         Override this method in subclasses to implement
-        document-specific content generation.
+        document-specific content generation. Implementations should
+        finish with save_docx(doc, output_path, self.deterministic)
+        so that paths, binary streams and deterministic output all work.
 
         Args:
-            output_path: Path to save the DOCX file
+            output_path: Path or binary stream to save the DOCX file to
 
         Returns:
             True if successful, False otherwise
@@ -295,3 +324,173 @@ class BaseDocumentGenerator:
         raise NotImplementedError(
             "Subclasses must implement generate_docx()"
         )
+
+
+def write_docx_output(
+    generator: BaseDocumentGenerator,
+    output_path: Path,
+    writer: Optional[WriteBehindQueue] = None,
+    **options
+) -> Optional[Path]:
+    """
+    Build a generator's DOCX at output_path, directly or via a write queue.
+
+    With a writer, the document is rendered in memory and handed to the
+    queue, so the caller can move on while the file is written; call
+    writer.flush() or writer.close() before reading the file.
+
+    Args:
+        generator: Document generator to build
+        output_path: Destination .docx path
+        writer: Optional write-behind queue for the finished bytes
+        **options: Extra keyword arguments for generate_docx()
+
+    Returns:
+        output_path, or None if generation failed
+    """
+    if writer is None:
+        return output_path if generator.generate_docx(output_path, **options) else None
+
+    content = generator.render_docx(**options)
+    if content is None:
+        return None
+    writer.submit(output_path, content)
+    return output_path
+
+
+# Human-readable labels used when reporting generated outputs
+OUTPUT_FORMAT_LABELS = {'md': 'Markdown', 'docx': 'DOCX', 'html': 'HTML'}
+
+
+class GenerationResult(dict):
+    """
+    Mapping of output format to generated path, with timings.
+
+    Behaves exactly like the Dict[str, Path] the generate_* functions have
+    always returned; timings holds the wall time of each output task and
+    total_seconds the wall time of the whole run.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.timings: Dict[str, float] = {}
+        self.total_seconds: float = 0.0
+        self.concurrent: bool = False
+
+    def timing_report(self) -> str:
+        """Return a short human-readable timing summary."""
+        mode = "concurrent" if self.concurrent else "sequential"
+        parts = [
+            f"{OUTPUT_FORMAT_LABELS.get(fmt, fmt)} {seconds:.2f}s"
+            for fmt, seconds in self.timings.items()
+        ]
+        return f"Timings ({mode}): {', '.join(parts)}; total {self.total_seconds:.2f}s"
+
+    def print_outputs(self) -> None:
+        """Print one "Generated <format>: <path>" line per output."""
+        for fmt, path in self.items():
+            print(f"Generated {OUTPUT_FORMAT_LABELS.get(fmt, fmt)}: {path}")
+
+
+def run_output_tasks(
+    tasks: Dict[str, Callable[[], Optional[Path]]],
+    concurrent: bool = True
+) -> GenerationResult:
+    """
+    Run one task per output format and collect the written paths.
+
+    The tasks only read the shared, already parsed data object, so with
+    concurrent=True they run on a small thread pool: the Markdown write
+    and the DOCX/HTML build overlap instead of running back to back.
+
+    Args:
+        tasks: Mapping of format to a callable returning the written path
+            (or None if that output failed)
+        concurrent: Run tasks in parallel threads when there is more than one
+
+    Returns:
+        GenerationResult in task order (failed outputs are omitted)
+    """
+    result = GenerationResult()
+    result.concurrent = concurrent and len(tasks) > 1
+    start = time.perf_counter()
+
+    def timed(fmt: str, task: Callable[[], Optional[Path]]) -> Optional[Path]:
+        task_start = time.perf_counter()
+        try:
+            return task()
+        finally:
+            result.timings[fmt] = time.perf_counter() - task_start
+
+    if result.concurrent:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {fmt: executor.submit(timed, fmt, task) for fmt, task in tasks.items()}
+            paths = {fmt: future.result() for fmt, future in futures.items()}
+    else:
+        paths = {fmt: timed(fmt, task) for fmt, task in tasks.items()}
+
+    result.total_seconds = time.perf_counter() - start
+    result.timings = {fmt: result.timings[fmt] for fmt in tasks}
+    for fmt, path in paths.items():
+        if path is not None:
+            result[fmt] = path
+    return result
+
+
+# =============================================================================
+# OUTPUT ARGUMENTS
+# =============================================================================
+
+def add_output_arguments(parser: argparse.ArgumentParser, docx: bool = True) -> None:
+    """Add --sequential/--timings (and --deterministic for DOCX generators) to a generator CLI."""
+    parser.add_argument(
+        '--sequential',
+        action='store_true',
+        help='Produce the outputs one after another instead of concurrently'
+    )
+    if docx:
+        parser.add_argument(
+            '--deterministic',
+            action='store_true',
+            help='Write byte-identical DOCX for identical content (honours SOURCE_DATE_EPOCH)'
+        )
+    parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='Print per-output generation timings'
+    )
+
+
+# =============================================================================
+# EVALUATION STORE INPUT
+# =============================================================================
+
+def add_store_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --from-store/--project to a generator CLI (alternative to --input)."""
+    parser.add_argument(
+        '--from-store',
+        type=Path,
+        metavar='DB',
+        help='Read project data from an evaluation store (portfolio/store.py) instead of --input'
+    )
+    parser.add_argument(
+        '--project', '-p',
+        help='Project name or source path in the store (with --from-store)'
+    )
+
+
+def load_store_input(parser: argparse.ArgumentParser, args: Any) -> Optional[Dict[str, Any]]:
+    """
+    Raw project data for --from-store, or None when it was not given.
+
+    Exits through parser.error() if the store or project cannot be found.
+    """
+    if getattr(args, 'from_store', None) is None:
+        return None
+
+    from portfolio.store import load_store_project
+
+    try:
+        return load_store_project(args.from_store, args.project)
+    except (FileNotFoundError, KeyError, ValueError) as e:
+        parser.error(str(e.args[0]) if e.args else str(e))
@@ -0,0 +1,737 @@
+#!/usr/bin/env python3
+"""
+VIANEO Template Fill Engine
+===========================
+
+Fills the Markdown templates in templates/ from project YAML/JSON data.
+
+A template is compiled once into literal segments and placeholders:
+- [Bracketed text] and ___ blanks are placeholders (checkboxes "- [ ]",
+  "- [x]" and links are not; "- [X] interviews with [Segment]" is a count)
+- consecutive list items or table rows with the same shape
+  ("1. [Feature 1]", "2. [Feature 2]", ...) become a repeating block
+- "- [ ] Option" lists under a bold label become a checkbox group
+
+Compiled templates are cached in memory by the SHA-256 of the template
+bytes (files are re-hashed only when their size or mtime changes), so
+filling a template for hundreds of projects parses it once.
+
+Placeholder keys (see --schema for a template's full key list):
+- a bold label before the placeholder names it:
+  "**Date Prepared:** [YYYY-MM-DD]" -> date_prepared, and
+  "**Project Name:**" followed by "[Enter official project name]" -> project_name
+- in a table, the column header names it: "| Target Client |" -> target_client
+- otherwise the placeholder text: "[Project Name]" -> project_name,
+  "[Gap description - impact]" -> gap_description
+
+Values are looked up in the data dict under the enclosing headings first
+("## Section B1: Project Name and Tagline" -> data["section_b1"]), then at
+the top level. A repeating block takes a list: items of a table are dicts
+keyed by column, list items are strings or dicts keyed by placeholder (the
+digits dropped: "[Feature 1]" -> feature). The list key is the bold label
+before the list ("**Key Features:**" -> key_features) or, for tables and
+unlabeled lists, the enclosing heading ("### Product Configurations" ->
+product_configurations). Placeholders without data are left as they are.
+
+Usage:
+    python fill_template.py --template templates/Executive_Brief_Template.md --input brief.yaml --output brief.md
+    python fill_template.py --template templates/Step12_Dashboard_Template.md --input evaluations/ --output filled/
+    python fill_template.py --template templates/40Q_Score_Summary_Template.md --schema
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils import load_data_file
+from core.write_behind import WriteBehindError, WriteBehindQueue
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# [text] (not "[ ]", not a link "[text](url)" / "[text][ref]") or a ___ / ___.___ blank
+PLACEHOLDER_PATTERN = re.compile(r'\[(?!\s*\])([^\[\]\n]+)\](?![(\[])|_{3,}(?:\._+)?')
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)(\d+\.|[-*+])\s+')
+CHECKBOX_PATTERN = re.compile(r'^(\s*[-*+]\s+)\[( |x|X)\]\s+(.+?)\s*$')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\s*\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$')
+HORIZONTAL_RULE_PATTERN = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+
+# **Label:** / **Label**: at the end of the text before a placeholder
+TRAILING_LABEL_PATTERN = re.compile(r'\*\*([^*]+?)\s*:?\s*\*\*\s*:?\s*$')
+# A line holding only a bold label
+LABEL_LINE_PATTERN = re.compile(r'^\s*(?:[-*+]\s+)?\*\*([^*]+?)\s*:?\s*\*\*\s*:?\s*$')
+
+# Placeholder texts longer than this are instructions, not names: a placeholder
+# alone on its line takes the section key instead, others are truncated
+MAX_KEY_WORDS = 5
+
+# Placeholder texts that say nothing about the value; the preceding word is used instead
+GENERIC_KEYS = {"", "x", "y", "n", "value", "yyyy_mm_dd"}
+
+# Fallback keys tried when a placeholder key is not in the data
+KEY_ALIASES = {
+    "project_name": ("company_name",),
+    "company_name": ("project_name",),
+    "project": ("project_name", "company_name"),
+    "company": ("company_name", "project_name"),
+    "date": ("report_date", "date_prepared"),
+    "date_prepared": ("date", "report_date"),
+    "prepared_by": ("author", "evaluator"),
+    "evaluator": ("prepared_by", "author"),
+}
+
+
+def slugify(text: str) -> str:
+    """
+    Data key for a label or heading.
+
+    The text is cut at the first " - ", ":" or "(" (explanations), a leading
+    "Enter"/"Insert" is dropped and the rest is snake_cased:
+    "Section B1: Project Name" -> "section_b1", "Enter project name" -> "project_name".
+    """
+    text = re.split(r'\s+[-–—]\s+|[:(]', text.replace('*', ''), maxsplit=1)[0]
+    text = re.sub(r'^\s*(enter|insert|add)\s+(the\s+|official\s+)?', '', text, flags=re.IGNORECASE)
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+def _strip_digits(key: str) -> str:
+    return re.sub(r'_?\d+$', '', key) or key
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass(frozen=True)
+class Placeholder:
+    """A value slot: the data key, its enclosing heading keys and the original text."""
+    key: str
+    raw: str
+    scope: Tuple[str, ...] = ()
+
+
+# A compiled line: literal strings and placeholders
+Line = Tuple[Union[str, Placeholder], ...]
+
+
+@dataclass(frozen=True)
+class CheckboxGroup:
+    """'- [ ] Option' lines under a bold label; options matching the value are ticked."""
+    key: str
+    options: Tuple[Tuple[str, str, Line], ...]  # (line prefix, option text, compiled option text)
+    scope: Tuple[str, ...] = ()
+    lines: Tuple[Line, ...] = ()                # original lines (used when the data has no value)
+
+
+@dataclass(frozen=True)
+class RepeatBlock:
+    """Same-shape list items or table rows, rendered once per list entry."""
+    key: str
+    kind: str                    # "list" or "table"
+    lines: Tuple[Line, ...]      # original lines (used when the data has no list)
+    row: Tuple[Line, ...]        # list: (item line,); table: one Line per cell
+    columns: Tuple[str, ...] = ()
+    scope: Tuple[str, ...] = ()
+    cells: Tuple[Tuple[Line, ...], ...] = ()  # table: original rows split into cells
+    labels: Tuple[str, ...] = ()              # table: first-cell key of each original row
+
+
+Node = Union[Line, CheckboxGroup, RepeatBlock]
+
+
+@dataclass
+class FilledTemplate:
+    """Result of filling a template."""
+    text: str
+    filled: int = 0
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+class _Filler:
+    """Rendering state for one fill() call."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data if isinstance(data, dict) else {}
+        self.filled = 0
+        self.missing: Dict[str, None] = {}
+
+    def lookup(self, key: str, scope: Sequence[str], local: Optional[Dict[str, Any]] = None) -> Any:
+        keys = (key,) + KEY_ALIASES.get(key, ())
+        if local is not None:
+            for candidate in keys:
+                if local.get(candidate) is not None:
+                    return local[candidate]
+            return None
+        for depth in range(len(scope), -1, -1):
+            container = self.data
+            for part in scope[:depth]:
+                container = container.get(part) if isinstance(container, dict) else None
+            if isinstance(container, dict):
+                for candidate in keys:
+                    if container.get(candidate) is not None:
+                        return container[candidate]
+        return None
+
+    def render_line(self, line: Line, local: Optional[Dict[str, Any]] = None) -> str:
+        parts = []
+        for part in line:
+            if isinstance(part, str):
+                parts.append(part)
+                continue
+            value = self.lookup(part.key, part.scope, local)
+            if value is None or isinstance(value, dict):
+                parts.append(part.raw)
+                self.missing.setdefault(part.key)
+            else:
+                parts.append(format_value(value))
+                self.filled += 1
+        return "".join(parts)
+
+
+def format_value(value: Any) -> str:
+    """Text for a data value (floats without trailing zeros, lists comma-joined)."""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, float):
+        return f"{value:g}"
+    if isinstance(value, (list, tuple)):
+        return ", ".join(format_value(item) for item in value)
+    return str(value)
+
+
+@dataclass
+class CompiledTemplate:
+    """A parsed template: a sequence of lines, checkbox groups and repeating blocks."""
+    name: str
+    digest: str
+    nodes: Tuple[Node, ...]
+
+    def fill(self, data: Dict[str, Any]) -> FilledTemplate:
+        """
+        Fill the template from project data.
+
+        Args:
+            data: Parsed project YAML/JSON
+
+        Returns:
+            FilledTemplate (missing lists placeholder keys without data)
+        """
+        filler = _Filler(data)
+        out: List[str] = []
+        for node in self.nodes:
+            if isinstance(node, tuple):
+                out.append(filler.render_line(node))
+            elif isinstance(node, CheckboxGroup):
+                out.extend(self._render_checkboxes(node, filler))
+            else:
+                out.extend(self._render_block(node, filler))
+        return FilledTemplate("\n".join(out), filler.filled, list(filler.missing))
+
+    @staticmethod
+    def _render_checkboxes(group: CheckboxGroup, filler: _Filler) -> List[str]:
+        value = filler.lookup(group.key, group.scope)
+        if value is None:
+            return [filler.render_line(line) for line in group.lines]
+        chosen = {format_value(v).strip().lower() for v in (value if isinstance(value, list) else [value])}
+        filler.filled += 1
+        lines = []
+        for prefix, option, compiled in group.options:
+            # "Other: [Specify]" is ticked by "Other"
+            name = PLACEHOLDER_PATTERN.split(option, maxsplit=1)[0].strip(' :-–—').lower()
+            mark = 'x' if option.strip().lower() in chosen or name in chosen else ' '
+            lines.append(f"{prefix}[{mark}] {filler.render_line(compiled)}")
+        return lines
+
+    @staticmethod
+    def _render_block(block: RepeatBlock, filler: _Filler) -> List[str]:
+        items = filler.lookup(block.key, block.scope)
+        if isinstance(items, dict) and block.kind == "table":
+            # Fixed rows keyed by their first cell: {"legitimacy": {"score": 4.2}}
+            lines = []
+            for line, cells, label in zip(block.lines, block.cells, block.labels):
+                row = items.get(label)
+                if isinstance(row, dict):
+                    lines.append("| " + " | ".join(filler.render_line(cell, row).strip() for cell in cells) + " |")
+                else:
+                    lines.append(filler.render_line(line))
+            return lines
+        if not isinstance(items, list):
+            if items is not None:
+                filler.missing.setdefault(block.key)
+            return [filler.render_line(line) for line in block.lines]
+
+        lines = []
+        for index, item in enumerate(items, 1):
+            if block.kind == "table":
+                if not isinstance(item, dict):
+                    item = {block.columns[0]: item}
+                cells = []
+                for column, cell in zip(block.columns, block.row):
+                    if column in item and item[column] is not None:
+                        cells.append(format_value(item[column]))
+                        filler.filled += 1
+                    else:
+                        cells.append(filler.render_line(cell, item).strip())
+                lines.append("| " + " | ".join(cells) + " |")
+            else:
+                row = block.row[0]
+                if not isinstance(item, dict):
+                    keys = [part.key for part in row if isinstance(part, Placeholder)]
+                    item = {keys[0]: item} if keys else {}
+                text = filler.render_line(row, item)
+                lines.append(re.sub(r'^(\s*)\d+\.', lambda m: f"{m.group(1)}{index}.", text, count=1))
+        return lines
+
+    @property
+    def placeholders(self) -> List[Placeholder]:
+        """Every placeholder outside repeating blocks, in template order."""
+        return [part for node in self.nodes if isinstance(node, tuple)
+                for part in node if isinstance(part, Placeholder)]
+
+    def schema(self) -> Dict[str, Any]:
+        """Nested skeleton of the data keys the template reads (for --schema)."""
+        skeleton: Dict[str, Any] = {}
+
+        def slot(scope: Sequence[str]) -> Dict[str, Any]:
+            container = skeleton
+            for part in scope:
+                child = container.setdefault(part, {})
+                if not isinstance(child, dict):
+                    break  # heading slug already used as a value key
+                container = child
+            return container
+
+        for node in self.nodes:
+            if isinstance(node, tuple):
+                for part in node:
+                    if isinstance(part, Placeholder):
+                        slot(part.scope).setdefault(part.key, part.raw)
+            elif isinstance(node, CheckboxGroup):
+                slot(node.scope).setdefault(node.key, [option for _, option, _ in node.options])
+            elif node.kind == "table":
+                slot(node.scope).setdefault(node.key, [{
+                    column: "".join(p if isinstance(p, str) else p.raw for p in cell).strip()
+                    for column, cell in zip(node.columns, node.row)
+                }])
+            else:
+                keys = {part.key: part.raw for part in node.row[0] if isinstance(part, Placeholder)}
+                slot(node.scope).setdefault(node.key, [next(iter(keys.values()))] if len(keys) == 1 else [keys])
+        return skeleton
+
+
+# =============================================================================
+# COMPILER
+# =============================================================================
+
+def _compile_line(
+    text: str,
+    scope: Tuple[str, ...],
+    label: Optional[str] = None,
+    cell_key: Optional[str] = None
+) -> Line:
+    """Split a line into literals and placeholders."""
+    parts: List[Union[str, Placeholder]] = []
+    position = 0
+    matches = list(PLACEHOLDER_PATTERN.finditer(text))
+    if len(matches) == 1 and matches[0].group(1) in ('x', 'X') and _checkbox(text):
+        matches = []  # "- [x] Option" is a ticked checkbox, not a placeholder
+    for match in matches:
+        prefix = text[position:match.start()]
+        own = slugify(match.group(1) or "")
+        trailing = TRAILING_LABEL_PATTERN.search(prefix)
+        if cell_key and len(matches) == 1:
+            key = cell_key
+        elif trailing:
+            key = slugify(trailing.group(1))
+        elif label and len(matches) == 1 and not text[:match.start()].strip() and not text[match.end():].strip():
+            key = label
+        elif own in GENERIC_KEYS:
+            words = re.findall(r'[A-Za-z][A-Za-z0-9]*', prefix)
+            key = slugify(words[-1]) if words else (cell_key or "value")
+        elif own.count('_') >= MAX_KEY_WORDS:
+            alone = len(matches) == 1 and not text[:match.start()].strip(' >-*') and not text[match.end():].strip()
+            key = scope[-1] if alone and scope else '_'.join(own.split('_')[:MAX_KEY_WORDS])
+        else:
+            key = own
+        if prefix:
+            parts.append(prefix)
+        # A placeholder named after its section is a value of the parent section
+        parts.append(Placeholder(key or "value", match.group(0), scope[:-1] if scope and key == scope[-1] else scope))
+        position = match.end()
+    if position < len(text) or not parts:
+        parts.append(text[position:])
+    return tuple(parts)
+
+
+def _checkbox(line: str) -> Optional[re.Match]:
+    """CHECKBOX_PATTERN match, unless "[x]" is a count placeholder ("- [X] interviews with [Segment]")."""
+    match = CHECKBOX_PATTERN.match(line)
+    if match and match.group(2) != ' ' and PLACEHOLDER_PATTERN.search(match.group(3)):
+        return None
+    return match
+
+
+def _has_placeholder(line: Line) -> bool:
+    return any(isinstance(part, Placeholder) for part in line)
+
+
+def _shape(line: Line) -> Tuple[Any, ...]:
+    """Line with digits removed, to compare repeated items ("[Feature 1]" vs "[Feature 2]")."""
+    return tuple(
+        re.sub(r'\d+', '#', part) if isinstance(part, str) else _strip_digits(part.key)
+        for part in line
+    )
+
+
+def _split_cells(row: str) -> List[str]:
+    cells = row.strip()
+    if cells.startswith('|'):
+        cells = cells[1:]
+    if cells.endswith('|'):
+        cells = cells[:-1]
+    return cells.split('|')
+
+
+def _generalize(line: Line) -> Line:
+    """Item template of a repeating list: placeholder keys without their digits."""
+    return tuple(
+        part if isinstance(part, str) else Placeholder(_strip_digits(part.key), part.raw, part.scope)
+        for part in line
+    )
+
+
+def compile_template(text: str, name: str = "<template>") -> CompiledTemplate:
+    """
+    Parse template text into a CompiledTemplate.
+
+    Args:
+        text: Markdown template
+        name: Name used in messages
+
+    Returns:
+        CompiledTemplate
+    """
+    lines = text.split('\n')
+    nodes: List[Node] = []
+    headings: List[Tuple[int, str]] = []
+    table_keys: Dict[str, int] = {}
+    label: Optional[str] = None  # bold label on the previous non-blank line
+    in_fence = False
+    index = 0
+
+    def scope() -> Tuple[str, ...]:
+        return tuple(slug for _, slug in headings)
+
+    while index < len(lines):
+        line = lines[index]
+
+        if line.lstrip().startswith('```') or in_fence:
+            if line.lstrip().startswith('```'):
+                in_fence = not in_fence
+            nodes.append(_compile_line(line, scope()))
+            index += 1
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            # The document title (#) is not a data scope
+            level = len(heading.group(1))
+            while headings and headings[-1][0] >= level:
+                headings.pop()
+            if level > 1:
+                headings.append((level, slugify(heading.group(2))))
+            nodes.append(_compile_line(line, scope()[:-1] if level > 1 else scope()))
+            label = None
+            index += 1
+            continue
+
+        # Tables: header, separator, body rows
+        if line.lstrip().startswith('|') and index + 1 < len(lines) and \
+                TABLE_SEPARATOR_PATTERN.match(lines[index + 1]):
+            columns = tuple(
+                slugify(cell) or f"column_{i + 1}" for i, cell in enumerate(_split_cells(line))
+            )
+            nodes.append((line,))
+            nodes.append((lines[index + 1],))
+            index += 2
+            body = []
+            while index < len(lines) and lines[index].lstrip().startswith('|'):
+                body.append(lines[index])
+                index += 1
+            compiled = []
+            for row in body:
+                cells = _split_cells(row)
+                compiled.append(tuple(
+                    _compile_line(cell, scope(), cell_key=columns[i] if i < len(columns) else None)
+                    for i, cell in enumerate(cells)
+                ))
+            template_rows = [row for row in compiled if any(_has_placeholder(cell) for cell in row)]
+            if template_rows and len(template_rows[0]) == len(columns):
+                base = scope()[-1] if scope() else "table"
+                count = table_keys.get(base, 0) + 1
+                table_keys[base] = count
+                key = base if count == 1 else f"{base}_{count}"
+                labels = tuple(
+                    slugify("".join(p if isinstance(p, str) else p.raw.strip('[]') for p in row[0]))
+                    for row in compiled
+                )
+                nodes.append(RepeatBlock(
+                    key, "table", tuple(_compile_line_from_cells(row) for row in compiled),
+                    template_rows[0], columns, scope()[:-1], tuple(compiled), labels
+                ))
+            else:
+                nodes.extend((row,) for row in body)
+            label = None
+            continue
+
+        # Checkbox groups under a bold label
+        checkbox = _checkbox(line)
+        if checkbox and label:
+            options, originals = [], []
+            while index < len(lines):
+                match = _checkbox(lines[index])
+                if not match:
+                    break
+                options.append((match.group(1), match.group(3), _compile_line(match.group(3), scope())))
+                originals.append(_compile_line(lines[index], scope()))
+                index += 1
+            nodes.append(CheckboxGroup(label, tuple(options), scope(), tuple(originals)))
+            label = None
+            continue
+
+        # Repeating list items
+        item = LIST_ITEM_PATTERN.match(line)
+        compiled_line = _compile_line(line, scope(), label if not item else None)
+        if item and _has_placeholder(compiled_line) and not checkbox:
+            group = [compiled_line]
+            marker_numbered = item.group(2)[0].isdigit()
+            probe = index + 1
+            while probe < len(lines):
+                next_item = LIST_ITEM_PATTERN.match(lines[probe])
+                if not next_item or next_item.group(1) != item.group(1) or \
+                        next_item.group(2)[0].isdigit() != marker_numbered:
+                    break
+                candidate = _compile_line(lines[probe], scope())
+                if _shape(candidate) != _shape(compiled_line):
+                    break
+                group.append(candidate)
+                probe += 1
+            if len(group) > 1:
+                key = label or (scope()[-1] if scope() else "items")
+                nodes.append(RepeatBlock(key, "list", tuple(group), (_generalize(compiled_line),),
+                                         scope=scope()[:-1] if not label else scope()))
+                index = probe
+                label = None
+                continue
+
+        nodes.append(compiled_line)
+        if line.strip():
+            match = LABEL_LINE_PATTERN.match(line)
+            label = slugify(match.group(1)) if match else None
+        index += 1
+
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return CompiledTemplate(name, digest, tuple(nodes))
+
+
+def _compile_line_from_cells(cells: Tuple[Line, ...]) -> Line:
+    """A table row as one Line (cells joined with pipes)."""
+    parts: List[Union[str, Placeholder]] = ["|"]
+    for cell in cells:
+        parts.extend(cell)
+        parts.append("|")
+    return tuple(parts)
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# SHA-256 of template bytes -> compiled template
+_compiled: Dict[str, CompiledTemplate] = {}
+
+# Resolved path -> (size, mtime_ns, digest)
+_digests: Dict[str, Tuple[int, int, str]] = {}
+
+
+def load_template(path: Union[str, Path]) -> CompiledTemplate:
+    """
+    Compiled template for a file, cached by content hash.
+
+    The file is hashed again only when its size or mtime changed, and
+    compiled again only when its content did.
+
+    Raises:
+        FileNotFoundError: If the template does not exist
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"Template not found: {path}")
+    key = str(path.resolve())
+    stat = path.stat()
+    known = _digests.get(key)
+    if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns and known[2] in _compiled:
+        return _compiled[known[2]]
+
+    content = path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    _digests[key] = (stat.st_size, stat.st_mtime_ns, digest)
+    if digest not in _compiled:
+        _compiled[digest] = compile_template(content.decode('utf-8'), path.name)
+    return _compiled[digest]
+
+
+def clear_template_cache() -> None:
+    """Forget all compiled templates."""
+    _compiled.clear()
+    _digests.clear()
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def fill_template(template: Union[str, Path], data: Dict[str, Any]) -> FilledTemplate:
+    """
+    Fill a template file from project data.
+
+    Args:
+        template: Template path
+        data: Parsed project YAML/JSON
+
+    Returns:
+        FilledTemplate
+    """
+    return load_template(template).fill(data)
+
+
+def fill_templates(
+    template: Union[str, Path],
+    projects: Iterable[Tuple[str, Dict[str, Any]]]
+) -> Iterator[Tuple[str, FilledTemplate]]:
+    """
+    Fill one template for many projects (compiled once).
+
+    Args:
+        template: Template path
+        projects: (source, data) pairs
+
+    Yields:
+        (source, FilledTemplate)
+    """
+    compiled = load_template(template)
+    for source, data in projects:
+        yield source, compiled.fill(data)
+
+
+def output_name(source: Union[str, Path], template: Union[str, Path]) -> str:
+    """Output file name for a project: <project stem>_<template name without _Template>.md"""
+    stem = re.sub(r'_?Template$', '', Path(template).stem, flags=re.IGNORECASE)
+    return f"{Path(source).stem}_{stem}.md"
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Fill a VIANEO Markdown template from project YAML/JSON"
+    )
+    parser.add_argument(
+        '--template', '-t',
+        type=Path,
+        required=True,
+        help='Template file (e.g. templates/Executive_Brief_Template.md)'
+    )
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        nargs='+',
+        help='Project data files and/or directories'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='Output file (one input) or directory (default: stdout for one input)'
+    )
+    parser.add_argument(
+        '--schema',
+        action='store_true',
+        help='Print the data keys the template reads, as YAML'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Exit with an error if any placeholder has no data'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        compiled = load_template(args.template)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.schema:
+        print(yaml.dump(compiled.schema(), default_flow_style=False, allow_unicode=True, sort_keys=False))
+        return 0
+    if not args.input:
+        parser.error("--input is required (or use --schema)")
+
+    from converters.portfolio_to_html import collect_portfolio_files
+    files = collect_portfolio_files(args.input)
+    if not files:
+        print("Error: no project data files found")
+        return 1
+
+    start = time.perf_counter()
+    incomplete = 0
+    projects = ((str(path), load_data_file(path) or {}) for path in files)
+
+    if args.output is None and len(files) == 1:
+        _, result = next(fill_templates(args.template, projects))
+        sys.stdout.write(result.text)
+        incomplete = 0 if result.complete else 1
+    else:
+        single_file = len(files) == 1 and args.output is not None and args.output.suffix.lower() == '.md'
+        directory = args.output.parent if single_file else (args.output or Path('.'))
+        directory.mkdir(parents=True, exist_ok=True)
+        try:
+            with WriteBehindQueue() as writer:
+                for source, result in fill_templates(args.template, projects):
+                    target = args.output if single_file else directory / output_name(source, args.template)
+                    writer.submit(target, result.text)
+                    if not result.complete:
+                        incomplete += 1
+                        print(f"{target}: {len(result.missing)} placeholder(s) without data", file=sys.stderr)
+        except WriteBehindError as e:
+            for path, error in e.failures:
+                print(f"Error writing {path}: {error}", file=sys.stderr)
+            return 1
+        print(f"Filled {len(files)} project(s) in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    return 1 if args.strict and incomplete else 0
+
+
+if __name__ == '__main__':
+    exit(main())
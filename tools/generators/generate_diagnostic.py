@@ -4,10 +4,12 @@ VIANEO Diagnostic Comment Generator
 ====================================
 
 Generates professional Step 10 VIANEO Diagnostic Comment documents
-in both DOCX and Markdown formats.
+in DOCX, Markdown and HTML formats. The layout is built once as a
+core.document_model tree and rendered to each format.
 
 Usage:
     python generate_diagnostic.py --input diagnostic_data.yaml --output DiagnosticComment
+    python generate_diagnostic.py --input diagnostic_data.yaml --format all
 """
 
 import argparse
@@ -15,7 +17,7 @@ import json
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO
 from dataclasses import dataclass, field
 
 import sys
@@ -23,19 +25,28 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.constants import DocxStyles, ScoreThresholds, VIANEO_DIMENSIONS
 from core.utils import format_date, safe_filename, clean_text, load_data_file
-from generators.base import BaseDocumentGenerator, is_docx_available, DOCX_AVAILABLE
-
-# Import python-docx components if available
-if DOCX_AVAILABLE:
-    from docx import Document
-    from docx.shared import Pt, Inches, RGBColor, Twips
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.table import WD_TABLE_ALIGNMENT
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
-else:
-    # Type hint stub when python-docx not available
-    Document = None
+from core.document_model import (
+    Cell,
+    DocumentModel,
+    Run,
+    bold,
+    render_docx,
+    render_html,
+    render_markdown,
+)
+from core.deterministic import save_docx
+from core.write_behind import WriteBehindQueue
+from generators.base import (
+    BaseDocumentGenerator,
+    DocxTarget,
+    GenerationResult,
+    add_output_arguments,
+    add_store_arguments,
+    load_store_input,
+    is_docx_available,
+    run_output_tasks,
+    write_docx_output,
+)
 
 
 # =============================================================================
@@ -97,6 +108,90 @@ class DiagnosticData:
     next_review: str = ""
 
 
+# =============================================================================
+# DOCUMENT MODEL
+# =============================================================================
+
+def build_document(data: DiagnosticData) -> DocumentModel:
+    """
+    Build the format-neutral diagnostic comment (rendered to MD, DOCX and HTML).
+
+    Args:
+        data: Diagnostic data
+
+    Returns:
+        DocumentModel
+    """
+    subheading = DocxStyles.MEDIUM_GRAY
+    doc = DocumentModel(title=f"{data.project_name}: Vianeo Main Diagnostic Comment")
+
+    # Header
+    doc.heading(doc.title, level=0)
+    doc.fields([
+        ("Date", data.date or format_date()),
+        ("Assessment Framework", "Vianeo Business Model Evaluation Playbook"),
+        ("Overall Maturity", data.overall_maturity)
+    ])
+    doc.rule()
+    doc.spacer()
+
+    # Executive Diagnostic
+    doc.heading("Executive Diagnostic", level=1)
+    for heading, text in [
+        ("Strengths", data.strengths),
+        ("Risks", data.risks),
+        ("Near-term Actions (30-60 days)", data.near_term_actions),
+        ("Evidence Gaps", data.evidence_gaps),
+    ]:
+        doc.heading(heading, level=2, color=subheading)
+        doc.paragraph(clean_text(text))
+    doc.rule()
+
+    # Dimension Summary (score cells shaded by threshold)
+    doc.heading("Dimension Summary", level=1)
+    doc.table(
+        ["Dimension", "Score", "Interpretation"],
+        (
+            [
+                bold(dim.name),
+                Cell([Run(f"{dim.score:.1f}/5")], fill=dim.color_code, align="center", highlight=True),
+                f"{dim.status_keyword} - {dim.interpretation}"
+            ]
+            for dim in data.dimension_scores
+        ),
+        widths=[2, 1, 3.5]
+    )
+    doc.spacer()
+    doc.paragraph(
+        Run("Overall Status: ", bold=True, size=DocxStyles.BODY_SIZE),
+        clean_text(data.overall_status),
+        style="plain"
+    )
+    doc.rule()
+
+    # Critical Path Forward
+    doc.heading("Critical Path Forward", level=1)
+    doc.heading("Immediate Priority (Weeks 1-4)", level=2, color=subheading)
+    doc.numbered(data.immediate_priorities[:3])
+    doc.heading("Short-term Priority (Months 2-3)", level=2, color=subheading)
+    doc.numbered(data.short_term_priorities[:4])
+    doc.heading("Medium-term Priority (Months 4-6)", level=2, color=subheading)
+    doc.numbered(data.medium_term_priorities[:4])
+    doc.heading("Success Metrics", level=2, color=subheading)
+    doc.bullets(data.success_metrics[:6])
+    doc.rule()
+    doc.spacer()
+
+    # Footer Metadata
+    doc.fields([
+        ("Assessment Methodology", data.assessment_methodology),
+        ("Evidence Sources", data.evidence_sources),
+        ("Next Review", data.next_review)
+    ], compact=False)
+
+    return doc
+
+
 # =============================================================================
 # DOCX GENERATION
 # =============================================================================
@@ -104,317 +199,87 @@ class DiagnosticData:
 class DiagnosticDocumentGenerator(BaseDocumentGenerator):
     """Generator for VIANEO Diagnostic Comment documents."""
 
-    def __init__(self, data: DiagnosticData):
+    def __init__(self, data: DiagnosticData, document: Optional[DocumentModel] = None):
         super().__init__()
         self.data = data
+        self._document = document
 
-    def generate_docx(self, output_path: Path) -> bool:
+    @property
+    def document(self) -> DocumentModel:
+        """The document model (built on first use, shared by every format)."""
+        if self._document is None:
+            self._document = build_document(self.data)
+        return self._document
+
+    def generate_docx(self, output_path: DocxTarget) -> bool:
         """Generate professional DOCX diagnostic document."""
         if not is_docx_available():
             print("Error: python-docx not installed")
             return False
 
-        doc = Document()
-        self._setup_document(doc)
-
-        # Add content
-        self._add_header(doc)
-        self._add_executive_diagnostic(doc)
-        self._add_dimension_summary(doc)
-        self._add_critical_path(doc)
-        self._add_footer_metadata(doc)
-
-        # Save document
-        doc.save(str(output_path))
+        save_docx(render_docx(self.document, self.styles), output_path, self.deterministic)
         return True
 
-    # Note: _setup_document() and _add_styled_heading() are inherited from BaseDocumentGenerator
-
-    def _add_header(self, doc: Document) -> None:
-        """Add document header."""
-        # Title
-        title = doc.add_heading(
-            f"{self.data.project_name}: Vianeo Main Diagnostic Comment",
-            level=0
-        )
-        for run in title.runs:
-            run.font.name = self.styles.FONT_FAMILY
-            run.font.size = Pt(self.styles.TITLE_SIZE)
-            run.font.color.rgb = RGBColor.from_string(self.styles.PRIMARY_BLUE)
-
-        # Metadata
-        meta_items = [
-            ("Date", self.data.date or format_date()),
-            ("Assessment Framework", "Vianeo Business Model Evaluation Playbook"),
-            ("Overall Maturity", self.data.overall_maturity)
-        ]
-
-        for label, value in meta_items:
-            para = doc.add_paragraph()
-            run = para.add_run(f"{label}: ")
-            run.bold = True
-            run.font.size = Pt(self.styles.METADATA_SIZE)
-            run.font.color.rgb = RGBColor.from_string(self.styles.LIGHT_GRAY)
-
-            run = para.add_run(value)
-            run.font.size = Pt(self.styles.METADATA_SIZE)
-            run.font.color.rgb = RGBColor.from_string(self.styles.LIGHT_GRAY)
-
-        doc.add_paragraph()  # Spacer
-
-    def _add_executive_diagnostic(self, doc: Document) -> None:
-        """Add Executive Diagnostic section."""
-        self._add_styled_heading(doc, "Executive Diagnostic", level=1)
-
-        # Strengths
-        self._add_styled_heading(doc, "Strengths", level=2, color=self.styles.MEDIUM_GRAY)
-        para = doc.add_paragraph()
-        run = para.add_run(clean_text(self.data.strengths))
-        run.font.name = self.styles.FONT_FAMILY
-        run.font.size = Pt(self.styles.BODY_SIZE)
-        run.font.color.rgb = RGBColor.from_string(self.styles.BODY_GRAY)
-
-        # Risks
-        self._add_styled_heading(doc, "Risks", level=2, color=self.styles.MEDIUM_GRAY)
-        para = doc.add_paragraph()
-        run = para.add_run(clean_text(self.data.risks))
-        run.font.name = self.styles.FONT_FAMILY
-        run.font.size = Pt(self.styles.BODY_SIZE)
-        run.font.color.rgb = RGBColor.from_string(self.styles.BODY_GRAY)
-
-        # Near-term Actions
-        self._add_styled_heading(
-            doc, "Near-term Actions (30-60 days)",
-            level=2, color=self.styles.MEDIUM_GRAY
-        )
-        para = doc.add_paragraph()
-        run = para.add_run(clean_text(self.data.near_term_actions))
-        run.font.name = self.styles.FONT_FAMILY
-        run.font.size = Pt(self.styles.BODY_SIZE)
-        run.font.color.rgb = RGBColor.from_string(self.styles.BODY_GRAY)
-
-        # Evidence Gaps
-        self._add_styled_heading(doc, "Evidence Gaps", level=2, color=self.styles.MEDIUM_GRAY)
-        para = doc.add_paragraph()
-        run = para.add_run(clean_text(self.data.evidence_gaps))
-        run.font.name = self.styles.FONT_FAMILY
-        run.font.size = Pt(self.styles.BODY_SIZE)
-        run.font.color.rgb = RGBColor.from_string(self.styles.BODY_GRAY)
-
-    def _add_dimension_summary(self, doc: Document) -> None:
-        """Add Dimension Summary section with table."""
-        self._add_styled_heading(doc, "Dimension Summary", level=1)
-
-        # Create table
-        table = doc.add_table(rows=1, cols=3)
-        table.style = 'Table Grid'
-
-        # Set column widths
-        for i, width in enumerate([Inches(2), Inches(1), Inches(3.5)]):
-            for cell in table.columns[i].cells:
-                cell.width = width
-
-        # Headers
-        headers = ["Dimension", "Score", "Interpretation"]
-        header_cells = table.rows[0].cells
-        for i, header in enumerate(headers):
-            header_cells[i].text = header
-            for para in header_cells[i].paragraphs:
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                for run in para.runs:
-                    run.bold = True
-                    run.font.size = Pt(11)
-            # Add header shading
-            shading = OxmlElement('w:shd')
-            shading.set(qn('w:fill'), self.styles.TABLE_HEADER_BG)
-            header_cells[i]._tc.get_or_add_tcPr().append(shading)
-
-        # Data rows
-        for dim in self.data.dimension_scores:
-            row = table.add_row()
-            cells = row.cells
-
-            # Dimension name
-            cells[0].text = dim.name
-            for para in cells[0].paragraphs:
-                for run in para.runs:
-                    run.bold = True
-
-            # Score with color coding
-            cells[1].text = f"{dim.score:.1f}/5"
-            for para in cells[1].paragraphs:
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                for run in para.runs:
-                    run.bold = True
-            # Add score shading
-            shading = OxmlElement('w:shd')
-            shading.set(qn('w:fill'), dim.color_code.replace('#', ''))
-            cells[1]._tc.get_or_add_tcPr().append(shading)
-
-            # Interpretation
-            cells[2].text = f"{dim.status_keyword} - {dim.interpretation}"
-
-        # Overall Status
-        doc.add_paragraph()
-        para = doc.add_paragraph()
-        run = para.add_run("Overall Status: ")
-        run.bold = True
-        run.font.size = Pt(self.styles.BODY_SIZE)
-        para.add_run(clean_text(self.data.overall_status))
-
-    def _add_critical_path(self, doc: Document) -> None:
-        """Add Critical Path Forward section."""
-        self._add_styled_heading(doc, "Critical Path Forward", level=1)
-
-        # Immediate Priority (Weeks 1-4)
-        self._add_styled_heading(
-            doc, "Immediate Priority (Weeks 1-4)",
-            level=2, color=self.styles.MEDIUM_GRAY
-        )
-        for i, action in enumerate(self.data.immediate_priorities[:3], 1):
-            para = doc.add_paragraph(style='List Number')
-            para.add_run(action)
-
-        # Short-term Priority (Months 2-3)
-        self._add_styled_heading(
-            doc, "Short-term Priority (Months 2-3)",
-            level=2, color=self.styles.MEDIUM_GRAY
-        )
-        for i, action in enumerate(self.data.short_term_priorities[:4], 1):
-            para = doc.add_paragraph(style='List Number')
-            para.add_run(action)
-
-        # Medium-term Priority (Months 4-6)
-        self._add_styled_heading(
-            doc, "Medium-term Priority (Months 4-6)",
-            level=2, color=self.styles.MEDIUM_GRAY
-        )
-        for i, action in enumerate(self.data.medium_term_priorities[:4], 1):
-            para = doc.add_paragraph(style='List Number')
-            para.add_run(action)
-
-        # Success Metrics
-        self._add_styled_heading(
-            doc, "Success Metrics",
-            level=2, color=self.styles.MEDIUM_GRAY
-        )
-        for metric in self.data.success_metrics[:6]:
-            para = doc.add_paragraph(style='List Bullet')
-            para.add_run(metric)
-
-    def _add_footer_metadata(self, doc: Document) -> None:
-        """Add footer metadata section."""
-        # Horizontal rule (simulated with paragraph border)
-        doc.add_paragraph()
-
-        # Metadata
-        meta_items = [
-            ("Assessment Methodology", self.data.assessment_methodology),
-            ("Evidence Sources", self.data.evidence_sources),
-            ("Next Review", self.data.next_review)
-        ]
-
-        for label, value in meta_items:
-            para = doc.add_paragraph()
-            run = para.add_run(f"{label}: ")
-            run.bold = True
-            run.font.size = Pt(self.styles.METADATA_SIZE)
-            run.font.color.rgb = RGBColor.from_string(self.styles.LIGHT_GRAY)
-
-            run = para.add_run(value)
-            run.font.size = Pt(self.styles.METADATA_SIZE)
-            run.font.color.rgb = RGBColor.from_string(self.styles.LIGHT_GRAY)
+    def render_html(self) -> str:
+        """Generate the diagnostic comment as a standalone HTML page."""
+        return render_html(self.document)
 
 
 # =============================================================================
 # MARKDOWN GENERATION
 # =============================================================================
 
-def generate_markdown(data: DiagnosticData) -> str:
+def generate_markdown(data: DiagnosticData, document: Optional[DocumentModel] = None) -> str:
     """Generate markdown version of diagnostic comment."""
-    md = f"""# {data.project_name}: Vianeo Main Diagnostic Comment
-
-**Date:** {data.date or format_date()}
-**Assessment Framework:** Vianeo Business Model Evaluation Playbook
-**Overall Maturity:** {data.overall_maturity}
-
----
-
-## Executive Diagnostic
-
-### Strengths
-
-{clean_text(data.strengths)}
-
-### Risks
-
-{clean_text(data.risks)}
-
-### Near-term Actions (30-60 days)
-
-{clean_text(data.near_term_actions)}
+    return render_markdown(document or build_document(data))
 
-### Evidence Gaps
 
-{clean_text(data.evidence_gaps)}
+def write_markdown(
+    data: DiagnosticData,
+    stream: TextIO,
+    document: Optional[DocumentModel] = None
+) -> None:
+    """Write markdown version of diagnostic comment to an open text stream."""
+    render_markdown(document or build_document(data), stream)
 
----
 
-## Dimension Summary
-
-| Dimension | Score | Interpretation |
-|-----------|-------|----------------|
-"""
-
-    for dim in data.dimension_scores:
-        status = ScoreThresholds.get_status_keyword(dim.score)
-        md += f"| **{dim.name}** | {dim.score:.1f}/5 | {status} - {dim.interpretation} |\n"
-
-    md += f"""
-**Overall Status:** {clean_text(data.overall_status)}
-
----
-
-## Critical Path Forward
-
-### Immediate Priority (Weeks 1-4)
-
-"""
-    for i, action in enumerate(data.immediate_priorities[:3], 1):
-        md += f"{i}. {action}\n"
-
-    md += """
-### Short-term Priority (Months 2-3)
-
-"""
-    for i, action in enumerate(data.short_term_priorities[:4], 1):
-        md += f"{i}. {action}\n"
-
-    md += """
-### Medium-term Priority (Months 4-6)
-
-"""
-    for i, action in enumerate(data.medium_term_priorities[:4], 1):
-        md += f"{i}. {action}\n"
-
-    md += """
-### Success Metrics
-
-"""
-    for metric in data.success_metrics[:6]:
-        md += f"- {metric}\n"
-
-    md += f"""
----
-
-**Assessment Methodology:** {data.assessment_methodology}
+# =============================================================================
+# DATA PARSING
+# =============================================================================
 
-**Evidence Sources:** {data.evidence_sources}
+def parse_diagnostic_data(raw_data: Dict[str, Any]) -> DiagnosticData:
+    """
+    Build DiagnosticData from a raw dictionary (as loaded from JSON/YAML).
 
-**Next Review:** {data.next_review}
-"""
+    Args:
+        raw_data: Parsed input data
 
-    return md
+    Returns:
+        DiagnosticData object
+    """
+    # Parse dimension scores
+    dimension_scores = []
+    for d in raw_data.get('dimension_scores', []):
+        dimension_scores.append(DimensionScore(**d))
+
+    return DiagnosticData(
+        project_name=raw_data.get('project_name', 'Project'),
+        date=raw_data.get('date', ''),
+        overall_maturity=raw_data.get('overall_maturity', ''),
+        strengths=raw_data.get('strengths', ''),
+        risks=raw_data.get('risks', ''),
+        near_term_actions=raw_data.get('near_term_actions', ''),
+        evidence_gaps=raw_data.get('evidence_gaps', ''),
+        dimension_scores=dimension_scores,
+        overall_status=raw_data.get('overall_status', ''),
+        immediate_priorities=raw_data.get('immediate_priorities', []),
+        short_term_priorities=raw_data.get('short_term_priorities', []),
+        medium_term_priorities=raw_data.get('medium_term_priorities', []),
+        success_metrics=raw_data.get('success_metrics', []),
+        assessment_methodology=raw_data.get('assessment_methodology', ''),
+        evidence_sources=raw_data.get('evidence_sources', ''),
+        next_review=raw_data.get('next_review', '')
+    )
 
 
 # =============================================================================
@@ -425,8 +290,11 @@ def generate_diagnostic(
     input_path: Optional[Path] = None,
     output_path: Optional[Path] = None,
     data: Optional[DiagnosticData] = None,
-    output_format: str = "both"
-) -> Dict[str, Path]:
+    output_format: str = "both",
+    concurrent: bool = True,
+    deterministic: bool = False,
+    writer: Optional[WriteBehindQueue] = None
+) -> GenerationResult:
     """
     Generate Diagnostic Comment document(s).
 
@@ -434,41 +302,21 @@ def generate_diagnostic(
         input_path: Path to input data file (JSON/YAML)
         output_path: Path for output file (without extension)
         data: DiagnosticData object (alternative to input_path)
-        output_format: "docx", "md", or "both"
+        output_format: "docx", "md", "html", "both" (md + docx) or "all"
+        concurrent: Produce the outputs in parallel threads (default: True)
+        deterministic: Write byte-identical DOCX for identical content
+        writer: Optional write-behind queue; outputs are rendered in memory
+            and written in the background (flush the queue before reading them)
 
     Returns:
-        Dict mapping format to output path
+        GenerationResult mapping format to output path, with timings
     """
     # Load data if not provided
     if data is None:
         if input_path is None:
             raise ValueError("Either input_path or data must be provided")
 
-        raw_data = load_data_file(input_path)
-
-        # Parse dimension scores
-        dimension_scores = []
-        for d in raw_data.get('dimension_scores', []):
-            dimension_scores.append(DimensionScore(**d))
-
-        data = DiagnosticData(
-            project_name=raw_data.get('project_name', 'Project'),
-            date=raw_data.get('date', ''),
-            overall_maturity=raw_data.get('overall_maturity', ''),
-            strengths=raw_data.get('strengths', ''),
-            risks=raw_data.get('risks', ''),
-            near_term_actions=raw_data.get('near_term_actions', ''),
-            evidence_gaps=raw_data.get('evidence_gaps', ''),
-            dimension_scores=dimension_scores,
-            overall_status=raw_data.get('overall_status', ''),
-            immediate_priorities=raw_data.get('immediate_priorities', []),
-            short_term_priorities=raw_data.get('short_term_priorities', []),
-            medium_term_priorities=raw_data.get('medium_term_priorities', []),
-            success_metrics=raw_data.get('success_metrics', []),
-            assessment_methodology=raw_data.get('assessment_methodology', ''),
-            evidence_sources=raw_data.get('evidence_sources', ''),
-            next_review=raw_data.get('next_review', '')
-        )
+        data = parse_diagnostic_data(load_data_file(input_path))
 
     # Determine output path
     if output_path is None:
@@ -476,24 +324,51 @@ def generate_diagnostic(
         output_path = Path(f"{project_name}_Vianeo_Diagnostic_Comment")
 
     output_path = Path(output_path)
-    outputs = {}
 
-    # Generate Markdown first (always available)
-    if output_format in ["md", "both"]:
+    # The document is laid out once; each format only renders the
+    # shared model, so the outputs are produced side by side
+    # (see run_output_tasks)
+    document = build_document(data)
+    tasks = {}
+
+    if output_format in ["md", "both", "all"]:
         md_path = output_path.with_suffix('.md')
-        md_content = generate_markdown(data)
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        outputs['md'] = md_path
-        print(f"Generated Markdown: {md_path}")
-
-    # Generate DOCX
-    if output_format in ["docx", "both"] and is_docx_available():
+
+        def write_md() -> Path:
+            if writer is not None:
+                writer.submit(md_path, generate_markdown(data, document))
+                return md_path
+            with open(md_path, 'w', encoding='utf-8') as f:
+                write_markdown(data, f, document)
+            return md_path
+
+        tasks['md'] = write_md
+
+    if output_format in ["docx", "both", "all"] and is_docx_available():
         docx_path = output_path.with_suffix('.docx')
-        generator = DiagnosticDocumentGenerator(data)
-        if generator.generate_docx(docx_path):
-            outputs['docx'] = docx_path
-            print(f"Generated DOCX: {docx_path}")
+
+        def write_docx() -> Optional[Path]:
+            generator = DiagnosticDocumentGenerator(data, document)
+            generator.deterministic = deterministic
+            return write_docx_output(generator, docx_path, writer)
+
+        tasks['docx'] = write_docx
+
+    if output_format in ["html", "all"]:
+        html_path = output_path.with_suffix('.html')
+
+        def write_html() -> Path:
+            if writer is not None:
+                writer.submit(html_path, render_html(document))
+                return html_path
+            with open(html_path, 'w', encoding='utf-8') as f:
+                render_html(document, f)
+            return html_path
+
+        tasks['html'] = write_html
+
+    outputs = run_output_tasks(tasks, concurrent=concurrent)
+    outputs.print_outputs()
 
     return outputs
 
@@ -519,22 +394,32 @@ def main():
     )
     parser.add_argument(
         '--format', '-f',
-        choices=['docx', 'md', 'both'],
+        choices=['docx', 'md', 'html', 'both', 'all'],
         default='both',
-        help='Output format (default: both)'
+        help='Output format: both = md + docx, all = md + docx + html (default: both)'
     )
 
+    add_output_arguments(parser)
+
+    add_store_arguments(parser)
+
     args = parser.parse_args()
+    store_data = load_store_input(parser, args)
 
-    if args.input:
+    if args.input or store_data is not None:
         outputs = generate_diagnostic(
             input_path=args.input,
+            data=parse_diagnostic_data(store_data) if store_data is not None else None,
             output_path=args.output,
-            output_format=args.format
+            output_format=args.format,
+            concurrent=not args.sequential,
+            deterministic=args.deterministic
         )
         print(f"\nGenerated {len(outputs)} file(s)")
+        if args.timings:
+            print(outputs.timing_report())
     else:
-        print("No input file provided. Use --input to specify data file.")
+        print("No input file provided. Use --input (or --from-store) to specify data.")
 
 
 if __name__ == '__main__':
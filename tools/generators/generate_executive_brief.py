@@ -17,7 +17,7 @@ import yaml
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO
 from dataclasses import dataclass, field
 
 import sys
@@ -32,7 +32,21 @@ from core.utils import (
     load_data_file,
     ValidationReport
 )
-from generators.base import BaseDocumentGenerator, is_docx_available, DOCX_AVAILABLE
+from core.markdown_builder import MarkdownBuilder
+from core.deterministic import save_docx
+from core.write_behind import WriteBehindQueue
+from generators.base import (
+    BaseDocumentGenerator,
+    DocxTarget,
+    GenerationResult,
+    add_output_arguments,
+    add_store_arguments,
+    load_store_input,
+    is_docx_available,
+    run_output_tasks,
+    write_docx_output,
+    DOCX_AVAILABLE,
+)
 
 # Import python-docx components if available
 if DOCX_AVAILABLE:
@@ -124,7 +138,7 @@ class ExecutiveBriefGenerator(BaseDocumentGenerator):
         super().__init__()
         self.data = data
 
-    def generate_docx(self, output_path: Path) -> bool:
+    def generate_docx(self, output_path: DocxTarget) -> bool:
         """
         Generate professional DOCX Executive Brief.
 
@@ -156,7 +170,7 @@ class ExecutiveBriefGenerator(BaseDocumentGenerator):
         self._add_evidence_log(doc)
 
         # Save document
-        doc.save(str(output_path))
+        save_docx(doc, output_path, self.deterministic)
         return True
 
     # Note: _setup_document(), _add_styled_heading(), _add_styled_paragraph(),
@@ -463,10 +477,22 @@ class ExecutiveBriefGenerator(BaseDocumentGenerator):
 
 def generate_markdown(data: ExecutiveBriefData) -> str:
     """Generate markdown version of Executive Brief."""
+    md = MarkdownBuilder()
+    _build_markdown(data, md)
+    return md.build()
+
+
+def write_markdown(data: ExecutiveBriefData, stream: TextIO) -> None:
+    """Write markdown version of Executive Brief to an open text stream."""
+    _build_markdown(data, MarkdownBuilder(stream))
+
+
+def _build_markdown(data: ExecutiveBriefData, md: MarkdownBuilder) -> None:
+    """Emit the Executive Brief markdown into a builder."""
     combined_b1 = f"{data.project_name}: {data.tagline}"
     b1_count = len(combined_b1)
 
-    md = f"""# Executive Brief Template
+    md.text(f"""# Executive Brief Template
 
 ## Project Information
 **Project Name:** {data.project_name}
@@ -527,13 +553,12 @@ def generate_markdown(data: ExecutiveBriefData) -> str:
 - [x] {data.solution_type}
 
 **Key Features:**
-"""
-    for i, feature in enumerate(data.key_features[:6], 1):
-        md += f"{i}. {feature}\n"
+""")
+    md.numbered(data.key_features[:6])
 
     users_buyers = "Yes" if data.users_are_buyers else "No"
 
-    md += f"""
+    md.text(f"""
 **Quality Checklist:**
 - [ ] Solution description is under 300 characters
 - [ ] Clear connection to problem statement
@@ -580,11 +605,10 @@ def generate_markdown(data: ExecutiveBriefData) -> str:
 [Character count: {len(data.revenue_description)}/300]
 
 **Revenue Streams:**
-"""
-    for i, stream in enumerate(data.revenue_streams[:3], 1):
-        md += f"{i}. {stream}\n"
+""")
+    md.numbered(data.revenue_streams[:3])
 
-    md += f"""
+    md.text(f"""
 **Unit Economics:**
 - **Customer Acquisition Cost (CAC):** {data.cac}
 - **Lifetime Value (LTV):** {data.ltv}
@@ -607,11 +631,10 @@ def generate_markdown(data: ExecutiveBriefData) -> str:
 [Character count: {len(data.status_description)}/300]
 
 **Key Metrics:**
-"""
-    for metric, value in data.key_metrics.items():
-        md += f"- **{metric}:** {value}\n"
+""")
+    md.bullets(f"**{metric}:** {value}" for metric, value in data.key_metrics.items())
 
-    md += f"""
+    md.text(f"""
 **Validation Evidence:**
 - **Customer Interviews:** {data.customer_interviews}
 - **Pilot Users:** {data.pilot_users}
@@ -635,20 +658,18 @@ def generate_markdown(data: ExecutiveBriefData) -> str:
 [Character count: {len(data.team_overview)}/200]
 
 **Key Team Members:**
-"""
-    for i, member in enumerate(data.team_members[:5], 1):
-        name = member.get('name', 'Team Member')
-        role = member.get('role', 'Role')
-        experience = member.get('experience', 'Relevant experience')
-        md += f"{i}. **{name}** - {role}: {experience}\n"
-
-    md += """
-**Team Strengths:**
-"""
-    for strength in data.team_strengths[:5]:
-        md += f"- {strength}\n"
+""")
+    md.numbered(
+        f"**{member.get('name', 'Team Member')}** - {member.get('role', 'Role')}: "
+        f"{member.get('experience', 'Relevant experience')}"
+        for member in data.team_members[:5]
+    )
+
+    md.blank()
+    md.line("**Team Strengths:**")
+    md.bullets(data.team_strengths[:5])
 
-    md += f"""
+    md.text(f"""
 **Quality Checklist:**
 - [ ] Team description is under 200 characters
 - [ ] Key team members are listed with relevant experience
@@ -660,13 +681,14 @@ def generate_markdown(data: ExecutiveBriefData) -> str:
 ## Maturity Assessment
 
 ### Current Stage
-"""
+""")
     stages = ["IDEA", "PROTOTYPE", "PILOT", "EARLY_COMMERCIALIZATION", "GROWTH"]
-    for stage in stages:
-        check = "[x]" if stage == data.maturity_stage else "[ ]"
-        md += f"- {check} {stage.replace('_', ' ').title()}\n"
+    md.bullets(
+        f"{'[x]' if stage == data.maturity_stage else '[ ]'} {stage.replace('_', ' ').title()}"
+        for stage in stages
+    )
 
-    md += f"""
+    md.text(f"""
 ### Technology Readiness Level (TRL)
 **Current TRL:** {data.trl}
 
@@ -680,19 +702,23 @@ def generate_markdown(data: ExecutiveBriefData) -> str:
 ## Evidence Tracking
 
 ### Evidence Log
-| Evidence ID | Section | Source Type | Quality Rating | Description | Date |
-|-------------|---------|-------------|----------------|-------------|------|
-"""
-    for evidence in data.evidence_log:
-        eid = evidence.get('id', '')
-        section = evidence.get('section', '')
-        source = evidence.get('source_type', '')
-        quality = evidence.get('quality_rating', '')
-        desc = evidence.get('description', '')
-        date = evidence.get('date', '')
-        md += f"| {eid} | {section} | {source} | {quality} | {desc} | {date} |\n"
-
-    md += """
+""")
+    md.table(
+        ["Evidence ID", "Section", "Source Type", "Quality Rating", "Description", "Date"],
+        (
+            [
+                evidence.get('id', ''),
+                evidence.get('section', ''),
+                evidence.get('source_type', ''),
+                evidence.get('quality_rating', ''),
+                evidence.get('description', ''),
+                evidence.get('date', '')
+            ]
+            for evidence in data.evidence_log
+        )
+    )
+
+    md.text("""
 **Quality Rating Scale:**
 - **5 - Gold Standard:** Published research, audited financials, signed contracts
 - **4 - Strong:** Multiple customer testimonials, verified metrics
@@ -701,9 +727,24 @@ def generate_markdown(data: ExecutiveBriefData) -> str:
 - **1 - Very Weak:** No supporting evidence
 
 ---
-"""
+""")
 
-    return md
+
+# =============================================================================
+# DATA PARSING
+# =============================================================================
+
+def parse_executive_brief_data(raw_data: Dict[str, Any]) -> ExecutiveBriefData:
+    """
+    Build ExecutiveBriefData from a raw dictionary (as loaded from JSON/YAML).
+
+    Args:
+        raw_data: Parsed input data
+
+    Returns:
+        ExecutiveBriefData object
+    """
+    return ExecutiveBriefData(**raw_data)
 
 
 # =============================================================================
@@ -714,8 +755,11 @@ def generate_executive_brief(
     input_path: Optional[Path] = None,
     output_path: Optional[Path] = None,
     data: Optional[ExecutiveBriefData] = None,
-    output_format: str = "both"
-) -> Dict[str, Path]:
+    output_format: str = "both",
+    concurrent: bool = True,
+    deterministic: bool = False,
+    writer: Optional[WriteBehindQueue] = None
+) -> GenerationResult:
     """
     Generate Executive Brief document(s).
 
@@ -724,17 +768,20 @@ def generate_executive_brief(
         output_path: Path for output file (without extension)
         data: ExecutiveBriefData object (alternative to input_path)
         output_format: "docx", "md", or "both"
+        concurrent: Produce the outputs in parallel threads (default: True)
+        deterministic: Write byte-identical DOCX for identical content
+        writer: Optional write-behind queue; outputs are rendered in memory
+            and written in the background (flush the queue before reading them)
 
     Returns:
-        Dict mapping format to output path
+        GenerationResult mapping format to output path, with timings
     """
     # Load data if not provided
     if data is None:
         if input_path is None:
             raise ValueError("Either input_path or data must be provided")
 
-        raw_data = load_data_file(input_path)
-        data = ExecutiveBriefData(**raw_data)
+        data = parse_executive_brief_data(load_data_file(input_path))
 
     # Determine output path
     if output_path is None:
@@ -743,24 +790,36 @@ def generate_executive_brief(
         output_path = Path(f"Executive_Brief_{project_name}_{date_str}")
 
     output_path = Path(output_path)
-    outputs = {}
 
-    # Generate DOCX
+    # Markdown and DOCX only read the parsed data, so they are
+    # produced side by side (see run_output_tasks)
+    tasks = {}
+
     if output_format in ["docx", "both"] and is_docx_available():
         docx_path = output_path.with_suffix('.docx')
-        generator = ExecutiveBriefGenerator(data)
-        if generator.generate_docx(docx_path):
-            outputs['docx'] = docx_path
-            print(f"Generated DOCX: {docx_path}")
 
-    # Generate Markdown
+        def write_docx() -> Optional[Path]:
+            generator = ExecutiveBriefGenerator(data)
+            generator.deterministic = deterministic
+            return write_docx_output(generator, docx_path, writer)
+
+        tasks['docx'] = write_docx
+
     if output_format in ["md", "both"]:
         md_path = output_path.with_suffix('.md')
-        md_content = generate_markdown(data)
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        outputs['md'] = md_path
-        print(f"Generated Markdown: {md_path}")
+
+        def write_md() -> Path:
+            if writer is not None:
+                writer.submit(md_path, generate_markdown(data))
+                return md_path
+            with open(md_path, 'w', encoding='utf-8') as f:
+                write_markdown(data, f)
+            return md_path
+
+        tasks['md'] = write_md
+
+    outputs = run_output_tasks(tasks, concurrent=concurrent)
+    outputs.print_outputs()
 
     return outputs
 
@@ -791,17 +850,27 @@ def main():
         help='Output format (default: both)'
     )
 
+    add_output_arguments(parser)
+
+    add_store_arguments(parser)
+
     args = parser.parse_args()
+    store_data = load_store_input(parser, args)
 
-    if args.input:
+    if args.input or store_data is not None:
         outputs = generate_executive_brief(
             input_path=args.input,
+            data=parse_executive_brief_data(store_data) if store_data is not None else None,
             output_path=args.output,
-            output_format=args.format
+            output_format=args.format,
+            concurrent=not args.sequential,
+            deterministic=args.deterministic
         )
         print(f"\nGenerated {len(outputs)} file(s)")
+        if args.timings:
+            print(outputs.timing_report())
     else:
-        print("No input file provided. Use --input to specify data file.")
+        print("No input file provided. Use --input (or --from-store) to specify data.")
         print("\nExample:")
         print("  python generate_executive_brief.py --input project_data.yaml --output brief")
 
@@ -16,9 +16,10 @@ Usage:
 import argparse
 import json
 import yaml
+from concurrent.futures import Executor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO
 from dataclasses import dataclass, field
 
 import sys
@@ -26,7 +27,22 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from core.constants import DocxStyles, ScoreThresholds, VIANEO_DIMENSIONS
 from core.utils import format_date, safe_filename, clean_text, load_data_file
-from generators.base import BaseDocumentGenerator, is_docx_available, DOCX_AVAILABLE
+from core.markdown_builder import MarkdownBuilder
+from core.deterministic import save_docx
+from core.write_behind import WriteBehindQueue
+from generators.base import (
+    BaseDocumentGenerator,
+    DocxTarget,
+    GenerationResult,
+    add_output_arguments,
+    add_store_arguments,
+    load_store_input,
+    is_docx_available,
+    run_output_tasks,
+    write_docx_output,
+    DOCX_AVAILABLE,
+)
+from generators.parallel_docx import merge_fragments, render_fragments_parallel
 
 # Import python-docx components if available
 if DOCX_AVAILABLE:
@@ -240,12 +256,38 @@ class ExecutiveSprintReportData:
 class ExecutiveSprintReportGenerator(BaseDocumentGenerator):
     """Generator for VIANEO Executive Sprint Report documents."""
 
+    # Report sections in document order; a page break separates each pair
+    SECTIONS = (
+        '_add_cover_page',
+        '_add_executive_summary',
+        '_add_business_model_overview',
+        '_add_evaluation_results',
+        '_add_stakeholder_analysis',
+        '_add_recommendations',
+        '_add_conclusion',
+    )
+
     def __init__(self, data: ExecutiveSprintReportData):
         super().__init__()
         self.data = data
 
-    def generate_docx(self, output_path: Path) -> bool:
-        """Generate professional DOCX executive sprint report."""
+    def generate_docx(
+        self,
+        output_path: DocxTarget,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> bool:
+        """
+        Generate professional DOCX executive sprint report.
+
+        Args:
+            output_path: Path or binary stream to save the DOCX file to
+            parallel: Render sections in worker processes and merge them
+                (see generators.parallel_docx)
+            max_workers: Worker processes for parallel mode
+            executor: Existing executor for parallel mode
+        """
         if not is_docx_available():
             print("Error: python-docx not installed")
             return False
@@ -254,22 +296,23 @@ class ExecutiveSprintReportGenerator(BaseDocumentGenerator):
         self._setup_document(doc)
 
         # Add sections
-        self._add_cover_page(doc)
-        self._add_page_break(doc)
-        self._add_executive_summary(doc)
-        self._add_page_break(doc)
-        self._add_business_model_overview(doc)
-        self._add_page_break(doc)
-        self._add_evaluation_results(doc)
-        self._add_page_break(doc)
-        self._add_stakeholder_analysis(doc)
-        self._add_page_break(doc)
-        self._add_recommendations(doc)
-        self._add_page_break(doc)
-        self._add_conclusion(doc)
+        if parallel:
+            fragments = render_fragments_parallel(
+                type(self),
+                self.data,
+                self.SECTIONS,
+                max_workers=max_workers,
+                executor=executor
+            )
+            merge_fragments(doc, fragments, separator=self._add_page_break)
+        else:
+            for index, section in enumerate(self.SECTIONS):
+                if index:
+                    self._add_page_break(doc)
+                getattr(self, section)(doc)
 
         # Save document
-        doc.save(str(output_path))
+        save_docx(doc, output_path, self.deterministic)
         return True
 
     def _add_page_break(self, doc: Document) -> None:
@@ -1073,8 +1116,24 @@ class ExecutiveSprintReportGenerator(BaseDocumentGenerator):
 
 def generate_markdown(data: ExecutiveSprintReportData) -> str:
     """Generate markdown version of executive sprint report."""
+    md = MarkdownBuilder()
+    _build_markdown(data, md)
+    return md.build()
+
+
+def write_markdown(data: ExecutiveSprintReportData, stream: TextIO) -> None:
+    """Write markdown version of executive sprint report to an open text stream."""
+    _build_markdown(data, MarkdownBuilder(stream))
 
-    md = f"""# {data.report_title}
+
+def _pass_fail_mark(status: str) -> str:
+    """Markdown status marker for a PASS/FAIL result."""
+    return "✓ PASS" if status == "PASS" else "✗ FAIL"
+
+
+def _build_markdown(data: ExecutiveSprintReportData, md: MarkdownBuilder) -> None:
+    """Emit the executive sprint report markdown into a builder."""
+    md.text(f"""# {data.report_title}
 ## {data.report_subtitle}
 
 *{data.project_tagline}*
@@ -1104,20 +1163,26 @@ def generate_markdown(data: ExecutiveSprintReportData) -> str:
 
 ### 1.2 Project Overview
 
-"""
+""")
 
     for para in data.project_overview:
-        md += f"{para}\n\n"
-
-    md += "### 1.3 Key Findings\n\n"
-    md += "| Dimension | Score | Status | Interpretation |\n"
-    md += "|-----------|-------|--------|----------------|\n"
-
-    for finding in data.key_findings:
-        status_mark = "✓ PASS" if finding.status == "PASS" else "✗ FAIL"
-        md += f"| **{finding.dimension} ({finding.weight})** | {finding.score} | {status_mark} | {finding.interpretation} |\n"
+        md.paragraph(para)
+
+    md.heading("1.3 Key Findings", level=3)
+    md.table(
+        ["Dimension", "Score", "Status", "Interpretation"],
+        (
+            [
+                f"**{finding.dimension} ({finding.weight})**",
+                finding.score,
+                _pass_fail_mark(finding.status),
+                finding.interpretation
+            ]
+            for finding in data.key_findings
+        )
+    )
 
-    md += f"""
+    md.text(f"""
 
 ### 1.4 Primary Recommendation
 
@@ -1127,17 +1192,14 @@ def generate_markdown(data: ExecutiveSprintReportData) -> str:
 
 **Critical validation gaps:**
 
-"""
-
-    for gap in data.validation_gaps:
-        md += f"- {gap}\n"
+""")
+    md.bullets(data.validation_gaps)
 
-    md += "\n**Immediate next steps (0-90 days):**\n\n"
+    md.blank()
+    md.paragraph("**Immediate next steps (0-90 days):**")
+    md.bullets(data.immediate_next_steps)
 
-    for step in data.immediate_next_steps:
-        md += f"- {step}\n"
-
-    md += """
+    md.text("""
 
 ---
 
@@ -1145,33 +1207,36 @@ def generate_markdown(data: ExecutiveSprintReportData) -> str:
 
 ### 2.1 Value Proposition
 
-"""
-
-    md += f"{data.value_proposition}\n\n"
-    md += "**Core differentiation:**\n\n"
-
-    for item in data.core_differentiation:
-        md += f"- {item}\n"
+""")
 
-    md += "\n### 2.2 Target Market Segments\n\n"
-    md += "| Segment | Key Characteristics |\n"
-    md += "|---------|---------------------|\n"
+    md.paragraph(data.value_proposition)
+    md.paragraph("**Core differentiation:**")
+    md.bullets(data.core_differentiation)
 
-    for seg in data.target_segments:
-        md += f"| **{seg.segment}** | {seg.characteristics} |\n"
-
-    md += f"\n### 2.3 Revenue Model\n\n**{data.revenue_model_type}:**\n\n"
+    md.blank()
+    md.heading("2.2 Target Market Segments", level=3)
+    md.table(
+        ["Segment", "Key Characteristics"],
+        ([f"**{seg.segment}**", seg.characteristics] for seg in data.target_segments)
+    )
 
-    for comp in data.revenue_model_components:
-        md += f"- {comp}\n"
+    md.blank()
+    md.heading("2.3 Revenue Model", level=3)
+    md.paragraph(f"**{data.revenue_model_type}:**")
+    md.bullets(data.revenue_model_components)
 
     if data.pricing_warning:
-        md += f"\n> **Critical pricing validation needed:** {data.pricing_warning}\n"
-
-    md += "\n---\n\n## 3. Evaluation Results by Proof of Value\n\n"
-    md += f"The Vianeo evaluation assessed {data.project_name} across five interconnected dimensions, "
-    md += "each weighted according to importance for commercialization success. This section details findings, "
-    md += "evidence, and validation gaps for each proof of value.\n\n"
+        md.blank()
+        md.line(f"> **Critical pricing validation needed:** {data.pricing_warning}")
+
+    md.blank()
+    md.rule()
+    md.heading("3. Evaluation Results by Proof of Value")
+    md.paragraph(
+        f"The Vianeo evaluation assessed {data.project_name} across five interconnected dimensions, "
+        "each weighted according to importance for commercialization success. This section details findings, "
+        "evidence, and validation gaps for each proof of value."
+    )
 
     # Add dimensions
     dimensions = [
@@ -1184,92 +1249,85 @@ def generate_markdown(data: ExecutiveSprintReportData) -> str:
 
     for section_num, dim in dimensions:
         if dim:
-            status_mark = "✓ PASS" if dim.status == "PASS" else "✗ FAIL"
-            md += f"### {section_num} {dim.name} ({dim.weight}) - Score: {dim.score}\n\n"
-            md += f"**Status:** {status_mark} (Threshold: {dim.threshold})\n\n"
-            md += "#### Key Findings\n\n"
-            md += f"{dim.summary}\n\n"
-            md += "**Strengths:**\n\n"
-            for strength in dim.strengths:
-                md += f"- {strength}\n"
-            md += "\n**Gaps:**\n\n"
-            for gap in dim.gaps:
-                md += f"- {gap}\n"
-            md += "\n"
-
-    md += "---\n\n## 4. Stakeholder & Ecosystem Analysis\n\n"
-    md += "### 4.1 Priority Personas\n\n"
-    md += "Four primary personas identified for customer discovery validation (all hypothetical pending interviews):\n\n"
+            md.heading(f"{section_num} {dim.name} ({dim.weight}) - Score: {dim.score}", level=3)
+            md.paragraph(f"**Status:** {_pass_fail_mark(dim.status)} (Threshold: {dim.threshold})")
+            md.heading("Key Findings", level=4)
+            md.paragraph(dim.summary)
+            md.paragraph("**Strengths:**")
+            md.bullets(dim.strengths)
+            md.blank()
+            md.paragraph("**Gaps:**")
+            md.bullets(dim.gaps)
+            md.blank()
+
+    md.rule()
+    md.heading("4. Stakeholder & Ecosystem Analysis")
+    md.heading("4.1 Priority Personas", level=3)
+    md.paragraph(
+        "Four primary personas identified for customer discovery validation "
+        "(all hypothetical pending interviews):"
+    )
 
     for i, persona in enumerate(data.personas, start=1):
-        md += f"#### {i}. {persona.name}\n\n"
-        md += f"**Profile:** {persona.profile}\n\n"
-        md += "**Key needs (hypothesized):**\n\n"
-        for need in persona.needs:
-            md += f"- {need}\n"
-        md += f"\n**Validation required:** {persona.validation_required}\n\n"
-
-    md += "### 4.2 Critical Ecosystem Relationships\n\n"
-    md += "| Relationship | Type | Criticality | Status |\n"
-    md += "|--------------|------|-------------|--------|\n"
-
-    for rel in data.ecosystem_relationships:
-        md += f"| **{rel.relationship}** | {rel.type} | {rel.criticality} | {rel.status} |\n"
-
-    md += "\n---\n\n## 5. Recommendations & Next Steps\n\n"
-    md += "### 5.1 Immediate Priorities (0-30 Days)\n\n"
-
-    for i, priority in enumerate(data.immediate_priorities, start=1):
-        md += f"#### {i}. {priority.title}\n\n"
-        md += f"**Owner:** {priority.owner}\n\n"
-        md += f"**Timeline:** {priority.timeline}\n\n"
-        md += f"**{priority.items_label}:**\n\n"
-        for item in priority.items:
-            md += f"- {item}\n"
-        md += "\n"
-
-    md += "### 5.2 Short-Term Validation (30-90 Days)\n\n"
-
-    start_num = len(data.immediate_priorities) + 1
-    for i, priority in enumerate(data.short_term_validation, start=start_num):
-        md += f"#### {i}. {priority.title}\n\n"
-        md += f"**Owner:** {priority.owner}\n\n"
-        md += f"**Timeline:** {priority.timeline}\n\n"
-        md += f"**{priority.items_label}:**\n\n"
-        for item in priority.items:
-            md += f"- {item}\n"
-        md += "\n"
-
-    md += "### 5.3 Medium-Term Priorities (90-180 Days)\n\n"
+        md.heading(f"{i}. {persona.name}", level=4)
+        md.paragraph(f"**Profile:** {persona.profile}")
+        md.paragraph("**Key needs (hypothesized):**")
+        md.bullets(persona.needs)
+        md.blank()
+        md.paragraph(f"**Validation required:** {persona.validation_required}")
+
+    md.heading("4.2 Critical Ecosystem Relationships", level=3)
+    md.table(
+        ["Relationship", "Type", "Criticality", "Status"],
+        (
+            [f"**{rel.relationship}**", rel.type, rel.criticality, rel.status]
+            for rel in data.ecosystem_relationships
+        )
+    )
+
+    md.blank()
+    md.rule()
+    md.heading("5. Recommendations & Next Steps")
+    md.heading("5.1 Immediate Priorities (0-30 Days)", level=3)
+    _build_priorities(md, data.immediate_priorities, start=1)
+
+    md.heading("5.2 Short-Term Validation (30-90 Days)", level=3)
+    _build_priorities(
+        md,
+        data.short_term_validation,
+        start=len(data.immediate_priorities) + 1
+    )
+
+    md.heading("5.3 Medium-Term Priorities (90-180 Days)", level=3)
 
     start_num = len(data.immediate_priorities) + len(data.short_term_validation) + 1
     for i, priority in enumerate(data.medium_term_priorities, start=start_num):
-        md += f"#### {i}. {priority.title}\n\n"
-        md += f"{priority.description}\n\n"
+        md.heading(f"{i}. {priority.title}", level=4)
+        md.paragraph(priority.description)
 
-    md += "### 5.4 Risk Mitigation Strategies\n\n"
-    md += "| Risk | Impact | Mitigation Strategy |\n"
-    md += "|------|--------|---------------------|\n"
-
-    for risk in data.risk_mitigation:
-        md += f"| **{risk.risk}** | {risk.impact} | {risk.strategy} |\n"
+    md.heading("5.4 Risk Mitigation Strategies", level=3)
+    md.table(
+        ["Risk", "Impact", "Mitigation Strategy"],
+        ([f"**{risk.risk}**", risk.impact, risk.strategy] for risk in data.risk_mitigation)
+    )
 
-    md += "\n---\n\n## 6. Conclusion\n\n"
+    md.blank()
+    md.rule()
+    md.heading("6. Conclusion")
 
     for para in data.conclusion:
-        md += f"{para}\n\n"
+        md.paragraph(para)
 
     if data.next_review:
-        md += "### 6.1 Next Review Checkpoint\n\n"
-        md += f"**Timing:** {data.next_review.timing}\n\n"
-        md += "**Expected Deliverables:**\n\n"
-        for deliverable in data.next_review.deliverables:
-            md += f"- {deliverable}\n"
-        md += "\n**Success Criteria for Series A Readiness:**\n\n"
-        for criterion in data.next_review.success_criteria:
-            md += f"- {criterion}\n"
+        md.heading("6.1 Next Review Checkpoint", level=3)
+        md.paragraph(f"**Timing:** {data.next_review.timing}")
+        md.paragraph("**Expected Deliverables:**")
+        md.bullets(data.next_review.deliverables)
+        md.blank()
+        md.paragraph("**Success Criteria for Series A Readiness:**")
+        md.bullets(data.next_review.success_criteria)
 
-    md += f"""
+    md.text(f"""
 
 ---
 
@@ -1279,9 +1337,97 @@ def generate_markdown(data: ExecutiveSprintReportData) -> str:
 {data.author}, {data.author_title}
 Using Vianeo Business Model Evaluation Framework
 {data.report_date}
-"""
+""")
+
 
-    return md
+def _build_priorities(md: MarkdownBuilder, priorities: List[Priority], start: int) -> None:
+    """Emit numbered priority blocks (owner, timeline, item list)."""
+    for i, priority in enumerate(priorities, start=start):
+        md.heading(f"{i}. {priority.title}", level=4)
+        md.paragraph(f"**Owner:** {priority.owner}")
+        md.paragraph(f"**Timeline:** {priority.timeline}")
+        md.paragraph(f"**{priority.items_label}:**")
+        md.bullets(priority.items)
+        md.blank()
+
+
+# =============================================================================
+# DATA PARSING
+# =============================================================================
+
+def parse_executive_sprint_report_data(raw_data: Dict[str, Any]) -> ExecutiveSprintReportData:
+    """
+    Build ExecutiveSprintReportData from a raw dictionary (as loaded from JSON/YAML).
+
+    Args:
+        raw_data: Parsed input data
+
+    Returns:
+        ExecutiveSprintReportData object
+    """
+    # Parse nested objects
+    key_findings = [KeyFinding(**kf) for kf in raw_data.get('key_findings', [])]
+    target_segments = [TargetSegment(**ts) for ts in raw_data.get('target_segments', [])]
+    personas = [Persona(**p) for p in raw_data.get('personas', [])]
+    ecosystem_relationships = [EcosystemRelationship(**er) for er in raw_data.get('ecosystem_relationships', [])]
+    immediate_priorities = [Priority(**ip) for ip in raw_data.get('immediate_priorities', [])]
+    short_term_validation = [Priority(**stv) for stv in raw_data.get('short_term_validation', [])]
+    medium_term_priorities = [MediumTermPriority(**mtp) for mtp in raw_data.get('medium_term_priorities', [])]
+    risk_mitigation = [RiskMitigation(**rm) for rm in raw_data.get('risk_mitigation', [])]
+
+    # Parse dimension details
+    legitimacy = DimensionDetail(**raw_data['legitimacy']) if 'legitimacy' in raw_data else None
+    desirability = DimensionDetail(**raw_data['desirability']) if 'desirability' in raw_data else None
+    acceptability = DimensionDetail(**raw_data['acceptability']) if 'acceptability' in raw_data else None
+    feasibility = DimensionDetail(**raw_data['feasibility']) if 'feasibility' in raw_data else None
+    viability = DimensionDetail(**raw_data['viability']) if 'viability' in raw_data else None
+
+    # Parse next review
+    next_review = NextReview(**raw_data['next_review']) if 'next_review' in raw_data else None
+
+    return ExecutiveSprintReportData(
+        project_name=raw_data.get('project_name', ''),
+        report_title=raw_data.get('report_title', ''),
+        report_subtitle=raw_data.get('report_subtitle', ''),
+        project_tagline=raw_data.get('project_tagline', ''),
+        subtitle=raw_data.get('subtitle', ''),
+        principal_investigator=raw_data.get('principal_investigator', ''),
+        institution=raw_data.get('institution', ''),
+        sprint_duration=raw_data.get('sprint_duration', ''),
+        evaluation_framework=raw_data.get('evaluation_framework', 'Vianeo Business Model Evaluation System'),
+        prepared_by=raw_data.get('prepared_by', '360 Social Impact Studios'),
+        report_date=raw_data.get('report_date', ''),
+        author=raw_data.get('author', ''),
+        author_title=raw_data.get('author_title', ''),
+        overall_vianeo_score=raw_data.get('overall_vianeo_score', ''),
+        market_maturity_score=raw_data.get('market_maturity_score', ''),
+        status=raw_data.get('status', ''),
+        key_findings=key_findings,
+        project_overview=raw_data.get('project_overview', []),
+        primary_recommendation_status=raw_data.get('primary_recommendation_status', ''),
+        primary_recommendation_summary=raw_data.get('primary_recommendation_summary', ''),
+        validation_gaps=raw_data.get('validation_gaps', []),
+        immediate_next_steps=raw_data.get('immediate_next_steps', []),
+        value_proposition=raw_data.get('value_proposition', ''),
+        core_differentiation=raw_data.get('core_differentiation', []),
+        target_segments=target_segments,
+        revenue_model_type=raw_data.get('revenue_model_type', ''),
+        revenue_model_components=raw_data.get('revenue_model_components', []),
+        pricing_warning=raw_data.get('pricing_warning', ''),
+        legitimacy=legitimacy,
+        desirability=desirability,
+        acceptability=acceptability,
+        feasibility=feasibility,
+        viability=viability,
+        personas=personas,
+        ecosystem_relationships=ecosystem_relationships,
+        immediate_priorities=immediate_priorities,
+        short_term_validation=short_term_validation,
+        medium_term_priorities=medium_term_priorities,
+        risk_mitigation=risk_mitigation,
+        conclusion=raw_data.get('conclusion', []),
+        next_review=next_review
+    )
 
 
 # =============================================================================
@@ -1292,8 +1438,12 @@ def generate_executive_sprint_report(
     input_path: Optional[Path] = None,
     output_path: Optional[Path] = None,
     data: Optional[ExecutiveSprintReportData] = None,
-    output_format: str = "both"
-) -> Dict[str, Path]:
+    output_format: str = "both",
+    concurrent: bool = True,
+    parallel_sections: bool = False,
+    deterministic: bool = False,
+    writer: Optional[WriteBehindQueue] = None
+) -> GenerationResult:
     """
     Generate Executive Sprint Report document(s).
 
@@ -1302,80 +1452,22 @@ def generate_executive_sprint_report(
         output_path: Path for output file (without extension)
         data: ExecutiveSprintReportData object (alternative to input_path)
         output_format: "docx", "md", or "both"
+        concurrent: Produce the outputs in parallel threads (default: True)
+        parallel_sections: Build the DOCX sections in worker processes
+            and merge them (worthwhile for large reports on multi-core hosts)
+        deterministic: Write byte-identical DOCX for identical content
+        writer: Optional write-behind queue; outputs are rendered in memory
+            and written in the background (flush the queue before reading them)
 
     Returns:
-        Dict mapping format to output path
+        GenerationResult mapping format to output path, with timings
     """
     # Load data if not provided
     if data is None:
         if input_path is None:
             raise ValueError("Either input_path or data must be provided")
 
-        raw_data = load_data_file(input_path)
-
-        # Parse nested objects
-        key_findings = [KeyFinding(**kf) for kf in raw_data.get('key_findings', [])]
-        target_segments = [TargetSegment(**ts) for ts in raw_data.get('target_segments', [])]
-        personas = [Persona(**p) for p in raw_data.get('personas', [])]
-        ecosystem_relationships = [EcosystemRelationship(**er) for er in raw_data.get('ecosystem_relationships', [])]
-        immediate_priorities = [Priority(**ip) for ip in raw_data.get('immediate_priorities', [])]
-        short_term_validation = [Priority(**stv) for stv in raw_data.get('short_term_validation', [])]
-        medium_term_priorities = [MediumTermPriority(**mtp) for mtp in raw_data.get('medium_term_priorities', [])]
-        risk_mitigation = [RiskMitigation(**rm) for rm in raw_data.get('risk_mitigation', [])]
-
-        # Parse dimension details
-        legitimacy = DimensionDetail(**raw_data['legitimacy']) if 'legitimacy' in raw_data else None
-        desirability = DimensionDetail(**raw_data['desirability']) if 'desirability' in raw_data else None
-        acceptability = DimensionDetail(**raw_data['acceptability']) if 'acceptability' in raw_data else None
-        feasibility = DimensionDetail(**raw_data['feasibility']) if 'feasibility' in raw_data else None
-        viability = DimensionDetail(**raw_data['viability']) if 'viability' in raw_data else None
-
-        # Parse next review
-        next_review = NextReview(**raw_data['next_review']) if 'next_review' in raw_data else None
-
-        data = ExecutiveSprintReportData(
-            project_name=raw_data.get('project_name', ''),
-            report_title=raw_data.get('report_title', ''),
-            report_subtitle=raw_data.get('report_subtitle', ''),
-            project_tagline=raw_data.get('project_tagline', ''),
-            subtitle=raw_data.get('subtitle', ''),
-            principal_investigator=raw_data.get('principal_investigator', ''),
-            institution=raw_data.get('institution', ''),
-            sprint_duration=raw_data.get('sprint_duration', ''),
-            evaluation_framework=raw_data.get('evaluation_framework', 'Vianeo Business Model Evaluation System'),
-            prepared_by=raw_data.get('prepared_by', '360 Social Impact Studios'),
-            report_date=raw_data.get('report_date', ''),
-            author=raw_data.get('author', ''),
-            author_title=raw_data.get('author_title', ''),
-            overall_vianeo_score=raw_data.get('overall_vianeo_score', ''),
-            market_maturity_score=raw_data.get('market_maturity_score', ''),
-            status=raw_data.get('status', ''),
-            key_findings=key_findings,
-            project_overview=raw_data.get('project_overview', []),
-            primary_recommendation_status=raw_data.get('primary_recommendation_status', ''),
-            primary_recommendation_summary=raw_data.get('primary_recommendation_summary', ''),
-            validation_gaps=raw_data.get('validation_gaps', []),
-            immediate_next_steps=raw_data.get('immediate_next_steps', []),
-            value_proposition=raw_data.get('value_proposition', ''),
-            core_differentiation=raw_data.get('core_differentiation', []),
-            target_segments=target_segments,
-            revenue_model_type=raw_data.get('revenue_model_type', ''),
-            revenue_model_components=raw_data.get('revenue_model_components', []),
-            pricing_warning=raw_data.get('pricing_warning', ''),
-            legitimacy=legitimacy,
-            desirability=desirability,
-            acceptability=acceptability,
-            feasibility=feasibility,
-            viability=viability,
-            personas=personas,
-            ecosystem_relationships=ecosystem_relationships,
-            immediate_priorities=immediate_priorities,
-            short_term_validation=short_term_validation,
-            medium_term_priorities=medium_term_priorities,
-            risk_mitigation=risk_mitigation,
-            conclusion=raw_data.get('conclusion', []),
-            next_review=next_review
-        )
+        data = parse_executive_sprint_report_data(load_data_file(input_path))
 
     # Determine output path
     if output_path is None:
@@ -1402,24 +1494,38 @@ def generate_executive_sprint_report(
         output_path = Path(f"{project_name}_Vianeo_Sprint_Executive_Report_{date_str}")
 
     output_path = Path(output_path)
-    outputs = {}
 
-    # Generate Markdown first (always available)
+    # Markdown and DOCX only read the parsed data, so they are
+    # produced side by side (see run_output_tasks)
+    tasks = {}
+
     if output_format in ["md", "both"]:
         md_path = output_path.with_suffix('.md')
-        md_content = generate_markdown(data)
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        outputs['md'] = md_path
-        print(f"Generated Markdown: {md_path}")
 
-    # Generate DOCX
+        def write_md() -> Path:
+            if writer is not None:
+                writer.submit(md_path, generate_markdown(data))
+                return md_path
+            with open(md_path, 'w', encoding='utf-8') as f:
+                write_markdown(data, f)
+            return md_path
+
+        tasks['md'] = write_md
+
     if output_format in ["docx", "both"] and is_docx_available():
         docx_path = output_path.with_suffix('.docx')
-        generator = ExecutiveSprintReportGenerator(data)
-        if generator.generate_docx(docx_path):
-            outputs['docx'] = docx_path
-            print(f"Generated DOCX: {docx_path}")
+
+        def write_docx() -> Optional[Path]:
+            generator = ExecutiveSprintReportGenerator(data)
+            generator.deterministic = deterministic
+            return write_docx_output(
+                generator, docx_path, writer, parallel=parallel_sections
+            )
+
+        tasks['docx'] = write_docx
+
+    outputs = run_output_tasks(tasks, concurrent=concurrent)
+    outputs.print_outputs()
 
     return outputs
 
@@ -1450,17 +1556,33 @@ def main():
         help='Output format (default: both)'
     )
 
+    parser.add_argument(
+        '--parallel-sections',
+        action='store_true',
+        help='Render DOCX sections in worker processes and merge them'
+    )
+    add_output_arguments(parser)
+
+    add_store_arguments(parser)
+
     args = parser.parse_args()
+    store_data = load_store_input(parser, args)
 
-    if args.input:
+    if args.input or store_data is not None:
         outputs = generate_executive_sprint_report(
             input_path=args.input,
+            data=parse_executive_sprint_report_data(store_data) if store_data is not None else None,
             output_path=args.output,
-            output_format=args.format
+            output_format=args.format,
+            concurrent=not args.sequential,
+            deterministic=args.deterministic,
+            parallel_sections=args.parallel_sections
         )
         print(f"\nGenerated {len(outputs)} file(s)")
+        if args.timings:
+            print(outputs.timing_report())
     else:
-        print("No input file provided. Use --input to specify data file.")
+        print("No input file provided. Use --input (or --from-store) to specify data.")
 
 
 if __name__ == '__main__':
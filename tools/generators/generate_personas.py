@@ -15,7 +15,7 @@ import json
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -24,7 +24,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.constants import CharacterLimits, DocxStyles
 from core.utils import format_date, safe_filename, clean_text, count_characters, load_data_file
-from generators.base import BaseDocumentGenerator, is_docx_available, DOCX_AVAILABLE
+from core.markdown_builder import MarkdownBuilder
+from core.deterministic import save_docx
+from core.write_behind import WriteBehindQueue
+from generators.base import (
+    BaseDocumentGenerator,
+    DocxTarget,
+    GenerationResult,
+    add_output_arguments,
+    add_store_arguments,
+    load_store_input,
+    is_docx_available,
+    run_output_tasks,
+    write_docx_output,
+    DOCX_AVAILABLE,
+)
 
 # Import python-docx components if available
 if DOCX_AVAILABLE:
@@ -151,7 +165,7 @@ class PersonaDocumentGenerator(BaseDocumentGenerator):
         super().__init__()
         self.data = data
 
-    def generate_docx(self, output_path: Path) -> bool:
+    def generate_docx(self, output_path: DocxTarget) -> bool:
         """Generate professional DOCX persona document."""
         if not is_docx_available():
             print("Error: python-docx not installed")
@@ -171,7 +185,7 @@ class PersonaDocumentGenerator(BaseDocumentGenerator):
             self._add_persona_page(doc, persona, i)
 
         # Save document
-        doc.save(str(output_path))
+        save_docx(doc, output_path, self.deterministic)
         return True
 
     # Note: _setup_document() is inherited from BaseDocumentGenerator
@@ -404,9 +418,26 @@ class PersonaDocumentGenerator(BaseDocumentGenerator):
 
 def generate_markdown(data: PersonaDocumentData) -> str:
     """Generate markdown version of persona document."""
+    md = MarkdownBuilder()
+    _build_markdown(data, md)
+    return md.build()
+
+
+def write_markdown(data: PersonaDocumentData, stream: TextIO) -> None:
+    """Write markdown version of persona document to an open text stream."""
+    _build_markdown(data, MarkdownBuilder(stream))
+
+
+def _truncate_item(text: str) -> str:
+    """Shorten a task/pain/expectation to the 60 character limit."""
+    return text[:57] + "..." if len(text) > 60 else text
+
+
+def _build_markdown(data: PersonaDocumentData, md: MarkdownBuilder) -> None:
+    """Emit the persona document markdown into a builder."""
     total_interviews = sum(p.interview_count for p in data.personas)
 
-    md = f"""# {data.company_name}
+    md.text(f"""# {data.company_name}
 ## Vianeo Business Model Evaluation
 
 # USER PERSONA ANALYSIS
@@ -431,37 +462,42 @@ VIANEO Framework v2.0
 
 ### Validation Breakdown
 
-| Persona | Interview Count | Date Range | Validation Status |
-|---------|-----------------|------------|-------------------|
-"""
-
-    for persona in data.personas:
-        status_style = get_validation_style(persona.validation_status)
-        md += f"| {persona.first_name} | {persona.interview_count} | {persona.interview_date_range} | {status_style['text']} |\n"
+""")
+
+    md.table(
+        ["Persona", "Interview Count", "Date Range", "Validation Status"],
+        (
+            [
+                persona.first_name,
+                persona.interview_count,
+                persona.interview_date_range,
+                get_validation_style(persona.validation_status)['text']
+            ]
+            for persona in data.personas
+        )
+    )
 
-    md += f"""
+    md.text(f"""
 ### Critical Gaps & Next Steps
 
 {data.critical_gaps}
 
 ---
 
-"""
+""")
 
     # Add each persona
     for i, persona in enumerate(data.personas, 1):
         status_style = get_validation_style(persona.validation_status)
 
-        md += f"""## PERSONA {i}: {persona.first_name.upper()}
-
-**[{status_style['icon']}] {status_style['text']}**
-"""
+        md.heading(f"PERSONA {i}: {persona.first_name.upper()}")
+        md.line(f"**[{status_style['icon']}] {status_style['text']}**")
         if persona.interview_count > 0:
-            md += f"*Based on {persona.interview_count} interviews ({persona.interview_date_range})*\n"
+            md.line(f"*Based on {persona.interview_count} interviews ({persona.interview_date_range})*")
         else:
-            md += "*No interviews conducted yet*\n"
+            md.line("*No interviews conducted yet*")
 
-        md += f"""
+        md.text(f"""
 ### Requester Profile
 
 **First Name:** {persona.first_name}
@@ -489,37 +525,61 @@ VIANEO Framework v2.0
 
 ### Activities & Challenges
 
-**Tasks (Jobs to be done):**
-"""
-        for task in persona.tasks[:6]:
-            task_text = task[:57] + "..." if len(task) > 60 else task
-            md += f"- {task_text}\n"
+""")
+        md.line("**Tasks (Jobs to be done):**")
+        md.bullets(_truncate_item(task) for task in persona.tasks[:6])
 
-        md += "\n**Pains (Problems to eliminate):**\n"
-        for pain in persona.pains[:6]:
-            pain_text = pain[:57] + "..." if len(pain) > 60 else pain
-            md += f"- {pain_text}\n"
+        md.blank()
+        md.line("**Pains (Problems to eliminate):**")
+        md.bullets(_truncate_item(pain) for pain in persona.pains[:6])
 
-        md += "\n**Expectations (Desired outcomes):**\n"
-        for exp in persona.expectations[:4]:
-            exp_text = exp[:57] + "..." if len(exp) > 60 else exp
-            md += f"- {exp_text}\n"
+        md.blank()
+        md.line("**Expectations (Desired outcomes):**")
+        md.bullets(_truncate_item(exp) for exp in persona.expectations[:4])
 
-        md += f"""
+        md.text(f"""
 ### Current Solutions
 
 {persona.current_solutions_description}
 
-**Current Tools:**
-"""
-        for tool in persona.current_tools:
-            name = tool.get('name', 'Tool')
-            limitation = tool.get('limitation', 'Limitation')
-            md += f"- **{name}:** {limitation}\n"
+""")
+        md.line("**Current Tools:**")
+        md.bullets(
+            f"**{tool.get('name', 'Tool')}:** {tool.get('limitation', 'Limitation')}"
+            for tool in persona.current_tools
+        )
+
+        md.blank()
+        md.rule()
 
-        md += "\n---\n\n"
 
-    return md
+# =============================================================================
+# DATA PARSING
+# =============================================================================
+
+def parse_personas_data(raw_data: Dict[str, Any]) -> PersonaDocumentData:
+    """
+    Build PersonaDocumentData from a raw dictionary (as loaded from JSON/YAML).
+
+    Args:
+        raw_data: Parsed input data
+
+    Returns:
+        PersonaDocumentData object
+    """
+    # Parse personas
+    personas = []
+    for p in raw_data.get('personas', []):
+        personas.append(PersonaData(**p))
+
+    return PersonaDocumentData(
+        company_name=raw_data.get('company_name', 'Company'),
+        project_subtitle=raw_data.get('project_subtitle', ''),
+        prepared_date=raw_data.get('prepared_date', ''),
+        research_overview=raw_data.get('research_overview', ''),
+        critical_gaps=raw_data.get('critical_gaps', ''),
+        personas=personas
+    )
 
 
 # =============================================================================
@@ -530,8 +590,11 @@ def generate_personas(
     input_path: Optional[Path] = None,
     output_path: Optional[Path] = None,
     data: Optional[PersonaDocumentData] = None,
-    output_format: str = "both"
-) -> Dict[str, Path]:
+    output_format: str = "both",
+    concurrent: bool = True,
+    deterministic: bool = False,
+    writer: Optional[WriteBehindQueue] = None
+) -> GenerationResult:
     """
     Generate Persona document(s).
 
@@ -540,30 +603,20 @@ def generate_personas(
         output_path: Path for output file (without extension)
         data: PersonaDocumentData object (alternative to input_path)
         output_format: "docx", "md", or "both"
+        concurrent: Produce the outputs in parallel threads (default: True)
+        deterministic: Write byte-identical DOCX for identical content
+        writer: Optional write-behind queue; outputs are rendered in memory
+            and written in the background (flush the queue before reading them)
 
     Returns:
-        Dict mapping format to output path
+        GenerationResult mapping format to output path, with timings
     """
     # Load data if not provided
     if data is None:
         if input_path is None:
             raise ValueError("Either input_path or data must be provided")
 
-        raw_data = load_data_file(input_path)
-
-        # Parse personas
-        personas = []
-        for p in raw_data.get('personas', []):
-            personas.append(PersonaData(**p))
-
-        data = PersonaDocumentData(
-            company_name=raw_data.get('company_name', 'Company'),
-            project_subtitle=raw_data.get('project_subtitle', ''),
-            prepared_date=raw_data.get('prepared_date', ''),
-            research_overview=raw_data.get('research_overview', ''),
-            critical_gaps=raw_data.get('critical_gaps', ''),
-            personas=personas
-        )
+        data = parse_personas_data(load_data_file(input_path))
 
     # Determine output path
     if output_path is None:
@@ -572,24 +625,36 @@ def generate_personas(
         output_path = Path(f"{company_name}_Vianeo_Personas_{date_str}")
 
     output_path = Path(output_path)
-    outputs = {}
 
-    # Generate DOCX
+    # Markdown and DOCX only read the parsed data, so they are
+    # produced side by side (see run_output_tasks)
+    tasks = {}
+
     if output_format in ["docx", "both"] and is_docx_available():
         docx_path = output_path.with_suffix('.docx')
-        generator = PersonaDocumentGenerator(data)
-        if generator.generate_docx(docx_path):
-            outputs['docx'] = docx_path
-            print(f"Generated DOCX: {docx_path}")
 
-    # Generate Markdown
+        def write_docx() -> Optional[Path]:
+            generator = PersonaDocumentGenerator(data)
+            generator.deterministic = deterministic
+            return write_docx_output(generator, docx_path, writer)
+
+        tasks['docx'] = write_docx
+
     if output_format in ["md", "both"]:
         md_path = output_path.with_suffix('.md')
-        md_content = generate_markdown(data)
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        outputs['md'] = md_path
-        print(f"Generated Markdown: {md_path}")
+
+        def write_md() -> Path:
+            if writer is not None:
+                writer.submit(md_path, generate_markdown(data))
+                return md_path
+            with open(md_path, 'w', encoding='utf-8') as f:
+                write_markdown(data, f)
+            return md_path
+
+        tasks['md'] = write_md
+
+    outputs = run_output_tasks(tasks, concurrent=concurrent)
+    outputs.print_outputs()
 
     return outputs
 
@@ -620,17 +685,27 @@ def main():
         help='Output format (default: both)'
     )
 
+    add_output_arguments(parser)
+
+    add_store_arguments(parser)
+
     args = parser.parse_args()
+    store_data = load_store_input(parser, args)
 
-    if args.input:
+    if args.input or store_data is not None:
         outputs = generate_personas(
             input_path=args.input,
+            data=parse_personas_data(store_data) if store_data is not None else None,
             output_path=args.output,
-            output_format=args.format
+            output_format=args.format,
+            concurrent=not args.sequential,
+            deterministic=args.deterministic
         )
         print(f"\nGenerated {len(outputs)} file(s)")
+        if args.timings:
+            print(outputs.timing_report())
     else:
-        print("No input file provided. Use --input to specify data file.")
+        print("No input file provided. Use --input (or --from-store) to specify data.")
 
 
 if __name__ == '__main__':
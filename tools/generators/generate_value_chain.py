@@ -7,6 +7,7 @@ Generates interactive HTML visualization for Step 9 Ecosystem Value Network Anal
 
 Usage:
     python generate_value_chain.py --input value_network.yaml --output network.html
+    python generate_value_chain.py --input value_network.yaml --html-mode virtual
 """
 
 import argparse
@@ -14,20 +15,42 @@ import json
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO
 from dataclasses import dataclass, field
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
 
 from core.constants import CharacterLimits
 from core.utils import format_date, safe_filename, clean_text, load_data_file
+from core.html_writer import json_for_script
+from core.markdown_builder import MarkdownBuilder
+from core.write_behind import WriteBehindQueue
+from generators.value_chain_layout import compute_network_layout
+from generators.base import (
+    GenerationResult,
+    add_output_arguments,
+    add_store_arguments,
+    load_store_input,
+    run_output_tasks,
+)
 
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+# HTML rendering modes
+HTML_MODES = ("standard", "virtual", "auto")
+
+# Organization count above which "auto" switches to the virtualized template
+VIRTUAL_RENDER_THRESHOLD = 500
+
+# Lookup tables shared by the virtualized template's data island
+ACCEPTABILITY_LEVELS = ["favorable", "neutral", "unfavorable"]
+NEED_LEVELS = ["Critical", "Important", "Secondary", "None"]
+
 
 # =============================================================================
 # DATA MODELS
@@ -101,7 +124,7 @@ def _get_jinja_env() -> Environment:
     """Get Jinja2 environment configured for HTML templates."""
     return Environment(
         loader=FileSystemLoader(TEMPLATE_DIR),
-        autoescape=select_autoescape(['html', 'xml'])
+        autoescape=select_autoescape(['html', 'xml', 'html.jinja2'])
     )
 
 
@@ -112,11 +135,45 @@ def _get_jinja_env() -> Environment:
 class ValueChainGenerator:
     """Generator for VIANEO Value Chain HTML visualization."""
 
-    def __init__(self, data: ValueChainData):
+    def __init__(
+        self,
+        data: ValueChainData,
+        html_mode: str = "standard",
+        layout_cache_dir: Optional[Path] = None
+    ):
+        if html_mode not in HTML_MODES:
+            raise ValueError(
+                f"Unknown html_mode '{html_mode}'. Use one of: {', '.join(HTML_MODES)}"
+            )
         self.data = data
+        self.html_mode = html_mode
+        self.layout_cache_dir = layout_cache_dir
+
+    def resolve_html_mode(self) -> str:
+        """Return the concrete template mode ("standard" or "virtual")."""
+        if self.html_mode == "auto":
+            if self._count_total_orgs() > VIRTUAL_RENDER_THRESHOLD:
+                return "virtual"
+            return "standard"
+        return self.html_mode
+
+    def render_html(self) -> str:
+        """Render the interactive HTML visualization and return it as a string."""
+        if self.resolve_html_mode() == "virtual":
+            return self._render_virtual_html()
+        return self._render_standard_html()
 
     def generate_html(self, output_path: Path) -> bool:
         """Generate interactive HTML visualization using Jinja2 template."""
+        html = self.render_html()
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+        return True
+
+    def _render_standard_html(self) -> str:
+        """Render the standard template with one card per organization."""
         env = _get_jinja_env()
         template = env.get_template('value_network.html.jinja2')
 
@@ -174,13 +231,116 @@ class ValueChainGenerator:
             key_features=self.data.key_features,
             value_chain_sections=value_chain_sections,
             detail_sections=detail_sections,
+            layout_json=self._layout_json(include_labels=True),
             generation_date=format_date()
         )
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        return html
 
-        return True
+    def _render_virtual_html(self) -> str:
+        """
+        Render the virtualized HTML visualization.
+
+        Organizations are embedded once as a compact JSON data island
+        (one array per organization, with tier, acceptability and need
+        level stored as indexes into lookup tables). The page renders only
+        the rows inside the scroll viewport and filters through a
+        precomputed index, so page weight and startup cost no longer grow
+        with one DOM node per organization.
+        """
+        env = _get_jinja_env()
+        template = env.get_template('value_network_virtual.html.jinja2')
+
+        tier_summaries = []
+        rows = []
+        for tier_index, (title, orgs) in enumerate(self._tier_sections()):
+            counts = {level: 0 for level in ACCEPTABILITY_LEVELS}
+            for org in orgs:
+                acceptability = org.acceptability.lower()
+                if acceptability not in counts:
+                    acceptability = "neutral"
+                counts[acceptability] += 1
+                need_level = org.need_level if org.need_level in NEED_LEVELS else "None"
+                rows.append([
+                    tier_index,
+                    org.name,
+                    org.role,
+                    org.requester,
+                    ACCEPTABILITY_LEVELS.index(acceptability),
+                    NEED_LEVELS.index(need_level),
+                    org.notes
+                ])
+            tier_summaries.append({
+                "title": title,
+                "total": len(orgs),
+                "favorable": counts["favorable"],
+                "neutral": counts["neutral"],
+                "unfavorable": counts["unfavorable"]
+            })
+
+        network_json = json_for_script({
+            "tiers": [summary["title"] for summary in tier_summaries],
+            "acceptability": ACCEPTABILITY_LEVELS,
+            "needLevels": NEED_LEVELS,
+            "orgs": rows
+        })
+
+        html = template.render(
+            project_name=self.data.project_name,
+            analysis_date=self.data.analysis_date or format_date(),
+            analyst=self.data.analyst,
+            project_stage=self.data.project_stage,
+            total_organizations=len(rows),
+            priority_targets=self._count_priority_targets(),
+            key_insight=self.data.key_insight,
+            strategic_implication=self.data.strategic_implication,
+            product_name=self.data.product_name,
+            tagline=self.data.tagline,
+            industry=self.data.industry,
+            core_solution=self.data.core_solution,
+            key_features=self.data.key_features,
+            tier_summaries=tier_summaries,
+            acceptability_levels=ACCEPTABILITY_LEVELS,
+            need_levels=NEED_LEVELS,
+            network_json=Markup(network_json),
+            layout_json=self._layout_json(include_labels=False),
+            generation_date=format_date()
+        )
+
+        return html
+
+    def _layout_json(self, include_labels: bool) -> Markup:
+        """
+        Compute the diagram layout and serialize it for the template.
+
+        Node order matches the tier order of _tier_sections(), which is
+        also the row order of the virtual template's data island.
+
+        Args:
+            include_labels: Embed organization names for canvas tooltips
+                (the virtual template reads them from its own data island)
+        """
+        tiers = [orgs for _, orgs in self._tier_sections()]
+        payload = compute_network_layout(tiers, cache_dir=self.layout_cache_dir).to_payload()
+        payload["tiers"] = [title for title, _ in self._tier_sections()]
+        payload["acceptability"] = [
+            ACCEPTABILITY_LEVELS.index(org.acceptability.lower())
+            if org.acceptability.lower() in ACCEPTABILITY_LEVELS else 1
+            for orgs in tiers for org in orgs
+        ]
+        if include_labels:
+            payload["labels"] = [org.name for orgs in tiers for org in orgs]
+        return Markup(json_for_script(payload))
+
+    def _tier_sections(self) -> List[tuple]:
+        """Return (title, organizations) pairs in value chain order."""
+        return [
+            ("Enablers & Influencers", self.data.enablers_influencers),
+            ("Products & Solutions", self.data.products_solutions),
+            ("Channels & Partners", self.data.channels_partners),
+            ("Buyers", self.data.buyers),
+            ("End Users", self.data.end_users)
+        ]
 
     def _prepare_orgs_for_template(self, orgs: List[OrganizationData]) -> List[Dict[str, Any]]:
         """Prepare organization data for Jinja2 template."""
@@ -228,9 +388,21 @@ class ValueChainGenerator:
 
 def generate_markdown(data: ValueChainData) -> str:
     """Generate markdown version of value network analysis."""
+    md = MarkdownBuilder()
+    _build_markdown(data, md)
+    return md.build()
+
+
+def write_markdown(data: ValueChainData, stream: TextIO) -> None:
+    """Write markdown version of value network analysis to an open text stream."""
+    _build_markdown(data, MarkdownBuilder(stream))
+
+
+def _build_markdown(data: ValueChainData, md: MarkdownBuilder) -> None:
+    """Emit the value network analysis markdown into a builder."""
     generator = ValueChainGenerator(data)
 
-    md = f"""# Vianeo Step 8: Ecosystem Value Network Analysis
+    md.text(f"""# Vianeo Step 8: Ecosystem Value Network Analysis
 ## {data.project_name}
 
 **Project:** {data.project_name}
@@ -265,9 +437,8 @@ def generate_markdown(data: ValueChainData) -> str:
 
 ### Key Features
 
-"""
-    for i, feature in enumerate(data.key_features, 1):
-        md += f"{i}. {feature}\n"
+""")
+    md.numbered(data.key_features)
 
     # Add sections
     sections = [
@@ -284,30 +455,80 @@ def generate_markdown(data: ValueChainData) -> str:
     ]
 
     for title, orgs, description in sections:
-        md += f"\n---\n\n## {title}\n\n*{description}*\n\n"
+        md.blank()
+        md.rule()
+        md.heading(title)
+        md.paragraph(f"*{description}*")
 
         if orgs:
-            md += "| Organization Name | Role/Description | Requester | Acceptability | Need Level | Notes |\n"
-            md += "|-------------------|------------------|-----------|---------------|------------|-------|\n"
-
-            for org in orgs:
-                emoji = {"favorable": "[F]", "neutral": "[N]", "unfavorable": "[U]"}.get(
-                    org.acceptability.lower(), "[N]"
+            md.table(
+                ["Organization Name", "Role/Description", "Requester",
+                 "Acceptability", "Need Level", "Notes"],
+                (
+                    [
+                        org.name,
+                        org.role,
+                        org.requester,
+                        {"favorable": "[F]", "neutral": "[N]", "unfavorable": "[U]"}.get(
+                            org.acceptability.lower(), "[N]"
+                        ),
+                        org.need_level,
+                        org.notes[:100] + "..." if len(org.notes) > 100 else org.notes
+                    ]
+                    for org in orgs
                 )
-                notes = org.notes[:100] + "..." if len(org.notes) > 100 else org.notes
-                md += f"| {org.name} | {org.role} | {org.requester} | {emoji} | {org.need_level} | {notes} |\n"
+            )
         else:
-            md += "*No organizations in this category*\n"
+            md.line("*No organizations in this category*")
 
-    md += f"""
+    md.text(f"""
 ---
 
 **This specification ensures every Step 9 output follows the exact same format for professional consistency and strategic clarity.**
 
 Generated: {format_date()}
-"""
+""")
 
-    return md
+
+# =============================================================================
+# DATA PARSING
+# =============================================================================
+
+def parse_value_chain_data(raw_data: Dict[str, Any]) -> ValueChainData:
+    """
+    Build ValueChainData from a raw dictionary (as loaded from JSON/YAML).
+
+    Args:
+        raw_data: Parsed input data
+
+    Returns:
+        ValueChainData object
+    """
+    # Parse organizations
+    def parse_orgs(key: str) -> List[OrganizationData]:
+        orgs = []
+        for o in raw_data.get(key, []):
+            orgs.append(OrganizationData(**o))
+        return orgs
+
+    return ValueChainData(
+        project_name=raw_data.get('project_name', 'Project'),
+        analysis_date=raw_data.get('analysis_date', ''),
+        analyst=raw_data.get('analyst', ''),
+        project_stage=raw_data.get('project_stage', ''),
+        key_insight=raw_data.get('key_insight', ''),
+        strategic_implication=raw_data.get('strategic_implication', ''),
+        product_name=raw_data.get('product_name', ''),
+        tagline=raw_data.get('tagline', ''),
+        industry=raw_data.get('industry', ''),
+        core_solution=raw_data.get('core_solution', ''),
+        key_features=raw_data.get('key_features', []),
+        enablers_influencers=parse_orgs('enablers_influencers'),
+        products_solutions=parse_orgs('products_solutions'),
+        channels_partners=parse_orgs('channels_partners'),
+        buyers=parse_orgs('buyers'),
+        end_users=parse_orgs('end_users')
+    )
 
 
 # =============================================================================
@@ -318,8 +539,12 @@ def generate_value_chain(
     input_path: Optional[Path] = None,
     output_path: Optional[Path] = None,
     data: Optional[ValueChainData] = None,
-    output_format: str = "both"
-) -> Dict[str, Path]:
+    output_format: str = "both",
+    html_mode: str = "standard",
+    layout_cache_dir: Optional[Path] = None,
+    concurrent: bool = True,
+    writer: Optional[WriteBehindQueue] = None
+) -> GenerationResult:
     """
     Generate Value Chain visualization(s).
 
@@ -328,42 +553,24 @@ def generate_value_chain(
         output_path: Path for output file (without extension)
         data: ValueChainData object (alternative to input_path)
         output_format: "html", "md", or "both"
+        html_mode: "standard" (one card per organization), "virtual"
+            (JSON data island with windowed rendering for large networks),
+            or "auto" (virtual above VIRTUAL_RENDER_THRESHOLD organizations)
+        layout_cache_dir: Optional directory for persisting precomputed
+            diagram layouts between runs (keyed by network content hash)
+        concurrent: Produce the outputs in parallel threads (default: True)
+        writer: Optional write-behind queue; outputs are rendered in memory
+            and written in the background (flush the queue before reading them)
 
     Returns:
-        Dict mapping format to output path
+        GenerationResult mapping format to output path, with timings
     """
     # Load data if not provided
     if data is None:
         if input_path is None:
             raise ValueError("Either input_path or data must be provided")
 
-        raw_data = load_data_file(input_path)
-
-        # Parse organizations
-        def parse_orgs(key: str) -> List[OrganizationData]:
-            orgs = []
-            for o in raw_data.get(key, []):
-                orgs.append(OrganizationData(**o))
-            return orgs
-
-        data = ValueChainData(
-            project_name=raw_data.get('project_name', 'Project'),
-            analysis_date=raw_data.get('analysis_date', ''),
-            analyst=raw_data.get('analyst', ''),
-            project_stage=raw_data.get('project_stage', ''),
-            key_insight=raw_data.get('key_insight', ''),
-            strategic_implication=raw_data.get('strategic_implication', ''),
-            product_name=raw_data.get('product_name', ''),
-            tagline=raw_data.get('tagline', ''),
-            industry=raw_data.get('industry', ''),
-            core_solution=raw_data.get('core_solution', ''),
-            key_features=raw_data.get('key_features', []),
-            enablers_influencers=parse_orgs('enablers_influencers'),
-            products_solutions=parse_orgs('products_solutions'),
-            channels_partners=parse_orgs('channels_partners'),
-            buyers=parse_orgs('buyers'),
-            end_users=parse_orgs('end_users')
-        )
+        data = parse_value_chain_data(load_data_file(input_path))
 
     # Determine output path
     if output_path is None:
@@ -372,24 +579,42 @@ def generate_value_chain(
         output_path = Path(f"{project_name}_{date_str}_09_Value_Network")
 
     output_path = Path(output_path)
-    outputs = {}
 
-    # Generate HTML
+    # Markdown and HTML only read the parsed data, so they are
+    # produced side by side (see run_output_tasks)
+    tasks = {}
+
     if output_format in ["html", "both"]:
         html_path = output_path.with_suffix('.html')
-        generator = ValueChainGenerator(data)
-        if generator.generate_html(html_path):
-            outputs['html'] = html_path
-            print(f"Generated HTML: {html_path}")
 
-    # Generate Markdown
+        def write_html() -> Optional[Path]:
+            generator = ValueChainGenerator(
+                data,
+                html_mode=html_mode,
+                layout_cache_dir=layout_cache_dir
+            )
+            if writer is not None:
+                writer.submit(html_path, generator.render_html())
+                return html_path
+            return html_path if generator.generate_html(html_path) else None
+
+        tasks['html'] = write_html
+
     if output_format in ["md", "both"]:
         md_path = output_path.with_suffix('.md')
-        md_content = generate_markdown(data)
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        outputs['md'] = md_path
-        print(f"Generated Markdown: {md_path}")
+
+        def write_md() -> Path:
+            if writer is not None:
+                writer.submit(md_path, generate_markdown(data))
+                return md_path
+            with open(md_path, 'w', encoding='utf-8') as f:
+                write_markdown(data, f)
+            return md_path
+
+        tasks['md'] = write_md
+
+    outputs = run_output_tasks(tasks, concurrent=concurrent)
+    outputs.print_outputs()
 
     return outputs
 
@@ -419,18 +644,45 @@ def main():
         default='both',
         help='Output format (default: both)'
     )
+    parser.add_argument(
+        '--html-mode',
+        choices=list(HTML_MODES),
+        default='standard',
+        help=(
+            'HTML rendering mode: standard cards, virtualized rendering for '
+            f'large networks, or auto (virtual above {VIRTUAL_RENDER_THRESHOLD} '
+            'organizations) (default: standard)'
+        )
+    )
+
+    parser.add_argument(
+        '--layout-cache',
+        type=Path,
+        help='Directory for caching precomputed diagram layouts between runs'
+    )
+
+    add_output_arguments(parser, docx=False)
+
+    add_store_arguments(parser)
 
     args = parser.parse_args()
+    store_data = load_store_input(parser, args)
 
-    if args.input:
+    if args.input or store_data is not None:
         outputs = generate_value_chain(
             input_path=args.input,
+            data=parse_value_chain_data(store_data) if store_data is not None else None,
             output_path=args.output,
-            output_format=args.format
+            output_format=args.format,
+            html_mode=args.html_mode,
+            layout_cache_dir=args.layout_cache,
+            concurrent=not args.sequential
         )
         print(f"\nGenerated {len(outputs)} file(s)")
+        if args.timings:
+            print(outputs.timing_report())
     else:
-        print("No input file provided. Use --input to specify data file.")
+        print("No input file provided. Use --input (or --from-store) to specify data.")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,281 @@
+"""
+VIANEO Section-Parallel DOCX Assembly
+=====================================
+
+Builds the sections of a DOCX document independently and merges them into
+one body. Each section is rendered by a worker process into its own
+python-docx Document, serialized as XML fragments (body elements plus the
+styles and numbering parts they may reference), and appended in order to
+the final document.
+
+Every fragment starts from the same default template, so style and
+numbering definitions usually match the target already. Any style the
+target lacks is copied over together with its basedOn/next/link chain.
+Any list numbering whose definition differs is copied under fresh
+abstractNum/num ids, and the fragment's references are rewritten to match.
+
+Fragments must not carry relationships (images, hyperlinks), because
+relationship ids are local to each document part; merge_fragments()
+raises ValueError if one does.
+"""
+
+import copy
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from generators.base import DOCX_AVAILABLE
+
+if DOCX_AVAILABLE:
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import qn
+    from lxml import etree
+
+# Attribute namespace for relationship references (r:id, r:embed, ...)
+RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class SectionFragment:
+    """Serialized output of one independently rendered section."""
+    name: str
+    body_xml: List[bytes]
+    styles_xml: bytes
+    numbering_xml: Optional[bytes] = None
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def render_section_fragment(generator_class: type, data, method_name: str) -> SectionFragment:
+    """
+    Render one section into a fresh document and serialize it.
+
+    Runs inside a worker process, so the arguments must be picklable
+    (a module-level generator class, its data object and a method name).
+
+    Args:
+        generator_class: BaseDocumentGenerator subclass
+        data: Data object passed to the generator's constructor
+        method_name: Section method taking the Document, e.g. "_add_conclusion"
+
+    Returns:
+        SectionFragment with the section's body elements in order
+    """
+    generator = generator_class(data)
+    doc = Document()
+    generator._setup_document(doc)
+    getattr(generator, method_name)(doc)
+
+    body_xml = [
+        etree.tostring(element)
+        for element in doc.element.body
+        if element.tag != qn('w:sectPr')
+    ]
+    numbering_part = doc.part.numbering_part
+    return SectionFragment(
+        name=method_name,
+        body_xml=body_xml,
+        styles_xml=etree.tostring(doc.styles.element),
+        numbering_xml=etree.tostring(numbering_part.element) if numbering_part is not None else None
+    )
+
+
+def render_fragments_parallel(
+    generator_class: type,
+    data,
+    method_names: Sequence[str],
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> List[SectionFragment]:
+    """
+    Render sections concurrently, returning fragments in section order.
+
+    Args:
+        generator_class: BaseDocumentGenerator subclass
+        data: Generator data object (pickled once per section)
+        method_names: Section methods in document order
+        max_workers: Pool size when no executor is given
+        executor: Existing executor to reuse (e.g. a long-lived process pool)
+
+    Returns:
+        List of SectionFragment in the order of method_names
+    """
+    if executor is not None:
+        futures = [
+            executor.submit(render_section_fragment, generator_class, data, name)
+            for name in method_names
+        ]
+        return [future.result() for future in futures]
+
+    # spawn: callers may already run threads (e.g. concurrent MD + DOCX output)
+    with ProcessPoolExecutor(
+        max_workers=max_workers or min(len(method_names), multiprocessing.cpu_count()),
+        mp_context=multiprocessing.get_context('spawn')
+    ) as pool:
+        return render_fragments_parallel(generator_class, data, method_names, executor=pool)
+
+
+# =============================================================================
+# MERGING
+# =============================================================================
+
+def merge_fragments(
+    doc: 'Document',
+    fragments: Iterable[SectionFragment],
+    separator: Optional[Callable[['Document'], None]] = None
+) -> None:
+    """
+    Append section fragments to a document body, reconciling definitions.
+
+    Args:
+        doc: Target python-docx Document
+        fragments: Fragments in document order
+        separator: Optional callable run on doc between consecutive
+            fragments (e.g. adding a page break)
+
+    Raises:
+        ValueError: If a fragment references relationships
+    """
+    body = doc.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+
+    for index, fragment in enumerate(fragments):
+        elements = [parse_xml(xml) for xml in fragment.body_xml]
+        _check_no_relationships(fragment.name, elements)
+
+        copied_styles = _reconcile_styles(doc, elements, fragment.styles_xml)
+        if fragment.numbering_xml is not None:
+            _reconcile_numbering(doc, elements + copied_styles, fragment.numbering_xml)
+
+        if index and separator is not None:
+            separator(doc)
+        for element in elements:
+            if sect_pr is not None:
+                sect_pr.addprevious(element)
+            else:
+                body.append(element)
+
+
+def _check_no_relationships(name: str, elements: List) -> None:
+    """Reject fragments whose elements point at part relationships."""
+    for element in elements:
+        for node in element.iter():
+            for attribute in node.attrib:
+                if attribute.startswith(f"{{{RELATIONSHIP_NS}}}"):
+                    raise ValueError(
+                        f"Section {name} references a relationship ({attribute}); "
+                        "images and hyperlinks cannot be merged from fragments"
+                    )
+
+
+def _referenced_values(elements: Iterable, tags: Iterable[str]) -> Set[str]:
+    """Collect w:val of the given reference tags under the elements."""
+    tag_names = [qn(tag) for tag in tags]
+    values = set()
+    for element in elements:
+        for tag in tag_names:
+            for node in element.iter(tag):
+                values.add(node.get(qn('w:val')))
+    return values
+
+
+def _reconcile_styles(doc: 'Document', elements: List, styles_xml: bytes) -> List:
+    """
+    Copy styles the fragment uses but the target lacks.
+
+    Returns:
+        The style elements that were copied into the target
+    """
+    target = doc.styles.element
+    target_ids = {style.get(qn('w:styleId')) for style in target.iter(qn('w:style'))}
+    source = {
+        style.get(qn('w:styleId')): style
+        for style in parse_xml(styles_xml).iter(qn('w:style'))
+    }
+
+    pending = _referenced_values(elements, ['w:pStyle', 'w:rStyle', 'w:tblStyle'])
+    copied = []
+    while pending:
+        style_id = pending.pop()
+        if style_id in target_ids or style_id not in source:
+            continue
+        style = copy.deepcopy(source[style_id])
+        target.append(style)
+        target_ids.add(style_id)
+        copied.append(style)
+        pending |= _referenced_values([style], ['w:basedOn', 'w:next', 'w:link'])
+    return copied
+
+
+def _reconcile_numbering(doc: 'Document', elements: List, numbering_xml: bytes) -> None:
+    """Make every numId the fragment uses resolve to its own definition."""
+    used = _referenced_values(elements, ['w:numId'])
+    used.discard('0')  # numId 0 means "no numbering"
+    if not used:
+        return
+
+    target = doc.part.numbering_part.element
+    source = parse_xml(numbering_xml)
+
+    def by_id(root, tag: str, attribute: str) -> Dict[str, object]:
+        return {node.get(qn(attribute)): node for node in root.findall(qn(tag))}
+
+    source_nums = by_id(source, 'w:num', 'w:numId')
+    source_abstracts = by_id(source, 'w:abstractNum', 'w:abstractNumId')
+    target_nums = by_id(target, 'w:num', 'w:numId')
+    target_abstracts = by_id(target, 'w:abstractNum', 'w:abstractNumId')
+
+    def definition(nums, abstracts, num_id: str) -> Optional[bytes]:
+        num = nums.get(num_id)
+        if num is None:
+            return None
+        abstract = abstracts.get(num.find(qn('w:abstractNumId')).get(qn('w:val')))
+        return etree.tostring(num) + (etree.tostring(abstract) if abstract is not None else b"")
+
+    remap = {}
+    for num_id in sorted(used, key=int):
+        source_definition = definition(source_nums, source_abstracts, num_id)
+        if source_definition is None:
+            continue
+        if source_definition == definition(target_nums, target_abstracts, num_id):
+            continue
+
+        num = copy.deepcopy(source_nums[num_id])
+        abstract_ref = num.find(qn('w:abstractNumId'))
+        abstract = copy.deepcopy(source_abstracts[abstract_ref.get(qn('w:val'))])
+
+        new_abstract_id = str(max((int(key) for key in target_abstracts), default=-1) + 1)
+        new_num_id = str(max((int(key) for key in target_nums), default=0) + 1)
+        abstract.set(qn('w:abstractNumId'), new_abstract_id)
+        abstract_ref.set(qn('w:val'), new_abstract_id)
+        num.set(qn('w:numId'), new_num_id)
+
+        # Schema order: all abstractNum elements precede the num elements
+        first_num = target.find(qn('w:num'))
+        if first_num is not None:
+            first_num.addprevious(abstract)
+        else:
+            target.append(abstract)
+        target.append(num)
+        target_abstracts[new_abstract_id] = abstract
+        target_nums[new_num_id] = num
+        remap[num_id] = new_num_id
+
+    if remap:
+        for element in elements:
+            for node in element.iter(qn('w:numId')):
+                value = node.get(qn('w:val'))
+                if value in remap:
+                    node.set(qn('w:val'), remap[value])
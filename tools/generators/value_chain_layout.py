@@ -0,0 +1,341 @@
+"""
+VIANEO Value Network Layout
+===========================
+
+Computes node coordinates for the Step 9 value network diagram at
+generation time, so the browser only has to draw precomputed positions.
+
+The layout is layered: each of the five value chain tiers is a column,
+and organizations are ordered within their column by barycenter
+relaxation over requester groups. Organizations that serve the same
+requester drift toward the same height in every column, which keeps
+related stakeholders aligned across the chain.
+
+The relaxation is vectorized with NumPy when it is installed and falls
+back to an equivalent pure-Python implementation otherwise. Results are
+deterministic and cached by a hash of the network content, so
+regenerating an unchanged network yields identical coordinates.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Check for NumPy availability
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Bump when the algorithm changes so cached layouts are invalidated
+LAYOUT_VERSION = 1
+
+# Logical canvas dimensions (the browser scales to the available width)
+LAYOUT_WIDTH = 1000
+LAYOUT_MARGIN = 24
+LAYOUT_HEADER_HEIGHT = 32
+LAYOUT_ROW_SPACING = 22
+LAYOUT_MIN_HEIGHT = 240
+LAYOUT_MAX_HEIGHT = 2400
+
+# Number of barycenter sweeps; ordering is stable well before this
+RELAXATION_SWEEPS = 8
+
+# Sort ranks used for the initial ordering within a tier
+_ACCEPTABILITY_RANK = {"favorable": 0, "neutral": 1, "unfavorable": 2}
+_NEED_RANK = {"Critical": 0, "Important": 1, "Secondary": 2, "None": 3}
+
+# Layouts kept in memory (least recently used are evicted first)
+LAYOUT_CACHE_SIZE = 128
+
+# In-memory LRU cache: content hash -> NetworkLayout
+_LAYOUT_CACHE: 'OrderedDict[str, NetworkLayout]' = OrderedDict()
+_LAYOUT_CACHE_LOCK = threading.Lock()
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class NetworkLayout:
+    """Precomputed coordinates for the value network diagram."""
+    content_hash: str = ""
+    width: int = LAYOUT_WIDTH
+    height: int = LAYOUT_MIN_HEIGHT
+    column_x: List[float] = field(default_factory=list)
+    # One [x, y] pair per organization, in tier order then input order
+    nodes: List[List[float]] = field(default_factory=list)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Return the compact dict embedded in the HTML output."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "columns": self.column_x,
+            "nodes": self.nodes
+        }
+
+
+# =============================================================================
+# HASHING AND CACHING
+# =============================================================================
+
+def _node_key(org: Any) -> List[str]:
+    """Return the layout-relevant fields of an organization."""
+    return [
+        str(getattr(org, "name", "")),
+        str(getattr(org, "requester", "")),
+        str(getattr(org, "acceptability", "neutral")).lower(),
+        str(getattr(org, "need_level", "None"))
+    ]
+
+
+def network_content_hash(tiers: Sequence[Sequence[Any]]) -> str:
+    """
+    Compute a stable hash of the layout-relevant network content.
+
+    Args:
+        tiers: Organizations grouped by value chain tier, in chain order
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        {
+            "version": LAYOUT_VERSION,
+            "width": LAYOUT_WIDTH,
+            "tiers": [[_node_key(org) for org in tier] for tier in tiers]
+        },
+        ensure_ascii=False,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def clear_layout_cache() -> None:
+    """Clear the in-memory layout cache."""
+    with _LAYOUT_CACHE_LOCK:
+        _LAYOUT_CACHE.clear()
+
+
+def _cached_layout(content_hash: str) -> Optional[NetworkLayout]:
+    """In-memory layout for a content hash, marked as most recently used."""
+    with _LAYOUT_CACHE_LOCK:
+        layout = _LAYOUT_CACHE.get(content_hash)
+        if layout is not None:
+            _LAYOUT_CACHE.move_to_end(content_hash)
+        return layout
+
+
+def _cache_layout(layout: NetworkLayout) -> None:
+    """Keep a layout in memory, evicting the least recently used beyond LAYOUT_CACHE_SIZE."""
+    with _LAYOUT_CACHE_LOCK:
+        _LAYOUT_CACHE[layout.content_hash] = layout
+        _LAYOUT_CACHE.move_to_end(layout.content_hash)
+        while len(_LAYOUT_CACHE) > LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+
+
+def _read_cached_layout(cache_dir: Path, content_hash: str) -> Optional[NetworkLayout]:
+    """Load a layout from the disk cache, if present and readable."""
+    cache_file = cache_dir / f"{content_hash}.json"
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return NetworkLayout(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_cached_layout(cache_dir: Path, layout: NetworkLayout) -> None:
+    """Write a layout to the disk cache; failures are not fatal."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = cache_dir / f"{layout.content_hash}.json"
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(asdict(layout), f, separators=(',', ':'))
+    except OSError as e:
+        print(f"Warning: could not write layout cache: {e}")
+
+
+# =============================================================================
+# LAYOUT ALGORITHM
+# =============================================================================
+
+def _initial_order(tier: Sequence[Any]) -> List[int]:
+    """Order a tier by requester, acceptability, need level, then name."""
+    def sort_key(i: int):
+        name, requester, acceptability, need = _node_key(tier[i])
+        return (
+            requester,
+            _ACCEPTABILITY_RANK.get(acceptability, 1),
+            _NEED_RANK.get(need, 3),
+            name,
+            i
+        )
+    return sorted(range(len(tier)), key=sort_key)
+
+
+def _relax_numpy(
+    groups: List[List[int]],
+    orders: List[List[int]],
+    group_count: int
+) -> List[List[int]]:
+    """Barycenter relaxation using NumPy arrays."""
+    group_arrays = [np.asarray(g, dtype=np.int64) for g in groups]
+    order_arrays = [np.asarray(o, dtype=np.int64) for o in orders]
+
+    for _ in range(RELAXATION_SWEEPS):
+        # Normalized position (0..1) of every node within its tier
+        positions = []
+        for order in order_arrays:
+            pos = np.empty(len(order), dtype=np.float64)
+            pos[order] = (np.arange(len(order), dtype=np.float64) + 0.5) / max(len(order), 1)
+            positions.append(pos)
+
+        all_groups = np.concatenate(group_arrays) if group_arrays else np.empty(0, np.int64)
+        all_pos = np.concatenate(positions) if positions else np.empty(0)
+        sums = np.bincount(all_groups, weights=all_pos, minlength=group_count)
+        counts = np.bincount(all_groups, minlength=group_count)
+        centers = sums / np.maximum(counts, 1)
+
+        new_orders = []
+        for group, pos in zip(group_arrays, positions):
+            keys = 0.5 * pos + 0.5 * centers[group]
+            new_orders.append(np.argsort(keys, kind='stable'))
+        if all(np.array_equal(a, b) for a, b in zip(order_arrays, new_orders)):
+            break
+        order_arrays = new_orders
+
+    return [o.tolist() for o in order_arrays]
+
+
+def _relax_python(
+    groups: List[List[int]],
+    orders: List[List[int]],
+    group_count: int
+) -> List[List[int]]:
+    """Barycenter relaxation without NumPy (same results, slower)."""
+    for _ in range(RELAXATION_SWEEPS):
+        positions = []
+        for order in orders:
+            n = max(len(order), 1)
+            pos = [0.0] * len(order)
+            for rank, node in enumerate(order):
+                pos[node] = (rank + 0.5) / n
+            positions.append(pos)
+
+        sums = [0.0] * group_count
+        counts = [0] * group_count
+        for group, pos in zip(groups, positions):
+            for g, p in zip(group, pos):
+                sums[g] += p
+                counts[g] += 1
+        centers = [s / max(c, 1) for s, c in zip(sums, counts)]
+
+        new_orders = []
+        for group, pos in zip(groups, positions):
+            keys = [0.5 * p + 0.5 * centers[g] for g, p in zip(group, pos)]
+            new_orders.append(sorted(range(len(keys)), key=keys.__getitem__))
+        if new_orders == orders:
+            break
+        orders = new_orders
+
+    return orders
+
+
+def _compute_layout(tiers: Sequence[Sequence[Any]], content_hash: str) -> NetworkLayout:
+    """Run the layered layout for a network."""
+    requesters = sorted({_node_key(org)[1] for tier in tiers for org in tier})
+    group_ids = {requester: i for i, requester in enumerate(requesters)}
+    groups = [[group_ids[_node_key(org)[1]] for org in tier] for tier in tiers]
+    orders = [_initial_order(tier) for tier in tiers]
+
+    if NUMPY_AVAILABLE:
+        orders = _relax_numpy(groups, orders, len(requesters))
+    else:
+        orders = _relax_python(groups, orders, len(requesters))
+
+    tier_count = max(len(tiers), 1)
+    column_width = (LAYOUT_WIDTH - 2 * LAYOUT_MARGIN) / tier_count
+    column_x = [
+        round(LAYOUT_MARGIN + column_width * (i + 0.5), 1)
+        for i in range(len(tiers))
+    ]
+
+    largest_tier = max((len(tier) for tier in tiers), default=0)
+    body_height = min(
+        max(largest_tier * LAYOUT_ROW_SPACING, LAYOUT_MIN_HEIGHT),
+        LAYOUT_MAX_HEIGHT
+    )
+    top = LAYOUT_MARGIN + LAYOUT_HEADER_HEIGHT
+
+    nodes: List[List[float]] = []
+    for tier_index, (tier, order) in enumerate(zip(tiers, orders)):
+        y_by_node = [0.0] * len(tier)
+        n = max(len(tier), 1)
+        for rank, node in enumerate(order):
+            y_by_node[node] = round(top + body_height * (rank + 0.5) / n, 1)
+        nodes.extend([column_x[tier_index], y] for y in y_by_node)
+
+    return NetworkLayout(
+        content_hash=content_hash,
+        width=LAYOUT_WIDTH,
+        height=int(top + body_height + LAYOUT_MARGIN),
+        column_x=column_x,
+        nodes=nodes
+    )
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def compute_network_layout(
+    tiers: Sequence[Sequence[Any]],
+    cache_dir: Optional[Path] = None
+) -> NetworkLayout:
+    """
+    Compute (or fetch from cache) the layered layout for a value network.
+
+    Args:
+        tiers: Organizations grouped by value chain tier, in chain order.
+            Each organization needs name, requester, acceptability and
+            need_level attributes (e.g. OrganizationData).
+        cache_dir: Optional directory for a persistent layout cache
+
+    Returns:
+        NetworkLayout with one node per organization, in tier order
+    """
+    content_hash = network_content_hash(tiers)
+
+    cached = _cached_layout(content_hash)
+    if cached is not None:
+        return cached
+
+    if cache_dir is not None:
+        cached = _read_cached_layout(Path(cache_dir), content_hash)
+        if cached is not None:
+            _cache_layout(cached)
+            return cached
+
+    layout = _compute_layout(tiers, content_hash)
+    _cache_layout(layout)
+
+    if cache_dir is not None:
+        _write_cached_layout(Path(cache_dir), layout)
+
+    return layout
@@ -0,0 +1,56 @@
+"""
+VIANEO Document Pipeline
+========================
+
+In-memory generate -> validate -> convert API.
+
+Available modules:
+- documents: Render documents to str/bytes buffers and validate them
+  without temporary files
+- aio: asyncio counterparts of the generator, validator and converter
+  entry points (import pipeline.aio)
+- server: Local HTTP rendering service with a bounded worker pool
+  (run with python -m pipeline.server)
+- context_bundle: Step-specific AI assistant context bundles (prompt,
+  upstream outputs, templates, references) trimmed to a token budget
+"""
+
+from .documents import (
+    DOCUMENT_KINDS,
+    DocumentKind,
+    RenderedDocument,
+    ProjectRender,
+    get_document_kind,
+    parse_document,
+    render_document,
+    validate_document,
+    render_project,
+    markdown_to_docx_bytes,
+    docx_bytes_to_markdown,
+)
+from .context_bundle import (
+    STEP_CONTEXTS,
+    ContextBundle,
+    StepContext,
+    approximate_tokens,
+    build_context_bundle,
+)
+
+__all__ = [
+    'DOCUMENT_KINDS',
+    'DocumentKind',
+    'RenderedDocument',
+    'ProjectRender',
+    'get_document_kind',
+    'parse_document',
+    'render_document',
+    'validate_document',
+    'render_project',
+    'markdown_to_docx_bytes',
+    'docx_bytes_to_markdown',
+    'STEP_CONTEXTS',
+    'ContextBundle',
+    'StepContext',
+    'approximate_tokens',
+    'build_context_bundle',
+]
@@ -0,0 +1,306 @@
+"""
+VIANEO asyncio API
+==================
+
+Async counterparts of the public generator, validator and converter entry
+points, for asyncio applications that must not block their event loop.
+
+CPU-bound work (parsing, rendering, validation) runs on a configurable
+executor: the event loop's default thread pool unless set_executor() or
+the executor= argument supplies one (e.g. a ProcessPoolExecutor for true
+parallelism). File loads and saves go through asyncio.to_thread, so disk
+I/O never waits behind renders queued on that executor.
+
+Cancelling an awaiting task cancels work that has not started yet; work
+already running in a worker finishes, but its result is discarded.
+
+Usage:
+    from pipeline import aio
+
+    aio.set_executor(ProcessPoolExecutor(max_workers=4))
+    outputs = await aio.generate_executive_sprint_report_async(
+        input_path=Path("sprint.yaml"), output_path=Path("out/Report")
+    )
+    report = await aio.validate_evidence_async(input_path=Path("brief.yaml"))
+"""
+
+import asyncio
+import functools
+import json
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar, Union
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import yaml
+
+from core.utils import ValidationReport
+from generators.generate_executive_brief import generate_executive_brief
+from generators.generate_personas import generate_personas
+from generators.generate_value_chain import generate_value_chain
+from generators.generate_diagnostic import generate_diagnostic
+from generators.generate_executive_sprint_report import generate_executive_sprint_report
+from validators.validate_character_limits import validate_character_limits
+from validators.validate_score_thresholds import validate_score_thresholds
+from validators.validate_data_flow import validate_data_flow
+from validators.validate_evidence import validate_evidence
+from converters.md_to_docx import convert_md_to_docx
+from converters.docx_to_md import convert_docx_to_md
+from converters.data_to_html import convert_data_to_html
+from converters.portfolio_to_html import convert_portfolio_to_html
+from pipeline.documents import (
+    ProjectRender,
+    RenderedDocument,
+    render_document,
+    validate_document,
+)
+
+T = TypeVar('T')
+
+# Executor for CPU-bound work; None means the event loop's default executor
+_executor: Optional[Executor] = None
+
+
+# =============================================================================
+# EXECUTOR
+# =============================================================================
+
+def set_executor(executor: Optional[Executor]) -> None:
+    """
+    Set the executor used for CPU-bound work.
+
+    Args:
+        executor: Thread or process pool; None restores the loop default
+    """
+    global _executor
+    _executor = executor
+
+
+def get_executor() -> Optional[Executor]:
+    """Return the configured executor (None means the loop default)."""
+    return _executor
+
+
+async def run_in_executor(
+    func: Callable[..., T],
+    *args: Any,
+    executor: Optional[Executor] = None,
+    **kwargs: Any
+) -> T:
+    """
+    Run func(*args, **kwargs) on the executor and await the result.
+
+    With a process pool, func and its arguments must be picklable
+    (module-level functions, dataclasses, dicts and paths all are).
+
+    Args:
+        func: Callable to run
+        executor: Executor for this call (default: get_executor())
+
+    Returns:
+        The callable's return value
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(executor or _executor, call)
+
+
+# =============================================================================
+# FILE I/O
+# =============================================================================
+
+async def read_text(path: Union[str, Path]) -> str:
+    """Read a UTF-8 text file without blocking the event loop."""
+    return await asyncio.to_thread(Path(path).read_text, encoding='utf-8')
+
+
+async def read_bytes(path: Union[str, Path]) -> bytes:
+    """Read a binary file without blocking the event loop."""
+    return await asyncio.to_thread(Path(path).read_bytes)
+
+
+async def write_text(path: Union[str, Path], content: str) -> Path:
+    """Write a UTF-8 text file without blocking the event loop."""
+    path = Path(path)
+    await asyncio.to_thread(path.write_text, content, encoding='utf-8')
+    return path
+
+
+async def write_bytes(path: Union[str, Path], content: bytes) -> Path:
+    """Write a binary file without blocking the event loop."""
+    path = Path(path)
+    await asyncio.to_thread(path.write_bytes, content)
+    return path
+
+
+def _parse_data_text(text: str, suffix: str) -> Dict[str, Any]:
+    """Parse JSON/YAML text (the in-memory half of core.utils.load_data_file)."""
+    if suffix == '.json':
+        return json.loads(text)
+    return yaml.safe_load(text)
+
+
+async def load_data_file_async(
+    path: Union[str, Path],
+    executor: Optional[Executor] = None
+) -> Dict[str, Any]:
+    """
+    Load a JSON/YAML data file: async read, parse on the executor.
+
+    Args:
+        path: Path to a .json, .yaml or .yml file
+        executor: Executor for parsing (default: get_executor())
+
+    Returns:
+        Parsed data dictionary
+
+    Raises:
+        ValueError: If file extension is not supported
+        FileNotFoundError: If file does not exist
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in ('.yaml', '.yml', '.json'):
+        raise ValueError(
+            f"Unsupported file format: {path.suffix}. "
+            f"Expected .yaml, .yml, or .json"
+        )
+    text = await read_text(path)
+    return await run_in_executor(_parse_data_text, text, suffix, executor=executor)
+
+
+# =============================================================================
+# IN-MEMORY PIPELINE
+# =============================================================================
+
+async def render_document_async(
+    kind: str,
+    data: Any,
+    formats: Optional[Iterable[str]] = None,
+    executor: Optional[Executor] = None,
+    **generator_options: Any
+) -> RenderedDocument:
+    """
+    Async render_document(): data files are read without blocking and
+    rendering runs on the executor.
+
+    Args:
+        kind: Registered document kind
+        data: Data object, raw dictionary, or path to a JSON/YAML file
+        formats: Formats to produce (default: all the kind supports)
+        executor: Executor for this call (default: get_executor())
+
+    Returns:
+        RenderedDocument with in-memory outputs
+    """
+    if isinstance(data, (str, Path)):
+        data = await load_data_file_async(data, executor=executor)
+    if formats is not None:
+        formats = tuple(formats)
+    return await run_in_executor(
+        render_document, kind, data, formats, executor=executor, **generator_options
+    )
+
+
+async def validate_document_async(
+    rendered: RenderedDocument,
+    executor: Optional[Executor] = None
+) -> Dict[str, ValidationReport]:
+    """Async validate_document(), run on the executor."""
+    return await run_in_executor(validate_document, rendered, executor=executor)
+
+
+async def save_rendered_async(rendered: RenderedDocument, output_path: Path) -> Dict[str, Path]:
+    """
+    Write every output of a RenderedDocument without blocking the loop.
+
+    Returns:
+        Dict mapping format to written path
+    """
+    output_path = Path(output_path)
+    writes = {}
+    for fmt, content in rendered.outputs().items():
+        path = output_path.with_suffix(f'.{fmt}')
+        if isinstance(content, bytes):
+            writes[fmt] = write_bytes(path, content)
+        else:
+            writes[fmt] = write_text(path, content)
+    paths = await asyncio.gather(*writes.values())
+    return dict(zip(writes, paths))
+
+
+async def render_project_async(
+    documents: Dict[str, Any],
+    validate: bool = True,
+    executor: Optional[Executor] = None
+) -> ProjectRender:
+    """
+    Async render_project(): all documents render concurrently.
+
+    Args:
+        documents: Mapping of document kind to data object, raw dictionary,
+            or data file path
+        validate: Also validate each rendered document
+        executor: Executor for this call (default: get_executor())
+
+    Returns:
+        ProjectRender with documents and reports keyed by kind
+    """
+    async def one(kind: str, data: Any):
+        rendered = await render_document_async(kind, data, executor=executor)
+        reports = await validate_document_async(rendered, executor=executor) if validate else None
+        return kind, rendered, reports
+
+    project = ProjectRender()
+    results = await asyncio.gather(*(one(kind, data) for kind, data in documents.items()))
+    for kind, rendered, reports in results:
+        project.documents[kind] = rendered
+        if reports is not None:
+            project.reports[kind] = reports
+    return project
+
+
+# =============================================================================
+# ASYNC COUNTERPARTS OF THE PUBLIC ENTRY POINTS
+# =============================================================================
+
+def _async_counterpart(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Wrap a public sync entry point so it runs on the executor.
+
+    The wrapped function's own file loads and saves happen inside the
+    worker, off the event loop.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: Any, executor: Optional[Executor] = None, **kwargs: Any) -> T:
+        return await run_in_executor(func, *args, executor=executor, **kwargs)
+
+    wrapper.__name__ = f"{func.__name__}_async"
+    wrapper.__qualname__ = wrapper.__name__
+    wrapper.__doc__ = (
+        f"Async counterpart of {func.__name__}(); accepts the same arguments "
+        f"plus executor=.\n\n{func.__doc__ or ''}"
+    )
+    return wrapper
+
+
+# Generators
+generate_executive_brief_async = _async_counterpart(generate_executive_brief)
+generate_personas_async = _async_counterpart(generate_personas)
+generate_value_chain_async = _async_counterpart(generate_value_chain)
+generate_diagnostic_async = _async_counterpart(generate_diagnostic)
+generate_executive_sprint_report_async = _async_counterpart(generate_executive_sprint_report)
+
+# Validators
+validate_character_limits_async = _async_counterpart(validate_character_limits)
+validate_score_thresholds_async = _async_counterpart(validate_score_thresholds)
+validate_data_flow_async = _async_counterpart(validate_data_flow)
+validate_evidence_async = _async_counterpart(validate_evidence)
+
+# Converters
+convert_md_to_docx_async = _async_counterpart(convert_md_to_docx)
+convert_docx_to_md_async = _async_counterpart(convert_docx_to_md)
+convert_data_to_html_async = _async_counterpart(convert_data_to_html)
+convert_portfolio_to_html_async = _async_counterpart(convert_portfolio_to_html)
@@ -0,0 +1,807 @@
+#!/usr/bin/env python3
+"""
+VIANEO Context Bundle Builder
+=============================
+
+Assembles the AI assistant context for one VIANEO step.
+
+docs/VIANEO_AI_Assisted_Workflow.md prescribes, per step, the prompt to use,
+the attachments and the guardrails. STEP_CONTEXTS encodes that table
+together with the step's output templates, format specs / quick validation
+docs and the upstream steps whose outputs it builds on. A bundle is:
+
+1. the execution instruction, manual attachments (platform screenshots) and
+   guardrails for the step
+2. the step prompt                                     (never trimmed)
+3. the project's upstream step outputs                 (priority 1)
+4. key reference docs, then output templates           (priority 1, 2)
+5. format specs, quick validation docs, common guides  (priority 3, 4)
+
+Every file is split into sections by heading and each section gets an
+offline approximate token count. Parsed sections are cached in memory and,
+when the parsed-data cache is enabled, on disk next to it (by path,
+size/mtime and content hash, see core.data_cache), so rebuilding a bundle
+only stats unchanged files. With a token budget, whole sections are dropped from the lowest
+priority files first (last sections first) until the bundle fits.
+
+Upstream outputs are found in the project directory by file name:
+"step_05_...", "Step9_...", "..._Step12b_...", Executive_Brief_* (Step 0),
+*_Personas_* (Step 6), *_09_Value_Network* (Step 9) and
+*_Diagnostic_Comment* (Step 10).
+
+Usage:
+    python context_bundle.py --list
+    python context_bundle.py --step 7 --project outputs/TechEd/ --output step7_context.md
+    python context_bundle.py --step 12b --project outputs/TechEd/ --budget 60000
+    python context_bundle.py --step 10 --project outputs/TechEd/ --format json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import REPO_ROOT
+from core.data_cache import DATA_CACHE, ParsedDataCache
+from core.utils import iter_sections
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Section trimming priorities (higher is trimmed first; 0 is never trimmed)
+PRIORITY_PROMPT = 0
+PRIORITY_UPSTREAM = 1
+PRIORITY_KEY_REFERENCE = 1
+PRIORITY_TEMPLATE = 2
+PRIORITY_REFERENCE = 3
+PRIORITY_COMMON = 4
+
+# Shared guidance attached to every step (lowest priority)
+COMMON_REFERENCES = (
+    "prompts/_common_prompt_guidelines.md",
+    "docs/AI_Guardrails.md",
+)
+
+MARKDOWN_SUFFIXES = {'.md', '.markdown'}
+OUTPUT_SUFFIXES = {'.md', '.markdown', '.txt', '.yaml', '.yml', '.json'}
+
+EXECUTION_INSTRUCTION = (
+    "Execute the {label} from the GITHUB Master Vianeo Repository, synced to this "
+    "project's files. Use the prompt called `{prompt}`."
+)
+
+FILE_SEPARATOR = "\n\n---\n\n"
+
+# Approximate tokenizer pieces: letter runs, digit runs, whitespace, other runs
+TOKEN_PIECE_PATTERN = re.compile(r'[A-Za-z]+|\d+|\s+|[^\sA-Za-z\d]+')
+
+# Step markers in output file names ("step_05", "Step9", "step-12b", "Step12_Final")
+STEP_FILE_PATTERN = re.compile(
+    r'(?<![a-z0-9])step[ _-]?(\d{1,2})([ab])?(?:[ _-]?(initial|final|needs|means|view[ _-]?[12]))?(?![0-9])',
+    re.IGNORECASE
+)
+
+# Deliverable names without a step marker (core.constants.FileNaming)
+NAMED_OUTPUT_PATTERNS = (
+    (re.compile(r'executive[ _-]?brief', re.IGNORECASE), "step_0b"),
+    (re.compile(r'(?<![a-z])personas(?![a-z])', re.IGNORECASE), "step_6"),
+    (re.compile(r'_09_value_network', re.IGNORECASE), "step_9"),
+    (re.compile(r'diagnostic[ _-]comment', re.IGNORECASE), "step_10"),
+)
+
+
+# =============================================================================
+# STEP DEFINITIONS
+# =============================================================================
+
+@dataclass(frozen=True)
+class StepContext:
+    """Prompt, attachments and guardrails for one step (AI-Assisted Workflow, section 2/5)."""
+    step: str
+    label: str
+    prompt: str
+    templates: Tuple[str, ...] = ()
+    key_references: Tuple[str, ...] = ()
+    references: Tuple[str, ...] = ()
+    upstream: Tuple[str, ...] = ()
+    attachments: Tuple[str, ...] = ()
+    guardrail: str = ""
+    instruction: Optional[str] = None
+
+    @property
+    def execution_instruction(self) -> str:
+        """The standard execution message for the step."""
+        return self.instruction or EXECUTION_INSTRUCTION.format(label=self.label, prompt=self.prompt)
+
+
+def _step_docs(number: str, spec: str) -> Tuple[str, ...]:
+    return (f"docs/FORMAT_SPEC_{spec}.md", f"docs/QUICK_VALIDATION_Step{number}.md")
+
+
+STEP_CONTEXTS: Dict[str, StepContext] = {context.step: context for context in (
+    StepContext(
+        step="step_0a",
+        label="Step 0a: Canvas Extraction",
+        prompt="prompts/step_00a_canvas_extraction.md",
+        attachments=("Raw venture materials (pitch deck, business plan)",
+                     "Screenshot/export of initial Vianeo canvas"),
+        guardrail="Do not alter the canvas structure, only fill or refine content",
+    ),
+    StepContext(
+        step="step_0b",
+        label="Step 0: Executive Brief Extraction",
+        prompt="prompts/step_00_executive_brief_extraction.md",
+        templates=("templates/Executive_Brief_Template.md",),
+        references=_step_docs("0", "Step0_Executive_Brief"),
+        upstream=("step_0a",),
+        attachments=("Additional venture docs",),
+        guardrail="Respect character limits and section headings exactly",
+    ),
+    StepContext(
+        step="step_2",
+        label="Step 2: 40-Question Diagnostic Assessment",
+        prompt="prompts/step_02_diagnostic_40q.md",
+        templates=("templates/40Q_Assessment_Results_Template.md",
+                   "templates/40Q_Score_Summary_Template.md"),
+        key_references=("docs/VIANEO_Comprehensive_Reference_Guide.md",),
+        references=_step_docs("2", "Step2_40Q_Diagnostic"),
+        upstream=("step_0b",),
+        guardrail="Use all 40 questions exactly as written, do not add or remove questions",
+    ),
+    StepContext(
+        step="step_3",
+        label="Step 3: 29-Question Market Maturity Assessment",
+        prompt="prompts/step_03_market_maturity_29q.md",
+        templates=("templates/Step3_MarketMaturity_Markdown_Template.md",
+                   "templates/Step3_Assessment_Results_Template.md"),
+        key_references=("docs/VIANEO_29Question_Quick_Reference.md",),
+        references=_step_docs("3", "Step3_Market_Maturity"),
+        upstream=("step_0b", "step_2"),
+        guardrail="Score based on evidence only, use 1-5 scale exactly as defined",
+    ),
+    StepContext(
+        step="step_4",
+        label="Step 4: Legitimacy Worksheet",
+        prompt="prompts/step_04_legitimacy_worksheet.md",
+        templates=("templates/Step4_Legitimacy_Markdown_Template.md",),
+        references=_step_docs("4", "Step4_Legitimacy"),
+        upstream=("step_0b", "step_3"),
+        guardrail="Document means with differentiation status",
+    ),
+    StepContext(
+        step="step_5",
+        label="Step 5: Needs and Requesters Analysis",
+        prompt="prompts/step_05_needs_requesters.md",
+        templates=("templates/Step5_NeedsRequesters_Markdown_Template.md",),
+        references=_step_docs("5", "Step5_Needs_Requesters"),
+        upstream=("step_0b",),
+        attachments=("Customer research data", "Interview transcripts"),
+        guardrail="Do not introduce new needs or requesters beyond those validated",
+    ),
+    StepContext(
+        step="step_6",
+        label="Step 6: Persona Development",
+        prompt="prompts/step_06_persona_development.md",
+        templates=("templates/Step6_Persona_Markdown_Template.md",),
+        references=_step_docs("6", "Step6_Persona") + ("docs/VIANEO_Persona_Reference_Guide.md",),
+        upstream=("step_5",),
+        attachments=("Screenshot of Requesters list from Vianeo platform",),
+        guardrail="Derive personas ONLY from these requesters. No new requester or persona names",
+    ),
+    StepContext(
+        step="step_7",
+        label="Step 7: Needs Qualification Matrix",
+        prompt="prompts/step_07_needs_qualification_matrix.md",
+        templates=("templates/Step7_Analysis_Report_Template.md",),
+        references=_step_docs("7", "Step7_Needs_Qualification"),
+        upstream=("step_5",),
+        attachments=("Screenshot of Needs/Requesters table from Vianeo platform",),
+        guardrail="Only qualify existing needs and requesters. Do NOT invent new entities",
+    ),
+    StepContext(
+        step="step_8",
+        label="Step 8: Players and Influencers Analysis",
+        prompt="prompts/step_08_players_influencers.md",
+        templates=("templates/Step8_EcosystemAnalysis_Markdown_Template.md",),
+        references=_step_docs("8", "Step8_Players_Influencers"),
+        upstream=("step_0b",),
+        attachments=("Ecosystem research data",),
+        guardrail="Use only listed entities. Acceptability ratings must match defined scales",
+    ),
+    StepContext(
+        step="step_9",
+        label="Step 9: Ecosystem Value Network Map",
+        prompt="prompts/step_09_ecosystem_value_network.md",
+        templates=("templates/Step9_Analysis_Markdown_Template.md",),
+        references=_step_docs("9", "Step9_Ecosystem_Value_Network")
+        + ("docs/VIANEO_Step9_Quick_Reference.md",),
+        upstream=("step_5", "step_8"),
+        attachments=("Screenshot of Value Network entity list from Vianeo platform",),
+        guardrail="Only use listed entity names. Output Entities and Relationships tables explicitly",
+    ),
+    StepContext(
+        step="step_10",
+        label="Step 10: Vianeo Diagnostic Comment",
+        prompt="prompts/step_10_vianeo_diagnostic.md",
+        templates=("templates/Step10_Diagnostic_Markdown_Template.md",),
+        references=_step_docs("10", "Step10_Diagnostic_Comment")
+        + ("docs/VIANEO_Diagnostic_Quality_Checklist.md",),
+        # All prior steps, especially 3, 7 and 9 (trimmed last)
+        upstream=("step_3", "step_7", "step_9", "step_2", "step_4", "step_5", "step_6", "step_8"),
+        guardrail="Synthesize only, do not introduce new findings",
+    ),
+    StepContext(
+        step="step_11_needs",
+        label="Step 11: Features-Needs Matrix Generation",
+        prompt="prompts/step_11_features_needs_matrix.md",
+        templates=("templates/Step11_FeaturesNeeds_Analysis_Template.md",),
+        references=_step_docs("11", "Step11_Features_Needs_Matrix")
+        + ("docs/VIANEO_Step11_Quick_Reference.md",),
+        upstream=("step_5", "step_7"),
+        attachments=("Screenshot of Features-Needs table from Vianeo platform",),
+        guardrail="Use only existing needs as columns, match Step 5 exactly",
+        instruction=EXECUTION_INSTRUCTION.format(
+            label="Step 11: Features-Needs Matrix Generation",
+            prompt="prompts/step_11_features_needs_matrix.md",
+        ) + " Generate View 1: Features-Needs.",
+    ),
+    StepContext(
+        step="step_11_means",
+        label="Step 11: Features-Means Matrix (View 2)",
+        prompt="prompts/step_11_features_needs_matrix.md",
+        templates=("templates/Step11_FeaturesNeeds_Analysis_Template.md",),
+        references=_step_docs("11", "Step11_Features_Needs_Matrix"),
+        upstream=("step_11_needs", "step_4"),
+        attachments=("Screenshot/export of Means list from Step 4",),
+        guardrail="Use only existing means as columns, do not create new means",
+        instruction=(
+            "Using the same features as in the Features-Needs matrix, generate a "
+            "Features-Means matrix. Base it on the available means as shown in the "
+            "attached screenshot. Do not create any new means."
+        ),
+    ),
+    StepContext(
+        step="step_12",
+        label="Step 12 Initial: Viability Assessment",
+        prompt="prompts/step_12_initial_viability_assessment.md",
+        references=_step_docs("12", "Step12_Viability"),
+        upstream=("step_3", "step_7", "step_9", "step_10", "step_11_needs", "step_11_means"),
+        guardrail="Synthesize dimension scores and signals",
+    ),
+    StepContext(
+        step="step_12a",
+        label="Step 12a: Product Market Fit Sheet",
+        prompt="prompts/step_12a_product_market_fit.md",
+        templates=("templates/Step12_PMF_Template.md",),
+        references=_step_docs("12", "Step12_Viability"),
+        upstream=("step_12",),
+        guardrail="Create Product Market Fit Sheet with MVP configuration",
+    ),
+    StepContext(
+        step="step_12b",
+        label="Step 12b: Viability Business Model",
+        prompt="prompts/step_12b_viability_business_model.md",
+        templates=("templates/Step12_Business_Model_Template.md",),
+        references=_step_docs("12", "Step12_Viability"),
+        upstream=("step_5", "step_6", "step_12", "step_12a"),
+        attachments=("Targeted requester segments from Steps 5/6",),
+        guardrail="Produce a SEPARATE business model per requester segment. Do NOT merge segments",
+    ),
+    StepContext(
+        step="step_12_final",
+        label="Step 12 Final: Viability Dashboard Generation",
+        prompt="prompts/step_12_final_viability_dashboard.md",
+        templates=("templates/Step12_Dashboard_Template.md",),
+        references=_step_docs("12", "Step12_Viability"),
+        upstream=("step_12", "step_12a", "step_12b"),
+        guardrail="Generate summary dashboard only",
+    ),
+)}
+
+_STEP_QUALIFIERS = {
+    "": "", "a": "a", "b": "b", "initial": "", "final": "_final",
+    "needs": "_needs", "view1": "_needs", "means": "_means", "view2": "_means",
+}
+
+
+def normalize_step(step: Union[str, int]) -> str:
+    """
+    Canonical step id ("7" -> "step_7", "12 final" -> "step_12_final").
+
+    Step 0 without a letter is the Executive Brief (step_0b); Step 11 without
+    a view is View 1 (step_11_needs).
+
+    Raises:
+        ValueError: For an unknown step
+    """
+    key = re.sub(r'[\s_-]+', '', str(step).strip().lower())
+    key = re.sub(r'^step', '', key)
+    match = re.match(r'^0*(\d+)(.*)$', key)
+    if match and match.group(2) in _STEP_QUALIFIERS:
+        number, qualifier = match.group(1), _STEP_QUALIFIERS[match.group(2)]
+        if number == "0" and not qualifier:
+            qualifier = "b"
+        if number == "11" and not qualifier:
+            qualifier = "_needs"
+        step_id = f"step_{number}{qualifier}"
+        if step_id in STEP_CONTEXTS:
+            return step_id
+    raise ValueError(f"Unknown step: {step}. Available: {', '.join(STEP_CONTEXTS)}")
+
+
+def get_step_context(step: Union[str, int]) -> StepContext:
+    """StepContext for a step id or number."""
+    return STEP_CONTEXTS[normalize_step(step)]
+
+
+# =============================================================================
+# TOKEN COUNTING
+# =============================================================================
+
+def approximate_tokens(text: str) -> int:
+    """
+    Offline approximation of the BPE token count of text.
+
+    Letter runs count one token per 6 letters (started), digit runs one per
+    3 digits, runs of ASCII punctuation one per 2 characters and non-ASCII
+    characters one each; whitespace is free (merged into the next token).
+    """
+    tokens = 0
+    for piece in TOKEN_PIECE_PATTERN.findall(text):
+        first = piece[0]
+        if first.isspace():
+            continue
+        length = len(piece)
+        if first.isalpha() and first.isascii():
+            tokens += 1 + (length - 1) // 6
+        elif first.isdigit() and first.isascii():
+            tokens += 1 + (length - 1) // 3
+        elif piece.isascii():
+            tokens += 1 + (length - 1) // 2
+        else:
+            tokens += sum(1 if ch.isascii() else 1 + (len(ch.encode('utf-8')) > 2) for ch in piece)
+    return tokens
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass(frozen=True)
+class ContextSection:
+    """A heading-delimited part of a file with its approximate token count."""
+    heading: Optional[str]
+    text: str
+    tokens: int
+
+
+@dataclass
+class ContextFile:
+    """A file in a bundle and which of its sections are kept."""
+    path: str
+    role: str
+    priority: int
+    sections: Tuple[ContextSection, ...]
+    kept: List[bool] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.kept:
+            self.kept = [True] * len(self.sections)
+
+    @property
+    def tokens(self) -> int:
+        return sum(section.tokens for section in self.sections)
+
+    @property
+    def kept_tokens(self) -> int:
+        return sum(section.tokens for section, kept in zip(self.sections, self.kept) if kept)
+
+    @property
+    def trimmed(self) -> List[ContextSection]:
+        return [section for section, kept in zip(self.sections, self.kept) if not kept]
+
+    def _notes(self) -> List[str]:
+        trimmed = self.trimmed
+        if len(trimmed) == len(self.sections):
+            return [f"<!-- omitted: {self.path} ({self.role}, {self.tokens} tokens) -->"]
+        notes = [f"<!-- {self.role}: {self.path} ({self.kept_tokens} tokens) -->"]
+        if trimmed:
+            notes.append(f"<!-- trimmed {len(trimmed)} section(s) of {self.path} "
+                         f"({sum(s.tokens for s in trimmed)} tokens) -->")
+        return notes
+
+    @property
+    def rendered_tokens(self) -> int:
+        """Approximate tokens of render(), including the file comments."""
+        return self.kept_tokens + sum(approximate_tokens(note) for note in self._notes())
+
+    def render(self) -> str:
+        notes = self._notes()
+        if len(notes) == 1 and not any(self.kept):
+            return notes[0]
+        parts = [notes[0]]
+        parts.extend(section.text for section, kept in zip(self.sections, self.kept) if kept)
+        parts.extend(notes[1:])
+        return "\n\n".join(parts)
+
+
+@dataclass
+class ContextBundle:
+    """The assembled context for one step."""
+    step: StepContext
+    files: List[ContextFile]
+    budget: Optional[int] = None
+    missing_upstream: List[str] = field(default_factory=list)
+    missing_files: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def preamble(self) -> str:
+        """Execution instruction, manual attachments and guardrails."""
+        lines = [f"# Context Bundle: {self.step.label}", "", f"> {self.step.execution_instruction}"]
+        if self.step.attachments:
+            lines += ["", "**Attach manually:**"] + [f"- {item}" for item in self.step.attachments]
+        if self.step.guardrail:
+            lines += ["", f"**Non-negotiable guardrails:** {self.step.guardrail}"]
+        if self.missing_upstream:
+            lines += ["", "**Missing upstream outputs:** " + ", ".join(self.missing_upstream)]
+        return "\n".join(lines)
+
+    @property
+    def tokens(self) -> int:
+        """Approximate tokens of to_markdown()."""
+        separators = approximate_tokens(FILE_SEPARATOR) * len(self.files)
+        return approximate_tokens(self.preamble()) + separators + sum(
+            file.rendered_tokens for file in self.files
+        )
+
+    @property
+    def untrimmed_tokens(self) -> int:
+        return sum(file.tokens for file in self.files)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.tokens > self.budget
+
+    def fit_to_budget(self, budget: int) -> None:
+        """
+        Drop sections until the bundle fits the budget.
+
+        Sections go lowest priority first; within a priority, later files and
+        later sections first. The prompt is never trimmed, so a budget below
+        the prompt size leaves the bundle over budget.
+        """
+        self.budget = budget
+        total = self.tokens
+        candidates = [
+            (file.priority, file_index, section_index)
+            for file_index, file in enumerate(self.files) if file.priority > PRIORITY_PROMPT
+            for section_index in range(len(file.sections))
+        ]
+        candidates.sort(reverse=True)
+        for _, file_index, section_index in candidates:
+            if total <= budget:
+                break
+            file = self.files[file_index]
+            before = file.rendered_tokens
+            file.kept[section_index] = False
+            total += file.rendered_tokens - before
+
+    def to_markdown(self) -> str:
+        return FILE_SEPARATOR.join([self.preamble()] + [file.render() for file in self.files]) + "\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Bundle manifest (no file content)."""
+        return {
+            "step": self.step.step,
+            "label": self.step.label,
+            "budget": self.budget,
+            "tokens": self.tokens,
+            "untrimmed_tokens": self.untrimmed_tokens,
+            "over_budget": self.over_budget,
+            "missing_upstream": self.missing_upstream,
+            "missing_files": self.missing_files,
+            "files": [
+                {
+                    "path": file.path,
+                    "role": file.role,
+                    "priority": file.priority,
+                    "tokens": file.tokens,
+                    "kept_tokens": file.kept_tokens,
+                    "sections": len(file.sections),
+                    "trimmed": [section.heading or "(preamble)" for section in file.trimmed],
+                }
+                for file in self.files
+            ],
+        }
+
+
+# =============================================================================
+# SECTION CACHE
+# =============================================================================
+
+_section_cache: Optional[ParsedDataCache] = None
+
+# Resolved path -> (size, mtime_ns, sections) for this process
+_section_memo: Dict[str, Tuple[int, int, Tuple[ContextSection, ...]]] = {}
+
+
+def _parse_sections(markdown: bool, content: bytes) -> List[Tuple[Optional[str], str, int]]:
+    """(heading, text, tokens) per section; headings inside code fences do not split."""
+    text = content.decode('utf-8', errors='replace')
+    if not markdown:
+        text = text.strip('\n')
+        return [(None, text, approximate_tokens(text))] if text.strip() else []
+
+    parts: List[List[Any]] = []
+    in_fence = False
+    for section in iter_sections(text, include_preamble=True):
+        body = '\n'.join(section.lines) if section.heading is None else \
+            '\n'.join([f"{'#' * section.level} {section.heading}"] + section.lines)
+        if in_fence and parts:
+            parts[-1][1] += '\n' + body
+        else:
+            parts.append([section.heading, body])
+        for line in body.split('\n'):
+            if line.lstrip().startswith('```'):
+                in_fence = not in_fence
+    result = []
+    for heading, body in parts:
+        body = body.strip('\n')
+        result.append((heading, body, approximate_tokens(body)))
+    return result
+
+
+def _cache() -> ParsedDataCache:
+    """Section cache stored beside the shared parsed-data cache."""
+    global _section_cache
+    directory = DATA_CACHE.directory / "context_sections"
+    if _section_cache is None or _section_cache.directory != directory:
+        _section_cache = ParsedDataCache(directory)
+    _section_cache.enabled = DATA_CACHE.enabled
+    return _section_cache
+
+
+def load_sections(path: Union[str, Path]) -> Tuple[ContextSection, ...]:
+    """
+    Sections of a file with token counts, cached by size/mtime and content hash.
+
+    Args:
+        path: Markdown (split by heading) or other text file (one section)
+
+    Returns:
+        Tuple of ContextSection
+    """
+    path = Path(path)
+    key = str(path.resolve())
+    stat = path.stat()
+    memo = _section_memo.get(key)
+    if memo and memo[0] == stat.st_size and memo[1] == stat.st_mtime_ns:
+        return memo[2]
+    parsed = _cache().load(path, "sections", partial(_parse_sections, path.suffix.lower() in MARKDOWN_SUFFIXES))
+    sections = tuple(ContextSection(*item) for item in parsed)
+    _section_memo[key] = (stat.st_size, stat.st_mtime_ns, sections)
+    return sections
+
+
+# =============================================================================
+# UPSTREAM OUTPUTS
+# =============================================================================
+
+def step_for_file(name: str) -> List[str]:
+    """Step ids a project file name belongs to (empty if none)."""
+    match = STEP_FILE_PATTERN.search(name)
+    if match:
+        number, letter, qualifier = match.groups()
+        qualifier = re.sub(r'[ _-]', '', (qualifier or "").lower())
+        if number.lstrip('0') == "11" and not qualifier:
+            return ["step_11_needs", "step_11_means"]
+        # "Step5_Needs_Requesters": the word after the number is not always a qualifier
+        for candidate in (f"{number}{letter or ''}{qualifier}", f"{number}{letter or ''}"):
+            try:
+                return [normalize_step(candidate)]
+            except ValueError:
+                continue
+        return []
+    for pattern, step in NAMED_OUTPUT_PATTERNS:
+        if pattern.search(name):
+            return [step]
+    return []
+
+
+def find_step_outputs(project_dir: Union[str, Path]) -> Dict[str, List[Path]]:
+    """
+    Text outputs in a project directory (recursively), grouped by step.
+
+    Returns:
+        Dict mapping step id to files sorted by path
+    """
+    outputs: Dict[str, List[Path]] = {}
+    for directory, subdirs, files in os.walk(project_dir):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith('.'))
+        for name in sorted(files):
+            if name.startswith('.') or Path(name).suffix.lower() not in OUTPUT_SUFFIXES:
+                continue
+            for step in step_for_file(name):
+                outputs.setdefault(step, []).append(Path(directory) / name)
+    return outputs
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def build_context_bundle(
+    step: Union[str, int],
+    project_dir: Optional[Union[str, Path]] = None,
+    budget: Optional[int] = None,
+    include_common: bool = True,
+    extra_files: Iterable[Union[str, Path]] = (),
+    repo_root: Union[str, Path] = REPO_ROOT
+) -> ContextBundle:
+    """
+    Assemble the context bundle for a step.
+
+    Args:
+        step: Step id or number ("7", "step_12b", "12 final", "11 means")
+        project_dir: Directory of the project's step outputs
+        budget: Token budget to trim the bundle to
+        include_common: Attach the common prompt guidelines and AI guardrails
+        extra_files: Additional files, attached as upstream material
+        repo_root: Repository checkout with prompts/, templates/ and docs/
+
+    Returns:
+        ContextBundle
+
+    Raises:
+        ValueError: For an unknown step
+        FileNotFoundError: If the step prompt does not exist
+    """
+    start = time.perf_counter()
+    context = get_step_context(step)
+    repo_root = Path(repo_root)
+    bundle = ContextBundle(context, [])
+
+    def attach(path: Path, label: str, role: str, priority: int) -> None:
+        if not path.is_file():
+            if role == "prompt":
+                raise FileNotFoundError(f"Prompt not found: {path}")
+            bundle.missing_files.append(label)
+            return
+        sections = load_sections(path)
+        if sections:
+            bundle.files.append(ContextFile(label, role, priority, sections))
+
+    attach(repo_root / context.prompt, context.prompt, "prompt", PRIORITY_PROMPT)
+
+    if project_dir is not None:
+        project_dir = Path(project_dir)
+        outputs = find_step_outputs(project_dir)
+        for upstream in context.upstream:
+            if upstream not in outputs:
+                bundle.missing_upstream.append(upstream)
+            for path in outputs.get(upstream, []):
+                label = f"{project_dir.name}/{path.relative_to(project_dir).as_posix()}"
+                attach(path, label, f"{upstream} output", PRIORITY_UPSTREAM)
+    for path in extra_files:
+        attach(Path(path), str(path), "attachment", PRIORITY_UPSTREAM)
+
+    for relative in context.key_references:
+        attach(repo_root / relative, relative, "reference", PRIORITY_KEY_REFERENCE)
+    for relative in context.templates:
+        attach(repo_root / relative, relative, "template", PRIORITY_TEMPLATE)
+    for relative in context.references:
+        attach(repo_root / relative, relative, "reference", PRIORITY_REFERENCE)
+    if include_common:
+        for relative in COMMON_REFERENCES:
+            attach(repo_root / relative, relative, "guidelines", PRIORITY_COMMON)
+
+    if budget is not None:
+        bundle.fit_to_budget(budget)
+    bundle.elapsed = time.perf_counter() - start
+    return bundle
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Build the AI assistant context bundle for a VIANEO step"
+    )
+    parser.add_argument(
+        '--step', '-s',
+        help='Step (0a, 0, 2-10, 11, "11 means", 12, 12a, 12b, "12 final")'
+    )
+    parser.add_argument(
+        '--project', '-p',
+        type=Path,
+        help="Directory with the project's step outputs"
+    )
+    parser.add_argument(
+        '--budget', '-b',
+        type=int,
+        help='Token budget; lower-priority sections are trimmed to fit'
+    )
+    parser.add_argument(
+        '--attach', '-a',
+        type=Path,
+        nargs='+',
+        default=[],
+        help='Additional files to include (e.g. exported platform data)'
+    )
+    parser.add_argument(
+        '--no-common',
+        action='store_true',
+        help='Leave out the common prompt guidelines and AI guardrails'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='Output file (default: stdout)'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['markdown', 'json'],
+        default='markdown',
+        help='Bundle text or its JSON manifest (default: markdown)'
+    )
+    parser.add_argument(
+        '--list',
+        action='store_true',
+        help='List the available steps'
+    )
+
+    args = parser.parse_args()
+
+    if args.list:
+        for context in STEP_CONTEXTS.values():
+            upstream = ", ".join(context.upstream) or "-"
+            print(f"{context.step:15} {context.label}  (upstream: {upstream})")
+        return 0
+    if not args.step:
+        parser.error("--step is required (or use --list)")
+
+    try:
+        bundle = build_context_bundle(
+            args.step, args.project, args.budget,
+            include_common=not args.no_common, extra_files=args.attach
+        )
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    content = bundle.to_markdown() if args.format == 'markdown' else \
+        json.dumps(bundle.to_dict(), indent=2, ensure_ascii=False) + "\n"
+    if args.output:
+        args.output.write_text(content, encoding='utf-8')
+    else:
+        sys.stdout.write(content)
+
+    budget = f" / budget {bundle.budget}" if bundle.budget is not None else ""
+    print(f"{bundle.step.label}: {len(bundle.files)} file(s), ~{bundle.tokens} tokens{budget} "
+          f"(untrimmed ~{bundle.untrimmed_tokens}) in {bundle.elapsed * 1000:.1f} ms", file=sys.stderr)
+    for step in bundle.missing_upstream:
+        print(f"Warning: no {step} output found in {args.project}", file=sys.stderr)
+    for path in bundle.missing_files:
+        print(f"Warning: {path} not found", file=sys.stderr)
+    if bundle.over_budget:
+        print(f"Warning: over budget; the prompt alone needs ~{bundle.files[0].tokens} tokens",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
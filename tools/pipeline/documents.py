@@ -0,0 +1,332 @@
+"""
+VIANEO In-Memory Document Pipeline
+==================================
+
+Library-level generate -> validate -> convert API that works entirely on
+in-memory buffers. Generators return Markdown as str and DOCX/HTML as
+bytes/str, validators read those buffers directly, and the converters
+accept and emit BytesIO, so a whole project can be produced and checked
+without writing temporary files.
+
+Usage:
+    from pipeline import render_document, validate_document
+
+    rendered = render_document("diagnostic", raw_data)
+    reports = validate_document(rendered)
+    Path("diagnostic.docx").write_bytes(rendered.docx)
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.document_model import render_markdown
+from core.utils import ValidationReport, load_data_file
+from core.write_behind import WriteBehindQueue
+from generators.base import is_docx_available
+from generators.generate_executive_brief import (
+    ExecutiveBriefGenerator,
+    parse_executive_brief_data,
+    generate_markdown as executive_brief_markdown,
+)
+from generators.generate_personas import (
+    PersonaDocumentGenerator,
+    parse_personas_data,
+    generate_markdown as personas_markdown,
+)
+from generators.generate_value_chain import (
+    ValueChainGenerator,
+    parse_value_chain_data,
+    generate_markdown as value_chain_markdown,
+)
+from generators.generate_diagnostic import (
+    DiagnosticDocumentGenerator,
+    build_document as diagnostic_document,
+    parse_diagnostic_data,
+    generate_markdown as diagnostic_markdown,
+)
+from generators.generate_executive_sprint_report import (
+    ExecutiveSprintReportGenerator,
+    parse_executive_sprint_report_data,
+    generate_markdown as executive_sprint_report_markdown,
+)
+from converters.md_to_docx import MarkdownToDocxConverter
+from converters.docx_to_md import DocxToMarkdownConverter
+from validators.validate_character_limits import validate_character_limits
+from validators.validate_score_thresholds import validate_score_thresholds
+
+
+# =============================================================================
+# DOCUMENT KINDS
+# =============================================================================
+
+@dataclass(frozen=True)
+class DocumentKind:
+    """
+    How to parse, render and validate one kind of VIANEO document.
+
+    Kinds with a document builder lay the document out once as a
+    core.document_model tree; every format is rendered from that tree
+    (the generator receives it as document=).
+    """
+    name: str
+    parse: Callable[[Dict[str, Any]], Any]
+    markdown: Callable[[Any], str]
+    generator: Callable[..., Any]
+    formats: Tuple[str, ...]
+    char_limit_type: str = 'generic'
+    check_scores: bool = False
+    document: Optional[Callable[[Any], Any]] = None
+
+
+DOCUMENT_KINDS: Dict[str, DocumentKind] = {
+    'executive_brief': DocumentKind(
+        name='executive_brief',
+        parse=parse_executive_brief_data,
+        markdown=executive_brief_markdown,
+        generator=ExecutiveBriefGenerator,
+        formats=('md', 'docx'),
+        char_limit_type='executive_brief'
+    ),
+    'personas': DocumentKind(
+        name='personas',
+        parse=parse_personas_data,
+        markdown=personas_markdown,
+        generator=PersonaDocumentGenerator,
+        formats=('md', 'docx')
+    ),
+    'value_chain': DocumentKind(
+        name='value_chain',
+        parse=parse_value_chain_data,
+        markdown=value_chain_markdown,
+        generator=ValueChainGenerator,
+        formats=('md', 'html'),
+        char_limit_type='value_network'
+    ),
+    'diagnostic': DocumentKind(
+        name='diagnostic',
+        parse=parse_diagnostic_data,
+        markdown=diagnostic_markdown,
+        generator=DiagnosticDocumentGenerator,
+        formats=('md', 'docx', 'html'),
+        check_scores=True,
+        document=diagnostic_document
+    ),
+    'executive_sprint_report': DocumentKind(
+        name='executive_sprint_report',
+        parse=parse_executive_sprint_report_data,
+        markdown=executive_sprint_report_markdown,
+        generator=ExecutiveSprintReportGenerator,
+        formats=('md', 'docx')
+    ),
+}
+
+
+def get_document_kind(kind: str) -> DocumentKind:
+    """
+    Look up a registered document kind.
+
+    Raises:
+        ValueError: If the kind is not registered
+    """
+    if kind not in DOCUMENT_KINDS:
+        raise ValueError(
+            f"Unknown document kind '{kind}'. Use one of: {', '.join(DOCUMENT_KINDS)}"
+        )
+    return DOCUMENT_KINDS[kind]
+
+
+# =============================================================================
+# RENDERED OUTPUT
+# =============================================================================
+
+@dataclass
+class RenderedDocument:
+    """In-memory outputs for one document."""
+    kind: str
+    data: Any
+    markdown: Optional[str] = None
+    docx: Optional[bytes] = None
+    html: Optional[str] = None
+
+    def outputs(self) -> Dict[str, Union[str, bytes]]:
+        """Return the produced outputs keyed by format."""
+        produced = {'md': self.markdown, 'docx': self.docx, 'html': self.html}
+        return {fmt: content for fmt, content in produced.items() if content is not None}
+
+    def save(self, output_path: Path, writer: Optional[WriteBehindQueue] = None) -> Dict[str, Path]:
+        """
+        Write every produced output next to output_path (extension replaced).
+
+        Args:
+            output_path: Output path (extension is replaced per format)
+            writer: Optional write-behind queue to hand the outputs to
+
+        Returns:
+            Dict mapping format to written (or queued) path
+        """
+        output_path = Path(output_path)
+        written = {}
+        for fmt, content in self.outputs().items():
+            path = output_path.with_suffix(f'.{fmt}')
+            if writer is not None:
+                writer.submit(path, content)
+            elif isinstance(content, bytes):
+                path.write_bytes(content)
+            else:
+                path.write_text(content, encoding='utf-8')
+            written[fmt] = path
+        return written
+
+
+@dataclass
+class ProjectRender:
+    """Rendered documents and validation reports for a whole project."""
+    documents: Dict[str, RenderedDocument] = field(default_factory=dict)
+    reports: Dict[str, Dict[str, ValidationReport]] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        """True when no validation report contains errors."""
+        return all(
+            report.is_valid
+            for kind_reports in self.reports.values()
+            for report in kind_reports.values()
+        )
+
+
+# =============================================================================
+# PIPELINE FUNCTIONS
+# =============================================================================
+
+def parse_document(kind: str, raw_data: Union[Dict[str, Any], Path, str]) -> Any:
+    """
+    Build the data object for a document kind.
+
+    Args:
+        kind: Registered document kind
+        raw_data: Raw dictionary, or a path to a JSON/YAML file
+
+    Returns:
+        The generator's data object
+    """
+    document_kind = get_document_kind(kind)
+    if isinstance(raw_data, (str, Path)):
+        raw_data = load_data_file(raw_data)
+    return document_kind.parse(raw_data)
+
+
+def render_document(
+    kind: str,
+    data: Any,
+    formats: Optional[Iterable[str]] = None,
+    **generator_options: Any
+) -> RenderedDocument:
+    """
+    Render a document to in-memory buffers.
+
+    Args:
+        kind: Registered document kind (see DOCUMENT_KINDS)
+        data: Data object, raw dictionary, or path to a JSON/YAML file
+        formats: Formats to produce; defaults to every format the kind supports
+        **generator_options: Extra keyword arguments for the generator class
+            (e.g. html_mode for value_chain)
+
+    Returns:
+        RenderedDocument with markdown (str), docx (bytes) and/or html (str)
+    """
+    document_kind = get_document_kind(kind)
+    if isinstance(data, (dict, str, Path)):
+        data = parse_document(kind, data)
+
+    formats = tuple(formats) if formats is not None else document_kind.formats
+    unsupported = [fmt for fmt in formats if fmt not in document_kind.formats]
+    if unsupported:
+        raise ValueError(
+            f"{kind} does not support format(s): {', '.join(unsupported)}"
+        )
+
+    rendered = RenderedDocument(kind=kind, data=data)
+
+    model = None
+    if document_kind.document is not None:
+        model = document_kind.document(data)
+        generator_options = dict(generator_options, document=model)
+
+    if 'md' in formats:
+        rendered.markdown = render_markdown(model) if model is not None else document_kind.markdown(data)
+
+    if 'docx' in formats and is_docx_available():
+        rendered.docx = document_kind.generator(data, **generator_options).render_docx()
+
+    if 'html' in formats:
+        rendered.html = document_kind.generator(data, **generator_options).render_html()
+
+    return rendered
+
+
+def validate_document(rendered: RenderedDocument) -> Dict[str, ValidationReport]:
+    """
+    Validate a rendered document's Markdown without touching the filesystem.
+
+    Args:
+        rendered: Output of render_document() (must include markdown)
+
+    Returns:
+        Dict mapping check name to ValidationReport
+    """
+    document_kind = get_document_kind(rendered.kind)
+    markdown = rendered.markdown
+    if markdown is None:
+        markdown = document_kind.markdown(rendered.data)
+
+    reports = {
+        'character_limits': validate_character_limits(
+            markdown=markdown,
+            doc_type=document_kind.char_limit_type
+        )
+    }
+    if document_kind.check_scores:
+        reports['score_thresholds'] = validate_score_thresholds(markdown=markdown)
+    return reports
+
+
+def render_project(
+    documents: Dict[str, Any],
+    validate: bool = True
+) -> ProjectRender:
+    """
+    Render (and optionally validate) several documents in memory.
+
+    Args:
+        documents: Mapping of document kind to data object, raw dictionary,
+            or data file path
+        validate: Run validate_document() on each rendered document
+
+    Returns:
+        ProjectRender with documents and reports keyed by kind
+    """
+    project = ProjectRender()
+    for kind, data in documents.items():
+        rendered = render_document(kind, data)
+        project.documents[kind] = rendered
+        if validate:
+            project.reports[kind] = validate_document(rendered)
+    return project
+
+
+# =============================================================================
+# CONVERSIONS
+# =============================================================================
+
+def markdown_to_docx_bytes(markdown: str) -> Optional[bytes]:
+    """Convert Markdown to DOCX bytes (None if python-docx is missing)."""
+    return MarkdownToDocxConverter().convert_to_bytes(markdown)
+
+
+def docx_bytes_to_markdown(content: bytes) -> str:
+    """Convert DOCX bytes back to Markdown."""
+    return DocxToMarkdownConverter().convert(content)
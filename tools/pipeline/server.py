@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+VIANEO Local Rendering Service
+==============================
+
+Small HTTP service that renders VIANEO documents from posted project
+data, so portals can call the generators without shelling out to the CLIs.
+
+Renders run on a bounded, pre-warmed worker pool (processes by default,
+each importing the generators once at startup). Admission is limited to
+the number of workers plus a fixed queue; requests beyond that are
+rejected immediately with 503 and a Retry-After header instead of piling
+up. Each request has a deadline; if its render has not finished in time
+the client gets 504.
+
+Endpoints:
+    POST /render/<generator>?format=md|docx|html
+        Body: project data as JSON or YAML. <generator> is a document kind
+        (e.g. "diagnostic") or CLI name (e.g. "generate_diagnostic").
+    GET /health
+        Pool size, in-flight count and registered generators as JSON.
+
+Usage:
+    python -m pipeline.server --port 8765 --workers 4 --queue 16 --timeout 30
+"""
+
+import argparse
+import json
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import yaml
+
+from pipeline.documents import DOCUMENT_KINDS, get_document_kind, render_document
+
+
+# Response content types by output format
+CONTENT_TYPES = {
+    'md': 'text/markdown; charset=utf-8',
+    'html': 'text/html; charset=utf-8',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+# =============================================================================
+# WORKER FUNCTIONS
+# =============================================================================
+
+def resolve_generator_name(name: str) -> str:
+    """
+    Map a generator name from the URL to a document kind.
+
+    Accepts both kinds ("diagnostic") and CLI names ("generate_diagnostic").
+
+    Raises:
+        ValueError: If the generator is unknown
+    """
+    if name.startswith('generate_'):
+        name = name[len('generate_'):]
+    return get_document_kind(name).name
+
+
+def parse_request_body(body: bytes, content_type: str = '') -> Dict[str, Any]:
+    """
+    Parse a JSON or YAML request body into a dictionary.
+
+    Raises:
+        ValueError: If the body is not a JSON/YAML mapping
+    """
+    text = body.decode('utf-8')
+    try:
+        if 'json' in content_type:
+            data = json.loads(text)
+        else:
+            # YAML is a superset of JSON, so this also covers untyped bodies
+            data = yaml.safe_load(text)
+    except (json.JSONDecodeError, yaml.YAMLError) as e:
+        raise ValueError(f"Could not parse request body: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON or YAML mapping")
+    return data
+
+
+def render_payload(kind: str, output_format: str, body: bytes, content_type: str = '') -> bytes:
+    """
+    Render one document from a raw request body (runs inside a worker).
+
+    Args:
+        kind: Document kind
+        output_format: "md", "docx" or "html"
+        body: JSON/YAML project data
+        content_type: Request Content-Type, used to pick the parser
+
+    Returns:
+        Rendered document bytes
+
+    Raises:
+        ValueError: On bad input or an unsupported format
+        RuntimeError: If the output could not be produced
+    """
+    raw_data = parse_request_body(body, content_type)
+    try:
+        rendered = render_document(kind, raw_data, formats=[output_format])
+    except TypeError as e:
+        # Unknown or missing dataclass fields in the posted data
+        raise ValueError(f"Invalid {kind} data: {e}")
+
+    content = rendered.outputs().get(output_format)
+    if content is None:
+        raise RuntimeError(f"Could not produce {output_format} output (is python-docx installed?)")
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return content
+
+
+def _warm_worker() -> int:
+    """Touch the render path so a worker has imported everything it needs."""
+    render_document('diagnostic', {'project_name': 'warmup'}, formats=['md'])
+    return multiprocessing.current_process().pid
+
+
+# =============================================================================
+# SERVICE CLASS
+# =============================================================================
+
+class RenderService:
+    """
+    Bounded, pre-warmed render pool with admission control.
+
+    Example:
+        service = RenderService(workers=4, queue_size=16, timeout=30)
+        server = service.create_server(port=8765)
+        server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        use_processes: bool = True,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size < 0:
+            raise ValueError("queue_size cannot be negative")
+
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.use_processes = use_processes
+        self.max_body_bytes = max_body_bytes
+
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._executor: Optional[Executor] = None
+
+    # -------------------------------------------------------------------------
+    # Pool lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Create the worker pool and warm every worker."""
+        if self._executor is not None:
+            return
+        if self.use_processes:
+            # spawn: the service itself is multithreaded, so forking is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix='vianeo-render'
+            )
+        warmups = [self._executor.submit(_warm_worker) for _ in range(self.workers)]
+        for future in warmups:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> 'RenderService':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    # -------------------------------------------------------------------------
+    # Requests
+    # -------------------------------------------------------------------------
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted requests (running or queued)."""
+        return self._in_flight
+
+    def health(self) -> Dict[str, Any]:
+        """Return service status for GET /health."""
+        return {
+            'status': 'ok' if self._executor is not None else 'stopped',
+            'workers': self.workers,
+            'queue_size': self.queue_size,
+            'in_flight': self._in_flight,
+            'capacity': self.workers + self.queue_size,
+            'executor': 'process' if self.use_processes else 'thread',
+            'generators': list(DOCUMENT_KINDS),
+        }
+
+    def render(
+        self,
+        generator: str,
+        output_format: str,
+        body: bytes,
+        content_type: str = ''
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Admit, run and wait for one render request.
+
+        Returns:
+            Tuple of (HTTP status, extra headers, response body)
+        """
+        if self._executor is None:
+            return 503, {'Retry-After': '1'}, b"Service not started\n"
+
+        try:
+            kind = resolve_generator_name(generator)
+        except ValueError as e:
+            return 404, {}, f"{e}\n".encode('utf-8')
+
+        if output_format not in get_document_kind(kind).formats:
+            supported = ', '.join(get_document_kind(kind).formats)
+            return 400, {}, f"{kind} supports format(s): {supported}\n".encode('utf-8')
+
+        if not self._slots.acquire(blocking=False):
+            retry_after = max(1, int(self.timeout // 2))
+            return 503, {'Retry-After': str(retry_after)}, b"Render queue is full\n"
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(render_payload, kind, output_format, body, content_type)
+        except BaseException:
+            self._release_slot()
+            raise
+        # The slot is held until the render really finishes, not just until
+        # this request stops waiting, so a timed-out render that is still
+        # running keeps counting against the capacity
+        future.add_done_callback(self._release_slot)
+
+        try:
+            content = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # Not started yet: drop it; already running: it finishes unobserved
+            future.cancel()
+            return 504, {}, f"Render exceeded {self.timeout:g}s timeout\n".encode('utf-8')
+        except ValueError as e:
+            return 400, {}, f"{e}\n".encode('utf-8')
+        except Exception as e:
+            return 500, {}, f"Render failed: {e}\n".encode('utf-8')
+        return 200, {'Content-Type': CONTENT_TYPES[output_format]}, content
+
+    def _release_slot(self, future: Optional[Future] = None) -> None:
+        """Give back an admission slot (also used as a future done-callback)."""
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    # -------------------------------------------------------------------------
+    # HTTP server
+    # -------------------------------------------------------------------------
+
+    def create_server(self, host: str = '127.0.0.1', port: int = 8765) -> 'RenderHTTPServer':
+        """
+        Start the pool and return an HTTP server bound to host:port.
+
+        Pass port=0 to bind a free port (see server.server_address).
+        """
+        self.start()
+        handler = type('BoundRenderRequestHandler', (RenderRequestHandler,), {'service': self})
+        return RenderHTTPServer((host, port), handler)
+
+
+# =============================================================================
+# HTTP SERVER
+# =============================================================================
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    """Thread-per-connection server sized for bursts of concurrent clients."""
+
+    daemon_threads = True
+    # Listen backlog; the default of 5 resets connections under a burst
+    # before admission control ever sees them
+    request_queue_size = 128
+    verbose = False
+
+
+# =============================================================================
+# REQUEST HANDLER
+# =============================================================================
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a RenderService (bound by create_server)."""
+
+    service: RenderService = None
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path == '/health':
+            body = json.dumps(self.service.health()).encode('utf-8')
+            self._send(200, {'Content-Type': 'application/json'}, body)
+        else:
+            self._send(404, {}, b"Not found\n")
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        parts = url.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'render':
+            discarded = self._discard_body()
+            self._send(404, {}, b"Use POST /render/<generator>?format=md|docx|html\n",
+                       close=not discarded)
+            return
+
+        length = self._content_length()
+        if length < 0:
+            self._send(400, {}, b"Invalid Content-Length\n", close=True)
+            return
+        if length > self.service.max_body_bytes:
+            self._send(413, {}, b"Request body too large\n", close=True)
+            return
+        body = self.rfile.read(length)
+
+        query = parse_qs(url.query)
+        output_format = query.get('format', ['md'])[0]
+        status, headers, content = self.service.render(
+            parts[1],
+            output_format,
+            body,
+            self.headers.get('Content-Type', '')
+        )
+        self._send(status, headers, content)
+
+    def _content_length(self) -> int:
+        """Return the declared body length, or -1 if the header is invalid."""
+        try:
+            return int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            return -1
+
+    def _discard_body(self) -> bool:
+        """
+        Read and drop the request body so the connection stays usable.
+
+        Returns:
+            False if the body could not be skipped (invalid or oversized
+            Content-Length) and the connection must be closed
+        """
+        length = self._content_length()
+        if length < 0 or length > self.service.max_body_bytes:
+            return False
+        if length:
+            self.rfile.read(length)
+        return True
+
+    def _send(
+        self,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        close: bool = False
+    ) -> None:
+        self.send_response(status)
+        headers = dict(headers)
+        headers.setdefault('Content-Type', 'text/plain; charset=utf-8')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        if close:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Log to stderr only when the service is run from the CLI."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Serve VIANEO document rendering over local HTTP"
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port (default: 8765)')
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Worker processes (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--queue',
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help=f'Requests allowed to wait for a worker before 503 (default: {DEFAULT_QUEUE_SIZE})'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f'Per-request timeout in seconds (default: {DEFAULT_TIMEOUT:g})'
+    )
+    parser.add_argument(
+        '--threads',
+        action='store_true',
+        help='Use worker threads instead of processes'
+    )
+
+    args = parser.parse_args()
+
+    service = RenderService(
+        workers=args.workers,
+        queue_size=args.queue,
+        timeout=args.timeout,
+        use_processes=not args.threads
+    )
+    server = service.create_server(args.host, args.port)
+    server.verbose = True
+    host, port = server.server_address[:2]
+    print(f"Serving VIANEO renders on http://{host}:{port} ({args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
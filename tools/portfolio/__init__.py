@@ -0,0 +1,39 @@
+"""
+VIANEO Portfolio Processing
+===========================
+
+Tools for working with many project evaluations at once.
+
+Available modules:
+- shared_memory: Zero-copy shared-memory column tables for scoring and
+  validating large portfolios across worker processes
+- store: SQLite evaluation store with indexed cross-project queries
+- columnar: Memory-mapped columnar on-disk portfolio format for threshold
+  checks and dashboard statistics over very large portfolios
+"""
+
+from .shared_memory import (
+    SharedPortfolio,
+    SharedPortfolioHandle,
+    build_portfolio_tables,
+    map_portfolio,
+    score_portfolio,
+    validate_portfolio,
+)
+from .store import EvaluationStore, load_store_project
+from .columnar import ColumnarPortfolio, export_columnar, open_columnar, write_columnar
+
+__all__ = [
+    'SharedPortfolio',
+    'SharedPortfolioHandle',
+    'build_portfolio_tables',
+    'map_portfolio',
+    'score_portfolio',
+    'validate_portfolio',
+    'EvaluationStore',
+    'load_store_project',
+    'ColumnarPortfolio',
+    'export_columnar',
+    'open_columnar',
+    'write_columnar',
+]
@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+"""
+VIANEO Columnar Portfolio
+=========================
+
+On-disk columnar format for historical evaluations, read through memory maps.
+
+A portfolio directory holds one file per column plus manifest.json:
+- numeric columns:  <table>.<column>.npy (float64/int64), opened with
+                    numpy.load(mmap_mode="r")
+- text columns:     <table>.<column>.offsets.npy (rows + 1 int64 offsets)
+                    and <table>.<column>.utf8 (concatenated UTF-8), the same
+                    arena layout as the shared-memory portfolio
+
+With pyarrow installed, storage="parquet" writes one <table>.parquet per
+table instead, read with memory mapping.
+
+Tables:
+- projects:       name, source, one float column per VIANEO dimension
+- evidence:       project, quality_rating, id, section, source_type, date
+- value_network:  project, section, name, role, acceptability, need_level
+- q40, q29:       project, one float per questionnaire dimension, overall,
+                  threshold_failures, red_flags, insufficient_data (projects
+                  with 40Q/29Q responses only)
+
+Opening a portfolio reads only the manifest; columns are mapped when first
+used, so threshold checks and dashboard statistics over 100k projects touch
+just the pages of the columns they need and build no per-project objects.
+
+Usage:
+    python columnar.py --input evaluations/ --output portfolio_columns/
+    python columnar.py --open portfolio_columns/ --level investment
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import ScoreThresholds, VIANEO_DIMENSIONS
+from core.utils import load_data_file
+from converters.portfolio_to_html import STATUS_KEYWORDS, UNSCORED_STATUS, collect_portfolio_files
+from portfolio.shared_memory import COLUMN_DTYPES, build_portfolio_tables
+from validators.validate_score_thresholds import ScoreThresholdValidator
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+MANIFEST_NAME = "manifest.json"
+COLUMNAR_FORMAT = "vianeo-columnar"
+COLUMNAR_VERSION = 1
+
+STORAGE_FORMATS = ("npy", "parquet")
+
+# Columns: {column: (kind, values)} as in portfolio.shared_memory
+Columns = Dict[str, Tuple[str, Sequence[Any]]]
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for columnar portfolios: pip install numpy")
+
+
+# =============================================================================
+# TABLE BUILDING
+# =============================================================================
+
+def _responses_for(data: Dict[str, Any], key: str) -> Optional[Any]:
+    """A project's responses to questionnaire key ("40q"/"29q"), if any."""
+    from scoring.questionnaire_engine import detect_questionnaire, iter_responses
+
+    specific = data.get(f"responses_{key}")
+    if specific:
+        return specific
+    responses = data.get('responses')
+    if not responses:
+        return None
+    declared = data.get('questionnaire')
+    if declared:
+        return responses if str(declared).lower() == key else None
+    try:
+        detected = detect_questionnaire(question for question, _ in iter_responses(responses))
+    except ValueError:
+        return None
+    return responses if detected.key == key else None
+
+
+def build_questionnaire_table(
+    projects: Sequence[Tuple[str, Dict[str, Any]]],
+    key: str
+) -> Columns:
+    """
+    Score one questionnaire for every project that answered it.
+
+    Args:
+        projects: (source, data) pairs, in project order
+        key: "40q" or "29q"
+
+    Returns:
+        Columns (project, dimension scores, overall, counts)
+
+    Raises:
+        ValueError: For invalid responses
+    """
+    from scoring.questionnaire_engine import (
+        RESPONSE_INSUFFICIENT_DATA,
+        build_response_matrix,
+        score_responses,
+    )
+    from scoring.questionnaires import get_questionnaire
+
+    questionnaire = get_questionnaire(key)
+    rows, indices = [], []
+    for index, (source, data) in enumerate(projects):
+        responses = _responses_for(data, key) if isinstance(data, dict) else None
+        if responses is not None:
+            rows.append((source, {"responses": responses}))
+            indices.append(index)
+
+    columns: Columns = {"project": ("int", indices)}
+    if not rows:
+        for dimension in questionnaire.dimensions:
+            columns[dimension.key] = ("float", [])
+        columns.update({
+            "overall": ("float", []), "threshold_failures": ("int", []),
+            "red_flags": ("int", []), "insufficient_data": ("int", []),
+        })
+        return columns
+
+    scores = score_responses(build_response_matrix(rows, questionnaire))
+    for d, dimension in enumerate(questionnaire.dimensions):
+        columns[dimension.key] = ("float", scores.dimension_scores[:, d])
+    columns["overall"] = ("float", scores.overall)
+    columns["threshold_failures"] = ("int", scores.below_threshold.sum(axis=1))
+    columns["red_flags"] = ("int", scores.red_flags.sum(axis=1))
+    columns["insufficient_data"] = ("int", scores.response_counts[:, RESPONSE_INSUFFICIENT_DATA])
+    return columns
+
+
+def build_columnar_tables(projects: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Columns]:
+    """
+    Flatten parsed project data into the columnar portfolio tables.
+
+    Args:
+        projects: (source, data) pairs, e.g. from load_data_file()
+
+    Returns:
+        Dict mapping table name to {column: (kind, values)}
+    """
+    _require_numpy()
+    projects = [(str(source), data if isinstance(data, dict) else {}) for source, data in projects]
+    tables = build_portfolio_tables(projects)
+    tables["q40"] = build_questionnaire_table(projects, "40q")
+    tables["q29"] = build_questionnaire_table(projects, "29q")
+    return tables
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+def write_columnar(
+    tables: Dict[str, Columns],
+    directory: Union[str, Path],
+    storage: str = "npy"
+) -> Path:
+    """
+    Write tables as a columnar portfolio directory.
+
+    Existing column files in the directory are replaced; the manifest is
+    written last, so a partially written portfolio never opens.
+
+    Args:
+        tables: {table: {column: (kind, values)}}
+        directory: Output directory (created if needed)
+        storage: "npy" or "parquet" (requires pyarrow)
+
+    Returns:
+        Path of the manifest
+
+    Raises:
+        ValueError: For unknown storage/kinds or ragged tables
+        ImportError: If storage is "parquet" and pyarrow is missing
+    """
+    _require_numpy()
+    if storage not in STORAGE_FORMATS:
+        raise ValueError(f"Unknown storage format: {storage}")
+    if storage == "parquet" and not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for parquet storage: pip install pyarrow")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest_path = directory / MANIFEST_NAME
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+    manifest_tables: Dict[str, Any] = {}
+    for table_name, columns in tables.items():
+        lengths = {len(values) for _, values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns of table {table_name} differ in length")
+        rows = lengths.pop() if lengths else 0
+
+        kinds = {}
+        arrow_columns = {}
+        for column_name, (kind, values) in columns.items():
+            if kind in COLUMN_DTYPES:
+                array = np.asarray(values, dtype=COLUMN_DTYPES[kind]).reshape(rows)
+                if storage == "npy":
+                    np.save(directory / f"{table_name}.{column_name}.npy", array)
+                else:
+                    arrow_columns[column_name] = pa.array(array)
+            elif kind == "text":
+                texts = ["" if value is None else str(value) for value in values]
+                if storage == "npy":
+                    parts = [text.encode('utf-8') for text in texts]
+                    offsets = np.zeros(rows + 1, dtype="<i8")
+                    if parts:
+                        np.cumsum([len(part) for part in parts], out=offsets[1:])
+                    np.save(directory / f"{table_name}.{column_name}.offsets.npy", offsets)
+                    (directory / f"{table_name}.{column_name}.utf8").write_bytes(b"".join(parts))
+                else:
+                    arrow_columns[column_name] = pa.array(texts, type=pa.string())
+            else:
+                raise ValueError(f"Unknown column kind for {table_name}.{column_name}: {kind}")
+            kinds[column_name] = kind
+
+        if storage == "parquet":
+            pq.write_table(pa.table(arrow_columns), directory / f"{table_name}.parquet")
+        manifest_tables[table_name] = {"rows": rows, "columns": kinds}
+
+    manifest = {
+        "format": COLUMNAR_FORMAT,
+        "version": COLUMNAR_VERSION,
+        "storage": storage,
+        "tables": manifest_tables,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    return manifest_path
+
+
+def export_columnar(
+    inputs: Iterable[Path],
+    directory: Union[str, Path],
+    storage: str = "npy"
+) -> Path:
+    """
+    Load project files (or directories of them) and write a columnar portfolio.
+
+    Returns:
+        Path of the manifest
+    """
+    files = collect_portfolio_files(inputs)
+    tables = build_columnar_tables((path, load_data_file(path) or {}) for path in files)
+    return write_columnar(tables, directory, storage)
+
+
+def is_columnar_directory(directory: Union[str, Path]) -> bool:
+    """True if the directory holds a manifest written by write_columnar()."""
+    manifest_path = Path(directory) / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return False
+    return isinstance(manifest, dict) and manifest.get("format") == COLUMNAR_FORMAT
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+class ColumnarTable:
+    """Read-only view of one table; columns are memory-mapped on first use."""
+
+    def __init__(self, portfolio: 'ColumnarPortfolio', name: str, rows: int, kinds: Dict[str, str]):
+        self._portfolio = portfolio
+        self.name = name
+        self.rows = rows
+        self.kinds = kinds
+        self._arrays: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.kinds)
+
+    def _kind(self, column: str, expected: Tuple[str, ...]) -> str:
+        kind = self.kinds.get(column)
+        if kind is None:
+            raise KeyError(f"No column {column} in table {self.name}")
+        if kind not in expected:
+            raise TypeError(f"{self.name}.{column} is a {kind} column")
+        return kind
+
+    def array(self, column: str) -> 'np.ndarray':
+        """Numeric column as a read-only (memory-mapped) array."""
+        self._kind(column, tuple(COLUMN_DTYPES))
+        if column not in self._arrays:
+            self._arrays[column] = self._portfolio._load_numeric(self.name, column, self.rows)
+        return self._arrays[column]
+
+    def _text_column(self, column: str) -> Tuple['np.ndarray', Any]:
+        self._kind(column, ("text",))
+        if column not in self._arrays:
+            self._arrays[column] = self._portfolio._load_text(self.name, column, self.rows)
+        return self._arrays[column]
+
+    def text(self, column: str, row: int) -> str:
+        """One text value."""
+        return self.texts(column, row, row + 1)[0]
+
+    def texts(self, column: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Text values for a row range."""
+        offsets, arena = self._text_column(column)
+        stop = self.rows if stop is None else min(stop, self.rows)
+        if isinstance(arena, list):
+            return arena[start:stop]
+        bounds = offsets[start:stop + 1].tolist()
+        return [
+            bytes(arena[bounds[i]:bounds[i + 1]]).decode('utf-8')
+            for i in range(len(bounds) - 1)
+        ]
+
+    def rows_for(self, project: int) -> Tuple[int, int]:
+        """Row range of a project in a child table (sorted by "project")."""
+        owners = self.array("project")
+        return (
+            int(np.searchsorted(owners, project, side="left")),
+            int(np.searchsorted(owners, project, side="right")),
+        )
+
+
+class ColumnarPortfolio:
+    """
+    A columnar portfolio directory opened for reading.
+
+    Args:
+        directory: Directory written by write_columnar()
+
+    Raises:
+        ValueError: If the directory has no valid manifest
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        _require_numpy()
+        self.directory = Path(directory)
+        manifest_path = self.directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            raise ValueError(f"No columnar portfolio in {self.directory} (missing {MANIFEST_NAME})")
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if manifest.get("format") != COLUMNAR_FORMAT or manifest.get("version") != COLUMNAR_VERSION:
+            raise ValueError(f"{manifest_path}: unsupported format {manifest.get('format')} "
+                             f"v{manifest.get('version')}")
+        self.storage = manifest["storage"]
+        if self.storage == "parquet" and not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to read parquet portfolios: pip install pyarrow")
+        self._arrow_tables: Dict[str, Any] = {}
+        self._tables = {
+            name: ColumnarTable(self, name, info["rows"], info["columns"])
+            for name, info in manifest["tables"].items()
+        }
+
+    # -------------------------------------------------------------------------
+    # Column access
+    # -------------------------------------------------------------------------
+
+    def _arrow_table(self, table: str) -> Any:
+        if table not in self._arrow_tables:
+            self._arrow_tables[table] = pq.read_table(
+                self.directory / f"{table}.parquet", memory_map=True
+            )
+        return self._arrow_tables[table]
+
+    def _load_numeric(self, table: str, column: str, rows: int) -> 'np.ndarray':
+        if self.storage == "parquet":
+            return self._arrow_table(table).column(column).to_numpy()
+        return np.load(self.directory / f"{table}.{column}.npy", mmap_mode="r")
+
+    def _load_text(self, table: str, column: str, rows: int) -> Tuple[Optional['np.ndarray'], Any]:
+        if self.storage == "parquet":
+            return None, self._arrow_table(table).column(column).to_pylist()
+        offsets = np.load(self.directory / f"{table}.{column}.offsets.npy", mmap_mode="r")
+        arena_path = self.directory / f"{table}.{column}.utf8"
+        if arena_path.stat().st_size == 0:
+            return offsets, b""
+        return offsets, np.memmap(arena_path, dtype=np.uint8, mode="r")
+
+    def table(self, name: str) -> ColumnarTable:
+        return self._tables[name]
+
+    @property
+    def table_names(self) -> List[str]:
+        return list(self._tables)
+
+    @property
+    def projects(self) -> ColumnarTable:
+        return self._tables["projects"]
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def score_matrix(self) -> 'np.ndarray':
+        """Projects x VIANEO_DIMENSIONS float array (NaN = missing)."""
+        return np.column_stack([self.projects.array(dim) for dim in VIANEO_DIMENSIONS]) \
+            if len(self) else np.empty((0, len(VIANEO_DIMENSIONS)))
+
+    # -------------------------------------------------------------------------
+    # Analytics
+    # -------------------------------------------------------------------------
+
+    def weighted_scores(self) -> 'np.ndarray':
+        """Weighted score over the dimensions present (0.0 when none)."""
+        scores = self.score_matrix()
+        weights = np.array([info["weight"] for info in VIANEO_DIMENSIONS.values()])
+        present = ~np.isnan(scores)
+        total_weight = present @ weights
+        return np.divide(
+            np.where(present, scores, 0.0) @ weights, total_weight,
+            out=np.zeros(len(scores)), where=total_weight > 0
+        )
+
+    def status_counts(self) -> Dict[str, int]:
+        """
+        Projects per ScoreThresholds status keyword of the weighted score.
+
+        Projects without any dimension score are counted under
+        UNSCORED_STATUS rather than as Non-viable.
+        """
+        weighted = self.weighted_scores()
+        scored = (~np.isnan(self.score_matrix())).any(axis=1)
+        lower_bounds = [
+            ScoreThresholds.STRONG[0], ScoreThresholds.PROMISING[0],
+            ScoreThresholds.DEVELOPING[0], ScoreThresholds.PROBLEMATIC[0],
+        ]
+        # Index into STATUS_KEYWORDS (descending): count of bounds not reached
+        index = (weighted[scored, None] < np.array(lower_bounds)[None, :]).sum(axis=1)
+        counts = np.bincount(index, minlength=len(STATUS_KEYWORDS))
+        result = dict(zip(STATUS_KEYWORDS, counts.tolist()))
+        result[UNSCORED_STATUS] = int((~scored).sum())
+        return result
+
+    def evidence_quality(self) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Per-project evidence statistics.
+
+        Returns:
+            (mean quality rating, NaN without rated evidence; entry count)
+        """
+        evidence = self.table("evidence")
+        owners = np.asarray(evidence.array("project"))
+        ratings = np.asarray(evidence.array("quality_rating"))
+        rated = ~np.isnan(ratings)
+        size = len(self)
+        sums = np.bincount(owners[rated], weights=ratings[rated], minlength=size)
+        counts = np.bincount(owners[rated], minlength=size)
+        mean = np.divide(sums, counts, out=np.full(size, np.nan), where=counts > 0)
+        return mean, np.bincount(owners, minlength=size)
+
+    def threshold_check(self, threshold_level: str = "viable") -> Dict[str, Dict[str, Any]]:
+        """
+        ScoreThresholdValidator checks for every project at once.
+
+        Args:
+            threshold_level: "viable" or "investment"
+
+        Returns:
+            {dimension: {threshold, mean, below, missing, out_of_range}};
+            below counts projects under the threshold (gap >= 0.5 are
+            errors in ScoreThresholdValidator, smaller gaps warnings)
+        """
+        validator = ScoreThresholdValidator(threshold_level)
+        result = {}
+        for dim in VIANEO_DIMENSIONS:
+            values = np.asarray(self.projects.array(dim))
+            present = ~np.isnan(values)
+            scored = values[present]
+            threshold = validator.get_threshold(dim)
+            in_range = (scored >= 0) & (scored <= 5)
+            below = in_range & (scored < threshold)
+            result[dim] = {
+                "threshold": threshold,
+                "mean": float(scored.mean()) if scored.size else None,
+                "below": int(below.sum()),
+                "below_errors": int((below & (threshold - scored >= 0.5)).sum()),
+                "missing": int((~present).sum()),
+                "out_of_range": int((~in_range).sum()),
+            }
+        return result
+
+    def failing_projects(self, threshold_level: str = "viable") -> 'np.ndarray':
+        """Indices of projects with any dimension below the threshold (missing counted)."""
+        validator = ScoreThresholdValidator(threshold_level)
+        thresholds = np.array([validator.get_threshold(dim) for dim in VIANEO_DIMENSIONS])
+        scores = self.score_matrix()
+        return np.flatnonzero((np.nan_to_num(scores, nan=0.0) < thresholds).any(axis=1))
+
+    # -------------------------------------------------------------------------
+    # Lifetime
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Drop the column maps (arrays handed out stay valid until released)."""
+        for table in self._tables.values():
+            table._arrays.clear()
+        self._arrow_tables.clear()
+
+    def __enter__(self) -> 'ColumnarPortfolio':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_columnar(directory: Union[str, Path]) -> ColumnarPortfolio:
+    """Open a columnar portfolio directory."""
+    return ColumnarPortfolio(directory)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def print_summary(portfolio: ColumnarPortfolio, threshold_level: str) -> None:
+    """Print fund-level statistics for a columnar portfolio."""
+    print(f"Projects: {len(portfolio)}")
+    for keyword, count in portfolio.status_counts().items():
+        print(f"  {keyword}: {count}")
+    print(f"Threshold check ({threshold_level}):")
+    for dim, stats in portfolio.threshold_check(threshold_level).items():
+        mean = "-" if stats["mean"] is None else f"{stats['mean']:.2f}"
+        print(f"  {VIANEO_DIMENSIONS[dim]['name']}: mean {mean}, below {stats['threshold']}: "
+              f"{stats['below']}, missing: {stats['missing']}")
+    quality, counts = portfolio.evidence_quality()
+    rated = quality[~np.isnan(quality)]
+    line = f"Evidence: {int(counts.sum())} entries"
+    if rated.size:
+        line += f", mean project quality {rated.mean():.2f}"
+    print(line)
+    for key in ("q40", "q29"):
+        if key in portfolio.table_names and len(portfolio.table(key)):
+            overall = np.asarray(portfolio.table(key).array("overall"))
+            print(f"{key.upper()}: {len(overall)} project(s), mean overall {np.nanmean(overall):.2f}")
+
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Export VIANEO evaluations to a memory-mapped columnar portfolio and summarize it"
+    )
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        nargs='+',
+        help='Project data files and/or directories to export'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='Columnar portfolio directory to write (with --input)'
+    )
+    parser.add_argument(
+        '--open',
+        type=Path,
+        help='Columnar portfolio directory to summarize'
+    )
+    parser.add_argument(
+        '--storage', '-s',
+        choices=STORAGE_FORMATS,
+        default='npy',
+        help='Column storage (default: npy; parquet requires pyarrow)'
+    )
+    parser.add_argument(
+        '--level',
+        choices=['viable', 'investment'],
+        default='viable',
+        help='Threshold level for the summary (default: viable)'
+    )
+    parser.add_argument(
+        '--overwrite',
+        action='store_true',
+        help='Remove an existing columnar portfolio at --output first'
+    )
+
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("Error: numpy is required (pip install numpy)")
+        return 1
+
+    directory = args.open
+    if args.input:
+        if args.output is None:
+            parser.error("--output is required with --input")
+        if args.overwrite and args.output.exists():
+            if not is_columnar_directory(args.output):
+                parser.error(f"--overwrite only replaces a columnar portfolio; "
+                             f"{args.output} has no {MANIFEST_NAME} in {COLUMNAR_FORMAT} format")
+            shutil.rmtree(args.output)
+        start = time.perf_counter()
+        try:
+            export_columnar(args.input, args.output, args.storage)
+        except (ValueError, ImportError) as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Exported to {args.output} in {time.perf_counter() - start:.2f}s")
+        directory = directory or args.output
+
+    if directory is None:
+        parser.error("Use --input/--output to export or --open to summarize")
+
+    start = time.perf_counter()
+    try:
+        with open_columnar(directory) as portfolio:
+            print_summary(portfolio, args.level)
+    except (ValueError, ImportError) as e:
+        print(f"Error: {e}")
+        return 1
+    print(f"Summary in {time.perf_counter() - start:.3f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
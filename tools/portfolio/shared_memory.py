@@ -0,0 +1,696 @@
+#!/usr/bin/env python3
+"""
+VIANEO Shared-Memory Portfolio
+==============================
+
+Zero-copy representation of a parsed portfolio for multi-process work.
+
+The portfolio is stored as column tables in one
+multiprocessing.shared_memory block:
+- numeric columns (scores, ratings, row links) are float64/int64 arrays
+  read through NumPy views
+- text columns are an offset-indexed UTF-8 arena: an int64 offsets array
+  (rows + 1 entries) followed by the concatenated encoded strings
+
+Workers receive only a SharedPortfolioHandle (block name plus layout, a few
+hundred bytes when pickled) and attach read-only. Nothing else is pickled
+per task, so scoring and validating large portfolios across many processes
+is no longer dominated by serializing dicts of scores, evidence logs and
+value network rows.
+
+Tables built by build_portfolio_tables():
+- projects:       name, source, one float column per VIANEO dimension (NaN = missing)
+- evidence:       project, id, section, source_type, date, quality_rating
+- value_network:  project, section, name, role, acceptability, need_level
+
+Child tables are sorted by their "project" column, so a project's rows
+are found with a binary search.
+
+Usage:
+    python shared_memory.py --input evaluations/ --workers 8
+"""
+
+import argparse
+import math
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import ScoreThresholds, VIANEO_DIMENSIONS
+from core.utils import ValidationReport, extract_dimension_scores, load_data_file
+from converters.portfolio_to_html import STATUS_KEYWORDS, UNSCORED_STATUS, collect_portfolio_files
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Column kinds and their NumPy dtypes ("text" columns live in the arena)
+COLUMN_DTYPES = {"float": "<f8", "int": "<i8"}
+
+# Every segment starts on an 8-byte boundary so NumPy views stay aligned
+SEGMENT_ALIGNMENT = 8
+
+# Value network sections, in ValueChainData field order
+VALUE_NETWORK_SECTIONS = (
+    "enablers_influencers",
+    "products_solutions",
+    "channels_partners",
+    "buyers",
+    "end_users",
+)
+
+EVIDENCE_TEXT_FIELDS = ("id", "section", "source_type", "date")
+ORGANIZATION_TEXT_FIELDS = ("name", "role", "acceptability", "need_level")
+
+# Minimum evidence entries per project (matches validate_evidence)
+MIN_EVIDENCE_ENTRIES = 3
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass(frozen=True)
+class ColumnLayout:
+    """Location of one column inside the shared block."""
+    kind: str                 # "float", "int" or "text"
+    offset: int               # values (float/int) or offsets array (text)
+    arena_offset: int = 0     # text only: start of the encoded strings
+    arena_size: int = 0
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """Row count and column layouts of one table."""
+    rows: int
+    columns: Tuple[Tuple[str, ColumnLayout], ...]
+
+    def column(self, name: str) -> ColumnLayout:
+        for column_name, layout in self.columns:
+            if column_name == name:
+                return layout
+        raise KeyError(f"Unknown column: {name}")
+
+
+@dataclass(frozen=True)
+class SharedPortfolioHandle:
+    """Picklable reference to a shared portfolio (what workers receive)."""
+    name: str
+    size: int
+    tables: Tuple[Tuple[str, TableLayout], ...]
+
+    def table(self, name: str) -> TableLayout:
+        for table_name, layout in self.tables:
+            if table_name == name:
+                return layout
+        raise KeyError(f"Unknown table: {name}")
+
+
+# =============================================================================
+# TABLE BUILDING
+# =============================================================================
+
+def build_portfolio_tables(
+    projects: Iterable[Tuple[str, Dict[str, Any]]]
+) -> Dict[str, Dict[str, Tuple[str, List[Any]]]]:
+    """
+    Flatten parsed project data into typed columns.
+
+    Args:
+        projects: (source, data) pairs, e.g. from load_data_file()
+
+    Returns:
+        Dict mapping table name to {column: (kind, values)}
+    """
+    project_cols: Dict[str, List[Any]] = {"name": [], "source": []}
+    project_cols.update({dim: [] for dim in VIANEO_DIMENSIONS})
+    evidence_cols: Dict[str, List[Any]] = {"project": [], "quality_rating": []}
+    evidence_cols.update({key: [] for key in EVIDENCE_TEXT_FIELDS})
+    network_cols: Dict[str, List[Any]] = {"project": [], "section": []}
+    network_cols.update({key: [] for key in ORGANIZATION_TEXT_FIELDS})
+
+    for index, (source, data) in enumerate(projects):
+        if not isinstance(data, dict):
+            data = {}
+        name = data.get('project_name') or data.get('company_name') or Path(source).stem
+        project_cols["name"].append(str(name))
+        project_cols["source"].append(str(source))
+        scores = extract_dimension_scores(data)
+        for dim in VIANEO_DIMENSIONS:
+            project_cols[dim].append(scores.get(dim, math.nan))
+
+        for entry in data.get('evidence_log') or []:
+            if not isinstance(entry, dict):
+                continue
+            evidence_cols["project"].append(index)
+            evidence_cols["quality_rating"].append(_to_float(entry.get('quality_rating')))
+            for key in EVIDENCE_TEXT_FIELDS:
+                evidence_cols[key].append(_to_text(entry.get(key)))
+
+        for section in VALUE_NETWORK_SECTIONS:
+            for org in data.get(section) or []:
+                if not isinstance(org, dict):
+                    continue
+                network_cols["project"].append(index)
+                network_cols["section"].append(section)
+                for key in ORGANIZATION_TEXT_FIELDS:
+                    network_cols[key].append(_to_text(org.get(key)))
+
+    def typed(columns: Dict[str, List[Any]], kinds: Dict[str, str]) -> Dict[str, Tuple[str, List[Any]]]:
+        return {name: (kinds.get(name, "text"), values) for name, values in columns.items()}
+
+    return {
+        "projects": typed(project_cols, {dim: "float" for dim in VIANEO_DIMENSIONS}),
+        "evidence": typed(evidence_cols, {"project": "int", "quality_rating": "float"}),
+        "value_network": typed(network_cols, {"project": "int"}),
+    }
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _to_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _align(offset: int) -> int:
+    return (offset + SEGMENT_ALIGNMENT - 1) // SEGMENT_ALIGNMENT * SEGMENT_ALIGNMENT
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for shared-memory portfolios: pip install numpy")
+
+
+# =============================================================================
+# SHARED PORTFOLIO CLASS
+# =============================================================================
+
+class SharedTable:
+    """Read-only view of one table in a shared portfolio."""
+
+    def __init__(self, buffer: memoryview, layout: TableLayout):
+        self._buffer = buffer
+        self.layout = layout
+        self._arrays: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return self.layout.rows
+
+    @property
+    def column_names(self) -> List[str]:
+        return [name for name, _ in self.layout.columns]
+
+    def array(self, name: str) -> 'np.ndarray':
+        """NumPy view of a float or int column (no copy, read-only)."""
+        if name not in self._arrays:
+            column = self.layout.column(name)
+            if column.kind == "text":
+                raise ValueError(f"Column {name} is text; use text() or texts()")
+            view = np.frombuffer(
+                self._buffer, dtype=COLUMN_DTYPES[column.kind],
+                count=self.layout.rows, offset=column.offset
+            )
+            view.flags.writeable = False
+            self._arrays[name] = view
+        return self._arrays[name]
+
+    def _text_offsets(self, name: str) -> Tuple['np.ndarray', ColumnLayout]:
+        column = self.layout.column(name)
+        if column.kind != "text":
+            raise ValueError(f"Column {name} is {column.kind}; use array()")
+        key = f"{name}#offsets"
+        if key not in self._arrays:
+            view = np.frombuffer(
+                self._buffer, dtype="<i8", count=self.layout.rows + 1, offset=column.offset
+            )
+            view.flags.writeable = False
+            self._arrays[key] = view
+        return self._arrays[key], column
+
+    def text(self, name: str, row: int) -> str:
+        """Decode one string from a text column."""
+        offsets, column = self._text_offsets(name)
+        start = column.arena_offset + int(offsets[row])
+        end = column.arena_offset + int(offsets[row + 1])
+        return bytes(self._buffer[start:end]).decode('utf-8')
+
+    def texts(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Decode a contiguous range of a text column."""
+        offsets, column = self._text_offsets(name)
+        stop = self.layout.rows if stop is None else stop
+        if start >= stop:
+            return []
+        base = column.arena_offset
+        blob = bytes(self._buffer[base + int(offsets[start]):base + int(offsets[stop])])
+        first = int(offsets[start])
+        return [
+            blob[int(offsets[i]) - first:int(offsets[i + 1]) - first].decode('utf-8')
+            for i in range(start, stop)
+        ]
+
+    def rows_for(self, project: int) -> Tuple[int, int]:
+        """Row range [start, stop) of a child table belonging to one project."""
+        projects = self.array("project")
+        return (
+            int(np.searchsorted(projects, project, side="left")),
+            int(np.searchsorted(projects, project, side="right")),
+        )
+
+    def _release(self) -> None:
+        self._arrays.clear()
+        self._buffer = None
+
+
+# Portfolios mapped in this process, by block name (see attach_portfolio)
+_OPEN: Dict[str, 'SharedPortfolio'] = {}
+_OPEN_LOCK = threading.Lock()
+
+
+class SharedPortfolio:
+    """
+    Portfolio tables stored in a shared memory block.
+
+    Create once in the parent with create() (or from_files()), pass
+    portfolio.handle to workers, and attach there with attach(). Views
+    returned by array() must not be kept after close().
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, handle: SharedPortfolioHandle, owner: bool):
+        self._shm = shm
+        self.handle = handle
+        self.owner = owner
+        self._tables = {
+            name: SharedTable(shm.buf, layout) for name, layout in handle.tables
+        }
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def create(cls, tables: Dict[str, Dict[str, Tuple[str, Sequence[Any]]]]) -> 'SharedPortfolio':
+        """
+        Copy typed columns into a new shared memory block.
+
+        Args:
+            tables: {table: {column: (kind, values)}} as returned by
+                build_portfolio_tables(); all columns of a table must have
+                the same length
+
+        Returns:
+            Owning SharedPortfolio (unlink() or use as a context manager)
+
+        Raises:
+            ValueError: For unknown column kinds or ragged tables
+        """
+        _require_numpy()
+
+        encoded: Dict[Tuple[str, str], List[bytes]] = {}
+        table_layouts = []
+        offset = 0
+        for table_name, columns in tables.items():
+            lengths = {len(values) for _, values in columns.values()}
+            if len(lengths) > 1:
+                raise ValueError(f"Columns of table {table_name} differ in length")
+            rows = lengths.pop() if lengths else 0
+
+            column_layouts = []
+            for column_name, (kind, values) in columns.items():
+                offset = _align(offset)
+                if kind in COLUMN_DTYPES:
+                    column_layouts.append((column_name, ColumnLayout(kind, offset)))
+                    offset += rows * 8
+                elif kind == "text":
+                    parts = [str(value).encode('utf-8') for value in values]
+                    encoded[(table_name, column_name)] = parts
+                    arena_offset = offset + (rows + 1) * 8
+                    arena_size = sum(len(part) for part in parts)
+                    column_layouts.append((column_name, ColumnLayout(kind, offset, arena_offset, arena_size)))
+                    offset = arena_offset + arena_size
+                else:
+                    raise ValueError(f"Unknown column kind for {table_name}.{column_name}: {kind}")
+            table_layouts.append((table_name, TableLayout(rows, tuple(column_layouts))))
+
+        size = max(_align(offset), SEGMENT_ALIGNMENT)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        handle = SharedPortfolioHandle(name=shm.name, size=size, tables=tuple(table_layouts))
+
+        try:
+            for table_name, layout in table_layouts:
+                for column_name, column in layout.columns:
+                    values = tables[table_name][column_name][1]
+                    if column.kind == "text":
+                        parts = encoded[(table_name, column_name)]
+                        offsets = np.ndarray((layout.rows + 1,), dtype="<i8", buffer=shm.buf, offset=column.offset)
+                        offsets[0] = 0
+                        if parts:
+                            np.cumsum([len(part) for part in parts], out=offsets[1:])
+                        shm.buf[column.arena_offset:column.arena_offset + column.arena_size] = b"".join(parts)
+                        del offsets
+                    else:
+                        target = np.ndarray((layout.rows,), dtype=COLUMN_DTYPES[column.kind], buffer=shm.buf, offset=column.offset)
+                        target[:] = values
+                        del target
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        portfolio = cls(shm, handle, owner=True)
+        with _OPEN_LOCK:
+            _OPEN[shm.name] = portfolio
+        return portfolio
+
+    @classmethod
+    def from_files(cls, inputs: Iterable[Path]) -> 'SharedPortfolio':
+        """
+        Load project data files (or directories of them) into shared memory.
+
+        Args:
+            inputs: Files and/or directories of YAML/JSON project data
+
+        Returns:
+            Owning SharedPortfolio
+        """
+        files = collect_portfolio_files(inputs)
+        return cls.create(build_portfolio_tables(
+            (path, load_data_file(path)) for path in files
+        ))
+
+    @classmethod
+    def attach(cls, handle: SharedPortfolioHandle) -> 'SharedPortfolio':
+        """
+        Attach to a portfolio created by another process (read-only views).
+
+        Args:
+            handle: SharedPortfolio.handle from the creating process
+
+        Returns:
+            Non-owning SharedPortfolio
+        """
+        _require_numpy()
+        try:
+            # Python 3.13+: the creator alone owns the block's lifetime
+            shm = shared_memory.SharedMemory(name=handle.name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=handle.name)
+        return cls(shm, handle, owner=False)
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    def table(self, name: str) -> SharedTable:
+        """Return one table (KeyError if absent)."""
+        return self._tables[name]
+
+    @property
+    def projects(self) -> SharedTable:
+        return self._tables["projects"]
+
+    def __len__(self) -> int:
+        return len(self.projects) if "projects" in self._tables else 0
+
+    def score_matrix(self, start: int = 0, stop: Optional[int] = None) -> 'np.ndarray':
+        """Rows x dimensions float array (NaN = missing) for a project range."""
+        stop = len(self) if stop is None else stop
+        return np.column_stack([
+            self.projects.array(dim)[start:stop] for dim in VIANEO_DIMENSIONS
+        ])
+
+    # -------------------------------------------------------------------------
+    # Lifetime
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Release this process's mapping (views become invalid)."""
+        with _OPEN_LOCK:
+            if _OPEN.get(self.handle.name) is self:
+                del _OPEN[self.handle.name]
+        for table in self._tables.values():
+            table._release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared block (owner only; attached workers keep their mapping)."""
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> 'SharedPortfolio':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        self.unlink()
+
+
+# =============================================================================
+# WORKER TASKS
+# =============================================================================
+
+def attach_portfolio(handle: SharedPortfolioHandle) -> SharedPortfolio:
+    """
+    Return this process's mapping of handle, attaching on first use.
+
+    Tasks running in the creating process (e.g. on a thread pool) reuse
+    the owner's mapping; worker processes attach once and keep the
+    mapping for every later task.
+    """
+    with _OPEN_LOCK:
+        portfolio = _OPEN.get(handle.name)
+        if portfolio is None:
+            portfolio = SharedPortfolio.attach(handle)
+            _OPEN[handle.name] = portfolio
+        return portfolio
+
+
+def score_rows(handle: SharedPortfolioHandle, start: int, stop: int) -> Dict[str, 'np.ndarray']:
+    """
+    Score a range of projects (vectorized, same rules as ProjectScores).
+
+    Returns:
+        Dict of arrays for the range: weighted (overall weighted score over
+        the dimensions present), gap (total distance below the dimension
+        minimums, missing counted as 0) and status (index into
+        STATUS_KEYWORDS, -1 for projects without any dimension score)
+    """
+    portfolio = attach_portfolio(handle)
+    scores = portfolio.score_matrix(start, stop)
+    weights = np.array([info["weight"] for info in VIANEO_DIMENSIONS.values()])
+    minimums = np.array([info["min_score"] for info in VIANEO_DIMENSIONS.values()])
+
+    present = ~np.isnan(scores)
+    filled = np.where(present, scores, 0.0)
+    total_weight = present @ weights
+    weighted = np.divide(
+        filled @ weights, total_weight,
+        out=np.zeros(len(scores)), where=total_weight > 0
+    )
+    gap = np.clip(minimums - filled, 0.0, None).sum(axis=1)
+    status = np.array([
+        STATUS_KEYWORDS.index(ScoreThresholds.get_status_keyword(float(value))) if scored else -1
+        for value, scored in zip(weighted, total_weight > 0)
+    ], dtype=np.int64)
+    return {"weighted": weighted, "gap": gap, "status": status}
+
+
+def validate_rows(handle: SharedPortfolioHandle, start: int, stop: int) -> Dict[int, ValidationReport]:
+    """
+    Validate scores and evidence logs for a range of projects.
+
+    Returns:
+        Dict mapping project index to its report, for projects with at
+        least one error or warning
+    """
+    portfolio = attach_portfolio(handle)
+    scores = portfolio.score_matrix(start, stop)
+    evidence = portfolio.table("evidence")
+    ratings = evidence.array("quality_rating")
+    dims = list(VIANEO_DIMENSIONS.items())
+
+    reports: Dict[int, ValidationReport] = {}
+    for offset, row in enumerate(scores):
+        project = start + offset
+        report = ValidationReport()
+
+        for (dim_key, dim_info), value in zip(dims, row):
+            if np.isnan(value):
+                report.add_error(f"{dim_key}_score", f"Missing {dim_info['name']} score")
+            elif value < dim_info["min_score"]:
+                report.add_warning(
+                    f"{dim_key}_score",
+                    f"{dim_info['name']} score {value:.1f} below minimum {dim_info['min_score']:.1f}"
+                )
+
+        first, last = evidence.rows_for(project)
+        if last - first < MIN_EVIDENCE_ENTRIES:
+            report.add_warning(
+                "evidence_log",
+                f"Only {last - first} evidence entries. Recommend minimum {MIN_EVIDENCE_ENTRIES}."
+            )
+        for index in range(first, last):
+            rating = ratings[index]
+            if np.isnan(rating) or not 1 <= rating <= 5:
+                evidence_id = evidence.text("id", index) or "unknown"
+                report.add_error(f"{evidence_id}.quality", "Quality rating missing or outside 1-5")
+
+        if report.results:
+            reports[project] = report
+    return reports
+
+
+# =============================================================================
+# PARALLEL DRIVER
+# =============================================================================
+
+def map_portfolio(
+    portfolio: SharedPortfolio,
+    task: Callable[[SharedPortfolioHandle, int, int], Any],
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> List[Any]:
+    """
+    Run task(handle, start, stop) over contiguous project ranges in parallel.
+
+    Only the handle and the range bounds are pickled per task.
+
+    Args:
+        portfolio: Owning or attached SharedPortfolio
+        task: Module-level function (must be picklable)
+        chunk_size: Projects per task (default: about 4 tasks per worker)
+        max_workers: Pool size when no executor is given
+        executor: Existing executor to reuse
+
+    Returns:
+        Task results in range order
+    """
+    rows = len(portfolio)
+    if rows == 0:
+        return []
+
+    workers = max_workers or multiprocessing.cpu_count()
+    chunk_size = chunk_size or max(1, math.ceil(rows / (workers * 4)))
+    ranges = [(start, min(start + chunk_size, rows)) for start in range(0, rows, chunk_size)]
+
+    if executor is not None:
+        futures = [executor.submit(task, portfolio.handle, start, stop) for start, stop in ranges]
+        return [future.result() for future in futures]
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(ranges)),
+        mp_context=multiprocessing.get_context('spawn')
+    ) as pool:
+        return map_portfolio(portfolio, task, chunk_size, executor=pool)
+
+
+def score_portfolio(portfolio: SharedPortfolio, **options) -> Dict[str, 'np.ndarray']:
+    """
+    Score every project in parallel (see score_rows).
+
+    Args:
+        portfolio: SharedPortfolio
+        **options: chunk_size, max_workers or executor for map_portfolio()
+
+    Returns:
+        Dict of per-project arrays: weighted, gap, status
+    """
+    chunks = map_portfolio(portfolio, score_rows, **options)
+    if not chunks:
+        return {key: np.zeros(0) for key in ("weighted", "gap", "status")}
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+
+def validate_portfolio(portfolio: SharedPortfolio, **options) -> Dict[int, ValidationReport]:
+    """
+    Validate every project in parallel (see validate_rows).
+
+    Args:
+        portfolio: SharedPortfolio
+        **options: chunk_size, max_workers or executor for map_portfolio()
+
+    Returns:
+        Dict mapping project index to report, for projects with findings
+    """
+    reports: Dict[int, ValidationReport] = {}
+    for chunk in map_portfolio(portfolio, validate_rows, **options):
+        reports.update(chunk)
+    return reports
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Score and validate a VIANEO portfolio across worker processes"
+    )
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        nargs='+',
+        required=True,
+        help='Project data files and/or directories'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Worker processes (default: CPU count)'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=None,
+        help='Projects per task (default: about 4 tasks per worker)'
+    )
+
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("Error: numpy is required (pip install numpy)")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    with SharedPortfolio.from_files(args.input) as portfolio:
+        loaded = time.perf_counter()
+        options = {"max_workers": args.workers, "chunk_size": args.chunk_size}
+        scores = score_portfolio(portfolio, **options)
+        reports = validate_portfolio(portfolio, **options)
+        done = time.perf_counter()
+
+        print(f"Projects: {len(portfolio)} ({portfolio.handle.size:,} bytes shared)")
+        for index, keyword in enumerate(STATUS_KEYWORDS):
+            print(f"  {keyword}: {int((scores['status'] == index).sum())}")
+        print(f"  {UNSCORED_STATUS}: {int((scores['status'] == -1).sum())}")
+        errors = sum(1 for report in reports.values() if not report.is_valid)
+        print(f"Projects with findings: {len(reports)} ({errors} with errors)")
+        print(f"Load: {loaded - start:.2f}s, score + validate: {done - loaded:.2f}s")
+
+    sys.exit(0 if errors == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
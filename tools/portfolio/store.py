@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+VIANEO Evaluation Store
+=======================
+
+Embedded SQLite database of project evaluations for cross-project queries.
+
+Project data files are parsed once and bulk-loaded (one transaction per
+batch) into indexed tables:
+- projects:          name, source, weighted score, status keyword and the
+                     original document (JSON) for the generators
+- dimension_scores:  project, dimension, score
+- evidence:          evidence log entries (id, section, source type,
+                     quality rating, date)
+- personas:          name, age, interview count, validation status
+- organizations:     value network organizations per section
+- relationships:     critical ecosystem relationships
+
+Questions such as "all projects with Desirability < 3.0 and fewer than 5
+evidence items rated 4 or better" then run as indexed SQL in milliseconds
+instead of re-parsing every YAML/JSON file.
+
+Usage:
+    python store.py --db evaluations.db --load evaluations/
+    python store.py --db evaluations.db --below desirability=3.0 --evidence-quality 4 --max-evidence 4
+    python store.py --db evaluations.db --sql "SELECT status, COUNT(*) FROM projects GROUP BY status"
+
+Generators read a stored project with --from-store:
+    python generators/generate_diagnostic.py --from-store evaluations.db --project "TechEd"
+"""
+
+import argparse
+import json
+import math
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import ScoreThresholds, VIANEO_DIMENSIONS
+from core.utils import calculate_weighted_score, extract_dimension_scores, load_data_file
+from converters.portfolio_to_html import collect_portfolio_files
+from generators.generate_personas import ValidationStatus
+from portfolio.shared_memory import VALUE_NETWORK_SECTIONS
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Bump when the schema changes; older stores must be rebuilt
+SCHEMA_VERSION = 1
+
+# Projects inserted per transaction when bulk loading
+LOAD_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    source TEXT NOT NULL UNIQUE,
+    weighted_score REAL,
+    status TEXT,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dimension_scores (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    dimension TEXT NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (project_id, dimension)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS evidence (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    evidence_id TEXT,
+    section TEXT,
+    source_type TEXT,
+    quality_rating REAL,
+    date TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS personas (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    first_name TEXT,
+    age INTEGER,
+    interview_count INTEGER,
+    validation_status TEXT
+);
+CREATE TABLE IF NOT EXISTS organizations (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    name TEXT,
+    role TEXT,
+    requester TEXT,
+    acceptability TEXT,
+    need_level TEXT
+);
+CREATE TABLE IF NOT EXISTS relationships (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    relationship TEXT,
+    type TEXT,
+    criticality TEXT,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name);
+CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status, weighted_score);
+CREATE INDEX IF NOT EXISTS idx_scores_dimension ON dimension_scores(dimension, score);
+CREATE INDEX IF NOT EXISTS idx_evidence_project ON evidence(project_id, quality_rating);
+CREATE INDEX IF NOT EXISTS idx_evidence_id ON evidence(evidence_id);
+CREATE INDEX IF NOT EXISTS idx_personas_project ON personas(project_id);
+CREATE INDEX IF NOT EXISTS idx_organizations_project ON organizations(project_id, section);
+CREATE INDEX IF NOT EXISTS idx_organizations_name ON organizations(name);
+CREATE INDEX IF NOT EXISTS idx_relationships_project ON relationships(project_id, criticality);
+"""
+
+
+# =============================================================================
+# ROW EXTRACTION
+# =============================================================================
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def _entries(data: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    return [entry for entry in data.get(key) or [] if isinstance(entry, dict)]
+
+
+def project_rows(data: Dict[str, Any]) -> Dict[str, List[Tuple]]:
+    """
+    Child-table rows for one project document (without project_id).
+
+    Args:
+        data: Parsed project data
+
+    Returns:
+        Dict mapping table name to row tuples
+    """
+    scores = extract_dimension_scores(data)
+    rows: Dict[str, List[Tuple]] = {
+        "dimension_scores": [(dim, score) for dim, score in scores.items()],
+        "evidence": [
+            (
+                _text(entry.get('id')), _text(entry.get('section')),
+                _text(entry.get('source_type')), _number(entry.get('quality_rating')),
+                _text(entry.get('date')), _text(entry.get('description')),
+            )
+            for entry in _entries(data, 'evidence_log')
+        ],
+        "personas": [],
+        "organizations": [
+            (
+                section, _text(org.get('name')), _text(org.get('role')),
+                _text(org.get('requester')), _text(org.get('acceptability')),
+                _text(org.get('need_level')),
+            )
+            for section in VALUE_NETWORK_SECTIONS
+            for org in _entries(data, section)
+        ],
+        "relationships": [
+            (
+                _text(rel.get('relationship')), _text(rel.get('type')),
+                _text(rel.get('criticality')), _text(rel.get('status')),
+            )
+            for rel in _entries(data, 'ecosystem_relationships')
+        ],
+    }
+    for persona in _entries(data, 'personas'):
+        interviews = int(_number(persona.get('interview_count')) or 0)
+        age = _number(persona.get('age'))
+        rows["personas"].append((
+            _text(persona.get('first_name', persona.get('name'))),
+            None if age is None else int(age),
+            interviews,
+            ValidationStatus.from_interview_count(interviews).value,
+        ))
+    return rows
+
+
+_INSERTS = {
+    "dimension_scores": "INSERT INTO dimension_scores VALUES (?, ?, ?)",
+    "evidence": "INSERT INTO evidence VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "personas": "INSERT INTO personas VALUES (?, ?, ?, ?, ?)",
+    "organizations": "INSERT INTO organizations VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "relationships": "INSERT INTO relationships VALUES (?, ?, ?, ?, ?)",
+}
+
+
+# =============================================================================
+# STORE CLASS
+# =============================================================================
+
+class EvaluationStore:
+    """
+    SQLite store of project evaluations.
+
+    Args:
+        path: Database file (":memory:" for a temporary store)
+
+    Raises:
+        ValueError: If the file holds a store with another schema version
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self.path = str(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if self.path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        has_tables = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects'"
+        ).fetchone()
+        if has_tables and version != SCHEMA_VERSION:
+            self.connection.close()
+            raise ValueError(
+                f"{self.path}: store schema v{version}, expected v{SCHEMA_VERSION}; rebuild it"
+            )
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def add_projects(
+        self,
+        projects: Iterable[Tuple[str, Dict[str, Any]]],
+        batch_size: int = LOAD_BATCH_SIZE
+    ) -> int:
+        """
+        Insert or replace projects, batch_size per transaction.
+
+        A project is identified by its source; loading the same source
+        again replaces its rows.
+
+        Args:
+            projects: (source, data) pairs, e.g. from load_data_file()
+            batch_size: Projects per transaction
+
+        Returns:
+            Number of projects stored
+        """
+        count = 0
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        for source, data in projects:
+            batch.append((str(source), data if isinstance(data, dict) else {}))
+            if len(batch) >= batch_size:
+                count += self._insert_batch(batch)
+                batch = []
+        if batch:
+            count += self._insert_batch(batch)
+        return count
+
+    def _insert_batch(self, batch: List[Tuple[str, Dict[str, Any]]]) -> int:
+        children: Dict[str, List[Tuple]] = {table: [] for table in _INSERTS}
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM projects WHERE source = ?", [(source,) for source, _ in batch]
+            )
+            for source, data in batch:
+                scores = extract_dimension_scores(data)
+                weighted = calculate_weighted_score(scores) if scores else None
+                cursor = self.connection.execute(
+                    "INSERT INTO projects (name, source, weighted_score, status, document) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        str(data.get('project_name') or data.get('company_name') or Path(source).stem),
+                        source,
+                        weighted,
+                        None if weighted is None else ScoreThresholds.get_status_keyword(weighted),
+                        json.dumps(data, ensure_ascii=False, default=str),
+                    )
+                )
+                project_id = cursor.lastrowid
+                for table, rows in project_rows(data).items():
+                    children[table].extend((project_id,) + row for row in rows)
+            for table, rows in children.items():
+                if rows:
+                    self.connection.executemany(_INSERTS[table], rows)
+        return len(batch)
+
+    def load_files(self, inputs: Iterable[Path], batch_size: int = LOAD_BATCH_SIZE) -> int:
+        """
+        Parse and store project files (or directories of them).
+
+        Args:
+            inputs: Files and/or directories of YAML/JSON project data
+            batch_size: Projects per transaction
+
+        Returns:
+            Number of projects stored
+        """
+        return self.add_projects(
+            ((str(path), load_data_file(path) or {}) for path in collect_portfolio_files(inputs)),
+            batch_size
+        )
+
+    def remove_project(self, source: str) -> bool:
+        """Delete a project (and its rows) by source; True if it existed."""
+        with self.connection:
+            cursor = self.connection.execute("DELETE FROM projects WHERE source = ?", (source,))
+        return cursor.rowcount > 0
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Run any SQL statement and return the rows as dicts."""
+        return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def project_names(self) -> List[str]:
+        return [row[0] for row in self.connection.execute("SELECT name FROM projects ORDER BY id")]
+
+    def project_id(self, project: str) -> int:
+        """
+        Row id of a project given its name, source path or source file name.
+
+        Raises:
+            KeyError: If no project matches or a name is ambiguous
+        """
+        rows = self.connection.execute(
+            "SELECT id, source FROM projects WHERE source = ? OR name = ? ORDER BY source = ? DESC, id",
+            (project, project, project)
+        ).fetchall()
+        if not rows:
+            rows = [
+                row for row in self.connection.execute("SELECT id, source FROM projects ORDER BY id")
+                if project in (Path(row[1]).name, Path(row[1]).stem)
+            ]
+        if not rows:
+            raise KeyError(f"Project not found in store: {project}")
+        if len(rows) > 1 and rows[0][1] != project:
+            sources = ", ".join(row[1] for row in rows)
+            raise KeyError(f"Project name {project} is ambiguous ({sources}); pass the source instead")
+        return rows[0][0]
+
+    def load_project(self, project: str) -> Dict[str, Any]:
+        """
+        The original document of a project (see project_id for lookup).
+
+        Raises:
+            KeyError: If no single project matches
+        """
+        row = self.connection.execute(
+            "SELECT document FROM projects WHERE id = ?", (self.project_id(project),)
+        ).fetchone()
+        return json.loads(row[0])
+
+    def dimension_scores(self, project: str) -> Dict[str, float]:
+        """Dimension scores of a project (see project_id for lookup)."""
+        return {
+            row[0]: row[1] for row in self.connection.execute(
+                "SELECT dimension, score FROM dimension_scores WHERE project_id = ?",
+                (self.project_id(project),)
+            )
+        }
+
+    def find_projects(
+        self,
+        below: Optional[Dict[str, float]] = None,
+        at_least: Optional[Dict[str, float]] = None,
+        evidence_quality: Optional[float] = None,
+        min_evidence: Optional[int] = None,
+        max_evidence: Optional[int] = None,
+        status: Optional[str] = None,
+        name_like: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Projects matching all given criteria.
+
+        Args:
+            below: Dimension scores strictly below these values
+                (a missing score never matches)
+            at_least: Dimension scores at or above these values
+            evidence_quality: Only evidence rated at least this counts
+                toward min_evidence/max_evidence (default: all entries)
+            min_evidence: At least this many (qualifying) evidence entries
+            max_evidence: At most this many (qualifying) evidence entries
+            status: Status keyword of the weighted score ("Promising", ...)
+            name_like: SQL LIKE pattern on the project name
+
+        Returns:
+            Rows with name, source, weighted_score, status and
+            evidence_count, ordered by weighted score
+
+        Raises:
+            ValueError: For unknown dimensions
+        """
+        where: List[str] = []
+        params: List[Any] = []
+
+        for criteria, op in ((below or {}, "<"), (at_least or {}, ">=")):
+            for dimension, value in criteria.items():
+                dimension = dimension.lower()
+                if dimension not in VIANEO_DIMENSIONS:
+                    raise ValueError(f"Unknown dimension: {dimension}")
+                where.append(
+                    "EXISTS (SELECT 1 FROM dimension_scores d WHERE d.project_id = p.id "
+                    f"AND d.dimension = ? AND d.score {op} ?)"
+                )
+                params.extend([dimension, float(value)])
+
+        evidence_filter = "" if evidence_quality is None else " AND e.quality_rating >= ?"
+        evidence_params = [] if evidence_quality is None else [float(evidence_quality)]
+        evidence_count = (
+            f"(SELECT COUNT(*) FROM evidence e WHERE e.project_id = p.id{evidence_filter})"
+        )
+        if min_evidence is not None:
+            where.append(f"{evidence_count} >= ?")
+            params.extend(evidence_params + [int(min_evidence)])
+        if max_evidence is not None:
+            where.append(f"{evidence_count} <= ?")
+            params.extend(evidence_params + [int(max_evidence)])
+        if status is not None:
+            where.append("p.status = ?")
+            params.append(status)
+        if name_like is not None:
+            where.append("p.name LIKE ?")
+            params.append(name_like)
+
+        sql = (
+            f"SELECT p.name, p.source, p.weighted_score, p.status, {evidence_count} AS evidence_count "
+            "FROM projects p"
+            + (f" WHERE {' AND '.join(where)}" if where else "")
+            + " ORDER BY p.weighted_score IS NULL, p.weighted_score, p.id"
+        )
+        return self.query(sql, evidence_params + params)
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts per table."""
+        return {
+            table: self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("projects",) + tuple(_INSERTS)
+        }
+
+    # -------------------------------------------------------------------------
+    # Lifetime
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'EvaluationStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_store_project(store_path: Path, project: Optional[str]) -> Dict[str, Any]:
+    """
+    Read one project's document from a store file (for generator --from-store).
+
+    Args:
+        store_path: Store database file
+        project: Project name, source path or source file name (may be
+            omitted if the store holds exactly one project)
+
+    Raises:
+        FileNotFoundError: If the store file does not exist
+        KeyError: If the project is not found or is ambiguous
+    """
+    if not Path(store_path).exists():
+        raise FileNotFoundError(f"Evaluation store not found: {store_path}")
+    with EvaluationStore(store_path) as store:
+        if project is None:
+            names = store.project_names()
+            if len(names) != 1:
+                raise KeyError(f"Store holds {len(names)} projects; pass --project")
+            project = names[0]
+        return store.load_project(project)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _parse_criteria(values: Optional[List[str]]) -> Dict[str, float]:
+    criteria = {}
+    for value in values or []:
+        dimension, _, score = value.partition('=')
+        criteria[dimension.strip().lower()] = float(score)
+    return criteria
+
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Load and query a SQLite store of VIANEO project evaluations"
+    )
+    parser.add_argument(
+        '--db', '-d',
+        type=Path,
+        required=True,
+        help='Store database file (created if missing)'
+    )
+    parser.add_argument(
+        '--load', '-l',
+        type=Path,
+        nargs='+',
+        help='Project data files and/or directories to load'
+    )
+    parser.add_argument(
+        '--below',
+        action='append',
+        metavar='DIMENSION=SCORE',
+        help='Dimension score strictly below SCORE (repeatable)'
+    )
+    parser.add_argument(
+        '--at-least',
+        action='append',
+        metavar='DIMENSION=SCORE',
+        help='Dimension score at or above SCORE (repeatable)'
+    )
+    parser.add_argument(
+        '--evidence-quality',
+        type=float,
+        help='Minimum quality rating for evidence counted by --min/--max-evidence'
+    )
+    parser.add_argument('--min-evidence', type=int, help='At least N evidence entries')
+    parser.add_argument('--max-evidence', type=int, help='At most N evidence entries')
+    parser.add_argument('--status', help='Status keyword (Strong, Promising, ...)')
+    parser.add_argument(
+        '--sql',
+        help='Run a SQL statement instead of the criteria query'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['table', 'json'],
+        default='table',
+        help='Result format (default: table)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        store = EvaluationStore(args.db)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    with store:
+        if args.load:
+            start = time.perf_counter()
+            count = store.load_files(args.load)
+            print(f"Loaded {count} project(s) in {time.perf_counter() - start:.2f}s")
+            print("  " + ", ".join(f"{table}: {rows}" for table, rows in store.stats().items()))
+
+        criteria = [args.below, args.at_least, args.min_evidence, args.max_evidence, args.status]
+        if args.sql is None and not any(value is not None for value in criteria):
+            return 0
+
+        start = time.perf_counter()
+        try:
+            rows = store.query(args.sql) if args.sql else store.find_projects(
+                below=_parse_criteria(args.below),
+                at_least=_parse_criteria(args.at_least),
+                evidence_quality=args.evidence_quality,
+                min_evidence=args.min_evidence,
+                max_evidence=args.max_evidence,
+                status=args.status,
+            )
+        except (ValueError, sqlite3.Error) as e:
+            print(f"Error: {e}")
+            return 1
+        elapsed = time.perf_counter() - start
+
+        if args.format == 'json':
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+        else:
+            for row in rows:
+                print("  ".join("" if value is None else str(value) for value in row.values()))
+        print(f"{len(rows)} row(s) in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
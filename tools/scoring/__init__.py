@@ -0,0 +1,71 @@
+"""
+VIANEO Questionnaire Scoring
+============================
+
+Batch scoring of the Step 2 and Step 3 questionnaires.
+
+Available modules:
+- questionnaires: 40Q Diagnostic and 29Q Market Maturity definitions
+  (dimensions, weights, thresholds, red-flag rules)
+- questionnaire_engine: Vectorized NumPy scoring of many projects' responses
+- gate_rules: Compiled decision table for Step 12 PROCEED/CONDITIONAL/HOLD
+  gate recommendations
+"""
+
+from .questionnaires import (
+    DIAGNOSTIC_40Q,
+    MARKET_MATURITY_29Q,
+    QUESTIONNAIRES,
+    Questionnaire,
+    QuestionDimension,
+    RedFlagRule,
+    get_questionnaire,
+)
+from .questionnaire_engine import (
+    QuestionnaireScores,
+    ResponseMatrix,
+    build_response_matrix,
+    load_response_files,
+    parse_response,
+    score_questionnaires,
+    score_responses,
+)
+from .gate_rules import (
+    GATE_OUTCOMES,
+    DecisionTable,
+    GateDecisions,
+    GatePolicy,
+    GateRule,
+    build_gate_inputs,
+    decide_gates,
+    default_decision_table,
+    load_decision_table,
+    parse_decision_table,
+)
+
+__all__ = [
+    'DIAGNOSTIC_40Q',
+    'MARKET_MATURITY_29Q',
+    'QUESTIONNAIRES',
+    'Questionnaire',
+    'QuestionDimension',
+    'RedFlagRule',
+    'get_questionnaire',
+    'QuestionnaireScores',
+    'ResponseMatrix',
+    'build_response_matrix',
+    'load_response_files',
+    'parse_response',
+    'score_questionnaires',
+    'score_responses',
+    'GATE_OUTCOMES',
+    'DecisionTable',
+    'GateDecisions',
+    'GatePolicy',
+    'GateRule',
+    'build_gate_inputs',
+    'decide_gates',
+    'default_decision_table',
+    'load_decision_table',
+    'parse_decision_table',
+]
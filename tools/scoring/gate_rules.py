@@ -0,0 +1,690 @@
+#!/usr/bin/env python3
+"""
+VIANEO Gate Decision Rules
+==========================
+
+Declarative decision table for the Step 12 gate recommendation
+(prompts/step_12_initial_viability_assessment.md, "Gate Recommendation").
+
+A decision table is an ordered list of rules. Each rule names an outcome
+(PROCEED, CONDITIONAL or HOLD) and the conditions under which it applies;
+the first rule whose conditions all hold decides the project. Conditions
+compare per-project features (dimension scores, weighted score, threshold
+failures, evidence quality, red flags) against numbers or named policy
+thresholds:
+
+    policy:
+      investment_ready: 3.5
+      minimums: {desirability: 3.5}
+    rules:
+      - name: critical_dimension
+        outcome: HOLD
+        description: A dimension is non-viable
+        when: {min_dimension: "< critical_score"}
+      - name: ready
+        outcome: PROCEED
+        when: {failing_dimensions: "== 0", weighted: ">= investment_ready"}
+      - name: otherwise
+        outcome: CONDITIONAL
+
+The table is compiled once into NumPy predicates and evaluated for a whole
+portfolio at a time, so re-running decisions after a policy change is a
+few array operations.
+
+Usage:
+    python gate_rules.py --input evaluations/ --output gates.json
+    python gate_rules.py --input evaluations/ --rules strict_policy.yaml --format csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import operator
+import re
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import ScoreThresholds, VIANEO_DIMENSIONS
+from core.utils import extract_dimension_scores, load_data_file, load_yaml
+from converters.portfolio_to_html import collect_portfolio_files
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+GATE_OUTCOMES = ("PROCEED", "CONDITIONAL", "HOLD")
+
+# Wording used by the Step 12 prompt and the sprint report
+GATE_LABELS = {
+    "PROCEED": "Go",
+    "CONDITIONAL": "Conditional Go",
+    "HOLD": "Hold",
+}
+
+# Per-project features rules can test (dimension keys are features too)
+GATE_FEATURES = (
+    "weighted",             # weighted score over the dimensions present
+    "min_dimension",        # lowest dimension score (NaN if none)
+    "failing_dimensions",   # dimensions below their minimum, missing counted as failing
+    "missing_dimensions",   # dimensions without a score
+    "evidence_quality",     # mean evidence quality_rating (NaN without rated evidence)
+    "evidence_count",       # evidence log entries
+    "red_flags",            # entries in the project's red_flags list
+) + tuple(VIANEO_DIMENSIONS)
+
+_OPERATORS: Dict[str, Callable] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_CONDITION_PATTERN = re.compile(r'^\s*(<=|>=|==|!=|<|>)\s*(\S+)\s*$')
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass(frozen=True)
+class GatePolicy:
+    """Named thresholds that rule conditions may refer to."""
+    minimums: Tuple[Tuple[str, float], ...] = tuple(
+        (key, info["min_score"]) for key, info in VIANEO_DIMENSIONS.items()
+    )
+    investment_ready: float = ScoreThresholds.INVESTMENT_READY_MIN
+    critical_score: float = ScoreThresholds.PROBLEMATIC[0]
+    evidence_min: float = 3.0
+    evidence_hold: float = 2.0
+
+    def value(self, name: str) -> float:
+        """
+        Resolve a threshold name ("investment_ready", "min_score.desirability").
+
+        Raises:
+            ValueError: If the name is unknown
+        """
+        if name.startswith("min_score."):
+            minimums = dict(self.minimums)
+            if name[10:] in minimums:
+                return float(minimums[name[10:]])
+        elif name != "minimums" and name in self.__dataclass_fields__:
+            return float(getattr(self, name))
+        raise ValueError(f"Unknown policy threshold: {name}")
+
+    def with_overrides(self, overrides: Dict[str, Any]) -> 'GatePolicy':
+        """
+        Copy with thresholds replaced; "minimums" may be a partial mapping.
+
+        Raises:
+            ValueError: For unknown thresholds or dimensions
+        """
+        changes: Dict[str, Any] = {}
+        for name, value in (overrides or {}).items():
+            if name == "minimums":
+                unknown = set(value) - set(VIANEO_DIMENSIONS)
+                if unknown:
+                    raise ValueError(f"Unknown dimensions in minimums: {', '.join(sorted(unknown))}")
+                merged = dict(self.minimums)
+                merged.update({key: float(v) for key, v in value.items()})
+                changes["minimums"] = tuple((key, merged[key]) for key in VIANEO_DIMENSIONS)
+            elif name in self.__dataclass_fields__:
+                changes[name] = float(value)
+            else:
+                raise ValueError(f"Unknown policy threshold: {name}")
+        return replace(self, **changes)
+
+
+@dataclass(frozen=True)
+class Condition:
+    """feature <op> value, where value is a number or a GatePolicy threshold name."""
+    feature: str
+    op: str
+    value: Union[float, str]
+
+    def __str__(self) -> str:
+        return f"{self.feature} {self.op} {self.value}"
+
+
+@dataclass(frozen=True)
+class GateRule:
+    """One row of the decision table (no conditions = always applies)."""
+    name: str
+    outcome: str
+    conditions: Tuple[Condition, ...] = ()
+    description: str = ""
+
+
+@dataclass
+class DecisionTable:
+    """Ordered gate rules and the policy their thresholds come from."""
+    rules: List[GateRule]
+    policy: GatePolicy = field(default_factory=GatePolicy)
+
+    def __post_init__(self):
+        for rule in self.rules:
+            if rule.outcome not in GATE_OUTCOMES:
+                raise ValueError(f"Rule {rule.name}: unknown outcome {rule.outcome}")
+            for condition in rule.conditions:
+                if condition.feature not in GATE_FEATURES:
+                    raise ValueError(f"Rule {rule.name}: unknown feature {condition.feature}")
+                if condition.op not in _OPERATORS:
+                    raise ValueError(f"Rule {rule.name}: unknown operator {condition.op}")
+                if isinstance(condition.value, str):
+                    self.policy.value(condition.value)
+
+    def compile(self) -> 'CompiledDecisionTable':
+        """Bind policy thresholds and build the vectorized predicates."""
+        return CompiledDecisionTable(self)
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def parse_condition(feature: str, expression: Any) -> Condition:
+    """
+    Parse a condition such as ("weighted", ">= investment_ready").
+
+    A bare number means equality.
+
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    if isinstance(expression, (int, float)) and not isinstance(expression, bool):
+        return Condition(feature, "==", float(expression))
+    match = _CONDITION_PATTERN.match(str(expression))
+    if not match:
+        raise ValueError(f"Invalid condition for {feature}: {expression!r}")
+    op, value = match.groups()
+    try:
+        return Condition(feature, op, float(value))
+    except ValueError:
+        return Condition(feature, op, value)
+
+
+def parse_decision_table(data: Dict[str, Any]) -> DecisionTable:
+    """
+    Build a DecisionTable from parsed YAML/JSON ({policy, rules}).
+
+    Without "rules", the default rules are used with the given policy.
+
+    Raises:
+        ValueError: For unknown outcomes, features or thresholds
+    """
+    policy = GatePolicy().with_overrides(data.get('policy') or {})
+    if not data.get('rules'):
+        return DecisionTable(list(DEFAULT_GATE_RULES), policy)
+
+    rules = []
+    for entry in data['rules']:
+        conditions = tuple(
+            parse_condition(feature, expression)
+            for feature, expression in (entry.get('when') or {}).items()
+        )
+        rules.append(GateRule(
+            name=str(entry.get('name', f"rule_{len(rules) + 1}")),
+            outcome=str(entry.get('outcome', '')).upper(),
+            conditions=conditions,
+            description=str(entry.get('description', '')),
+        ))
+    return DecisionTable(rules, policy)
+
+
+def load_decision_table(path: Path) -> DecisionTable:
+    """Load a decision table from a YAML file."""
+    return parse_decision_table(load_yaml(path) or {})
+
+
+# =============================================================================
+# DEFAULT RULES
+# =============================================================================
+
+DEFAULT_GATE_RULES: Tuple[GateRule, ...] = (
+    GateRule(
+        "critical_dimension", "HOLD",
+        (Condition("min_dimension", "<", "critical_score"),),
+        "A dimension scores in the non-viable range"
+    ),
+    GateRule(
+        "multiple_threshold_failures", "HOLD",
+        (Condition("failing_dimensions", ">=", 2.0),),
+        "Two or more dimensions are below their minimum threshold"
+    ),
+    GateRule(
+        "weak_evidence", "HOLD",
+        (Condition("evidence_quality", "<", "evidence_hold"),),
+        "Evidence quality too weak to support a decision"
+    ),
+    GateRule(
+        "all_thresholds_met", "PROCEED",
+        (
+            Condition("failing_dimensions", "==", 0.0),
+            Condition("weighted", ">=", "investment_ready"),
+            Condition("evidence_quality", ">=", "evidence_min"),
+            Condition("red_flags", "==", 0.0),
+        ),
+        "All thresholds met with investment-ready score and solid evidence"
+    ),
+    GateRule(
+        "conditions_required", "CONDITIONAL",
+        (),
+        "Mostly positive; specific gaps must be closed first"
+    ),
+)
+
+
+def default_decision_table(policy: Optional[GatePolicy] = None) -> DecisionTable:
+    """The built-in decision table, optionally with another policy."""
+    return DecisionTable(list(DEFAULT_GATE_RULES), policy or GatePolicy())
+
+
+# =============================================================================
+# FEATURES
+# =============================================================================
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for gate decisions: pip install numpy")
+
+
+@dataclass
+class GateInputs:
+    """Policy-independent per-project inputs to the decision table."""
+    projects: List[str]
+    sources: List[str]
+    scores: 'np.ndarray'            # projects x VIANEO_DIMENSIONS, NaN = missing
+    evidence_quality: 'np.ndarray'  # mean quality_rating, NaN = none rated
+    evidence_count: 'np.ndarray'
+    red_flags: 'np.ndarray'
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def features(self, policy: GatePolicy) -> Dict[str, 'np.ndarray']:
+        """Feature arrays for every project under the given policy."""
+        weights = np.array([info["weight"] for info in VIANEO_DIMENSIONS.values()])
+        minimums = np.array([value for _, value in policy.minimums])
+
+        present = ~np.isnan(self.scores)
+        filled = np.where(present, self.scores, 0.0)
+        total_weight = present @ weights
+        weighted = np.divide(
+            filled @ weights, total_weight,
+            out=np.zeros(len(self)), where=total_weight > 0
+        )
+        min_dimension = np.where(
+            present.any(axis=1),
+            np.where(present, self.scores, np.inf).min(axis=1),
+            np.nan
+        )
+
+        features = {
+            "weighted": weighted,
+            "min_dimension": min_dimension,
+            "failing_dimensions": (filled < minimums).sum(axis=1).astype(np.float64),
+            "missing_dimensions": (~present).sum(axis=1).astype(np.float64),
+            "evidence_quality": self.evidence_quality,
+            "evidence_count": self.evidence_count.astype(np.float64),
+            "red_flags": self.red_flags.astype(np.float64),
+        }
+        for d, dim in enumerate(VIANEO_DIMENSIONS):
+            features[dim] = self.scores[:, d]
+        return features
+
+
+def build_gate_inputs(projects: Iterable[Tuple[str, Dict[str, Any]]]) -> GateInputs:
+    """
+    Extract gate inputs from parsed project data.
+
+    Args:
+        projects: (source, data) pairs, e.g. from load_data_file()
+
+    Returns:
+        GateInputs
+    """
+    _require_numpy()
+    names, sources, rows, quality, counts, flags = [], [], [], [], [], []
+
+    for source, data in projects:
+        if not isinstance(data, dict):
+            data = {}
+        names.append(str(data.get('project_name') or data.get('company_name') or Path(source).stem))
+        sources.append(str(source))
+        scores = extract_dimension_scores(data)
+        rows.append([scores.get(dim, math.nan) for dim in VIANEO_DIMENSIONS])
+
+        ratings = []
+        entries = [entry for entry in data.get('evidence_log') or [] if isinstance(entry, dict)]
+        for entry in entries:
+            try:
+                ratings.append(float(entry.get('quality_rating')))
+            except (TypeError, ValueError):
+                continue
+        quality.append(sum(ratings) / len(ratings) if ratings else math.nan)
+        counts.append(len(entries))
+        flags.append(len(data.get('red_flags') or []))
+
+    return GateInputs(
+        projects=names,
+        sources=sources,
+        scores=np.array(rows, dtype=np.float64).reshape(len(names), len(VIANEO_DIMENSIONS)),
+        evidence_quality=np.array(quality, dtype=np.float64),
+        evidence_count=np.array(counts, dtype=np.int64),
+        red_flags=np.array(flags, dtype=np.int64),
+    )
+
+
+def load_gate_inputs(inputs: Iterable[Path]) -> GateInputs:
+    """Load project files (or directories of them) into GateInputs."""
+    return build_gate_inputs(
+        (path, load_data_file(path) or {}) for path in collect_portfolio_files(inputs)
+    )
+
+
+def gate_inputs_from_portfolio(portfolio) -> GateInputs:
+    """
+    Build GateInputs from a portfolio.shared_memory.SharedPortfolio.
+
+    The projects' red_flags lists are not part of the shared tables and
+    count as empty.
+    """
+    _require_numpy()
+    evidence = portfolio.table("evidence")
+    owners = evidence.array("project")
+    ratings = evidence.array("quality_rating")
+    rated = ~np.isnan(ratings)
+    size = len(portfolio)
+
+    rating_sums = np.bincount(owners[rated], weights=ratings[rated], minlength=size)
+    rating_counts = np.bincount(owners[rated], minlength=size)
+    return GateInputs(
+        projects=portfolio.projects.texts("name"),
+        sources=portfolio.projects.texts("source"),
+        scores=portfolio.score_matrix(),
+        evidence_quality=np.divide(
+            rating_sums, rating_counts,
+            out=np.full(size, np.nan), where=rating_counts > 0
+        ),
+        evidence_count=np.bincount(owners, minlength=size),
+        red_flags=np.zeros(size, dtype=np.int64),
+    )
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+class CompiledDecisionTable:
+    """
+    A DecisionTable with thresholds resolved, evaluated over whole arrays.
+
+    Args:
+        table: Decision table to compile
+    """
+
+    def __init__(self, table: DecisionTable):
+        _require_numpy()
+        self.table = table
+        self.policy = table.policy
+        self._predicates: List[List[Tuple[str, Callable, float]]] = [
+            [
+                (
+                    condition.feature,
+                    _OPERATORS[condition.op],
+                    self.policy.value(condition.value)
+                    if isinstance(condition.value, str) else float(condition.value),
+                )
+                for condition in rule.conditions
+            ]
+            for rule in table.rules
+        ]
+        self._outcomes = np.array(
+            [GATE_OUTCOMES.index(rule.outcome) for rule in table.rules], dtype=np.int8
+        )
+
+    def evaluate(self, inputs: GateInputs) -> 'GateDecisions':
+        """
+        Decide every project: the first matching rule wins.
+
+        Comparisons with missing values (NaN) are false for every operator,
+        "!=" included, so a rule testing evidence_quality never fires for a
+        project without rated evidence.
+        Projects no rule matches are reported with rule index -1 and HOLD.
+        """
+        features = inputs.features(self.policy)
+        size = len(inputs)
+        fired = np.full(size, -1, dtype=np.int64)
+        undecided = np.ones(size, dtype=bool)
+
+        for index, predicates in enumerate(self._predicates):
+            match = undecided.copy()
+            for feature, compare, threshold in predicates:
+                values = features[feature]
+                # NaN != x is true in numpy; missing values never match any operator
+                with np.errstate(invalid='ignore'):
+                    match &= compare(values, threshold) & ~np.isnan(values)
+            fired[match] = index
+            undecided &= ~match
+            if not undecided.any():
+                break
+
+        outcomes = np.where(
+            fired >= 0, self._outcomes[np.maximum(fired, 0)], GATE_OUTCOMES.index("HOLD")
+        ).astype(np.int8)
+        return GateDecisions(self, inputs, features, outcomes, fired)
+
+
+@dataclass
+class GateDecisions:
+    """Gate outcomes for a portfolio and the rule that decided each project."""
+    compiled: CompiledDecisionTable
+    inputs: GateInputs
+    features: Dict[str, 'np.ndarray']
+    outcomes: 'np.ndarray'   # index into GATE_OUTCOMES
+    rules: 'np.ndarray'      # index into the table's rules, -1 if none matched
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def outcome(self, index: int) -> str:
+        return GATE_OUTCOMES[self.outcomes[index]]
+
+    def counts(self) -> Dict[str, int]:
+        """Projects per outcome."""
+        totals = np.bincount(self.outcomes, minlength=len(GATE_OUTCOMES))
+        return dict(zip(GATE_OUTCOMES, totals.tolist()))
+
+    def failing_dimensions(self, index: int) -> List[str]:
+        """Dimension names below the policy minimum (missing counted as failing)."""
+        return [
+            VIANEO_DIMENSIONS[dim]["name"]
+            for dim, minimum in self.compiled.policy.minimums
+            if not self.features[dim][index] >= minimum
+        ]
+
+    def explain(self, index: int) -> str:
+        """Which rule fired and the feature values it tested."""
+        rule_index = int(self.rules[index])
+        if rule_index < 0:
+            return "No rule matched; defaulting to HOLD"
+        rule = self.compiled.table.rules[rule_index]
+        tested = [
+            f"{feature} = {_format_value(self.features[feature][index])} "
+            f"({_symbol(compare)} {_format_value(threshold)})"
+            for feature, compare, threshold in self.compiled._predicates[rule_index]
+        ]
+        text = f"Rule '{rule.name}'"
+        if rule.description:
+            text += f": {rule.description}"
+        if tested:
+            text += f" [{'; '.join(tested)}]"
+        return text
+
+    def decision(self, index: int) -> Dict[str, Any]:
+        """
+        One project's decision as plain data.
+
+        primary_recommendation_status/summary use the sprint report's keys,
+        so the dict can be merged into ExecutiveSprintReportData input.
+        """
+        outcome = self.outcome(index)
+        rule_index = int(self.rules[index])
+        weighted = float(self.features["weighted"][index])
+        return {
+            "project_name": self.inputs.projects[index],
+            "source": self.inputs.sources[index],
+            "gate_outcome": outcome,
+            "rule": self.compiled.table.rules[rule_index].name if rule_index >= 0 else "",
+            "weighted_score": round(weighted, 2),
+            "failing_dimensions": self.failing_dimensions(index),
+            "primary_recommendation_status": GATE_LABELS[outcome],
+            "primary_recommendation_summary": self.explain(index),
+        }
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """One flat row per project."""
+        rows = []
+        for index in range(len(self)):
+            decision = self.decision(index)
+            decision["failing_dimensions"] = ", ".join(decision["failing_dimensions"])
+            del decision["primary_recommendation_summary"]
+            rows.append(decision)
+        return rows
+
+
+def _format_value(value: float) -> str:
+    return "n/a" if math.isnan(value) else f"{value:g}" if float(value).is_integer() else f"{value:.2f}"
+
+
+def _symbol(compare: Callable) -> str:
+    return next(symbol for symbol, func in _OPERATORS.items() if func is compare)
+
+
+def decide_gates(inputs: GateInputs, table: Optional[DecisionTable] = None) -> GateDecisions:
+    """Compile a decision table (default rules if None) and evaluate it."""
+    return (table or default_decision_table()).compile().evaluate(inputs)
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def evaluate_gates(
+    inputs: Iterable[Path],
+    output_path: Optional[Path] = None,
+    rules_path: Optional[Path] = None,
+    output_format: str = "json"
+) -> Optional[GateDecisions]:
+    """
+    Decide gates for project files and optionally write the decisions.
+
+    Args:
+        inputs: Project files and/or directories
+        output_path: Where to write decisions
+        rules_path: YAML decision table (default: built-in rules)
+        output_format: "json", "yaml" or "csv"
+
+    Returns:
+        GateDecisions, or None if the decision table is invalid
+    """
+    try:
+        table = load_decision_table(rules_path) if rules_path else default_decision_table()
+    except ValueError as e:
+        print(f"Error: {e}")
+        return None
+
+    decisions = decide_gates(load_gate_inputs(inputs), table)
+
+    if output_path is not None:
+        output_path = Path(output_path)
+        if output_format == "csv":
+            rows = decisions.to_rows()
+            with open(output_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["project_name"])
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            data = {
+                "counts": decisions.counts(),
+                "decisions": [decisions.decision(i) for i in range(len(decisions))],
+            }
+            with open(output_path, 'w', encoding='utf-8') as f:
+                if output_format == "yaml":
+                    yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+                else:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+        print(f"Generated {output_format.upper()}: {output_path}")
+
+    return decisions
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Decide Step 12 gate recommendations (PROCEED/CONDITIONAL/HOLD) for a portfolio"
+    )
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        nargs='+',
+        required=True,
+        help='Project score files and/or directories (YAML or JSON)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='Output file for the decisions'
+    )
+    parser.add_argument(
+        '--rules', '-r',
+        type=Path,
+        help='YAML decision table (policy and/or rules)'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['json', 'yaml', 'csv'],
+        default='json',
+        help='Output format (default: json)'
+    )
+
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("Error: numpy is required (pip install numpy)")
+        return 1
+
+    start = time.perf_counter()
+    decisions = evaluate_gates(args.input, args.output, args.rules, args.format)
+    if decisions is None:
+        return 1
+
+    print(f"\nGate decisions for {len(decisions)} project(s) in {time.perf_counter() - start:.2f}s")
+    for outcome, count in decisions.counts().items():
+        print(f"  {outcome}: {count}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
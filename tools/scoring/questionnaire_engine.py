@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+VIANEO Questionnaire Scoring Engine
+===================================
+
+Batch scoring of Step 2 (40Q Diagnostic) and Step 3 (29Q Market Maturity)
+questionnaires.
+
+Responses for many projects are loaded into two NumPy matrices (projects x
+questions): the 1-5 scores (NaN when not scored) and a response-type code
+(scored, INSUFFICIENT DATA, N/A, YES, NO, missing). Dimension averages,
+weighted overall scores, threshold failures and red-flag hits are then
+computed for every project at once with a handful of matrix products.
+
+Input files (YAML/JSON), one per project:
+
+    project_name: "TechEd"
+    questionnaire: 29q            # optional, detected from question ids
+    responses:
+      Q1: 4
+      Q2: "3 - CONTEXTUAL NOTE: pilot schools only"
+      Q7: "INSUFFICIENT DATA - interview log not shared"
+      Q10: "N/A - unregulated market"
+      Tech4: "YES - patent filed"     # (40Q)
+
+Responses may also be a list of {id, score|response, note} entries.
+
+Usage:
+    python questionnaire_engine.py --input responses/ --output scores.json
+    python questionnaire_engine.py --input a.yaml b.yaml --questionnaire 40q --format csv
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils import load_data_file
+from converters.portfolio_to_html import collect_portfolio_files
+from scoring.questionnaires import QUESTIONNAIRES, Questionnaire, get_questionnaire
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# =============================================================================
+# RESPONSE TYPES
+# =============================================================================
+
+RESPONSE_SCORED = 0
+RESPONSE_INSUFFICIENT_DATA = 1
+RESPONSE_NOT_APPLICABLE = 2
+RESPONSE_YES = 3
+RESPONSE_NO = 4
+RESPONSE_MISSING = 5
+
+RESPONSE_LABELS = (
+    "scored",
+    "insufficient_data",
+    "not_applicable",
+    "yes",
+    "no",
+    "missing",
+)
+
+_SCORE_PATTERN = re.compile(r'^(?:score\s*:?\s*)?([1-5](?:\.\d+)?)(?!\d)', re.IGNORECASE)
+_INSUFFICIENT_PATTERN = re.compile(r'^insufficient(?:\s+data)?\b', re.IGNORECASE)
+_NOT_APPLICABLE_PATTERN = re.compile(r'^(?:n/?a|not applicable)\b', re.IGNORECASE)
+# Bare YES/NO or "YES - note" ("No interviews yet" is not an answer)
+_YES_NO_PATTERN = re.compile(r'^(yes|no)(?:\s*$|\s+[-–—]\s)', re.IGNORECASE)
+
+
+def parse_response(value: Any) -> Tuple[int, float]:
+    """
+    Classify one questionnaire response.
+
+    Accepts 1-5 numbers, "Score 2 - CONTEXTUAL NOTE: ...", "INSUFFICIENT
+    DATA - ...", "N/A - ...", "YES - ..."/"NO - ..." (YAML may already
+    have turned bare YES/NO into booleans), None for unanswered, and dicts
+    with a "score" or "response" key.
+
+    Args:
+        value: Raw response value
+
+    Returns:
+        (response code, score) where score is NaN unless the code is
+        RESPONSE_SCORED
+
+    Raises:
+        ValueError: For scores outside 1-5 (numbers or text) or unrecognized text
+    """
+    if isinstance(value, dict):
+        value = value.get('score', value.get('response'))
+
+    if value is None:
+        return RESPONSE_MISSING, float('nan')
+    if isinstance(value, bool):
+        return (RESPONSE_YES if value else RESPONSE_NO), float('nan')
+    if isinstance(value, (int, float)):
+        if not 1 <= value <= 5:
+            raise ValueError(f"Score {value} outside the 1-5 scale")
+        return RESPONSE_SCORED, float(value)
+
+    text = str(value).strip()
+    if not text:
+        return RESPONSE_MISSING, float('nan')
+    match = _SCORE_PATTERN.match(text)
+    if match:
+        score = float(match.group(1))
+        if score > 5:
+            raise ValueError(f"Score {score} outside the 1-5 scale")
+        return RESPONSE_SCORED, score
+    if _INSUFFICIENT_PATTERN.match(text):
+        return RESPONSE_INSUFFICIENT_DATA, float('nan')
+    if _NOT_APPLICABLE_PATTERN.match(text):
+        return RESPONSE_NOT_APPLICABLE, float('nan')
+    match = _YES_NO_PATTERN.match(text)
+    if match:
+        return (RESPONSE_YES if match.group(1).lower() == 'yes' else RESPONSE_NO), float('nan')
+    raise ValueError(f"Unrecognized response: {text[:60]}")
+
+
+def iter_responses(raw: Any) -> Iterable[Tuple[str, Any]]:
+    """Yield (question id, value) from a responses mapping or entry list."""
+    if isinstance(raw, dict):
+        yield from raw.items()
+    elif isinstance(raw, list):
+        for entry in raw:
+            if isinstance(entry, dict) and 'id' in entry:
+                yield str(entry['id']), entry
+
+
+def detect_questionnaire(question_ids: Iterable[str]) -> Questionnaire:
+    """
+    Pick the questionnaire whose question ids cover the given ids.
+
+    Raises:
+        ValueError: If no single questionnaire matches
+    """
+    ids = set(question_ids)
+    matches = [q for q in QUESTIONNAIRES.values() if ids and ids <= set(q.question_ids)]
+    if len(matches) != 1:
+        raise ValueError("Cannot detect questionnaire from question ids; pass it explicitly")
+    return matches[0]
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class ResponseMatrix:
+    """Responses of many projects to one questionnaire."""
+    questionnaire: Questionnaire
+    projects: List[str]
+    sources: List[str]
+    scores: 'np.ndarray'    # float64, projects x questions, NaN unless scored
+    codes: 'np.ndarray'     # int8 response codes, projects x questions
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+
+@dataclass
+class QuestionnaireScores:
+    """Vectorized scoring results for a ResponseMatrix."""
+    matrix: ResponseMatrix
+    dimension_scores: 'np.ndarray'        # projects x dimensions, NaN if nothing scored
+    scored_counts: 'np.ndarray'           # projects x dimensions
+    overall: 'np.ndarray'                 # projects, NaN if nothing scored
+    below_threshold: 'np.ndarray'         # projects x dimensions (bool)
+    overall_below_threshold: 'np.ndarray'  # projects (bool)
+    red_flags: 'np.ndarray'               # projects x red-flag rules (bool)
+    response_counts: 'np.ndarray'         # projects x response codes
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    @property
+    def questionnaire(self) -> Questionnaire:
+        return self.matrix.questionnaire
+
+    def project_summary(self, index: int) -> Dict[str, Any]:
+        """
+        Scores of one project as plain data.
+
+        The result can be fed to the generators and converters directly:
+        "dimension_scores" matches DiagnosticData (name/score/interpretation)
+        and DataToHtmlConverter's scores dashboard, and "key_findings"
+        matches ExecutiveSprintReportData.
+
+        Args:
+            index: Project row
+
+        Returns:
+            Dict with dimension scores, overall score/status, threshold
+            failures, red flags and the questions to ask founders
+        """
+        questionnaire = self.questionnaire
+        titles = questionnaire.question_titles
+        question_ids = questionnaire.question_ids
+        codes = self.matrix.codes[index]
+
+        dimension_scores = []
+        key_findings = []
+        for d, dimension in enumerate(questionnaire.dimensions):
+            score = self.dimension_scores[index, d]
+            if np.isnan(score):
+                if self.below_threshold[index, d]:
+                    key_findings.append({
+                        "dimension": dimension.name,
+                        "weight": f"{dimension.weight:.0%}",
+                        "score": "",
+                        "status": "FAIL",
+                        "interpretation": f"No scored questions; minimum {dimension.min_score:.1f}",
+                    })
+                continue
+            status = ("FAIL" if self.below_threshold[index, d] else "PASS") \
+                if dimension.min_score is not None else questionnaire.status_for(score)
+            scored = int(self.scored_counts[index, d])
+            dimension_scores.append({
+                "name": dimension.name,
+                "score": round(float(score), 2),
+                "interpretation": f"{status}; {scored}/{len(dimension.questions)} questions scored",
+            })
+            key_findings.append({
+                "dimension": dimension.name,
+                "weight": f"{dimension.weight:.0%}",
+                "score": f"{score:.2f}",
+                "status": status,
+                "interpretation": (
+                    f"Below minimum {dimension.min_score:.1f}"
+                    if self.below_threshold[index, d] else ""
+                ),
+            })
+
+        overall = self.overall[index]
+        summary = {
+            "project_name": self.matrix.projects[index],
+            "source": self.matrix.sources[index],
+            "questionnaire": questionnaire.key,
+            "dimension_scores": dimension_scores,
+            "key_findings": key_findings,
+            "overall_score": None if np.isnan(overall) else round(float(overall), 2),
+            "overall_status": "" if np.isnan(overall) else questionnaire.status_for(overall),
+            "threshold_failures": [
+                dimension.name
+                for d, dimension in enumerate(questionnaire.dimensions)
+                if self.below_threshold[index, d]
+            ],
+            "red_flags": [
+                rule.description
+                for r, rule in enumerate(questionnaire.red_flags)
+                if self.red_flags[index, r]
+            ],
+            "questions_to_ask": [
+                f"{question_ids[q]}: {titles[question_ids[q]]}"
+                for q in np.flatnonzero(codes == RESPONSE_INSUFFICIENT_DATA)
+            ],
+            "not_applicable": [
+                question_ids[q] for q in np.flatnonzero(codes == RESPONSE_NOT_APPLICABLE)
+            ],
+            "response_counts": dict(zip(RESPONSE_LABELS, self.response_counts[index].tolist())),
+        }
+        if questionnaire.overall_min is not None:
+            summary["overall_below_threshold"] = bool(self.overall_below_threshold[index])
+        if questionnaire.key == "29q" and summary["overall_score"] is not None:
+            summary["market_maturity_score"] = f"{overall:.2f}"
+        return summary
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """One flat row per project (dimension scores, overall, counts)."""
+        questionnaire = self.questionnaire
+        rows = []
+        for index, name in enumerate(self.matrix.projects):
+            row: Dict[str, Any] = {"project": name}
+            for d, dimension in enumerate(questionnaire.dimensions):
+                score = self.dimension_scores[index, d]
+                row[dimension.name] = None if np.isnan(score) else round(float(score), 2)
+            overall = self.overall[index]
+            row["overall"] = None if np.isnan(overall) else round(float(overall), 2)
+            row["status"] = "" if np.isnan(overall) else questionnaire.status_for(overall)
+            row["threshold_failures"] = int(self.below_threshold[index].sum())
+            row["red_flags"] = int(self.red_flags[index].sum())
+            row["insufficient_data"] = int(self.response_counts[index, RESPONSE_INSUFFICIENT_DATA])
+            rows.append(row)
+        return rows
+
+    def to_dashboard_data(self) -> Dict[str, Any]:
+        """Batch results for DataToHtmlConverter (rendered as a table via "rows")."""
+        return {
+            "questionnaire": self.questionnaire.key,
+            "rows": self.to_rows(),
+            "projects": [self.project_summary(i) for i in range(len(self))],
+        }
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for questionnaire scoring: pip install numpy")
+
+
+def build_response_matrix(
+    projects: Iterable[Tuple[str, Dict[str, Any]]],
+    questionnaire: Optional[Questionnaire] = None
+) -> ResponseMatrix:
+    """
+    Load parsed project response data into a ResponseMatrix.
+
+    Args:
+        projects: (source, data) pairs with a "responses" mapping or list
+        questionnaire: Questionnaire to score against (default: from the
+            first project's "questionnaire" key or its question ids)
+
+    Returns:
+        ResponseMatrix
+
+    Raises:
+        ValueError: For non-mapping project data, unknown question ids or
+            invalid responses
+    """
+    _require_numpy()
+    projects = list(projects)
+    for source, data in projects:
+        if not isinstance(data, dict):
+            raise ValueError(f"{source}: expected a mapping of project data, got {type(data).__name__}")
+
+    if questionnaire is None:
+        if not projects:
+            raise ValueError("No projects to score and no questionnaire given")
+        data = projects[0][1]
+        if data.get('questionnaire'):
+            questionnaire = get_questionnaire(str(data['questionnaire']))
+        else:
+            questionnaire = detect_questionnaire(
+                question for question, _ in iter_responses(data.get('responses'))
+            )
+
+    column = {question: i for i, question in enumerate(questionnaire.question_ids)}
+    scores = np.full((len(projects), len(column)), np.nan)
+    codes = np.full((len(projects), len(column)), RESPONSE_MISSING, dtype=np.int8)
+    names, sources = [], []
+
+    for row, (source, data) in enumerate(projects):
+        names.append(str(data.get('project_name') or data.get('company_name') or Path(source).stem))
+        sources.append(str(source))
+        for question, value in iter_responses(data.get('responses')):
+            col = column.get(question)
+            if col is None:
+                raise ValueError(f"{source}: unknown {questionnaire.key} question id {question}")
+            try:
+                codes[row, col], scores[row, col] = parse_response(value)
+            except ValueError as e:
+                raise ValueError(f"{source}: {question}: {e}") from None
+
+    return ResponseMatrix(questionnaire, names, sources, scores, codes)
+
+
+def load_response_files(
+    inputs: Iterable[Path],
+    questionnaire: Optional[Questionnaire] = None
+) -> ResponseMatrix:
+    """
+    Load response files (or directories of them) into a ResponseMatrix.
+
+    Args:
+        inputs: Files and/or directories of YAML/JSON response files
+        questionnaire: Questionnaire (default: detected)
+
+    Returns:
+        ResponseMatrix
+    """
+    return build_response_matrix(
+        ((path, load_data_file(path) or {}) for path in collect_portfolio_files(inputs)),
+        questionnaire
+    )
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def score_responses(matrix: ResponseMatrix) -> QuestionnaireScores:
+    """
+    Score every project in one vectorized pass.
+
+    Dimension scores are averages over the questions scored 1-5 (special
+    responses are excluded, as in the manual worksheets). The overall score
+    weights the dimensions that have at least one scored question,
+    renormalizing the weights over them. A dimension with a minimum score
+    but no scored question counts as a threshold failure.
+
+    Args:
+        matrix: Loaded responses
+
+    Returns:
+        QuestionnaireScores
+    """
+    _require_numpy()
+    questionnaire = matrix.questionnaire
+    column = {question: i for i, question in enumerate(questionnaire.question_ids)}
+    question_count = len(column)
+
+    membership = np.zeros((question_count, len(questionnaire.dimensions)))
+    for d, dimension in enumerate(questionnaire.dimensions):
+        membership[[column[q] for q in dimension.questions], d] = 1.0
+    weights = np.array([dimension.weight for dimension in questionnaire.dimensions])
+    minimums = np.array([
+        -np.inf if dimension.min_score is None else dimension.min_score
+        for dimension in questionnaire.dimensions
+    ])
+
+    scored = matrix.codes == RESPONSE_SCORED
+    filled = np.where(scored, matrix.scores, 0.0)
+
+    # Dimension averages over scored questions
+    sums = filled @ membership
+    counts = scored.astype(np.float64) @ membership
+    dimension_scores = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+
+    # Weighted overall over the dimensions present
+    present = counts > 0
+    total_weight = present @ weights
+    weighted_sum = np.where(present, dimension_scores, 0.0) @ weights
+    overall = np.divide(
+        weighted_sum, total_weight,
+        out=np.full(len(matrix), np.nan), where=total_weight > 0
+    )
+
+    # A dimension with a minimum and no scored question cannot show it is met
+    below_threshold = np.isfinite(minimums) & (~present | (dimension_scores < minimums))
+    if questionnaire.overall_min is not None:
+        overall_below = ~np.isnan(overall) & (overall < questionnaire.overall_min)
+    else:
+        overall_below = np.zeros(len(matrix), dtype=bool)
+
+    # Red flags: one product per distinct score ceiling
+    red_flags = np.zeros((len(matrix), len(questionnaire.red_flags)), dtype=bool)
+    ceilings = sorted({rule.max_score for rule in questionnaire.red_flags})
+    for ceiling in ceilings:
+        rule_indices = [
+            r for r, rule in enumerate(questionnaire.red_flags) if rule.max_score == ceiling
+        ]
+        rule_members = np.zeros((question_count, len(rule_indices)))
+        for j, r in enumerate(rule_indices):
+            rule_members[[column[q] for q in questionnaire.red_flags[r].questions], j] = 1.0
+        low = (scored & (filled <= ceiling)).astype(np.float64)
+        hits = low @ rule_members
+        min_counts = np.array([questionnaire.red_flags[r].min_count for r in rule_indices])
+        red_flags[:, rule_indices] = hits >= min_counts
+
+    response_counts = np.stack(
+        [(matrix.codes == code).sum(axis=1) for code in range(len(RESPONSE_LABELS))],
+        axis=1
+    )
+
+    return QuestionnaireScores(
+        matrix=matrix,
+        dimension_scores=dimension_scores,
+        scored_counts=counts.astype(np.int64),
+        overall=overall,
+        below_threshold=below_threshold,
+        overall_below_threshold=overall_below,
+        red_flags=red_flags,
+        response_counts=response_counts
+    )
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def score_questionnaires(
+    inputs: Iterable[Path],
+    output_path: Optional[Path] = None,
+    questionnaire: Optional[str] = None,
+    output_format: str = "json"
+) -> Optional[QuestionnaireScores]:
+    """
+    Score questionnaire response files and optionally write the results.
+
+    Args:
+        inputs: Response files and/or directories
+        output_path: Where to write results (json/yaml: rows plus per-project
+            summaries; csv: rows only)
+        questionnaire: "40q", "29q" or None to detect
+        output_format: "json", "yaml" or "csv"
+
+    Returns:
+        QuestionnaireScores, or None if loading failed
+    """
+    try:
+        matrix = load_response_files(
+            inputs, get_questionnaire(questionnaire) if questionnaire else None
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return None
+
+    scores = score_responses(matrix)
+
+    if output_path is not None:
+        output_path = Path(output_path)
+        if output_format == "csv":
+            rows = scores.to_rows()
+            with open(output_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["project"])
+                writer.writeheader()
+                writer.writerows(rows)
+        elif output_format == "yaml":
+            with open(output_path, 'w', encoding='utf-8') as f:
+                yaml.safe_dump(scores.to_dashboard_data(), f, sort_keys=False, allow_unicode=True)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(scores.to_dashboard_data(), f, indent=2, ensure_ascii=False)
+        print(f"Generated {output_format.upper()}: {output_path}")
+
+    return scores
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Score VIANEO 40Q Diagnostic and 29Q Market Maturity questionnaires"
+    )
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        nargs='+',
+        required=True,
+        help='Response files and/or directories (YAML or JSON)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='Output file for the scores'
+    )
+    parser.add_argument(
+        '--questionnaire', '-q',
+        choices=sorted(QUESTIONNAIRES),
+        help='Questionnaire (default: detect from question ids)'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['json', 'yaml', 'csv'],
+        default='json',
+        help='Output format (default: json)'
+    )
+
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("Error: numpy is required (pip install numpy)")
+        return 1
+
+    start = time.perf_counter()
+    scores = score_questionnaires(args.input, args.output, args.questionnaire, args.format)
+    if scores is None:
+        return 1
+
+    questionnaire = scores.questionnaire
+    print(f"\n{questionnaire.name}: {len(scores)} project(s) in {time.perf_counter() - start:.2f}s")
+    for d, dimension in enumerate(questionnaire.dimensions):
+        values = scores.dimension_scores[:, d]
+        scored = values[~np.isnan(values)]
+        mean = f"{scored.mean():.2f}" if scored.size else "-"
+        print(f"  {dimension.name}: mean {mean}, below minimum {int(scores.below_threshold[:, d].sum())}")
+    print(f"  Projects with red flags: {int(scores.red_flags.any(axis=1).sum())}")
+    print(f"  INSUFFICIENT DATA responses: {int(scores.response_counts[:, RESPONSE_INSUFFICIENT_DATA].sum())}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,274 @@
+"""
+VIANEO Questionnaire Definitions
+================================
+
+Question sets, dimensions, weights, thresholds and red-flag rules for the
+Step 2 40-Question Diagnostic and the Step 3 29-Question Market Maturity
+Assessment, as defined in prompts/step_02_diagnostic_40q.md and
+prompts/step_03_market_maturity_29q.md.
+
+Question wording lives in docs/VIANEO_Comprehensive_Reference_Guide.md;
+only the short titles used in reports are repeated here.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass(frozen=True)
+class QuestionDimension:
+    """A scored dimension: its questions, weight and minimum threshold."""
+    key: str
+    name: str
+    questions: Tuple[str, ...]
+    weight: float
+    min_score: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class RedFlagRule:
+    """
+    Raised when at least min_count of the questions score at or below max_score.
+
+    Only 1-5 scores count; special responses (INSUFFICIENT DATA, N/A,
+    YES/NO) never raise a flag.
+    """
+    key: str
+    description: str
+    questions: Tuple[str, ...]
+    max_score: float
+    min_count: int = 1
+
+
+@dataclass(frozen=True)
+class Questionnaire:
+    """A complete questionnaire definition."""
+    key: str
+    name: str
+    step: str
+    titles: Tuple[Tuple[str, str], ...]           # (question id, short title) in order
+    dimensions: Tuple[QuestionDimension, ...]
+    red_flags: Tuple[RedFlagRule, ...]
+    status_bands: Tuple[Tuple[float, str], ...]   # (lower bound, label), descending
+    overall_min: Optional[float] = None
+
+    @property
+    def question_ids(self) -> Tuple[str, ...]:
+        return tuple(question for question, _ in self.titles)
+
+    @property
+    def question_titles(self) -> Dict[str, str]:
+        return dict(self.titles)
+
+    def status_for(self, score: float) -> str:
+        """Status label for a score (the lowest band when below all bounds)."""
+        for lower, label in self.status_bands:
+            if score >= lower:
+                return label
+        return self.status_bands[-1][1]
+
+
+def _ids(prefix: str, count: int) -> Tuple[str, ...]:
+    return tuple(f"{prefix}{i}" for i in range(1, count + 1))
+
+
+def _questions(*ids: int) -> Tuple[str, ...]:
+    return tuple(f"Q{i}" for i in ids)
+
+
+# =============================================================================
+# STEP 2: 40-QUESTION DIAGNOSTIC
+# =============================================================================
+
+DIAGNOSTIC_40Q_TITLES = (
+    ("T1", "Technical Completeness of Team"),
+    ("T2", "Previous Startup/Innovation Experience"),
+    ("T3", "Domain Expertise Depth"),
+    ("T4", "Ability to Attract Talent"),
+    ("T5", "Leadership and Vision Clarity"),
+    ("T6", "Execution Capability Demonstrated"),
+    ("T7", "Resilience and Adaptability Shown"),
+    ("T8", "Network and Advisory Support"),
+    ("T9", "Commitment Level (Full-time/Part-time)"),
+    ("Tech1", "Innovation Level vs. Existing Solutions"),
+    ("Tech2", "Technical Feasibility Validated"),
+    ("Tech3", "Prototype/MVP Development Stage"),
+    ("Tech4", "Intellectual Property Position"),
+    ("Tech5", "Scalability of Technical Solution"),
+    ("Tech6", "Technical Risk Identification/Mitigation"),
+    ("Tech7", "Development Roadmap Clarity"),
+    ("Tech8", "Technical Partnerships/Resources"),
+    ("Tech9", "Security and Data Privacy Approach"),
+    ("Tech10", "Technology Stack Appropriateness"),
+    ("Tech11", "Quality Assurance and Testing"),
+    ("M1", "Strategy Clarity and Communication"),
+    ("M2", "Market Understanding Depth"),
+    ("M3", "Financial Planning Sophistication"),
+    ("M4", "Risk Management Approach"),
+    ("M5", "Operational Planning Quality"),
+    ("M6", "Milestone Setting and Tracking"),
+    ("M7", "Resource Allocation Efficiency"),
+    ("M8", "Decision-Making Process"),
+    ("M9", "Stakeholder Management"),
+    ("M10", "Culture and Values Definition"),
+    ("M11", "Learning and Iteration Speed"),
+    ("M12", "Governance Structure"),
+    ("C1", "Customer Validation Depth"),
+    ("C2", "Market Size Quantification"),
+    ("C3", "Business Model Clarity"),
+    ("C4", "Revenue Model Validation"),
+    ("C5", "Sales and Marketing Strategy"),
+    ("C6", "Partnership Development"),
+    ("C7", "Competitive Positioning"),
+    ("C8", "Growth Strategy Definition"),
+)
+
+# Step 2 reports plain dimension averages; the overall score is their mean
+DIAGNOSTIC_40Q_DIMENSIONS = (
+    QuestionDimension("team", "Team", _ids("T", 9), 0.25),
+    QuestionDimension("technology", "Technology", _ids("Tech", 11), 0.25),
+    QuestionDimension("management", "Management", _ids("M", 12), 0.25),
+    QuestionDimension("commercial", "Commercial", _ids("C", 8), 0.25),
+)
+
+DIAGNOSTIC_40Q_RED_FLAGS = (
+    RedFlagRule("team_score_1", "Any score of 1 in Team dimension", _ids("T", 9), 1),
+    RedFlagRule("team_three_2s", "Three or more Team scores of 2 or below", _ids("T", 9), 2, 3),
+    RedFlagRule("no_full_time", "No full-time commitment (T9 ≤ 2)", ("T9",), 2),
+    RedFlagRule("no_domain_expertise", "No domain expertise (T3 ≤ 2)", ("T3",), 2),
+    RedFlagRule("no_technical_capability", "No technical capability (T1 ≤ 2)", ("T1",), 2),
+    RedFlagRule("poor_execution", "Poor execution track record (T6 ≤ 2)", ("T6",), 2),
+    RedFlagRule("technology_score_1", "Any score of 1 in Technology dimension", _ids("Tech", 11), 1),
+    RedFlagRule("feasibility_unproven", "Technical feasibility unproven (Tech2 = 1)", ("Tech2",), 1),
+    RedFlagRule("no_prototype", "No working prototype (Tech3 ≤ 2)", ("Tech3",), 2),
+    RedFlagRule("cannot_scale", "Cannot scale (Tech5 ≤ 2)", ("Tech5",), 2),
+    RedFlagRule(
+        "security_privacy",
+        "Security/privacy not addressed (Tech9 ≤ 2; critical in regulated sectors)",
+        ("Tech9",), 2
+    ),
+    RedFlagRule("management_score_1", "Any score of 1 in Management dimension", _ids("M", 12), 1),
+    RedFlagRule("no_strategy", "No clear strategy (M1 ≤ 2)", ("M1",), 2),
+    RedFlagRule("poor_financial_planning", "Poor financial planning (M3 ≤ 2)", ("M3",), 2),
+    RedFlagRule("no_milestones", "No milestone tracking (M6 ≤ 2)", ("M6",), 2),
+    RedFlagRule("no_iteration", "No learning/iteration (M11 ≤ 2)", ("M11",), 2),
+    RedFlagRule("commercial_score_1", "Any score of 1 in Commercial dimension", _ids("C", 8), 1),
+    RedFlagRule("no_customer_validation", "No customer validation (C1 ≤ 2)", ("C1",), 2),
+    RedFlagRule("business_model_unclear", "Business model unclear (C3 ≤ 2)", ("C3",), 2),
+    RedFlagRule("revenue_untested", "Revenue model untested (C4 ≤ 2)", ("C4",), 2),
+    RedFlagRule("market_size_unknown", "Market size unknown (C2 = 1)", ("C2",), 1),
+    RedFlagRule("no_competitive_analysis", "No competitive analysis (C7 ≤ 2)", ("C7",), 2),
+)
+
+DIAGNOSTIC_40Q = Questionnaire(
+    key="40q",
+    name="40-Question Diagnostic Assessment",
+    step="step_02",
+    titles=DIAGNOSTIC_40Q_TITLES,
+    dimensions=DIAGNOSTIC_40Q_DIMENSIONS,
+    red_flags=DIAGNOSTIC_40Q_RED_FLAGS,
+    status_bands=((4.0, "STRONG"), (3.0, "ADEQUATE"), (2.0, "CONCERN"), (0.0, "CRITICAL")),
+)
+
+
+# =============================================================================
+# STEP 3: 29-QUESTION MARKET MATURITY
+# =============================================================================
+
+MARKET_MATURITY_29Q_TITLES = (
+    ("Q1", "Solid and tangible resources to launch and carry out the project"),
+    ("Q2", "Identified people with strong needs who are looking for solutions"),
+    ("Q3", "Know the market players beyond clients and competitors"),
+    ("Q4", "Offer and features defined to meet unmet needs today"),
+    ("Q5", "Target easiest and most strategic customers to enter the market"),
+    ("Q6", "Identified and studied solutions currently used to meet needs"),
+    ("Q7", "Verified through interviews with at least 5 people per profile that needs are expressed"),
+    ("Q8", "Identified one or more markets or fields of application"),
+    ("Q9", "Defined product-market fit per customer segment"),
+    ("Q10", "Regulations may help the project grow"),
+    ("Q11", "Customers will easily perceive the interest of the offer compared to existing solutions"),
+    ("Q12", "Regularly test the offer with users at any stage of development"),
+    ("Q13", "Validated with several people that the problem is real and important"),
+    ("Q14", "Defined revenue streams"),
+    ("Q15", "Plan to use technical partners to focus on core project"),
+    ("Q16", "Fully committed team formed"),
+    ("Q17", "Identified players potentially unfavorable to the project"),
+    ("Q18", "Differentiating assets exist"),
+    ("Q19", "Tested the revenue model with at least 3 potential customers"),
+    ("Q20", "Able to represent market organization and links between groups of players"),
+    ("Q21", "Offer meets key needs better than existing solutions"),
+    ("Q22", "Tested products or services with at least 3 customers per segment"),
+    ("Q23", "Identified market players who will support the project"),
+    ("Q24", "Regulations may have a strong negative influence on the project"),
+    ("Q25", "Can accurately describe profiles, behaviors, and expectations of people who express needs"),
+    ("Q26", "Have the necessary means to develop the offer"),
+    ("Q27", "Able to express value proposition in one sentence per customer type"),
+    ("Q28", "Able to prioritize people with strong and poorly met needs"),
+    ("Q29", "Have the means to reach customers"),
+)
+
+MARKET_MATURITY_29Q_DIMENSIONS = (
+    QuestionDimension("legitimacy", "Legitimacy", _questions(8, 13), 0.15, 3.0),
+    QuestionDimension(
+        "desirability", "Desirability",
+        _questions(2, 4, 5, 6, 7, 9, 11, 12, 21, 22, 25, 28), 0.25, 3.5
+    ),
+    QuestionDimension("acceptability", "Acceptability", _questions(3, 10, 17, 20, 23, 24), 0.20, 3.0),
+    QuestionDimension("feasibility", "Feasibility", _questions(1, 15, 16, 18, 26), 0.20, 3.0),
+    QuestionDimension("viability", "Viability", _questions(14, 19, 27, 29), 0.20, 3.0),
+)
+
+MARKET_MATURITY_29Q_RED_FLAGS = (
+    RedFlagRule("no_user_interviews", "No user interviews (Q7 ≤ 2): cannot validate desirability", ("Q7",), 2),
+    RedFlagRule("problem_not_validated", "Problem not validated (Q13 ≤ 2): foundation questionable", ("Q13",), 2),
+    RedFlagRule("revenue_not_tested", "Revenue not tested (Q19 ≤ 2): business model unproven", ("Q19",), 2),
+    RedFlagRule(
+        "not_tested_per_segment",
+        "Not tested per segment (Q22 ≤ 2): product-market fit unvalidated",
+        ("Q22",), 2
+    ),
+    RedFlagRule(
+        "any_score_1", "Any score of 1: immediate action required",
+        tuple(question for question, _ in MARKET_MATURITY_29Q_TITLES), 1
+    ),
+)
+
+MARKET_MATURITY_29Q = Questionnaire(
+    key="29q",
+    name="29-Question Market Maturity Assessment",
+    step="step_03",
+    titles=MARKET_MATURITY_29Q_TITLES,
+    dimensions=MARKET_MATURITY_29Q_DIMENSIONS,
+    red_flags=MARKET_MATURITY_29Q_RED_FLAGS,
+    status_bands=((3.2, "PASS"), (0.0, "FAIL")),
+    overall_min=3.2,
+)
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+QUESTIONNAIRES: Dict[str, Questionnaire] = {
+    DIAGNOSTIC_40Q.key: DIAGNOSTIC_40Q,
+    MARKET_MATURITY_29Q.key: MARKET_MATURITY_29Q,
+}
+
+
+def get_questionnaire(key: str) -> Questionnaire:
+    """
+    Look up a questionnaire by key ("40q" or "29q").
+
+    Raises:
+        ValueError: If the key is unknown
+    """
+    questionnaire = QUESTIONNAIRES.get(key.lower())
+    if questionnaire is None:
+        raise ValueError(
+            f"Unknown questionnaire: {key} (expected one of {', '.join(QUESTIONNAIRES)})"
+        )
+    return questionnaire
@@ -0,0 +1,26 @@
+"""
+VIANEO Methodology Search
+=========================
+
+Indexed full-text search over the repository's methodology text.
+
+Available modules:
+- index: Persistent SQLite inverted index over prompts, templates, docs,
+  examples and outputs, refreshed by mtime and ranked with BM25
+"""
+
+from .index import (
+    SearchHit,
+    SearchIndex,
+    default_index_path,
+    search_repository,
+    tokenize,
+)
+
+__all__ = [
+    'SearchHit',
+    'SearchIndex',
+    'default_index_path',
+    'search_repository',
+    'tokenize',
+]
@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+VIANEO Methodology Search
+=========================
+
+Ranked full-text search over prompts, templates, docs, examples and outputs.
+
+Files are split into sections with core.utils.iter_sections (the heading
+parsing behind extract_sections) and kept in a persistent SQLite inverted
+index:
+- files:     path (relative to the repository root), mtime, size
+- sections:  file, heading, heading trail ("Step 2 > Scoring"), line, text
+- postings:  token -> section, term frequency
+
+Before each search the indexed roots are walked and only files whose mtime
+or size changed are re-indexed (deleted files are dropped), so a query on
+an up-to-date index costs one stat() per file plus a few indexed lookups.
+Sections are ranked with BM25; each hit shows its heading trail and the
+lines that match the most query terms.
+
+The index lives in $XDG_CACHE_HOME/vianeo/search (default ~/.cache) unless
+--db is given.
+
+Usage:
+    python index.py character limit
+    python index.py "investment ready" threshold --root docs --root prompts
+    python index.py E001 --path outputs/ --format json
+    python index.py --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import REPO_ROOT
+from core.data_cache import default_cache_directory
+from core.utils import iter_sections
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Directories indexed by default (relative to REPO_ROOT; missing ones skipped)
+DEFAULT_ROOTS = ("prompts", "templates", "docs", "examples", "outputs", "archive")
+
+INDEXED_SUFFIXES = {'.md', '.markdown', '.txt', '.yaml', '.yml'}
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    heading TEXT,
+    trail TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    section_id INTEGER NOT NULL REFERENCES sections(id) ON DELETE CASCADE,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (token, section_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sections_file ON sections(file_id);
+CREATE INDEX IF NOT EXISTS idx_postings_section ON postings(section_id);
+"""
+
+# Numbers keep their decimals ("3.5"); everything else splits on non-word characters
+TOKEN_PATTERN = re.compile(r'\d+(?:\.\d+)*|\w+')
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Heading words count this many extra times towards a section's term frequency
+HEADING_BOOST = 2
+
+TRAIL_SEPARATOR = " > "
+
+
+def default_index_path(base: Union[str, Path] = REPO_ROOT) -> Path:
+    """Index file for a repository root, under the user cache directory."""
+    key = hashlib.blake2b(str(Path(base).resolve()).encode('utf-8'), digest_size=8).hexdigest()
+    return default_cache_directory().parent / "search" / f"{key}.sqlite"
+
+
+# =============================================================================
+# TOKENIZING
+# =============================================================================
+
+def normalize_token(token: str) -> str:
+    """Fold simple plurals so "limits" matches "limit"."""
+    if len(token) > 3 and token[-1] == 's' and token[-2] not in 'su' and token.isalpha():
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased, plural-folded tokens of text."""
+    return [normalize_token(token) for token in TOKEN_PATTERN.findall(text.lower())]
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class SearchHit:
+    """A ranked section with its best matching lines."""
+    path: str
+    heading: str
+    line: int
+    score: float
+    matches: List[Tuple[int, str]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["matches"] = [{"line": number, "text": text} for number, text in self.matches]
+        return data
+
+
+@dataclass
+class RefreshStats:
+    """What an index refresh did."""
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def changed(self) -> int:
+        return self.added + self.updated + self.removed
+
+    def __str__(self) -> str:
+        return (f"{self.added} added, {self.updated} updated, {self.removed} removed, "
+                f"{self.unchanged} unchanged in {self.elapsed * 1000:.0f} ms")
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+def _walk(root: Path) -> Iterable[Path]:
+    """Indexable files under root (hidden entries skipped)."""
+    if root.is_file():
+        yield root
+        return
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = [d for d in subdirs if not d.startswith('.') and d != '__pycache__']
+        for name in files:
+            if not name.startswith('.') and Path(name).suffix.lower() in INDEXED_SUFFIXES:
+                yield Path(directory) / name
+
+
+def split_sections(text: str) -> List[Tuple[Optional[str], str, int, str]]:
+    """
+    Sections of a document with their heading trail.
+
+    Returns:
+        List of (heading, trail, first line, text) where text starts with
+        the heading line itself
+    """
+    result = []
+    stack: List[Tuple[int, str]] = []
+    for section in iter_sections(text, include_preamble=True):
+        if section.heading is None:
+            result.append((None, "", section.line, '\n'.join(section.lines)))
+            continue
+        while stack and stack[-1][0] >= section.level:
+            stack.pop()
+        stack.append((section.level, section.heading.strip()))
+        trail = TRAIL_SEPARATOR.join(heading for _, heading in stack)
+        body = '\n'.join([f"{'#' * section.level} {section.heading}"] + section.lines)
+        result.append((section.heading.strip(), trail, section.line, body))
+    return result
+
+
+class SearchIndex:
+    """
+    Persistent inverted index over repository text files.
+
+    Args:
+        path: Index database file (":memory:" for a temporary index)
+        base: Directory that indexed paths are stored relative to
+
+    Raises:
+        ValueError: If the file holds an index with another schema version
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:", base: Union[str, Path] = REPO_ROOT):
+        self.path = str(path)
+        self.base = Path(base).resolve()
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if self.path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        has_tables = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postings'"
+        ).fetchone()
+        if has_tables and version != SCHEMA_VERSION:
+            self.connection.close()
+            raise ValueError(
+                f"{self.path}: index schema v{version}, expected v{SCHEMA_VERSION}; use --rebuild"
+            )
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+
+    def _relative(self, path: Path) -> str:
+        path = path.resolve()
+        try:
+            return path.relative_to(self.base).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _index_file(self, file_id: int, text: str) -> None:
+        postings = []
+        for heading, trail, line, body in split_sections(text):
+            tokens = tokenize(body)
+            if not tokens:
+                continue
+            counts = Counter(tokens)
+            if heading:
+                for token in tokenize(heading):
+                    counts[token] += HEADING_BOOST
+            cursor = self.connection.execute(
+                "INSERT INTO sections (file_id, heading, trail, line, length, body) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (file_id, heading, trail, line, len(tokens), body)
+            )
+            section_id = cursor.lastrowid
+            postings.extend((token, section_id, tf) for token, tf in counts.items())
+        self.connection.executemany(
+            "INSERT INTO postings (token, section_id, tf) VALUES (?, ?, ?)", postings
+        )
+
+    def refresh(self, roots: Optional[Sequence[Union[str, Path]]] = None) -> RefreshStats:
+        """
+        Bring the index up to date with the files under roots.
+
+        Only files whose mtime or size changed are re-read. Indexed files
+        under roots that no longer exist are removed; files outside roots
+        are left alone.
+
+        Args:
+            roots: Files/directories (relative to base or absolute);
+                default DEFAULT_ROOTS
+
+        Returns:
+            RefreshStats
+        """
+        start = time.perf_counter()
+        stats = RefreshStats()
+        roots = [self.base / root for root in (roots or DEFAULT_ROOTS)]
+        roots = [root for root in roots if root.exists()]
+        prefixes = [self._relative(root) for root in roots]
+
+        known = {
+            row["path"]: (row["id"], row["mtime_ns"], row["size"])
+            for row in self.connection.execute("SELECT id, path, mtime_ns, size FROM files")
+        }
+        seen = set()
+
+        with self.connection:
+            for root in roots:
+                for path in _walk(root):
+                    relative = self._relative(path)
+                    if relative in seen:
+                        continue
+                    seen.add(relative)
+                    stat = path.stat()
+                    entry = known.get(relative)
+                    if entry and entry[1] == stat.st_mtime_ns and entry[2] == stat.st_size:
+                        stats.unchanged += 1
+                        continue
+                    text = path.read_text(encoding='utf-8', errors='replace')
+                    if entry:
+                        self.connection.execute("DELETE FROM sections WHERE file_id = ?", (entry[0],))
+                        self.connection.execute(
+                            "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                            (stat.st_mtime_ns, stat.st_size, entry[0])
+                        )
+                        file_id = entry[0]
+                        stats.updated += 1
+                    else:
+                        file_id = self.connection.execute(
+                            "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                            (relative, stat.st_mtime_ns, stat.st_size)
+                        ).lastrowid
+                        stats.added += 1
+                    self._index_file(file_id, text)
+
+            for relative, (file_id, _, _) in known.items():
+                under_root = any(
+                    relative == prefix or relative.startswith(prefix.rstrip('/') + '/')
+                    for prefix in prefixes
+                )
+                if under_root and relative not in seen:
+                    self.connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                    stats.removed += 1
+
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    def clear(self) -> None:
+        """Remove everything from the index."""
+        with self.connection:
+            self.connection.execute("DELETE FROM postings")
+            self.connection.execute("DELETE FROM sections")
+            self.connection.execute("DELETE FROM files")
+
+    # -------------------------------------------------------------------------
+    # Searching
+    # -------------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        match_all: bool = True,
+        path_prefix: Optional[str] = None,
+        context_lines: int = 3
+    ) -> List[SearchHit]:
+        """
+        Rank indexed sections against a query with BM25.
+
+        Args:
+            query: Free text; tokenized like the indexed documents
+            limit: Maximum number of hits
+            match_all: Only sections containing every query term (else any)
+            path_prefix: Only files whose relative path starts with this
+            context_lines: Matching lines shown per hit
+
+        Returns:
+            SearchHit list, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        total, average = self.connection.execute(
+            "SELECT COUNT(*), AVG(length) FROM sections"
+        ).fetchone()
+        if not total:
+            return []
+
+        placeholders = ", ".join("?" * len(terms))
+        # Document frequency over the whole index; path_prefix only selects hits
+        document_frequency = dict(self.connection.execute(
+            "SELECT token, COUNT(*) FROM postings WHERE token IN (" + placeholders + ") GROUP BY token",
+            terms
+        ).fetchall())
+        sql = (
+            "SELECT p.token, p.section_id, p.tf, s.length FROM postings p "
+            "JOIN sections s ON s.id = p.section_id "
+        )
+        params: List[Any] = list(terms)
+        if path_prefix:
+            sql += "JOIN files f ON f.id = s.file_id WHERE p.token IN (" + placeholders + ") AND f.path LIKE ? ESCAPE '\\'"
+            escaped = path_prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(escaped + '%')
+        else:
+            sql += "WHERE p.token IN (" + placeholders + ")"
+        rows = self.connection.execute(sql, params).fetchall()
+
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = Counter()
+        for row in rows:
+            df = document_frequency[row["token"]]
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            tf = row["tf"]
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * row["length"] / average)
+            scores[row["section_id"]] = scores.get(row["section_id"], 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+            matched[row["section_id"]] += 1
+
+        if match_all:
+            scores = {sid: score for sid, score in scores.items() if matched[sid] == len(terms)}
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+        hits = []
+        term_set = set(terms)
+        for section_id, score in best:
+            row = self.connection.execute(
+                "SELECT f.path, s.trail, s.line, s.body FROM sections s "
+                "JOIN files f ON f.id = s.file_id WHERE s.id = ?", (section_id,)
+            ).fetchone()
+            hits.append(SearchHit(
+                path=row["path"],
+                heading=row["trail"],
+                line=row["line"],
+                score=round(score, 4),
+                matches=_best_lines(row["body"], row["line"], term_set, context_lines),
+            ))
+        return hits
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts of the index tables."""
+        return {
+            table: self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("files", "sections", "postings")
+        }
+
+    # -------------------------------------------------------------------------
+    # Lifetime
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'SearchIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _best_lines(body: str, first_line: int, terms: set, count: int) -> List[Tuple[int, str]]:
+    """Lines of a section matching the most distinct terms, in line order."""
+    scored = []
+    for offset, text in enumerate(body.split('\n')):
+        hits = len(terms.intersection(tokenize(text)))
+        if hits:
+            scored.append((-hits, offset, text.strip()))
+    scored.sort()
+    return sorted((first_line + offset, text) for _, offset, text in scored[:count])
+
+
+def search_repository(
+    query: str,
+    roots: Optional[Sequence[Union[str, Path]]] = None,
+    index_path: Optional[Union[str, Path]] = None,
+    **options
+) -> List[SearchHit]:
+    """
+    Refresh the default repository index and search it.
+
+    Args:
+        query: Free text query
+        roots: Roots to refresh (default DEFAULT_ROOTS)
+        index_path: Index file (default: default_index_path())
+        **options: Passed to SearchIndex.search()
+
+    Returns:
+        SearchHit list, best first
+    """
+    with SearchIndex(index_path or default_index_path()) as index:
+        index.refresh(roots)
+        return index.search(query, **options)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Search VIANEO prompts, templates, docs and outputs"
+    )
+    parser.add_argument(
+        'query',
+        nargs='*',
+        help='Search terms (omit to only refresh the index)'
+    )
+    parser.add_argument(
+        '--root', '-r',
+        action='append',
+        help=f'Directory/file to index, relative to the repository root '
+             f'(repeatable; default: {", ".join(DEFAULT_ROOTS)})'
+    )
+    parser.add_argument(
+        '--path', '-p',
+        help='Only show hits in files whose path starts with this prefix'
+    )
+    parser.add_argument(
+        '--limit', '-n',
+        type=int,
+        default=10,
+        help='Maximum number of hits (default: 10)'
+    )
+    parser.add_argument(
+        '--any',
+        action='store_true',
+        help='Match sections containing any term (default: all terms)'
+    )
+    parser.add_argument(
+        '--db',
+        type=Path,
+        help='Index database (default: user cache directory)'
+    )
+    parser.add_argument(
+        '--no-refresh',
+        action='store_true',
+        help='Search the index as is, without checking for changed files'
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Discard the index and build it again'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['text', 'json'],
+        default='text',
+        help='Output format (default: text)'
+    )
+
+    args = parser.parse_args()
+
+    db_path = args.db or default_index_path()
+    if args.rebuild and db_path.exists():
+        db_path.unlink()
+    try:
+        index = SearchIndex(db_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    with index:
+        if not args.no_refresh:
+            refresh = index.refresh(args.root)
+            if refresh.changed or not args.query:
+                print(f"Index: {refresh}", file=sys.stderr)
+        if not args.query:
+            stats = index.stats()
+            print(f"{stats['files']} files, {stats['sections']} sections, "
+                  f"{stats['postings']} postings in {db_path}")
+            return 0
+
+        start = time.perf_counter()
+        hits = index.search(" ".join(args.query), limit=args.limit,
+                            match_all=not args.any, path_prefix=args.path)
+        elapsed = time.perf_counter() - start
+
+    if args.format == 'json':
+        print(json.dumps([hit.to_dict() for hit in hits], indent=2, ensure_ascii=False))
+        return 0 if hits else 1
+
+    for hit in hits:
+        print(f"{hit.path}:{hit.line}  {hit.heading}  [{hit.score:.2f}]")
+        for number, text in hit.matches:
+            print(f"    {number}: {text}")
+    print(f"{len(hits)} hit(s) in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0 if hits else 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -2,6 +2,7 @@
 Pytest configuration and shared fixtures for VIANEO tools tests.
 """
 
+import copy
 import pytest
 import sys
 from pathlib import Path
@@ -11,6 +12,21 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+# =============================================================================
+# CACHE FIXTURES
+# =============================================================================
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_data_cache(tmp_path_factory):
+    """Keep the parsed-data cache out of the user's cache directory."""
+    from core.data_cache import DATA_CACHE
+
+    previous = DATA_CACHE.directory
+    DATA_CACHE.directory = tmp_path_factory.mktemp("data_cache")
+    yield DATA_CACHE
+    DATA_CACHE.directory = previous
+
+
 # =============================================================================
 # PATH FIXTURES
 # =============================================================================
@@ -124,6 +140,40 @@ def sample_dimension_scores() -> dict:
     }
 
 
+# =============================================================================
+# PORTFOLIO FIXTURES
+# =============================================================================
+
+SAMPLE_PORTFOLIO = [
+    ("/data/alpha.yaml", {
+        "project_name": "Alpha",
+        "dimension_scores": {"legitimacy": 4.0, "desirability": 2.5, "acceptability": 3.5,
+                             "feasibility": 4.0, "viability": 3.0},
+        "evidence_log": [
+            {"id": "E001", "section": "B2", "source_type": "L1", "quality_rating": 4},
+            {"id": "E002", "section": "B4", "source_type": "L2", "quality_rating": 2},
+        ],
+        "personas": [{"first_name": "Maria", "age": 41, "interview_count": 6}],
+        "buyers": [{"name": "District A", "role": "Buyer", "acceptability": "favorable",
+                    "need_level": "Critical"}],
+        "ecosystem_relationships": [{"relationship": "Regulator", "criticality": "Critical"}],
+    }),
+    ("/data/beta.yaml", {
+        "project_name": "Beta",
+        "dimension_scores": {"legitimacy": 4.8, "desirability": 4.6, "acceptability": 4.5,
+                             "feasibility": 4.7, "viability": 4.9},
+        "evidence_log": [{"id": f"E00{i}", "quality_rating": 5} for i in range(1, 7)],
+    }),
+    ("/data/gamma.json", {"project_name": "Gamma"}),
+]
+
+
+@pytest.fixture
+def sample_portfolio() -> list:
+    """(source, data) pairs for a scored, a strong and an unscored project (fresh copy)."""
+    return copy.deepcopy(SAMPLE_PORTFOLIO)
+
+
 # =============================================================================
 # DATE FIXTURES
 # =============================================================================
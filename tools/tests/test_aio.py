@@ -0,0 +1,117 @@
+"""
+Tests for pipeline/aio.py asyncio API.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pipeline import aio, parse_document
+
+
+DIAGNOSTIC = {
+    "project_name": "AsyncTest",
+    "dimension_scores": [{"name": "Legitimacy", "score": 3.4}],
+}
+
+
+@pytest.fixture
+def diagnostic_file(tmp_path):
+    path = tmp_path / "diagnostic.json"
+    path.write_text('{"project_name": "AsyncFile"}', encoding="utf-8")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    yield
+    aio.set_executor(None)
+
+
+class TestExecutor:
+    """Tests for executor configuration."""
+
+    def test_runs_on_configured_executor(self):
+        names = []
+
+        def record():
+            names.append(threading.current_thread().name)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="vianeo-test") as pool:
+            aio.set_executor(pool)
+            assert asyncio.run(aio.run_in_executor(record)) == 42
+        assert names[0].startswith("vianeo-test")
+
+    def test_cancel_pending_work(self):
+        release = threading.Event()
+        ran = []
+
+        async def scenario(pool):
+            blocker = asyncio.ensure_future(aio.run_in_executor(release.wait, 5, executor=pool))
+            queued = asyncio.ensure_future(aio.run_in_executor(ran.append, 1, executor=pool))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            await asyncio.sleep(0.05)
+            release.set()
+            await blocker
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            asyncio.run(scenario(pool))
+        assert ran == []
+
+
+class TestAsyncPipeline:
+    """Tests for async load/render/validate/save."""
+
+    def test_load_data_file(self, diagnostic_file):
+        assert asyncio.run(aio.load_data_file_async(diagnostic_file)) == {"project_name": "AsyncFile"}
+
+    def test_load_rejects_unknown_extension(self, tmp_path):
+        with pytest.raises(ValueError):
+            asyncio.run(aio.load_data_file_async(tmp_path / "data.txt"))
+
+    def test_render_validate_save(self, tmp_path):
+        async def scenario():
+            rendered = await aio.render_document_async("diagnostic", DIAGNOSTIC, formats=["md"])
+            reports = await aio.validate_document_async(rendered)
+            written = await aio.save_rendered_async(rendered, tmp_path / "diag")
+            return rendered, reports, written
+
+        rendered, reports, written = asyncio.run(scenario())
+        assert "AsyncTest" in rendered.markdown
+        assert "score_thresholds" in reports
+        assert written["md"].read_text(encoding="utf-8") == rendered.markdown
+
+    def test_render_project_concurrently(self, diagnostic_file):
+        project = asyncio.run(aio.render_project_async({
+            "diagnostic": diagnostic_file,
+            "value_chain": {"project_name": "AsyncNetwork"},
+        }))
+        assert "AsyncFile" in project.documents["diagnostic"].markdown
+        assert "AsyncNetwork" in project.documents["value_chain"].html
+
+
+class TestAsyncCounterparts:
+    """Tests for the wrapped public entry points."""
+
+    def test_names(self):
+        assert aio.generate_diagnostic_async.__name__ == "generate_diagnostic_async"
+        assert aio.validate_evidence_async.__name__ == "validate_evidence_async"
+        assert aio.convert_md_to_docx_async.__name__ == "convert_md_to_docx_async"
+
+    def test_generator(self, tmp_path):
+        outputs = asyncio.run(aio.generate_diagnostic_async(
+            data=parse_document("diagnostic", DIAGNOSTIC),
+            output_path=tmp_path / "diag",
+            output_format="md"
+        ))
+        assert outputs["md"].exists()
+
+    def test_validator(self):
+        report = asyncio.run(aio.validate_score_thresholds_async(scores={"legitimacy": 3.5}))
+        assert report.is_valid
@@ -0,0 +1,173 @@
+"""
+Tests for portfolio/columnar.py memory-mapped columnar portfolios.
+"""
+
+import json
+import math
+import sys
+
+import pytest
+
+from portfolio.columnar import (
+    MANIFEST_NAME,
+    NUMPY_AVAILABLE,
+    build_columnar_tables,
+    export_columnar,
+    is_columnar_directory,
+    main,
+    open_columnar,
+    write_columnar,
+)
+from scoring.questionnaires import DIAGNOSTIC_40Q, MARKET_MATURITY_29Q
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+@pytest.fixture
+def projects(sample_portfolio):
+    """Sample portfolio with questionnaire responses, a UTF-8 name and a viability-only Gamma."""
+    alpha, beta, gamma = (data for _, data in sample_portfolio)
+    alpha["responses_29q"] = {question: 4 for question in MARKET_MATURITY_29Q.question_ids}
+    beta["project_name"] = "Bêta"
+    beta["questionnaire"] = "40q"
+    beta["responses"] = {question: 2 for question in DIAGNOSTIC_40Q.question_ids}
+    gamma["dimension_scores"] = {"viability": 1.0}
+    return sample_portfolio
+
+
+@pytest.fixture
+def portfolio(tmp_path, projects):
+    write_columnar(build_columnar_tables(projects), tmp_path / "cols")
+    with open_columnar(tmp_path / "cols") as portfolio:
+        yield portfolio
+
+
+class TestColumnarFormat:
+    """Tests for writing and reading columns."""
+
+    def test_manifest_and_files(self, portfolio):
+        manifest = json.loads((portfolio.directory / MANIFEST_NAME).read_text())
+        assert manifest["storage"] == "npy"
+        assert manifest["tables"]["projects"]["rows"] == 3
+        assert manifest["tables"]["evidence"]["columns"]["quality_rating"] == "float"
+        assert (portfolio.directory / "projects.name.utf8").exists()
+
+    def test_columns_are_memory_mapped(self, portfolio):
+        import numpy as np
+
+        legitimacy = portfolio.projects.array("legitimacy")
+        assert isinstance(legitimacy, np.memmap)
+        assert not legitimacy.flags.writeable
+        assert legitimacy.tolist()[:2] == [4.0, 4.8]
+        assert math.isnan(legitimacy[2])
+
+    def test_text_columns(self, portfolio):
+        assert portfolio.projects.texts("name") == ["Alpha", "Bêta", "Gamma"]
+        assert portfolio.projects.text("source", 2) == "/data/gamma.json"
+        evidence = portfolio.table("evidence")
+        start, stop = evidence.rows_for(0)
+        assert evidence.texts("id", start, stop) == ["E001", "E002"]
+
+    def test_column_kind_errors(self, portfolio):
+        with pytest.raises(TypeError):
+            portfolio.projects.array("name")
+        with pytest.raises(KeyError):
+            portfolio.projects.array("missing")
+
+    def test_questionnaire_tables(self, portfolio):
+        q29, q40 = portfolio.table("q29"), portfolio.table("q40")
+        assert q29.array("project").tolist() == [0]
+        assert q29.array("overall").tolist() == [4.0]
+        assert q40.array("project").tolist() == [1]
+        assert q40.array("red_flags")[0] > 0
+        assert "technology" in q40.column_names
+
+    def test_missing_manifest(self, tmp_path):
+        with pytest.raises(ValueError):
+            open_columnar(tmp_path)
+
+    def test_ragged_table(self, tmp_path):
+        tables = {"projects": {"a": ("float", [1.0]), "b": ("float", [1.0, 2.0])}}
+        with pytest.raises(ValueError):
+            write_columnar(tables, tmp_path)
+
+    def test_export_files(self, tmp_path, projects):
+        source = tmp_path / "alpha.json"
+        source.write_text(json.dumps(projects[0][1]))
+        export_columnar([tmp_path], tmp_path / "cols")
+        with open_columnar(tmp_path / "cols") as portfolio:
+            assert len(portfolio) == 1
+            assert portfolio.projects.text("name", 0) == "Alpha"
+
+
+class TestCli:
+    """Tests for --overwrite handling."""
+
+    def test_is_columnar_directory(self, tmp_path, projects):
+        write_columnar(build_columnar_tables(projects), tmp_path / "cols")
+        assert is_columnar_directory(tmp_path / "cols")
+        assert not is_columnar_directory(tmp_path)
+        (tmp_path / MANIFEST_NAME).write_text(json.dumps({"format": "other"}))
+        assert not is_columnar_directory(tmp_path)
+
+    def test_overwrite_replaces_portfolio(self, tmp_path, projects, monkeypatch):
+        source = tmp_path / "alpha.json"
+        source.write_text(json.dumps(projects[0][1]))
+        output = tmp_path / "cols"
+        write_columnar(build_columnar_tables(projects), output)
+        monkeypatch.setattr(sys, "argv", ["columnar.py", "-i", str(source), "-o", str(output), "--overwrite"])
+        assert main() == 0
+        with open_columnar(output) as portfolio:
+            assert len(portfolio) == 1
+
+    def test_overwrite_refuses_other_directories(self, tmp_path, projects, monkeypatch):
+        source = tmp_path / "alpha.json"
+        source.write_text(json.dumps(projects[0][1]))
+        output = tmp_path / "evaluations"
+        output.mkdir()
+        keep = output / "notes.md"
+        keep.write_text("keep me")
+        monkeypatch.setattr(sys, "argv", ["columnar.py", "-i", str(source), "-o", str(output), "--overwrite"])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 2
+        assert keep.read_text() == "keep me"
+
+
+class TestColumnarAnalytics:
+    """Tests for vectorized portfolio checks."""
+
+    def test_threshold_check(self, portfolio):
+        check = portfolio.threshold_check("viable")
+        assert check["desirability"]["below"] == 1
+        assert check["desirability"]["below_errors"] == 1
+        assert check["viability"]["below"] == 1
+        assert check["legitimacy"]["missing"] == 1
+        assert check["legitimacy"]["mean"] == pytest.approx(4.4)
+
+        investment = portfolio.threshold_check("investment")
+        assert investment["viability"]["below"] == 2
+
+    def test_failing_projects(self, portfolio):
+        assert portfolio.failing_projects("viable").tolist() == [0, 2]
+
+    def test_status_counts(self, portfolio):
+        counts = portfolio.status_counts()
+        assert counts["Strong"] == 1
+        assert counts["Developing"] == 1
+        assert counts["Non-viable"] == 1
+        assert counts["Unscored"] == 0
+
+    def test_unscored_projects_are_not_non_viable(self, tmp_path, projects):
+        projects.append(("/data/delta.yaml", {"project_name": "Delta"}))
+        write_columnar(build_columnar_tables(projects), tmp_path / "cols")
+        with open_columnar(tmp_path / "cols") as portfolio:
+            counts = portfolio.status_counts()
+        assert counts["Non-viable"] == 1
+        assert counts["Unscored"] == 1
+
+    def test_evidence_quality(self, portfolio):
+        quality, counts = portfolio.evidence_quality()
+        assert quality[:2].tolist() == [3.0, 5.0]
+        assert math.isnan(quality[2])
+        assert counts.tolist() == [2, 6, 0]
@@ -0,0 +1,135 @@
+"""
+Tests for pipeline/context_bundle.py step context bundles.
+"""
+
+import re
+
+import pytest
+
+from core.constants import REPO_ROOT, STEP_DEPENDENCIES
+from pipeline.context_bundle import (
+    COMMON_REFERENCES,
+    STEP_CONTEXTS,
+    approximate_tokens,
+    build_context_bundle,
+    find_step_outputs,
+    load_sections,
+    normalize_step,
+)
+
+STEP5_OUTPUT = """# TechEd Needs and Requesters
+
+## Requesters
+
+- District technology directors
+
+## Needs
+
+- Reduce onboarding time
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "TechEd"
+    project.mkdir()
+    (project / "TechEd_Step5_Needs_Requesters.md").write_text(STEP5_OUTPUT)
+    (project / "TechEd_Step5_Needs_Requesters.docx").write_bytes(b"PK")
+    (project / "Executive_Brief_TechEd_2025-01-15.yaml").write_text("project_name: TechEd\n")
+    return project
+
+
+class TestStepContexts:
+    """Tests for the step registry."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("7", "step_7"), ("Step 07", "step_7"), ("0", "step_0b"), ("0a", "step_0a"),
+        ("11", "step_11_needs"), ("11 means", "step_11_means"), ("12 initial", "step_12"),
+        ("12 Final", "step_12_final"), ("step_12b", "step_12b"),
+    ])
+    def test_normalize_step(self, value, expected):
+        assert normalize_step(value) == expected
+
+    def test_unknown_step(self):
+        with pytest.raises(ValueError):
+            normalize_step("13")
+
+    def test_files_exist(self):
+        for context in STEP_CONTEXTS.values():
+            for relative in (context.prompt,) + context.templates + context.key_references + context.references:
+                assert (REPO_ROOT / relative).is_file(), relative
+        for relative in COMMON_REFERENCES:
+            assert (REPO_ROOT / relative).is_file()
+
+    def test_matches_workflow_guide(self):
+        guide = (REPO_ROOT / "docs" / "VIANEO_AI_Assisted_Workflow.md").read_text(encoding="utf-8")
+        prompts = set(re.findall(r"Use the prompt called `(prompts/[^`]+)`", guide))
+        assert prompts <= {context.prompt for context in STEP_CONTEXTS.values()}
+
+    def test_covers_step_dependencies(self):
+        for step, required in STEP_DEPENDENCIES.items():
+            assert set(required) <= set(STEP_CONTEXTS[step].upstream)
+
+
+class TestContextBundle:
+    """Tests for bundle assembly and trimming."""
+
+    def test_approximate_tokens(self):
+        assert approximate_tokens("") == 0
+        assert approximate_tokens("the needs") == 2
+        assert approximate_tokens("qualification 2025") == 5
+        assert approximate_tokens("a" * 1000) > approximate_tokens("a" * 100)
+
+    def test_find_step_outputs(self, project):
+        outputs = find_step_outputs(project)
+        assert [p.name for p in outputs["step_5"]] == ["TechEd_Step5_Needs_Requesters.md"]
+        assert [p.name for p in outputs["step_0b"]] == ["Executive_Brief_TechEd_2025-01-15.yaml"]
+
+    def test_bundle_contents(self, project):
+        bundle = build_context_bundle("7", project)
+        roles = [file.role for file in bundle.files]
+        assert roles[0] == "prompt"
+        assert roles[1] == "step_5 output"
+        assert "template" in roles and roles[-1] == "guidelines"
+        assert bundle.missing_upstream == []
+
+        text = bundle.to_markdown()
+        assert text.startswith("# Context Bundle: Step 7: Needs Qualification Matrix")
+        assert "Use the prompt called `prompts/step_07_needs_qualification_matrix.md`" in text
+        assert "Screenshot of Needs/Requesters table" in text
+        assert "District technology directors" in text
+
+    def test_missing_upstream(self, project):
+        bundle = build_context_bundle("9", project, include_common=False)
+        assert bundle.missing_upstream == ["step_8"]
+        assert "**Missing upstream outputs:** step_8" in bundle.to_markdown()
+        assert all(file.role != "guidelines" for file in bundle.files)
+
+    def test_budget_trims_lowest_priority_first(self, project):
+        full = build_context_bundle("7", project)
+        prompt_tokens = full.files[0].tokens
+        bundle = build_context_bundle("7", project, budget=prompt_tokens + 400)
+        assert not bundle.over_budget
+        assert bundle.tokens <= prompt_tokens + 400 < full.tokens
+        by_role = {file.role: file for file in bundle.files}
+        assert by_role["prompt"].trimmed == []
+        assert by_role["step_5 output"].trimmed == []
+        assert by_role["guidelines"].kept_tokens == 0
+        assert "<!-- omitted: docs/AI_Guardrails.md" in bundle.to_markdown()
+
+    def test_budget_below_prompt(self, project):
+        bundle = build_context_bundle("7", project, budget=10)
+        assert bundle.over_budget
+        assert bundle.files[0].kept_tokens == bundle.files[0].tokens
+        assert bundle.to_dict()["over_budget"] is True
+
+    def test_sections_cached_and_refreshed(self, tmp_path):
+        doc = tmp_path / "doc.md"
+        doc.write_text("# A\n\ntext\n\n```bash\n# not a heading\n```\n\n# B\n\nmore\n")
+        sections = load_sections(doc)
+        assert [s.heading for s in sections] == ["A", "B"]
+        assert "# not a heading" in sections[0].text
+        assert load_sections(doc) is sections
+
+        doc.write_text("# A\n\nchanged text\n")
+        assert [s.text for s in load_sections(doc)] == ["# A\n\nchanged text"]
@@ -0,0 +1,153 @@
+"""
+Tests for core/data_cache.py parsed-data cache.
+"""
+
+import os
+
+import pytest
+
+from core.data_cache import ParsedDataCache, is_private_directory
+from core.utils import load_data_file
+
+
+def _parse_counter():
+    calls = []
+
+    def parse(content):
+        calls.append(content)
+        return {"text": content.decode("utf-8")}
+
+    return parse, calls
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParsedDataCache(tmp_path / "cache")
+
+
+class TestParsedDataCache:
+    """Tests for cache hits, invalidation and configuration."""
+
+    def test_second_load_skips_parsing(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        parse, calls = _parse_counter()
+
+        first = cache.load(source, "yaml", parse)
+        second = cache.load(source, "yaml", parse)
+
+        assert first == second == {"text": "x: 1\n"}
+        assert first is not second
+        assert len(calls) == 1
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    def test_changed_file_is_reparsed(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        parse, calls = _parse_counter()
+        cache.load(source, "yaml", parse)
+
+        source.write_text("x: 2\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+        assert cache.load(source, "yaml", parse) == {"text": "x: 2\n"}
+        assert len(calls) == 2
+
+    def test_touched_file_validated_by_hash(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        parse, calls = _parse_counter()
+        cache.load(source, "yaml", parse)
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+        assert cache.load(source, "yaml", parse) == {"text": "x: 1\n"}
+        assert len(calls) == 1
+
+    def test_disabled_cache_writes_nothing(self, tmp_path):
+        cache = ParsedDataCache(tmp_path / "cache", enabled=False)
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        parse, calls = _parse_counter()
+
+        cache.load(source, "yaml", parse)
+        cache.load(source, "yaml", parse)
+
+        assert len(calls) == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_corrupt_entry_falls_back_to_parsing(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        parse, calls = _parse_counter()
+        cache.load(source, "yaml", parse)
+        cache.entry_path(source, "yaml").write_bytes(b"not a pickle")
+
+        assert cache.load(source, "yaml", parse) == {"text": "x: 1\n"}
+        assert len(calls) == 2
+        assert cache.stats().errors == 1
+
+    def test_parser_is_part_of_key(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        parse, calls = _parse_counter()
+
+        cache.load(source, "yaml", parse)
+        cache.load(source, "json", parse)
+
+        assert len(calls) == 2
+        assert cache.entry_path(source, "yaml") != cache.entry_path(source, "json")
+
+    def test_shared_directory_is_not_trusted(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        parse, calls = _parse_counter()
+        cache.load(source, "yaml", parse)
+        cache.directory.chmod(0o777)
+
+        assert not is_private_directory(cache.directory)
+        assert cache.load(source, "yaml", parse) == {"text": "x: 1\n"}
+        assert len(calls) == 2
+        assert cache.stats().errors == 2
+
+    def test_clear(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("x: 1\n")
+        cache.load(source, "yaml", _parse_counter()[0])
+
+        assert cache.clear() == 1
+        assert cache.stats().writes == 0
+
+    @pytest.mark.parametrize("value,enabled,directory", [
+        ("", False, None),
+        ("off", False, None),
+        ("1", True, None),
+        ("/tmp/vianeo-cache", True, "/tmp/vianeo-cache"),
+    ])
+    def test_from_environment(self, monkeypatch, value, enabled, directory):
+        monkeypatch.setenv("VIANEO_DATA_CACHE", value)
+        cache = ParsedDataCache.from_environment()
+
+        assert cache.enabled is enabled
+        if directory:
+            assert str(cache.directory) == directory
+
+
+class TestLoadDataFileCache:
+    """load_data_file goes through the shared cache."""
+
+    def test_yaml_and_json_round_trip(self, isolated_data_cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(isolated_data_cache, "enabled", True)
+        yaml_file = tmp_path / "p.yaml"
+        yaml_file.write_text("project_name: Ünïcode\nscores: {legitimacy: 3.5}\n", encoding="utf-8")
+        json_file = tmp_path / "p.json"
+        json_file.write_text('{"project_name": "J"}', encoding="utf-8")
+        before = isolated_data_cache.stats().hits
+
+        for _ in range(2):
+            assert load_data_file(yaml_file) == {"project_name": "Ünïcode", "scores": {"legitimacy": 3.5}}
+            assert load_data_file(json_file) == {"project_name": "J"}
+
+        assert isolated_data_cache.stats().hits - before == 2
@@ -0,0 +1,160 @@
+"""
+Tests for converters/data_to_html.py dashboards and paginated tables.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from converters import data_to_html
+from converters.data_to_html import (
+    DataToHtmlConverter,
+    convert_data_to_html,
+    main,
+    positive_int,
+    write_paginated_csv,
+)
+from core.html_writer import HtmlWriter
+
+# Page bodies (after </head>) from the string-built converter that preceded
+# HtmlWriter, one case per dashboard type; generated on 2026-01-15
+BASELINE = json.loads(
+    (Path(__file__).parent / "fixtures" / "data_to_html_baseline.json").read_text(encoding="utf-8")
+)["cases"]
+
+
+def write_csv(path, count):
+    """CSV with id/name columns and count rows."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name"])
+        for i in range(1, count + 1):
+            writer.writerow([i, f"Row {i}"])
+    return path
+
+
+@pytest.fixture
+def fixed_date(monkeypatch):
+    monkeypatch.setattr(data_to_html, "format_date", lambda *args, **kwargs: "2026-01-15")
+
+
+class TestDashboards:
+    """Tests for the dashboard pages."""
+
+    @pytest.mark.parametrize("case", BASELINE, ids=[case["name"] for case in BASELINE])
+    def test_streamed_page_matches_baseline(self, case, fixed_date):
+        converter = DataToHtmlConverter(case["input"])
+        buffered = getattr(converter, case["method"])()
+        stream = io.StringIO()
+        converter.write_dashboard(case["type"], HtmlWriter(stream))
+
+        assert stream.getvalue() == buffered
+        assert buffered.split("</head>", 1)[1] == case["body"]
+
+    def test_evidence_values_are_escaped(self):
+        html = DataToHtmlConverter({"evidence_log": [{
+            "id": "E1&2", "section": "<b>B2</b>", "source_type": "L1",
+            "quality_rating": 4, "description": "<script>alert(1)</script>", "date": "\"2025\"",
+        }]}).generate_evidence_dashboard()
+        assert "<script>alert" not in html
+        assert "<td>&lt;script&gt;alert(1)&lt;/script&gt;</td>" in html
+        assert "<td>E1&amp;2</td>" in html
+        assert "<td>&lt;b&gt;B2&lt;/b&gt;</td>" in html
+        assert "<td>&quot;2025&quot;</td>" in html
+
+    def test_needs_values_are_escaped(self):
+        html = DataToHtmlConverter({
+            "needs": [{"statement": "Cut <wait> times", "ratings": {"A&B": "<High>"}}],
+            "requesters": [{"name": "A&B"}],
+        }).generate_needs_matrix()
+        assert "<th>A&amp;B</th>" in html
+        assert "<td>Cut &lt;wait&gt; times</td>" in html
+        assert "&lt;High&gt;</span>" in html
+
+    def test_table_values_are_escaped(self, tmp_path):
+        html = DataToHtmlConverter({"data": [{"<col>": "<img src=x onerror=alert(1)>"}]}).generate_generic_table()
+        assert "<th>&lt;col&gt;</th>" in html
+        assert "<img" not in html
+
+        source = tmp_path / "rows.csv"
+        source.write_text("name\n<i>Alpha</i>\n", encoding="utf-8")
+        convert_data_to_html(source, tmp_path / "rows.html")
+        assert "<td>&lt;i&gt;Alpha&lt;/i&gt;</td>" in (tmp_path / "rows.html").read_text(encoding="utf-8")
+
+
+class TestPagination:
+    """Tests for splitting CSV tables into pages."""
+
+    def test_pages_and_partial_last_page(self, tmp_path):
+        source = write_csv(tmp_path / "rows.csv", 7)
+        written = write_paginated_csv(source, tmp_path / "rows.html", 3)
+
+        assert [path.name for path in written] == [
+            "rows.html", "rows_page_0001.html", "rows_page_0002.html", "rows_page_0003.html"
+        ]
+        pages = [path.read_text(encoding="utf-8") for path in written[1:]]
+        assert [page.count("<td>Row ") for page in pages] == [3, 3, 1]
+        assert "<td>Row 7</td>" in pages[2]
+        index = written[0].read_text(encoding="utf-8")
+        assert "7 rows across 3 pages (3 rows per page)" in index
+        assert "<td>7-7</td>" in index
+
+    def test_navigation_links(self, tmp_path):
+        source = write_csv(tmp_path / "rows.csv", 4)
+        written = write_paginated_csv(source, tmp_path / "rows.html", 2)
+        first, last = (path.read_text(encoding="utf-8") for path in written[1:])
+
+        assert "Previous" not in first
+        assert 'href="rows_page_0002.html"' in first
+        assert 'href="rows_page_0001.html"' in last
+        assert "Next" not in last
+
+    def test_exact_multiple_has_no_empty_page(self, tmp_path):
+        source = write_csv(tmp_path / "rows.csv", 4)
+        written = write_paginated_csv(source, tmp_path / "rows.html", 2)
+        assert len(written) == 3
+
+    def test_invalid_page_size(self, tmp_path):
+        source = write_csv(tmp_path / "rows.csv", 2)
+        with pytest.raises(ValueError):
+            write_paginated_csv(source, tmp_path / "rows.html", 0)
+        with pytest.raises(ValueError):
+            convert_data_to_html(source, tmp_path / "rows.html", rows_per_page=0)
+
+    def test_csv_closed_when_header_is_unreadable(self, tmp_path, monkeypatch):
+        source = tmp_path / "rows.csv"
+        source.write_bytes(b"id,\xffname\n1,Row 1\n")
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            f = open(*args, **kwargs)
+            opened.append(f)
+            return f
+
+        monkeypatch.setattr(data_to_html, "open", tracking_open, raising=False)
+        with pytest.raises(UnicodeDecodeError):
+            write_paginated_csv(source, tmp_path / "rows.html", 2)
+        assert len(opened) == 1 and opened[0].closed
+
+
+class TestCli:
+    """Tests for command-line parsing."""
+
+    def test_positive_int(self):
+        assert positive_int("5") == 5
+        for value in ("0", "-3", "five"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                positive_int(value)
+
+    def test_rejects_zero_rows_per_page(self, tmp_path, monkeypatch):
+        source = write_csv(tmp_path / "rows.csv", 2)
+        monkeypatch.setattr(sys, "argv", ["data_to_html.py", "-i", str(source), "--rows-per-page", "0"])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 2
+        assert not (tmp_path / "rows.html").exists()
@@ -0,0 +1,118 @@
+"""
+Tests for core/deterministic.py reproducible DOCX output.
+"""
+
+import io
+import zipfile
+from datetime import datetime, timezone
+
+import pytest
+
+from core.deterministic import (
+    ZIP_EPOCH,
+    normalize_core_properties,
+    normalize_docx_bytes,
+    save_docx,
+    source_date_epoch,
+)
+from generators.base import is_docx_available
+
+requires_docx = pytest.mark.skipif(
+    not is_docx_available(), reason="python-docx not installed"
+)
+
+CORE_XML = (
+    b'<cp:coreProperties xmlns:cp="cp" xmlns:dcterms="dcterms" xmlns:xsi="xsi">'
+    b'<cp:revision>7</cp:revision>'
+    b'<dcterms:created xsi:type="dcterms:W3CDTF">2024-05-01T10:00:00Z</dcterms:created>'
+    b'<dcterms:modified xsi:type="dcterms:W3CDTF">2024-05-02T11:00:00Z</dcterms:modified>'
+    b'</cp:coreProperties>'
+)
+
+
+def make_zip(entries, date_time):
+    """Build a zip with the given entries, all stamped with date_time."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in entries:
+            archive.writestr(zipfile.ZipInfo(name, date_time=date_time), content)
+    return buffer.getvalue()
+
+
+class TestSourceDateEpoch:
+    """Tests for source_date_epoch function."""
+
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+        assert source_date_epoch() == ZIP_EPOCH
+
+    def test_from_environment(self, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+        assert source_date_epoch() == datetime.fromtimestamp(1700000000, tz=timezone.utc)
+
+    def test_clamped_and_invalid(self, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+        assert source_date_epoch() == ZIP_EPOCH
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "yesterday")
+        assert source_date_epoch() == ZIP_EPOCH
+
+
+class TestNormalizeDocxBytes:
+    """Tests for normalize_docx_bytes function."""
+
+    def test_core_properties(self):
+        stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        xml = normalize_core_properties(CORE_XML, stamp).decode("utf-8")
+        assert xml.count("2025-01-02T03:04:05Z") == 2
+        assert "<cp:revision>1</cp:revision>" in xml
+
+    def test_timestamps_and_order_ignored(self):
+        entries = [("word/document.xml", b"<doc/>"), ("[Content_Types].xml", b"<types/>"),
+                   ("docProps/core.xml", CORE_XML)]
+        first = make_zip(entries, (2024, 1, 1, 0, 0, 0))
+        second = make_zip(list(reversed(entries)), (2025, 6, 30, 12, 0, 0))
+        assert first != second
+        assert normalize_docx_bytes(first) == normalize_docx_bytes(second)
+
+    def test_content_types_first(self):
+        content = make_zip([("b.xml", b"b"), ("[Content_Types].xml", b"t"), ("a.xml", b"a")],
+                           (2024, 1, 1, 0, 0, 0))
+        names = zipfile.ZipFile(io.BytesIO(normalize_docx_bytes(content))).namelist()
+        assert names == ["[Content_Types].xml", "a.xml", "b.xml"]
+
+    def test_content_changes_are_kept(self):
+        first = make_zip([("word/document.xml", b"<one/>")], (2024, 1, 1, 0, 0, 0))
+        second = make_zip([("word/document.xml", b"<two/>")], (2024, 1, 1, 0, 0, 0))
+        assert normalize_docx_bytes(first) != normalize_docx_bytes(second)
+
+
+@requires_docx
+class TestDeterministicGeneration:
+    """Generators and converters produce identical bytes when asked to."""
+
+    def test_save_docx_path_and_stream(self, tmp_path):
+        from docx import Document
+        doc = Document()
+        doc.add_paragraph("Same bytes")
+        stream = io.BytesIO()
+        save_docx(doc, stream, deterministic=True)
+        save_docx(doc, tmp_path / "a.docx", deterministic=True)
+        assert (tmp_path / "a.docx").read_bytes() == stream.getvalue()
+        assert stream.getvalue() == normalize_docx_bytes(stream.getvalue())
+
+    def test_converter(self):
+        from converters.md_to_docx import MarkdownToDocxConverter
+        markdown = "# Title\n\n- one\n- two\n"
+        first = MarkdownToDocxConverter(deterministic=True).convert_to_bytes(markdown)
+        second = MarkdownToDocxConverter(deterministic=True).convert_to_bytes(markdown)
+        assert first == second
+        assert zipfile.ZipFile(io.BytesIO(first)).testzip() is None
+
+    def test_generator(self, tmp_path):
+        from generators.generate_diagnostic import generate_diagnostic, parse_diagnostic_data
+        data = parse_diagnostic_data({"project_name": "Repeatable"})
+        first = generate_diagnostic(data=data, output_path=tmp_path / "a",
+                                    output_format="docx", deterministic=True)
+        second = generate_diagnostic(data=data, output_path=tmp_path / "b",
+                                     output_format="docx", deterministic=True)
+        assert first["docx"].read_bytes() == second["docx"].read_bytes()
@@ -0,0 +1,201 @@
+"""
+Tests for core/document_model.py document tree and renderers.
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from core.document_model import (
+    Cell,
+    DocumentModel,
+    DocumentRenderer,
+    Run,
+    bold,
+    italic,
+    render_docx,
+    render_html,
+    render_markdown,
+)
+from generators.base import is_docx_available
+from generators.generate_diagnostic import (
+    DiagnosticDocumentGenerator,
+    build_document,
+    generate_markdown,
+    parse_diagnostic_data,
+)
+from pipeline.documents import render_document
+
+# generate_diagnostic output from before the document model (Markdown and
+# DOCX paragraph structure), for a full project and one with empty lists
+BASELINE = json.loads(
+    (Path(__file__).parent / "fixtures" / "diagnostic_baseline.json").read_text(encoding="utf-8")
+)["cases"]
+
+
+@pytest.fixture
+def model():
+    doc = DocumentModel(title="Alpha")
+    doc.heading("Alpha", level=0)
+    doc.fields([("Date", "2025-01-15"), ("Owner", "Sam")])
+    doc.rule()
+    doc.heading("Summary", level=1)
+    doc.paragraph(bold("Status: "), "Strong <proven>")
+    doc.table(["Dimension", "Score"], [
+        [bold("Legitimacy"), Cell([Run("4.2/5")], fill="#D4EDDA", align="center", highlight=True)],
+    ])
+    doc.numbered(["First", [italic("Second")]])
+    doc.spacer()
+    doc.bullets([])
+    doc.fields([("Next Review", "Q3"), ("Sources", "Interviews")], compact=False)
+    return doc
+
+
+class TestMarkdownRenderer:
+    """Tests for Markdown output."""
+
+    def test_layout(self, model):
+        assert render_markdown(model) == (
+            "# Alpha\n\n"
+            "**Date:** 2025-01-15\n**Owner:** Sam\n\n"
+            "---\n\n"
+            "## Summary\n\n"
+            "**Status:** Strong <proven>\n\n"
+            "| Dimension | Score |\n|-----------|-------|\n| **Legitimacy** | 4.2/5 |\n\n"
+            "1. First\n2. *Second*\n\n"
+            "\n"
+            "**Next Review:** Q3\n\n**Sources:** Interviews\n"
+        )
+
+    def test_streaming(self, model):
+        stream = io.StringIO()
+        assert render_markdown(model, stream) is None
+        assert stream.getvalue() == render_markdown(model)
+
+
+class TestHtmlRenderer:
+    """Tests for HTML output."""
+
+    def test_page(self, model):
+        page = render_html(model)
+        assert page.startswith("<!DOCTYPE html>")
+        assert "<title>Alpha</title>" in page
+        assert "<h2>Summary</h2>" in page
+        assert "<strong>Status: </strong>Strong &lt;proven&gt;" in page
+        assert '<td class="center" style="background-color:#D4EDDA"><strong>4.2/5</strong></td>' in page
+        assert "<ol><li>First</li><li><em>Second</em></li></ol>" in page
+        assert "<ul>" not in page
+
+    def test_fragment(self, model):
+        fragment = render_html(model, standalone=False)
+        assert fragment.startswith("<h1>Alpha</h1>")
+        assert "</html>" not in fragment
+
+    def test_unknown_node_kind(self):
+        class Quote:
+            kind = "quote"
+
+        with pytest.raises(ValueError):
+            DocumentRenderer().render(DocumentModel(nodes=[Quote()]))
+
+
+@pytest.mark.skipif(not is_docx_available(), reason="python-docx not installed")
+class TestDocxRenderer:
+    """Tests for DOCX output."""
+
+    def test_document(self, model):
+        document = render_docx(model)
+        paragraphs = [(p.style.name, p.text) for p in document.paragraphs]
+        assert paragraphs[0] == ("Title", "Alpha")
+        assert ("Normal", "Date: 2025-01-15") in paragraphs
+        assert ("Heading 1", "Summary") in paragraphs
+        assert ("List Number", "Second") in paragraphs
+        # The rule has no DOCX paragraph; the spacer is one empty paragraph
+        assert paragraphs.count(("Normal", "")) == 1
+        table = document.tables[0]
+        assert [cell.text for cell in table.rows[1].cells] == ["Legitimacy", "4.2/5"]
+        assert "D4EDDA" in table.rows[1].cells[1]._tc.xml
+        assert table.rows[1].cells[1].paragraphs[0].runs[0].bold
+
+
+def _run_format(run):
+    """Text and direct formatting of a run (None = inherited)."""
+    font = run.font
+    color = str(font.color.rgb) if font.color is not None and font.color.type is not None else None
+    return [run.text, run.bold, run.italic, font.name, font.size.pt if font.size else None, color]
+
+
+def _paragraph_structure(para):
+    """Style, alignment and runs of a paragraph."""
+    alignment = para.alignment
+    return {
+        "style": para.style.name,
+        "alignment": None if alignment is None else int(alignment),
+        "runs": [_run_format(run) for run in para.runs],
+    }
+
+
+def _docx_structure(document):
+    """Body paragraphs and tables of a DOCX in document order, as plain data."""
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+    from docx.oxml.ns import qn
+
+    blocks = []
+    for child in document.element.body.iterchildren():
+        if child.tag == qn('w:p'):
+            blocks.append(_paragraph_structure(Paragraph(child, document)))
+        elif child.tag == qn('w:tbl'):
+            table = Table(child, document)
+            rows = []
+            for row in table.rows:
+                cells = []
+                for cell in row.cells:
+                    shading = cell._tc.tcPr.find(qn('w:shd')) if cell._tc.tcPr is not None else None
+                    cells.append({
+                        "paragraphs": [_paragraph_structure(p) for p in cell.paragraphs],
+                        "fill": None if shading is None else shading.get(qn('w:fill')),
+                        "width": cell.width,
+                    })
+                rows.append(cells)
+            blocks.append({"style": table.style.name if table.style is not None else None, "rows": rows})
+    return blocks
+
+
+class TestDiagnosticModel:
+    """Tests for the diagnostic generator built on the document model."""
+
+    RAW = {
+        "project_name": "Alpha",
+        "date": "2025-01-15",
+        "strengths": "Strong team.",
+        "dimension_scores": [{"name": "Legitimacy", "score": 4.2, "interpretation": "solid"}],
+        "immediate_priorities": ["a", "b", "c", "d"],
+    }
+
+    def test_markdown_layout(self):
+        markdown = generate_markdown(parse_diagnostic_data(self.RAW))
+        assert markdown.startswith("# Alpha: Vianeo Main Diagnostic Comment\n\n**Date:** 2025-01-15\n")
+        assert "### Strengths\n\nStrong team.\n" in markdown
+        assert "| **Legitimacy** | 4.2/5 | Promising - solid |" in markdown
+        assert "3. c\n\n### Short-term" in markdown
+
+    @pytest.mark.parametrize("case", BASELINE, ids=[case["name"] for case in BASELINE])
+    def test_markdown_matches_baseline(self, case):
+        assert generate_markdown(parse_diagnostic_data(case["input"])) == case["markdown"]
+
+    @pytest.mark.skipif(not is_docx_available(), reason="python-docx not installed")
+    @pytest.mark.parametrize("case", BASELINE, ids=[case["name"] for case in BASELINE])
+    def test_docx_matches_baseline(self, case):
+        import docx
+
+        content = DiagnosticDocumentGenerator(parse_diagnostic_data(case["input"])).render_docx()
+        structure = _docx_structure(docx.Document(io.BytesIO(content)))
+        assert json.loads(json.dumps(structure)) == case["docx"]
+
+    def test_formats_share_one_model(self):
+        rendered = render_document("diagnostic", self.RAW, formats=["md", "html"])
+        assert rendered.markdown == render_markdown(build_document(rendered.data))
+        assert "Vianeo Main Diagnostic Comment" in rendered.html
@@ -0,0 +1,188 @@
+"""
+Tests for generators/fill_template.py template filling.
+"""
+
+import pytest
+
+from core.constants import REPO_ROOT
+from generators.fill_template import (
+    RepeatBlock,
+    clear_template_cache,
+    compile_template,
+    fill_template,
+    load_template,
+    output_name,
+    slugify,
+)
+
+TEMPLATE = """# Brief: [Project Name]
+
+## Project Information
+**Project Name:** [Enter project name]
+**Date Prepared:** [YYYY-MM-DD]
+
+## Section B3: Solution
+**Solution Description:**
+[Describe what the solution does]
+
+**Solution Type:**
+- [ ] Product
+- [ ] Platform
+
+**Key Features:**
+1. [Feature 1]
+2. [Feature 2]
+3. [Feature 3]
+
+### Competitors
+
+| Competitor | Strength | Weakness |
+|------------|----------|----------|
+| [Name] | [Strength] | [Weakness] |
+| [Name] | [Strength] | [Weakness] |
+
+### Scores
+
+| Dimension | Score |
+|-----------|-------|
+| **Legitimacy** | [X] |
+| **Viability** | [X] |
+
+See [the guide](guide.md). Score: [X]/5
+"""
+
+
+@pytest.fixture
+def compiled():
+    return compile_template(TEMPLATE, "brief.md")
+
+
+class TestCompile:
+    """Tests for template parsing."""
+
+    def test_slugify(self):
+        assert slugify("Section B1: Project Name and Tagline") == "section_b1"
+        assert slugify("Enter official project name") == "project_name"
+        assert slugify("Gap description - impact") == "gap_description"
+        assert slugify("Customer Acquisition Cost (CAC)") == "customer_acquisition_cost"
+
+    def test_schema(self, compiled):
+        schema = compiled.schema()
+        assert schema["project_name"] == "[Project Name]"
+        assert set(schema["project_information"]) == {"project_name", "date_prepared"}
+        section = schema["section_b3"]
+        assert section["solution_description"] == "[Describe what the solution does]"
+        assert section["solution_type"] == ["Product", "Platform"]
+        assert section["key_features"] == ["[Feature 1]"]
+        assert section["competitors"] == [{"competitor": "[Name]", "strength": "[Strength]",
+                                           "weakness": "[Weakness]"}]
+
+    def test_blocks(self, compiled):
+        blocks = [node for node in compiled.nodes if isinstance(node, RepeatBlock)]
+        assert [(b.key, b.kind) for b in blocks] == [
+            ("key_features", "list"), ("competitors", "table"), ("scores", "table")
+        ]
+        assert blocks[2].labels == ("legitimacy", "viability")
+
+    def test_links_and_checkboxes_are_literal(self, compiled):
+        keys = [placeholder.raw for placeholder in compiled.placeholders]
+        assert "[the guide]" not in keys
+        assert "[ ]" not in keys
+
+    def test_all_repository_templates_compile(self):
+        for path in sorted((REPO_ROOT / "templates").glob("*.md")):
+            assert isinstance(load_template(path).schema(), dict), path.name
+
+
+class TestFill:
+    """Tests for filling compiled templates."""
+
+    def test_scalars_and_scopes(self, compiled):
+        result = compiled.fill({
+            "project_name": "Alpha",
+            "project_information": {"date_prepared": "2026-01-15"},
+            "section_b3": {"solution_description": "Remote triage"},
+        })
+        assert result.text.startswith("# Brief: Alpha\n")
+        assert "**Project Name:** Alpha" in result.text
+        assert "**Date Prepared:** 2026-01-15" in result.text
+        assert "\nRemote triage\n" in result.text
+
+    def test_aliases(self, compiled):
+        result = compiled.fill({"company_name": "Beta"})
+        assert "# Brief: Beta" in result.text
+
+    def test_missing_placeholders_are_kept(self, compiled):
+        result = compiled.fill({})
+        assert result.text == TEMPLATE
+        assert not result.complete
+        assert "project_name" in result.missing
+
+    def test_repeating_list(self, compiled):
+        result = compiled.fill({"key_features": ["Triage", "Routing"]})
+        assert "1. Triage\n2. Routing\n\n### Competitors" in result.text
+
+    def test_repeating_table(self, compiled):
+        result = compiled.fill({"section_b3": {"competitors": [
+            {"competitor": "Acme", "strength": "Brand", "weakness": "Price"},
+            {"competitor": "Globex", "strength": "Reach"},
+        ]}})
+        assert "| Acme | Brand | Price |" in result.text
+        assert "| Globex | Reach | [Weakness] |" in result.text
+        assert "weakness" in result.missing
+
+    def test_fixed_table_rows(self, compiled):
+        result = compiled.fill({"scores": {"legitimacy": {"score": 4.0}, "viability": {"score": 3.25}}})
+        assert "| **Legitimacy** | 4 |" in result.text
+        assert "| **Viability** | 3.25 |" in result.text
+
+    def test_checkboxes(self, compiled):
+        result = compiled.fill({"solution_type": "platform"})
+        assert "- [ ] Product\n- [x] Platform" in result.text
+
+    def test_checkbox_option_placeholders(self):
+        template = compile_template("**Channel:**\n- [x] Direct\n- [ ] Other: [Specify]\n", "c.md")
+        assert template.fill({}).text == "**Channel:**\n- [x] Direct\n- [ ] Other: [Specify]\n"
+        result = template.fill({"channel": "Other", "specify": "Kiosks"})
+        assert result.text == "**Channel:**\n- [ ] Direct\n- [x] Other: Kiosks\n"
+
+    def test_count_placeholder_is_not_a_checkbox(self):
+        template = compile_template("**Target:**\n- [X] interviews with [Segment 1]\n"
+                                    "- [X] interviews with [Segment 2]\n", "t.md")
+        result = template.fill({"target": [{"value": 12, "segment": "Clinics"}]})
+        assert result.text == "**Target:**\n- 12 interviews with Clinics\n"
+
+    def test_empty_data_reproduces_repository_templates(self):
+        for path in sorted((REPO_ROOT / "templates").glob("*.md")):
+            text = path.read_text(encoding="utf-8")
+            assert load_template(path).fill({}).text == text, path.name
+
+    def test_generic_placeholder_uses_preceding_word(self, compiled):
+        assert "Score: 4/5" in compiled.fill({"score": 4}).text
+
+
+class TestTemplateCache:
+    """Tests for compiled template caching."""
+
+    def test_compiled_once_per_content(self, tmp_path):
+        clear_template_cache()
+        first, second = tmp_path / "a.md", tmp_path / "b.md"
+        first.write_text(TEMPLATE)
+        second.write_text(TEMPLATE)
+        assert load_template(first) is load_template(first)
+        assert load_template(second) is load_template(first)
+
+    def test_recompiled_on_change(self, tmp_path):
+        path = tmp_path / "a.md"
+        path.write_text("Name: [Name]\n")
+        before = load_template(path)
+        path.write_text("Owner: [Owner]\n")
+        assert load_template(path) is not before
+        assert fill_template(path, {"owner": "Sam"}).text == "Owner: Sam\n"
+
+    def test_missing_template(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_template(tmp_path / "missing.md")
+
+    def test_output_name(self):
+        assert output_name("data/alpha.yaml", "Step12_Dashboard_Template.md") == "alpha_Step12_Dashboard.md"
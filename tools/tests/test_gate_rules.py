@@ -0,0 +1,155 @@
+"""
+Tests for scoring/gate_rules.py compiled gate decision tables.
+"""
+
+import json
+
+import pytest
+import yaml
+
+from portfolio.shared_memory import SharedPortfolio, build_portfolio_tables
+from scoring.gate_rules import (
+    NUMPY_AVAILABLE,
+    DecisionTable,
+    GatePolicy,
+    GateRule,
+    build_gate_inputs,
+    decide_gates,
+    evaluate_gates,
+    gate_inputs_from_portfolio,
+    parse_condition,
+    parse_decision_table,
+)
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+ALL_FOUR = {"legitimacy": 4.0, "desirability": 4.0, "acceptability": 4.0,
+            "feasibility": 4.0, "viability": 4.0}
+GOOD_EVIDENCE = [{"quality_rating": 4}, {"quality_rating": 3}]
+
+# One project per gate outcome; the shared sample portfolio covers the rest
+SCENARIOS = [
+    ("ready.yaml", {"project_name": "Ready", "dimension_scores": ALL_FOUR,
+                    "evidence_log": GOOD_EVIDENCE}),
+    ("critical.yaml", {"project_name": "Critical",
+                       "dimension_scores": dict(ALL_FOUR, viability=1.5),
+                       "evidence_log": GOOD_EVIDENCE}),
+    ("gap.yaml", {"project_name": "Gap",
+                  "dimension_scores": dict(ALL_FOUR, desirability=2.8),
+                  "evidence_log": GOOD_EVIDENCE}),
+    ("two_gaps.yaml", {"project_name": "TwoGaps",
+                       "dimension_scores": dict(ALL_FOUR, desirability=2.8, feasibility=2.5)}),
+    ("weak.yaml", {"project_name": "Weak", "dimension_scores": ALL_FOUR,
+                   "evidence_log": [{"quality_rating": 1}]}),
+    ("flagged.yaml", {"project_name": "Flagged", "dimension_scores": ALL_FOUR,
+                      "evidence_log": GOOD_EVIDENCE, "red_flags": ["No revenue model"]}),
+]
+
+
+class TestDecisionTable:
+    """Tests for rule parsing and validation."""
+
+    def test_parse_condition(self):
+        assert parse_condition("weighted", ">= investment_ready").value == "investment_ready"
+        condition = parse_condition("failing_dimensions", "<2")
+        assert (condition.op, condition.value) == ("<", 2.0)
+        assert parse_condition("red_flags", 0).op == "=="
+        with pytest.raises(ValueError):
+            parse_condition("weighted", "about 3")
+
+    def test_unknown_feature_outcome_and_threshold(self):
+        with pytest.raises(ValueError, match="feature"):
+            parse_decision_table({"rules": [{"outcome": "HOLD", "when": {"mood": "< 2"}}]})
+        with pytest.raises(ValueError, match="outcome"):
+            parse_decision_table({"rules": [{"outcome": "MAYBE"}]})
+        with pytest.raises(ValueError, match="threshold"):
+            parse_decision_table({"rules": [{"outcome": "HOLD", "when": {"weighted": "< bar"}}]})
+        with pytest.raises(ValueError):
+            GatePolicy().with_overrides({"minimums": {"charisma": 3}})
+
+    def test_policy_overrides(self):
+        policy = GatePolicy().with_overrides({"investment_ready": 4.2, "minimums": {"viability": 3.5}})
+        assert policy.value("investment_ready") == 4.2
+        assert policy.value("min_score.viability") == 3.5
+        assert policy.value("min_score.legitimacy") == 3.0
+
+
+class TestDecideGates:
+    """Tests for vectorized evaluation."""
+
+    def test_default_rules(self):
+        decisions = decide_gates(build_gate_inputs(SCENARIOS))
+
+        assert [decisions.outcome(i) for i in range(len(SCENARIOS))] == [
+            "PROCEED", "HOLD", "CONDITIONAL", "HOLD", "HOLD", "CONDITIONAL"
+        ]
+        assert decisions.counts() == {"PROCEED": 1, "CONDITIONAL": 2, "HOLD": 3}
+
+    def test_explanations(self):
+        decisions = decide_gates(build_gate_inputs(SCENARIOS))
+
+        critical = decisions.decision(1)
+        assert critical["rule"] == "critical_dimension"
+        assert "min_dimension = 1.50" in critical["primary_recommendation_summary"]
+        assert decisions.decision(2)["failing_dimensions"] == ["Desirability"]
+        assert decisions.decision(0)["primary_recommendation_status"] == "Go"
+
+    def test_policy_change_reevaluates(self):
+        inputs = build_gate_inputs(SCENARIOS)
+        strict = parse_decision_table({"policy": {"investment_ready": 4.5}})
+
+        assert decide_gates(inputs, strict).outcome(0) == "CONDITIONAL"
+
+    def test_no_rule_matched_defaults_to_hold(self):
+        table = DecisionTable([GateRule("never", "PROCEED", (parse_condition("weighted", "> 9"),))])
+        decisions = decide_gates(build_gate_inputs(SCENARIOS[:1]), table)
+
+        assert decisions.outcome(0) == "HOLD"
+        assert decisions.decision(0)["rule"] == ""
+
+    def test_missing_evidence_never_matches(self):
+        table = parse_decision_table({"rules": [
+            {"name": "weak", "outcome": "HOLD", "when": {"evidence_quality": "< 5"}},
+            {"name": "rest", "outcome": "CONDITIONAL"},
+        ]})
+        decisions = decide_gates(build_gate_inputs(SCENARIOS), table)
+
+        assert decisions.outcome(3) == "CONDITIONAL"
+
+    def test_missing_evidence_never_matches_not_equal(self):
+        table = parse_decision_table({"rules": [
+            {"name": "unrated", "outcome": "HOLD", "when": {"evidence_quality": "!= 5"}},
+            {"name": "rest", "outcome": "CONDITIONAL"},
+        ]})
+        decisions = decide_gates(build_gate_inputs(SCENARIOS), table)
+
+        assert decisions.outcome(0) == "HOLD"
+        assert decisions.outcome(3) == "CONDITIONAL"
+
+    @pytest.mark.parametrize("use_sample", [False, True])
+    def test_shared_portfolio_inputs_match(self, sample_portfolio, use_sample):
+        projects = sample_portfolio if use_sample else SCENARIOS[:5]
+        direct = decide_gates(build_gate_inputs(projects))
+        with SharedPortfolio.create(build_portfolio_tables(projects)) as portfolio:
+            shared = decide_gates(gate_inputs_from_portfolio(portfolio))
+
+        assert shared.outcomes.tolist() == direct.outcomes.tolist()
+
+
+class TestEvaluateGates:
+    """Tests for file loading and output."""
+
+    def test_files_with_rules_file(self, tmp_path):
+        (tmp_path / "projects").mkdir()
+        for source, data in SCENARIOS:
+            with open(tmp_path / "projects" / source, "w") as f:
+                yaml.safe_dump(data, f)
+        rules = tmp_path / "policy.yaml"
+        rules.write_text(yaml.safe_dump({"policy": {"minimums": {"legitimacy": 4.5}}}))
+        output = tmp_path / "gates.json"
+
+        decisions = evaluate_gates([tmp_path / "projects"], output, rules_path=rules)
+
+        assert len(decisions) == len(SCENARIOS)
+        data = json.loads(output.read_text())
+        assert data["counts"]["PROCEED"] == 0
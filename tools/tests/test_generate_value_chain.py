@@ -0,0 +1,64 @@
+"""
+Tests for generators/generate_value_chain.py HTML modes.
+"""
+
+import json
+
+import pytest
+
+from generators.generate_value_chain import (
+    VIRTUAL_RENDER_THRESHOLD,
+    ValueChainGenerator,
+    generate_value_chain,
+    parse_value_chain_data,
+)
+
+
+def network(org_count: int, name: str = "Org"):
+    """ValueChainData with org_count buyers."""
+    return parse_value_chain_data({
+        "project_name": "Network",
+        "buyers": [{"name": f"{name} {i}", "role": "Purchaser"} for i in range(org_count)],
+    })
+
+
+def data_island(html: str) -> str:
+    """Contents of the virtual template's JSON script element."""
+    return html.split('<script type="application/json" id="network-data">', 1)[1].split('</script>', 1)[0]
+
+
+class TestHtmlMode:
+    """Tests for choosing the standard or virtualized template."""
+
+    def test_auto_switches_above_threshold(self):
+        at_threshold = ValueChainGenerator(network(VIRTUAL_RENDER_THRESHOLD), html_mode="auto")
+        above = ValueChainGenerator(network(VIRTUAL_RENDER_THRESHOLD + 1), html_mode="auto")
+        assert at_threshold.resolve_html_mode() == "standard"
+        assert above.resolve_html_mode() == "virtual"
+
+    def test_auto_writes_virtual_page(self, tmp_path):
+        result = generate_value_chain(
+            data=network(VIRTUAL_RENDER_THRESHOLD + 1), output_path=tmp_path / "net",
+            output_format="html", html_mode="auto"
+        )
+        html = result["html"].read_text(encoding="utf-8")
+        assert len(json.loads(data_island(html))["orgs"]) == VIRTUAL_RENDER_THRESHOLD + 1
+
+    def test_small_network_stays_standard(self):
+        html = ValueChainGenerator(network(3), html_mode="auto").render_html()
+        assert 'id="network-data"' not in html
+        assert "Org 2" in html
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            ValueChainGenerator(network(1), html_mode="fast")
+
+
+class TestDataIsland:
+    """Tests for embedding data in a script element."""
+
+    def test_virtual_page_keeps_names_inside_data_island(self):
+        html = ValueChainGenerator(network(2, name="</script><!--"), html_mode="virtual").render_html()
+        island = data_island(html)
+        assert json.loads(island)["orgs"][0][1] == "</script><!-- 0"
+        assert "<!--" not in island
@@ -0,0 +1,75 @@
+"""
+Tests for generators/base.py shared generation helpers.
+"""
+
+import argparse
+import threading
+from pathlib import Path
+
+import pytest
+
+from generators.base import GenerationResult, add_output_arguments, run_output_tasks
+
+
+class TestRunOutputTasks:
+    """Tests for run_output_tasks function."""
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    def test_collects_paths_in_task_order(self, concurrent):
+        tasks = {
+            "docx": lambda: Path("out.docx"),
+            "md": lambda: Path("out.md"),
+        }
+        result = run_output_tasks(tasks, concurrent=concurrent)
+        assert isinstance(result, GenerationResult)
+        assert list(result) == ["docx", "md"]
+        assert list(result.timings) == ["docx", "md"]
+
+    def test_failed_output_omitted(self):
+        result = run_output_tasks({"md": lambda: Path("out.md"), "docx": lambda: None})
+        assert result == {"md": Path("out.md")}
+        assert "docx" in result.timings
+
+    def test_tasks_overlap_when_concurrent(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def task(name):
+            def run():
+                barrier.wait()
+                return Path(name)
+            return run
+
+        result = run_output_tasks({"md": task("a.md"), "docx": task("a.docx")})
+        assert result.concurrent
+        assert len(result) == 2
+
+    def test_single_task_runs_inline(self):
+        result = run_output_tasks({"md": lambda: Path("out.md")})
+        assert not result.concurrent
+
+    def test_task_errors_propagate(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            run_output_tasks({"md": lambda: Path("out.md"), "docx": fail})
+
+    def test_timing_report(self):
+        result = run_output_tasks({"md": lambda: Path("out.md")}, concurrent=False)
+        report = result.timing_report()
+        assert report.startswith("Timings (sequential): Markdown")
+
+
+class TestAddOutputArguments:
+    """Tests for add_output_arguments function."""
+
+    def test_docx_generator_flags(self):
+        parser = argparse.ArgumentParser()
+        add_output_arguments(parser)
+        args = parser.parse_args(["--sequential", "--deterministic", "--timings"])
+        assert (args.sequential, args.deterministic, args.timings) == (True, True, True)
+
+    def test_without_docx(self):
+        parser = argparse.ArgumentParser()
+        add_output_arguments(parser, docx=False)
+        assert not hasattr(parser.parse_args([]), "deterministic")
@@ -0,0 +1,75 @@
+"""
+Tests for core/html_writer.py HTML builder.
+"""
+
+import io
+import json
+
+import pytest
+
+from core.html_writer import HtmlWriter, escape_html, json_for_script
+
+
+class TestEscapeHtml:
+    """Tests for escape_html function."""
+
+    def test_escapes_markup(self):
+        assert escape_html('<b>"R&D"</b>') == '&lt;b&gt;&quot;R&amp;D&quot;&lt;/b&gt;'
+
+    def test_none_is_empty(self):
+        assert escape_html(None) == ""
+
+    def test_non_string_values(self):
+        assert escape_html(4) == "4"
+        assert escape_html(3.5) == "3.5"
+
+
+class TestJsonForScript:
+    """Tests for json_for_script function."""
+
+    def test_escapes_markup(self):
+        text = json_for_script({"name": "</script><!-- & \u2028\u2029"})
+        for sequence in ("</", "<!--", "&", "\u2028", "\u2029"):
+            assert sequence not in text
+        assert json.loads(text) == {"name": "</script><!-- & \u2028\u2029"}
+
+
+class TestHtmlWriter:
+    """Tests for HtmlWriter class."""
+
+    def test_raw_is_unescaped(self):
+        writer = HtmlWriter()
+        writer.raw("<p>")
+        assert writer.getvalue() == "<p>"
+
+    def test_text_is_escaped(self):
+        writer = HtmlWriter()
+        writer.text("a < b")
+        assert writer.getvalue() == "a &lt; b"
+
+    def test_element_with_attrs(self):
+        writer = HtmlWriter()
+        writer.element("td", "x & y", {"class": 'say "hi"', "title": None})
+        assert writer.getvalue() == '<td class="say &quot;hi&quot;">x &amp; y</td>'
+
+    def test_row(self):
+        writer = HtmlWriter()
+        writer.row(["A", "<B>"], cell_tag="th")
+        assert writer.getvalue() == "<tr><th>A</th><th>&lt;B&gt;</th></tr>"
+
+    def test_chaining(self):
+        writer = HtmlWriter()
+        writer.raw("<p>").text("hi").raw("</p>")
+        assert writer.getvalue() == "<p>hi</p>"
+
+    def test_streaming_writes_through(self):
+        stream = io.StringIO()
+        writer = HtmlWriter(stream)
+        writer.raw("<ul>").element("li", "one").raw("</ul>")
+        assert writer.is_streaming
+        assert stream.getvalue() == "<ul><li>one</li></ul>"
+
+    def test_streaming_getvalue_raises(self):
+        writer = HtmlWriter(io.StringIO())
+        with pytest.raises(ValueError):
+            writer.getvalue()
@@ -0,0 +1,76 @@
+"""
+Tests for core/markdown_builder.py Markdown builder.
+"""
+
+import io
+
+import pytest
+
+from core.markdown_builder import MarkdownBuilder
+
+
+class TestMarkdownBuilder:
+    """Tests for MarkdownBuilder class."""
+
+    def test_heading(self):
+        md = MarkdownBuilder()
+        md.heading("Title", level=3)
+        assert md.build() == "### Title\n\n"
+
+    def test_text_line_blank_paragraph(self):
+        md = MarkdownBuilder()
+        md.text("a").line("b").blank().paragraph("c")
+        assert md.build() == "ab\n\nc\n\n"
+
+    def test_rule(self):
+        md = MarkdownBuilder()
+        md.rule()
+        assert md.build() == "---\n\n"
+
+    def test_bullets_and_numbered(self):
+        md = MarkdownBuilder()
+        md.bullets(["x", "y"]).numbered(["first", "second"])
+        assert md.build() == "- x\n- y\n1. first\n2. second\n"
+
+    def test_numbered_start(self):
+        md = MarkdownBuilder()
+        md.numbered(["a"], start=4)
+        assert md.build() == "4. a\n"
+
+    def test_table_default_separator(self):
+        md = MarkdownBuilder()
+        md.table(["Dimension", "Score"], [["Legitimacy", 3.5]])
+        assert md.build() == (
+            "| Dimension | Score |\n"
+            "|-----------|-------|\n"
+            "| Legitimacy | 3.5 |\n"
+        )
+
+    def test_table_custom_separator(self):
+        md = MarkdownBuilder()
+        md.table_header(["A", "B"], separator="|---|---|")
+        assert md.build() == "| A | B |\n|---|---|\n"
+
+    def test_table_accepts_generator(self):
+        md = MarkdownBuilder()
+        md.table(["N"], ([i] for i in range(3)))
+        assert md.build().count("\n") == 5
+
+    def test_streaming_writes_through(self):
+        stream = io.StringIO()
+        md = MarkdownBuilder(stream)
+        md.heading("Streamed", level=1).bullets(["one"])
+        assert md.is_streaming
+        assert stream.getvalue() == "# Streamed\n\n- one\n"
+
+    def test_streaming_build_raises(self):
+        md = MarkdownBuilder(io.StringIO())
+        with pytest.raises(ValueError):
+            md.build()
+
+    def test_write_to(self):
+        md = MarkdownBuilder()
+        md.line("hello")
+        stream = io.StringIO()
+        md.write_to(stream)
+        assert stream.getvalue() == "hello\n"
@@ -0,0 +1,146 @@
+"""
+Tests for generators/parallel_docx.py section-parallel DOCX assembly.
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from generators.base import is_docx_available
+
+pytestmark = pytest.mark.skipif(not is_docx_available(), reason="python-docx not installed")
+
+if is_docx_available():
+    from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import qn
+    from lxml import etree
+
+    from generators.generate_executive_sprint_report import (
+        ExecutiveSprintReportGenerator,
+        parse_executive_sprint_report_data,
+    )
+    from generators.parallel_docx import (
+        SectionFragment,
+        merge_fragments,
+        render_fragments_parallel,
+    )
+
+
+@pytest.fixture
+def report_data():
+    """Small sprint report with list and table content."""
+    return parse_executive_sprint_report_data({
+        "project_name": "ParallelTest",
+        "report_title": "Parallel Report",
+        "overall_vianeo_score": "3.2",
+        "key_findings": [{"dimension": "Desirability", "score": "3.4", "status": "PASS"}],
+        "validation_gaps": ["Pricing", "Channel"],
+        "immediate_next_steps": ["Run pilot"],
+        "conclusion": ["Proceed with conditions"],
+    })
+
+
+def fragment_from(doc, name="section"):
+    """Serialize a whole document as one fragment."""
+    return SectionFragment(
+        name=name,
+        body_xml=[
+            etree.tostring(element)
+            for element in doc.element.body
+            if element.tag != qn('w:sectPr')
+        ],
+        styles_xml=etree.tostring(doc.styles.element),
+        numbering_xml=etree.tostring(doc.part.numbering_part.element)
+    )
+
+
+class TestSprintReportParallel:
+    """Parallel assembly must reproduce the sequential document."""
+
+    def test_matches_sequential(self, report_data):
+        generator = ExecutiveSprintReportGenerator(report_data)
+        sequential, parallel = io.BytesIO(), io.BytesIO()
+        assert generator.generate_docx(sequential)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            assert generator.generate_docx(parallel, parallel=True, executor=pool)
+
+        first = Document(io.BytesIO(sequential.getvalue()))
+        second = Document(io.BytesIO(parallel.getvalue()))
+        assert first.element.body.xml == second.element.body.xml
+        assert first.styles.element.xml == second.styles.element.xml
+
+    def test_fragments_in_section_order(self, report_data):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fragments = render_fragments_parallel(
+                ExecutiveSprintReportGenerator,
+                report_data,
+                ExecutiveSprintReportGenerator.SECTIONS,
+                executor=pool
+            )
+        assert [f.name for f in fragments] == list(ExecutiveSprintReportGenerator.SECTIONS)
+        assert all(f.body_xml for f in fragments)
+
+
+class TestMergeFragments:
+    """Tests for style/numbering reconciliation."""
+
+    def test_copies_missing_style_chain(self):
+        source = Document()
+        base = source.styles.add_style("Vianeo Base", WD_STYLE_TYPE.PARAGRAPH)
+        callout = source.styles.add_style("Vianeo Callout", WD_STYLE_TYPE.PARAGRAPH)
+        callout.base_style = base
+        source.add_paragraph("Note", style="Vianeo Callout")
+
+        target = Document()
+        merge_fragments(target, [fragment_from(source)])
+        style_ids = {s.style_id for s in target.styles}
+        assert {"VianeoCallout", "VianeoBase"} <= style_ids
+        assert target.paragraphs[0].style.name == "Vianeo Callout"
+
+    def test_remaps_conflicting_numbering(self):
+        source = Document()
+        numbering = source.part.numbering_part.element
+        num = numbering.findall(qn('w:num'))[0]
+        num_id = num.get(qn('w:numId'))
+        abstract_id = num.find(qn('w:abstractNumId')).get(qn('w:val'))
+        for abstract in numbering.findall(qn('w:abstractNum')):
+            if abstract.get(qn('w:abstractNumId')) == abstract_id:
+                abstract.find('.//' + qn('w:numFmt')).set(qn('w:val'), 'upperRoman')
+        paragraph = source.add_paragraph("Roman item")
+        paragraph._p.get_or_add_pPr().append(parse_xml(
+            f'<w:numPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:ilvl w:val="0"/><w:numId w:val="{num_id}"/></w:numPr>'
+        ))
+
+        target = Document()
+        before = len(target.part.numbering_part.element.findall(qn('w:num')))
+        merge_fragments(target, [fragment_from(source)])
+        nums = target.part.numbering_part.element.findall(qn('w:num'))
+        assert len(nums) == before + 1
+        merged_id = target.paragraphs[0]._p.find('.//' + qn('w:numId')).get(qn('w:val'))
+        assert merged_id == nums[-1].get(qn('w:numId'))
+
+    def test_separator_between_fragments(self):
+        first, second = Document(), Document()
+        first.add_paragraph("One")
+        second.add_paragraph("Two")
+        target = Document()
+        merge_fragments(
+            target,
+            [fragment_from(first, "a"), fragment_from(second, "b")],
+            separator=lambda doc: doc.add_paragraph("---")
+        )
+        assert [p.text for p in target.paragraphs] == ["One", "---", "Two"]
+
+    def test_rejects_relationships(self):
+        source = Document()
+        paragraph = source.add_paragraph()
+        paragraph._p.append(parse_xml(
+            '<w:hyperlink xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" r:id="rId99"/>'
+        ))
+        with pytest.raises(ValueError):
+            merge_fragments(Document(), [fragment_from(source)])
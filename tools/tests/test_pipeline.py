@@ -0,0 +1,147 @@
+"""
+Tests for pipeline/documents.py in-memory document pipeline.
+"""
+
+import io
+
+import pytest
+
+from generators.base import is_docx_available
+from pipeline import (
+    DOCUMENT_KINDS,
+    RenderedDocument,
+    docx_bytes_to_markdown,
+    markdown_to_docx_bytes,
+    parse_document,
+    render_document,
+    render_project,
+    validate_document,
+)
+
+requires_docx = pytest.mark.skipif(
+    not is_docx_available(), reason="python-docx not installed"
+)
+
+
+@pytest.fixture
+def diagnostic_data() -> dict:
+    """Minimal diagnostic input."""
+    return {
+        "project_name": "TestProject",
+        "date": "2025-01-15",
+        "overall_maturity": "Early validation",
+        "strengths": "Clear problem definition",
+        "risks": "Unproven pricing",
+        "dimension_scores": [
+            {"name": "Legitimacy", "score": 3.6, "interpretation": "Solid"},
+            {"name": "Viability", "score": 2.4, "interpretation": "Gaps"},
+        ],
+        "immediate_priorities": ["Interview 10 buyers"],
+    }
+
+
+@pytest.fixture
+def value_chain_data() -> dict:
+    """Minimal value chain input."""
+    return {
+        "project_name": "TestProject",
+        "buyers": [{"name": "District", "role": "Purchaser", "requester": "Buyer"}],
+        "end_users": [{"name": "Teacher", "role": "User", "requester": "User"}],
+    }
+
+
+class TestParseDocument:
+    """Tests for parse_document function."""
+
+    def test_parses_raw_dict(self, diagnostic_data):
+        data = parse_document("diagnostic", diagnostic_data)
+        assert data.project_name == "TestProject"
+        assert data.dimension_scores[0].score == 3.6
+
+    def test_parses_file(self, fixtures_dir):
+        data = parse_document("personas", fixtures_dir / "sample_personas.yaml")
+        assert data.personas
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            parse_document("nonexistent", {})
+
+
+class TestRenderDocument:
+    """Tests for render_document function."""
+
+    def test_markdown_only(self, diagnostic_data):
+        rendered = render_document("diagnostic", diagnostic_data, formats=["md"])
+        assert isinstance(rendered, RenderedDocument)
+        assert "TestProject" in rendered.markdown
+        assert rendered.docx is None
+
+    @requires_docx
+    def test_docx_bytes(self, diagnostic_data):
+        rendered = render_document("diagnostic", diagnostic_data)
+        assert rendered.docx.startswith(b"PK")
+        assert "TestProject" in docx_bytes_to_markdown(rendered.docx)
+
+    def test_value_chain_html(self, value_chain_data):
+        rendered = render_document("value_chain", value_chain_data, html_mode="virtual")
+        assert "District" in rendered.html
+        assert set(rendered.outputs()) == {"md", "html"}
+
+    def test_unsupported_format(self, value_chain_data):
+        with pytest.raises(ValueError):
+            render_document("value_chain", value_chain_data, formats=["docx"])
+
+    def test_save_writes_outputs(self, value_chain_data, tmp_path):
+        rendered = render_document("value_chain", value_chain_data)
+        written = rendered.save(tmp_path / "network")
+        assert written["md"].read_text(encoding="utf-8") == rendered.markdown
+        assert written["html"].suffix == ".html"
+
+    def test_save_through_writer(self, value_chain_data, tmp_path):
+        from core.write_behind import WriteBehindQueue
+        rendered = render_document("value_chain", value_chain_data)
+        with WriteBehindQueue() as writer:
+            written = rendered.save(tmp_path / "network", writer=writer)
+        assert written["html"].read_text(encoding="utf-8") == rendered.html
+
+    def test_every_kind_registered(self):
+        assert set(DOCUMENT_KINDS) == {
+            "executive_brief",
+            "personas",
+            "value_chain",
+            "diagnostic",
+            "executive_sprint_report",
+        }
+
+
+class TestValidateDocument:
+    """Tests for validate_document and render_project functions."""
+
+    def test_diagnostic_checks_scores(self, diagnostic_data):
+        reports = validate_document(render_document("diagnostic", diagnostic_data, formats=["md"]))
+        assert set(reports) == {"character_limits", "score_thresholds"}
+
+    def test_render_project(self, diagnostic_data, value_chain_data):
+        project = render_project({
+            "diagnostic": diagnostic_data,
+            "value_chain": value_chain_data,
+        })
+        assert set(project.documents) == {"diagnostic", "value_chain"}
+        assert set(project.reports) == {"diagnostic", "value_chain"}
+
+
+@requires_docx
+class TestInMemoryConversion:
+    """Tests for Markdown/DOCX conversion without files."""
+
+    def test_round_trip(self):
+        content = markdown_to_docx_bytes("# Title\n\nSome body text\n")
+        markdown = docx_bytes_to_markdown(content)
+        assert "Title" in markdown
+        assert "Some body text" in markdown
+
+    def test_converter_accepts_stream(self):
+        from converters.md_to_docx import MarkdownToDocxConverter
+        buffer = io.BytesIO()
+        assert MarkdownToDocxConverter().convert("Body\n", buffer)
+        assert buffer.getvalue().startswith(b"PK")
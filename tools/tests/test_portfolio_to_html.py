@@ -0,0 +1,113 @@
+"""
+Tests for converters/portfolio_to_html.py portfolio dashboard.
+"""
+
+import json
+
+import pytest
+import yaml
+
+from core.constants import REPO_ROOT
+from converters.portfolio_to_html import (
+    PortfolioDashboardConverter,
+    ProjectScores,
+    UNSCORED_STATUS,
+    convert_portfolio_to_html,
+    load_project_scores,
+)
+
+FULL = {"legitimacy": 4.0, "desirability": 3.8, "acceptability": 3.5,
+        "feasibility": 3.6, "viability": 3.2}
+
+
+@pytest.fixture
+def projects():
+    return [
+        ProjectScores("Alpha", "a.yaml", dict(FULL)),
+        ProjectScores("<Beta>", "b.yaml", {"legitimacy": 1.0, "viability": 1.5}),
+        ProjectScores("Gamma", "c.yaml", {dim: 4.8 for dim in FULL}),
+    ]
+
+
+class TestAggregates:
+    """Tests for build-time aggregates."""
+
+    def test_status_counts(self, projects):
+        counts = PortfolioDashboardConverter(projects, unscored=2).status_counts()
+        assert counts["Strong"] == 1
+        assert counts["Non-viable"] == 1
+        assert counts[UNSCORED_STATUS] == 2
+
+    def test_unscored_project_is_not_non_viable(self):
+        project = ProjectScores("Delta", "d.yaml", {})
+        assert project.status == UNSCORED_STATUS
+        converter = PortfolioDashboardConverter([project])
+        assert converter.status_counts()["Non-viable"] == 0
+        assert converter.dataset()["status"] == [-1]
+
+    def test_dimension_statistics(self, projects):
+        stats = PortfolioDashboardConverter(projects).dimension_statistics()
+        assert stats["legitimacy"]["count"] == 3
+        assert stats["desirability"]["count"] == 2
+        assert stats["viability"]["below_threshold"] == 1
+        assert stats["desirability"]["missing"] == 1
+        assert stats["desirability"]["below_threshold"] == 1
+
+    def test_missing_dimension_fails_everywhere(self, projects):
+        converter = PortfolioDashboardConverter(projects)
+        stats = converter.dimension_statistics()
+        for dim in FULL:
+            assert stats[dim]["below_threshold"] == sum(dim in p.failing_dimensions for p in projects)
+        assert "desirability" in projects[1].failing_dimensions
+        assert "Desirability (missing)" in converter.generate_html()
+
+    def test_gap_ranking(self, projects):
+        ranking = PortfolioDashboardConverter(projects).gap_ranking()
+        assert [p.project_name for p in ranking] == ["<Beta>"]
+
+    def test_dataset_orders(self, projects):
+        dataset = PortfolioDashboardConverter(projects).dataset()
+        assert dataset["scores"][1] == [38, -1, 48]
+        assert [dataset["names"][i] for i in dataset["order"]["weighted"]] == ["<Beta>", "Alpha", "Gamma"]
+
+
+class TestLoading:
+    """Tests for reading score files."""
+
+    def test_key_findings_layout(self):
+        path = REPO_ROOT / "examples" / "executive_sprint_report_irdose_sample.yaml"
+        project = load_project_scores(path)
+        assert project is not None
+        assert project.scores["legitimacy"] == pytest.approx(4.7)
+        assert len(project.scores) == 5
+
+    def test_file_without_scores(self, tmp_path):
+        path = tmp_path / "notes.yaml"
+        path.write_text(yaml.safe_dump({"project_name": "Notes"}))
+        assert load_project_scores(path) is None
+
+
+class TestHtml:
+    """Tests for the rendered page."""
+
+    def test_page_escapes_names(self, projects):
+        html = PortfolioDashboardConverter(projects).generate_html()
+        assert "VIANEO Portfolio Dashboard" in html
+        assert "<Beta>" not in html
+        data = html.split('id="portfolio-data">', 1)[1].split('</script>', 1)[0]
+        assert json.loads(data)["names"][1] == "<Beta>"
+
+    def test_data_island_escapes_line_separators(self):
+        project = ProjectScores("Line\u2028Sep", "a.yaml", dict(FULL))
+        html = PortfolioDashboardConverter([project]).generate_html()
+        data = html.split('id="portfolio-data">', 1)[1].split('</script>', 1)[0]
+        assert "\u2028" not in data
+        assert json.loads(data)["names"][0] == "Line\u2028Sep"
+
+    def test_convert_directory(self, tmp_path):
+        (tmp_path / "alpha.json").write_text(json.dumps({"project_name": "Alpha", "dimension_scores": FULL}))
+        (tmp_path / "empty.yaml").write_text(yaml.safe_dump({"project_name": "Empty"}))
+        output = convert_portfolio_to_html([tmp_path], tmp_path / "out.html")
+        html = output.read_text(encoding="utf-8")
+        assert "1 evaluations" in html
+        assert f"{UNSCORED_STATUS}: 1 (no dimension scores)" in html
@@ -0,0 +1,230 @@
+"""
+Tests for pipeline/server.py local rendering service.
+"""
+
+import http.client
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from generators.base import is_docx_available
+from pipeline import server as render_server
+from pipeline.server import RenderService, parse_request_body, resolve_generator_name
+
+
+DIAGNOSTIC = {
+    "project_name": "ServiceTest",
+    "dimension_scores": [{"name": "Legitimacy", "score": 3.4}],
+}
+
+
+def start(service: RenderService):
+    """Serve on a free localhost port; return (server, base_url)."""
+    server = service.create_server(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def post(url: str, payload, content_type: str = "application/json"):
+    """POST a payload; return (status, headers, body) for any status."""
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": content_type})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+@pytest.fixture
+def running():
+    """Thread-pool service on localhost."""
+    service = RenderService(workers=2, queue_size=2, timeout=10, use_processes=False)
+    server, url = start(service)
+    yield service, url
+    server.shutdown()
+    server.server_close()
+    service.shutdown()
+
+
+class TestHelpers:
+    """Tests for request parsing helpers."""
+
+    def test_resolve_generator_name(self):
+        assert resolve_generator_name("generate_diagnostic") == "diagnostic"
+        assert resolve_generator_name("value_chain") == "value_chain"
+        with pytest.raises(ValueError):
+            resolve_generator_name("generate_unknown")
+
+    def test_parse_yaml_body(self):
+        assert parse_request_body(b"project_name: X\n") == {"project_name": "X"}
+
+    def test_parse_rejects_non_mapping(self):
+        with pytest.raises(ValueError):
+            parse_request_body(b"[1, 2]", "application/json")
+
+
+class TestRenderEndpoints:
+    """Tests for the HTTP endpoints."""
+
+    def test_health(self, running):
+        _, url = running
+        with urllib.request.urlopen(f"{url}/health") as response:
+            health = json.loads(response.read())
+        assert health["status"] == "ok"
+        assert health["capacity"] == 4
+        assert "diagnostic" in health["generators"]
+
+    def test_render_markdown(self, running):
+        _, url = running
+        status, headers, body = post(f"{url}/render/generate_diagnostic?format=md", DIAGNOSTIC)
+        assert status == 200
+        assert headers["Content-Type"].startswith("text/markdown")
+        assert b"ServiceTest" in body
+
+    @pytest.mark.skipif(not is_docx_available(), reason="python-docx not installed")
+    def test_render_docx(self, running):
+        _, url = running
+        status, _, body = post(f"{url}/render/diagnostic?format=docx", DIAGNOSTIC)
+        assert status == 200
+        assert body.startswith(b"PK")
+
+    def test_render_yaml_body(self, running):
+        _, url = running
+        status, _, body = post(
+            f"{url}/render/value_chain?format=html",
+            b"project_name: YamlNetwork\nbuyers:\n  - name: District\n",
+            "application/x-yaml"
+        )
+        assert status == 200
+        assert b"YamlNetwork" in body
+
+    def test_unknown_generator(self, running):
+        _, url = running
+        assert post(f"{url}/render/generate_nothing?format=md", DIAGNOSTIC)[0] == 404
+
+    def test_unsupported_format(self, running):
+        _, url = running
+        assert post(f"{url}/render/personas?format=html", {"project_name": "P"})[0] == 400
+
+    def test_invalid_data(self, running):
+        _, url = running
+        assert post(f"{url}/render/executive_brief?format=md", {"not_a_field": 1})[0] == 400
+
+    def test_bad_path_with_invalid_content_length_closes(self, running):
+        _, url = running
+        conn = http.client.HTTPConnection(url[len("http://"):], timeout=10)
+        try:
+            conn.putrequest("POST", "/nowhere")
+            conn.putheader("Content-Length", "abc")
+            conn.endheaders()
+            response = conn.getresponse()
+            assert response.status == 404
+            assert response.getheader("Connection") == "close"
+        finally:
+            conn.close()
+
+
+class TestBackpressure:
+    """Tests for admission control and timeouts."""
+
+    def test_full_queue_returns_503(self, monkeypatch):
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking_render(*args):
+            started.set()
+            release.wait(10)
+            return b"done"
+
+        service = RenderService(workers=1, queue_size=0, timeout=10, use_processes=False)
+        server, url = start(service)
+        monkeypatch.setattr(render_server, "render_payload", blocking_render)
+        try:
+            first = threading.Thread(
+                target=post, args=(f"{url}/render/diagnostic?format=md", DIAGNOSTIC)
+            )
+            first.start()
+            assert started.wait(10)
+            status, headers, _ = post(f"{url}/render/diagnostic?format=md", DIAGNOSTIC)
+            assert status == 503
+            assert int(headers["Retry-After"]) >= 1
+            release.set()
+            first.join(10)
+            assert service.in_flight == 0
+        finally:
+            release.set()
+            server.shutdown()
+            server.server_close()
+            service.shutdown()
+
+    def test_timeout_returns_504(self, monkeypatch):
+        release = threading.Event()
+
+        def slow_render(*args):
+            release.wait(10)
+            return b"late"
+
+        service = RenderService(workers=1, queue_size=1, timeout=0.2, use_processes=False)
+        server, url = start(service)
+        monkeypatch.setattr(render_server, "render_payload", slow_render)
+        try:
+            assert post(f"{url}/render/diagnostic?format=md", DIAGNOSTIC)[0] == 504
+        finally:
+            release.set()
+            server.shutdown()
+            server.server_close()
+            service.shutdown()
+
+    def test_timed_out_render_keeps_its_slot(self, monkeypatch):
+        release = threading.Event()
+
+        def slow_render(*args):
+            release.wait(10)
+            return b"late"
+
+        service = RenderService(workers=1, queue_size=0, timeout=0.2, use_processes=False)
+        service.start()
+        monkeypatch.setattr(render_server, "render_payload", slow_render)
+        try:
+            assert service.render("diagnostic", "md", b"{}")[0] == 504
+            # Still running: no new work is admitted past the worker count
+            assert service.in_flight == 1
+            assert service.render("diagnostic", "md", b"{}")[0] == 503
+            release.set()
+            deadline = time.monotonic() + 10
+            while service.in_flight and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert service.in_flight == 0
+            assert service.render("diagnostic", "md", b"{}")[0] == 200
+        finally:
+            release.set()
+            service.shutdown()
+
+
+class TestProcessPool:
+    """Tests for the pre-warmed process pool."""
+
+    def test_concurrent_renders(self):
+        service = RenderService(workers=2, queue_size=8, timeout=60)
+        server, url = start(service)
+        results = []
+
+        def render():
+            results.append(post(f"{url}/render/diagnostic?format=md", DIAGNOSTIC)[0])
+
+        try:
+            threads = [threading.Thread(target=render) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(60)
+            assert results == [200] * 6
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.shutdown()
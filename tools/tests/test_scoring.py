@@ -0,0 +1,192 @@
+"""
+Tests for scoring/ questionnaire definitions and the vectorized engine.
+"""
+
+import json
+import math
+
+import pytest
+import yaml
+
+from scoring.questionnaires import DIAGNOSTIC_40Q, MARKET_MATURITY_29Q, get_questionnaire
+from scoring.questionnaire_engine import (
+    NUMPY_AVAILABLE,
+    RESPONSE_INSUFFICIENT_DATA,
+    RESPONSE_MISSING,
+    RESPONSE_NO,
+    RESPONSE_NOT_APPLICABLE,
+    RESPONSE_SCORED,
+    RESPONSE_YES,
+    build_response_matrix,
+    parse_response,
+    score_questionnaires,
+    score_responses,
+)
+from generators.generate_executive_sprint_report import KeyFinding
+from generators.generate_diagnostic import DimensionScore
+
+
+def _all_29q(score):
+    return {question: score for question in MARKET_MATURITY_29Q.question_ids}
+
+
+class TestQuestionnaires:
+    """Tests for the questionnaire definitions."""
+
+    @pytest.mark.parametrize("questionnaire,count", [(DIAGNOSTIC_40Q, 40), (MARKET_MATURITY_29Q, 29)])
+    def test_dimensions_partition_questions(self, questionnaire, count):
+        assigned = [q for d in questionnaire.dimensions for q in d.questions]
+        assert len(questionnaire.question_ids) == count
+        assert sorted(assigned) == sorted(questionnaire.question_ids)
+        assert math.isclose(sum(d.weight for d in questionnaire.dimensions), 1.0)
+
+    def test_red_flags_reference_known_questions(self):
+        for questionnaire in (DIAGNOSTIC_40Q, MARKET_MATURITY_29Q):
+            ids = set(questionnaire.question_ids)
+            for rule in questionnaire.red_flags:
+                assert set(rule.questions) <= ids
+
+    def test_get_questionnaire(self):
+        assert get_questionnaire("29Q") is MARKET_MATURITY_29Q
+        with pytest.raises(ValueError):
+            get_questionnaire("12q")
+
+
+class TestParseResponse:
+    """Tests for response classification."""
+
+    @pytest.mark.parametrize("value,code,score", [
+        (4, RESPONSE_SCORED, 4.0),
+        (3.5, RESPONSE_SCORED, 3.5),
+        ("Score 2 - CONTEXTUAL NOTE: early stage", RESPONSE_SCORED, 2.0),
+        ("5", RESPONSE_SCORED, 5.0),
+        ({"score": 3, "note": "pilot"}, RESPONSE_SCORED, 3.0),
+        ("INSUFFICIENT DATA - no interviews", RESPONSE_INSUFFICIENT_DATA, None),
+        ("N/A - unregulated", RESPONSE_NOT_APPLICABLE, None),
+        ("YES - patent filed", RESPONSE_YES, None),
+        ("NO", RESPONSE_NO, None),
+        (False, RESPONSE_NO, None),
+        (None, RESPONSE_MISSING, None),
+    ])
+    def test_classification(self, value, code, score):
+        parsed_code, parsed_score = parse_response(value)
+        assert parsed_code == code
+        if score is None:
+            assert math.isnan(parsed_score)
+        else:
+            assert parsed_score == score
+
+    @pytest.mark.parametrize("value", [0, 6, "maybe", "12", "5.9 - note", "No interviews yet"])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_response(value)
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+class TestScoreResponses:
+    """Tests for vectorized scoring."""
+
+    def test_dimension_and_overall_scores(self):
+        responses = _all_29q(4)
+        responses["Q8"] = 2          # Legitimacy: (2 + 4) / 2 = 3.0
+        matrix = build_response_matrix([("p.yaml", {"project_name": "P", "responses": responses})])
+        scores = score_responses(matrix)
+
+        assert matrix.questionnaire is MARKET_MATURITY_29Q
+        assert scores.dimension_scores[0, 0] == pytest.approx(3.0)
+        assert scores.overall[0] == pytest.approx(0.15 * 3.0 + 0.85 * 4.0)
+        assert not scores.below_threshold[0].any()
+
+    def test_thresholds_and_red_flags(self):
+        responses = _all_29q(3)
+        responses["Q7"] = 1
+        responses["Q13"] = "INSUFFICIENT DATA - not researched"
+        matrix = build_response_matrix(
+            [("p.yaml", {"responses": responses})], MARKET_MATURITY_29Q
+        )
+        summary = score_responses(matrix).project_summary(0)
+
+        assert "Desirability" in summary["threshold_failures"]
+        assert summary["overall_below_threshold"] is True
+        assert any("Q7" in flag for flag in summary["red_flags"])
+        assert any("score of 1" in flag for flag in summary["red_flags"])
+        assert not any("Q13" in flag for flag in summary["red_flags"])
+        assert summary["questions_to_ask"][0].startswith("Q13:")
+        assert summary["response_counts"]["insufficient_data"] == 1
+
+    def test_unscored_dimension_fails_its_minimum(self):
+        responses = _all_29q(5)
+        desirability = MARKET_MATURITY_29Q.dimensions[1]
+        for question in desirability.questions:
+            responses[question] = "INSUFFICIENT DATA - no interviews yet"
+        scores = score_responses(build_response_matrix([("p.yaml", {"responses": responses})]))
+        summary = scores.project_summary(0)
+
+        assert desirability.name == "Desirability"
+        assert summary["threshold_failures"] == ["Desirability"]
+        assert scores.to_rows()[0]["threshold_failures"] == 1
+        finding = next(f for f in summary["key_findings"] if f["dimension"] == "Desirability")
+        assert finding["status"] == "FAIL"
+        assert "Desirability" not in [d["name"] for d in summary["dimension_scores"]]
+
+    def test_missing_dimension_renormalizes_weights(self):
+        responses = {question: 4 for question in DIAGNOSTIC_40Q.dimensions[0].questions}
+        responses.update({"Tech4": "YES", "M1": 2})
+        scores = score_responses(build_response_matrix([("p.yaml", {"responses": responses})]))
+
+        assert scores.questionnaire is DIAGNOSTIC_40Q
+        assert math.isnan(scores.dimension_scores[0, 1])
+        assert math.isnan(scores.dimension_scores[0, 3])
+        assert scores.overall[0] == pytest.approx((0.25 * 4.0 + 0.25 * 2.0) / 0.5)
+        assert scores.response_counts[0, RESPONSE_YES] == 1
+
+    def test_rows_are_independent(self):
+        projects = [
+            (f"{i}.yaml", {"project_name": f"P{i}", "responses": _all_29q(score)})
+            for i, score in enumerate([1, 3, 5])
+        ]
+        scores = score_responses(build_response_matrix(projects))
+
+        assert scores.overall.tolist() == pytest.approx([1.0, 3.0, 5.0])
+        assert scores.red_flags[0].any() and not scores.red_flags[2].any()
+        assert [row["status"] for row in scores.to_rows()] == ["FAIL", "FAIL", "PASS"]
+
+    def test_unknown_question_id(self):
+        with pytest.raises(ValueError, match="Q99"):
+            build_response_matrix([("p.yaml", {"responses": {"Q99": 3}})], MARKET_MATURITY_29Q)
+
+    @pytest.mark.parametrize("data", [[{"Q1": 3}], "Q1: 3", None])
+    def test_non_mapping_data_names_source(self, data):
+        with pytest.raises(ValueError, match="broken.yaml"):
+            build_response_matrix([("broken.yaml", data)], MARKET_MATURITY_29Q)
+        with pytest.raises(ValueError, match="broken.yaml"):
+            build_response_matrix([("broken.yaml", data)])
+
+    def test_summary_feeds_generator_models(self):
+        scores = score_responses(build_response_matrix([("p.yaml", {"responses": _all_29q(4)})]))
+        summary = scores.project_summary(0)
+
+        findings = [KeyFinding(**finding) for finding in summary["key_findings"]]
+        dimensions = [DimensionScore(**dimension) for dimension in summary["dimension_scores"]]
+        assert len(findings) == len(dimensions) == 5
+        assert summary["market_maturity_score"] == "4.00"
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+class TestScoreQuestionnaires:
+    """Tests for file loading and output."""
+
+    def test_directory_to_json(self, tmp_path):
+        (tmp_path / "in").mkdir()
+        for name, score in [("a", 4), ("b", 2)]:
+            with open(tmp_path / "in" / f"{name}.yaml", "w") as f:
+                yaml.safe_dump({"project_name": name, "questionnaire": "29q",
+                                "responses": _all_29q(score)}, f)
+        output = tmp_path / "scores.json"
+
+        scores = score_questionnaires([tmp_path / "in"], output)
+
+        assert len(scores) == 2
+        data = json.loads(output.read_text())
+        assert [row["project"] for row in data["rows"]] == ["a", "b"]
+        assert data["projects"][1]["overall_status"] == "FAIL"
@@ -0,0 +1,117 @@
+"""
+Tests for search/index.py methodology search.
+"""
+
+import os
+
+import pytest
+
+from search.index import SCHEMA_VERSION, SearchIndex, split_sections, tokenize
+
+GUIDE = """# Reference Guide
+
+## Character Limits
+
+- Titles: 60 characters maximum
+- Descriptions: 250 characters maximum
+
+## Score Thresholds
+
+Investment ready requires 3.5 in every dimension.
+"""
+
+PROMPT = """Preamble about character counting.
+
+# Step 6 Personas
+
+### Limits
+
+Persona names stay under the limit.
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "prompts").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text(GUIDE)
+    (tmp_path / "prompts" / "step6.md").write_text(PROMPT)
+    (tmp_path / "prompts" / "image.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+@pytest.fixture
+def index(tree):
+    with SearchIndex(":memory:", base=tree) as index:
+        index.refresh(["docs", "prompts"])
+        yield index
+
+
+class TestTokenizing:
+    """Tests for tokens and sections."""
+
+    def test_tokenize(self):
+        assert tokenize("Character LIMITS: 3.5 for E001") == ["character", "limit", "3.5", "for", "e001"]
+        assert tokenize("process status") == ["process", "status"]
+
+    def test_split_sections_trail(self):
+        sections = split_sections(PROMPT)
+        assert [(heading, trail, line) for heading, trail, line, _ in sections] == [
+            (None, "", 1),
+            ("Step 6 Personas", "Step 6 Personas", 3),
+            ("Limits", "Step 6 Personas > Limits", 5),
+        ]
+        assert sections[2][3].startswith("### Limits")
+
+
+class TestSearchIndex:
+    """Tests for indexing, refresh and ranking."""
+
+    def test_ranked_hits_with_heading_context(self, index):
+        hits = index.search("character limits")
+        assert hits[0].path == "docs/guide.md"
+        assert hits[0].heading == "Reference Guide > Character Limits"
+        assert hits[0].line == 3
+        assert (5, "- Titles: 60 characters maximum") in hits[0].matches
+
+    def test_match_all_and_any(self, index):
+        assert [hit.heading for hit in index.search("investment 3.5")] == [
+            "Reference Guide > Score Thresholds"
+        ]
+        assert len(index.search("investment persona")) == 0
+        assert len(index.search("investment persona", match_all=False)) == 3
+
+    def test_path_prefix(self, index):
+        hits = index.search("limit", path_prefix="prompts/")
+        assert {hit.path for hit in hits} == {"prompts/step6.md"}
+
+    def test_path_prefix_keeps_global_idf(self, index):
+        everywhere = {(hit.path, hit.line): hit.score for hit in index.search("limit")}
+        for hit in index.search("limit", path_prefix="prompts/"):
+            assert hit.score == everywhere[(hit.path, hit.line)]
+
+    def test_incremental_refresh(self, tree, index):
+        stats = index.refresh(["docs", "prompts"])
+        assert (stats.added, stats.updated, stats.unchanged) == (0, 0, 2)
+
+        guide = tree / "docs" / "guide.md"
+        guide.write_text(GUIDE + "\n## Gate Decisions\n\nHold when evidence is thin.\n")
+        os.utime(guide, ns=(1, 1))
+        (tree / "prompts" / "step6.md").unlink()
+        stats = index.refresh(["docs", "prompts"])
+        assert (stats.updated, stats.removed, stats.unchanged) == (1, 1, 0)
+        assert index.search("evidence thin")[0].heading == "Reference Guide > Gate Decisions"
+        assert index.search("persona") == []
+
+    def test_refresh_other_root_keeps_files(self, index):
+        assert index.refresh(["docs"]).removed == 0
+        assert index.stats()["files"] == 2
+
+    def test_persistent_schema_check(self, tree):
+        path = tree / "index.sqlite"
+        with SearchIndex(path, base=tree) as index:
+            index.refresh(["docs"])
+            index.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+            index.connection.commit()
+        with pytest.raises(ValueError):
+            SearchIndex(path, base=tree)
@@ -0,0 +1,124 @@
+"""
+Tests for portfolio/shared_memory.py zero-copy portfolio tables.
+"""
+
+import math
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from portfolio.shared_memory import (
+    NUMPY_AVAILABLE,
+    SharedPortfolio,
+    build_portfolio_tables,
+    score_portfolio,
+    validate_portfolio,
+)
+from converters.portfolio_to_html import STATUS_KEYWORDS, ProjectScores
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+@pytest.fixture
+def projects(sample_portfolio):
+    """Sample portfolio with markup in a name, a gap in Beta and Gamma scored via "scores"."""
+    alpha, beta, gamma = (data for _, data in sample_portfolio)
+    alpha["project_name"] = "Ünïcode <Alpha>"
+    del beta["dimension_scores"]["acceptability"]
+    beta["evidence_log"] = [{"id": "E9", "quality_rating": 9}]
+    gamma["scores"] = {"Legitimacy": 3.0}
+    return sample_portfolio
+
+
+@pytest.fixture
+def portfolio(projects):
+    with SharedPortfolio.create(build_portfolio_tables(projects)) as shared:
+        yield shared
+
+
+class TestSharedPortfolio:
+    """Tests for SharedPortfolio layout and access."""
+
+    def test_text_and_numeric_columns(self, portfolio):
+        projects = portfolio.projects
+        assert len(portfolio) == 3
+        assert projects.texts("name") == ["Ünïcode <Alpha>", "Beta", "Gamma"]
+        assert projects.text("source", 1) == "/data/beta.yaml"
+        assert projects.array("legitimacy").tolist() == [4.0, 4.8, 3.0]
+        assert math.isnan(projects.array("acceptability")[1])
+
+    def test_views_are_read_only(self, portfolio):
+        with pytest.raises(ValueError):
+            portfolio.projects.array("viability")[0] = 0.0
+
+    def test_child_tables(self, portfolio):
+        evidence = portfolio.table("evidence")
+        assert evidence.rows_for(0) == (0, 2)
+        assert evidence.rows_for(2) == (3, 3)
+        assert evidence.texts("id") == ["E001", "E002", "E9"]
+        network = portfolio.table("value_network")
+        assert network.texts("section") == ["buyers"]
+        assert network.text("need_level", 0) == "Critical"
+
+    def test_attach_sees_same_data(self, portfolio):
+        handle = pickle.loads(pickle.dumps(portfolio.handle))
+        attached = SharedPortfolio.attach(handle)
+        try:
+            assert attached.projects.texts("name") == portfolio.projects.texts("name")
+            assert not attached.owner
+        finally:
+            attached.close()
+
+    def test_column_kind_errors(self, portfolio):
+        with pytest.raises(ValueError):
+            portfolio.projects.array("name")
+        with pytest.raises(ValueError):
+            portfolio.projects.text("legitimacy", 0)
+        with pytest.raises(ValueError):
+            SharedPortfolio.create({"t": {"x": ("complex", [1j])}})
+        with pytest.raises(ValueError):
+            SharedPortfolio.create({"t": {"x": ("int", [1]), "y": ("int", [1, 2])}})
+
+    def test_empty_portfolio(self):
+        with SharedPortfolio.create(build_portfolio_tables([])) as shared:
+            assert len(shared) == 0
+            assert score_portfolio(shared)["weighted"].size == 0
+            assert validate_portfolio(shared) == {}
+
+
+class TestParallelScoring:
+    """Scoring and validation over row ranges."""
+
+    def test_matches_project_scores(self, portfolio):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            scores = score_portfolio(portfolio, chunk_size=2, executor=pool)
+        for index in range(len(portfolio)):
+            expected = ProjectScores(scores={
+                key: value for key, value in zip(
+                    ["legitimacy", "desirability", "acceptability", "feasibility", "viability"],
+                    portfolio.score_matrix(index, index + 1)[0]
+                ) if not math.isnan(value)
+            })
+            assert scores["weighted"][index] == pytest.approx(expected.weighted_score)
+            assert scores["gap"][index] == pytest.approx(expected.threshold_gap)
+            assert STATUS_KEYWORDS[scores["status"][index]] == expected.status
+
+    def test_validation_findings(self, portfolio):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            reports = validate_portfolio(portfolio, chunk_size=1, executor=pool)
+        assert reports[0].is_valid  # warnings only: desirability 2.5, two evidence entries
+        assert reports[0].warning_count == 2
+        assert not reports[1].is_valid  # missing acceptability, rating 9
+        fields = {result.field_name for result in reports[1].results}
+        assert {"acceptability_score", "E9.quality", "evidence_log"} <= fields
+        assert reports[2].error_count == 4
+
+    def test_worker_processes(self, portfolio):
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            in_process = score_portfolio(portfolio, chunk_size=2, executor=pool)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            in_thread = score_portfolio(portfolio, executor=pool)
+        assert in_process["weighted"].tolist() == pytest.approx(in_thread["weighted"].tolist())
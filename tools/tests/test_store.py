@@ -0,0 +1,119 @@
+"""
+Tests for portfolio/store.py SQLite evaluation store.
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+
+import pytest
+import yaml
+
+from generators.base import add_store_arguments, load_store_input
+from portfolio.store import SCHEMA_VERSION, EvaluationStore, load_store_project, main
+
+
+@pytest.fixture
+def projects(sample_portfolio):
+    """Sample portfolio with Beta's scores in list form and no legitimacy score."""
+    sample_portfolio[1][1]["dimension_scores"] = [
+        {"name": "Desirability", "score": 4.5}, {"name": "Viability", "score": 4.0},
+    ]
+    return sample_portfolio
+
+
+@pytest.fixture
+def store(projects):
+    with EvaluationStore() as store:
+        store.add_projects(projects, batch_size=2)
+        yield store
+
+
+class TestEvaluationStore:
+    """Tests for loading and querying."""
+
+    def test_child_tables(self, store):
+        assert store.stats() == {
+            "projects": 3, "dimension_scores": 7, "evidence": 8, "personas": 1,
+            "organizations": 1, "relationships": 1,
+        }
+        assert store.query("SELECT validation_status FROM personas")[0]["validation_status"] == "VALIDATED"
+
+    def test_find_projects(self, store):
+        rows = store.find_projects(below={"Desirability": 3.0}, evidence_quality=4, max_evidence=4)
+        assert [row["name"] for row in rows] == ["Alpha"]
+        assert rows[0]["evidence_count"] == 1
+
+        assert [row["name"] for row in store.find_projects(min_evidence=5)] == ["Beta"]
+        assert [row["name"] for row in store.find_projects(at_least={"viability": 3.0})] == ["Alpha", "Beta"]
+        assert len(store.find_projects()) == 3
+        with pytest.raises(ValueError):
+            store.find_projects(below={"charm": 3})
+
+    def test_missing_score_never_matches(self, store):
+        names = [row["name"] for row in store.find_projects(below={"legitimacy": 5.0})]
+        assert names == ["Alpha"]
+
+    def test_reload_replaces_rows(self, store):
+        store.add_projects([("/data/alpha.yaml", {"project_name": "Alpha 2"})])
+
+        assert len(store) == 3
+        assert store.stats()["evidence"] == 6
+        assert store.load_project("alpha") == {"project_name": "Alpha 2"}
+
+    def test_project_lookup(self, store):
+        assert store.load_project("Beta")["project_name"] == "Beta"
+        assert store.load_project("/data/gamma.json")["project_name"] == "Gamma"
+        assert store.dimension_scores("alpha.yaml")["desirability"] == 2.5
+        with pytest.raises(KeyError):
+            store.load_project("Delta")
+
+    def test_ambiguous_name(self, store):
+        store.add_projects([("/other/alpha.yaml", {"project_name": "Alpha"})])
+
+        with pytest.raises(KeyError, match="ambiguous"):
+            store.load_project("Alpha")
+        assert store.load_project("/other/alpha.yaml") == {"project_name": "Alpha"}
+
+
+class TestStoreFiles:
+    """Tests for file-backed stores and generator input."""
+
+    def test_load_files_and_generator_input(self, tmp_path, projects):
+        (tmp_path / "in").mkdir()
+        with open(tmp_path / "in" / "alpha.yaml", "w") as f:
+            yaml.safe_dump(projects[0][1], f)
+        db = tmp_path / "store.db"
+        with EvaluationStore(db) as store:
+            assert store.load_files([tmp_path / "in"]) == 1
+
+        assert load_store_project(db, None)["project_name"] == "Alpha"
+
+        parser = argparse.ArgumentParser()
+        add_store_arguments(parser)
+        args = parser.parse_args(["--from-store", str(db), "--project", "Alpha"])
+        assert load_store_input(parser, args)["evidence_log"][0]["id"] == "E001"
+        assert load_store_input(parser, parser.parse_args([])) is None
+        with pytest.raises(SystemExit):
+            load_store_input(parser, parser.parse_args(["--from-store", str(tmp_path / "none.db")]))
+
+    def test_schema_version_mismatch(self, tmp_path):
+        db = tmp_path / "store.db"
+        EvaluationStore(db).close()
+        connection = sqlite3.connect(db)
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        connection.close()
+
+        with pytest.raises(ValueError, match="schema"):
+            EvaluationStore(db)
+
+    def test_json_output_is_valid_json(self, tmp_path, monkeypatch, capsys, projects):
+        db = tmp_path / "store.db"
+        with EvaluationStore(db) as store:
+            store.add_projects(projects)
+        monkeypatch.setattr(sys, "argv", ["store.py", "--db", str(db), "--min-evidence", "5", "--format", "json"])
+        assert main() == 0
+        captured = capsys.readouterr()
+        assert [row["name"] for row in json.loads(captured.out)] == ["Beta"]
+        assert "1 row(s)" in captured.err
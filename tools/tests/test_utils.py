@@ -28,6 +28,7 @@ from core.utils import (
     parse_score,
     validate_score,
     calculate_weighted_score,
+    extract_dimension_scores,
     # File handling
     safe_filename,
     generate_filename,
@@ -42,6 +43,7 @@ from core.utils import (
     # Markdown parsing
     extract_frontmatter,
     extract_sections,
+    iter_sections,
     extract_table,
     # Validation classes
     ValidationResult,
@@ -329,6 +331,38 @@ class TestCalculateWeightedScore:
         assert calculate_weighted_score({}) == 0.0
 
 
+class TestExtractDimensionScores:
+    """Tests for extract_dimension_scores function."""
+
+    def test_dimension_keys(self, sample_dimension_scores):
+        data = {"dimension_scores": sample_dimension_scores}
+        assert extract_dimension_scores(data) == {
+            k: float(v) for k, v in sample_dimension_scores.items()
+        }
+
+    def test_scores_with_display_names(self):
+        data = {"scores": {"Legitimacy": 3.5, "Viability": "4.0"}}
+        assert extract_dimension_scores(data) == {"legitimacy": 3.5, "viability": 4.0}
+
+    def test_list_of_entries(self):
+        data = {"dimension_scores": [
+            {"name": "Desirability", "score": 3.8},
+            {"name": "Unknown", "score": 1.0},
+        ]}
+        assert extract_dimension_scores(data) == {"desirability": 3.8}
+
+    def test_key_findings(self):
+        data = {"key_findings": [
+            {"dimension": "Legitimacy", "weight": "15%", "score": "4.7", "status": "PASS"},
+            {"dimension": "Desirability", "score": "4.2/5"},
+            {"dimension": "Viability", "score": ""},
+        ]}
+        assert extract_dimension_scores(data) == {"legitimacy": 4.7, "desirability": 4.2}
+
+    def test_missing_scores(self):
+        assert extract_dimension_scores({}) == {}
+
+
 # =============================================================================
 # FILE HANDLING TESTS
 # =============================================================================
@@ -509,6 +543,15 @@ class TestExtractSections:
         sections = extract_sections(sample_markdown_document)
         assert "first section content" in sections["Section One"]
 
+    def test_iter_sections_line_numbers(self):
+        markdown = "Intro text\n# Title\nBody\n## Sub\nMore"
+        sections = list(iter_sections(markdown, include_preamble=True))
+        assert [(s.heading, s.level, s.line) for s in sections] == [
+            (None, 0, 1), ("Title", 1, 2), ("Sub", 2, 4),
+        ]
+        assert sections[2].content == "More"
+        assert [s.heading for s in iter_sections(markdown)] == ["Title", "Sub"]
+
 
 class TestExtractTable:
     """Tests for extract_table function."""
@@ -0,0 +1,104 @@
+"""
+Tests for validators/validate_citations.py.
+"""
+
+import json
+
+import yaml
+
+from validators.validate_citations import (
+    check_citations,
+    scan_deliverable,
+    validate_citations,
+)
+
+
+def _write_log(path, ids):
+    data = {"evidence_log": [{"id": i, "quality_rating": 4} for i in ids]}
+    path.write_text(json.dumps(data) if path.suffix == ".json" else yaml.safe_dump(data))
+
+
+class TestScanDeliverable:
+    """Tests for the single-file citation index."""
+
+    def test_sections_and_lines(self, tmp_path):
+        doc = tmp_path / "brief.md"
+        doc.write_text(
+            "# Brief\n"
+            "Intro [E001]\n"
+            "## Market\n"
+            "Size (E002, E001)\n"
+            "<h2>Team</h2>\n"
+            "Founders E003.\n"
+        )
+        index = scan_deliverable(doc, "brief.md")
+
+        assert [(c.section, c.line) for c in index["E001"]] == [("Brief", 2), ("Market", 4)]
+        assert index["E003"][0].section == "Team"
+        assert str(index["E002"][0]) == "brief.md:4 (Market)"
+
+    def test_ignores_embedded_ids(self, tmp_path):
+        doc = tmp_path / "notes.txt"
+        doc.write_text("TYPE001 E0012 xE005 E004_ok? E006\n")
+
+        assert list(scan_deliverable(doc)) == ["E006"]
+
+
+class TestCheckCitations:
+    """Tests for joining citations with evidence logs."""
+
+    def test_unknown_and_uncited(self, tmp_path):
+        (tmp_path / "report.md").write_text("# R\nSee E001 and E009.\n")
+        _write_log(tmp_path / "evidence.yaml", ["E001", "E002"])
+
+        check = check_citations(tmp_path)
+        scope = check.scopes["."]
+        report = check.to_report()
+
+        assert scope.unknown_ids == ["E009"]
+        assert scope.uncited_ids == ["E002"]
+        assert report.error_count == 1 and report.warning_count == 1
+        assert not report.is_valid
+
+    def test_per_project_scopes(self, tmp_path):
+        for name, cited, logged in [("alpha", "E001", ["E001"]), ("beta", "E001", ["E002"])]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "doc.md").write_text(f"Claim {cited}\n")
+            _write_log(tmp_path / name / "log.yaml", logged)
+
+        check = check_citations(tmp_path, per_project=True)
+
+        assert check.scopes["alpha"].unknown_ids == []
+        assert check.scopes["beta"].unknown_ids == ["E001"]
+        assert check.files_scanned == 2
+
+    def test_external_evidence_matched_by_name(self, tmp_path):
+        outputs = tmp_path / "outputs"
+        (outputs / "alpha").mkdir(parents=True)
+        (outputs / "alpha" / "doc.md").write_text("Claim E001\n")
+        logs = tmp_path / "logs"
+        logs.mkdir()
+        _write_log(logs / "alpha.yaml", ["E001"])
+        _write_log(logs / "unrelated.yaml", ["E007"])
+
+        check = check_citations(outputs, [logs], per_project=True)
+
+        assert list(check.scopes) == ["alpha"]
+        assert check.scopes["alpha"].evidence_ids == {"E001"}
+
+    def test_missing_log_is_warning(self, tmp_path):
+        (tmp_path / "doc.md").write_text("Claim E001\n")
+
+        report = validate_citations(tmp_path)
+
+        assert report.is_valid
+        assert report.warning_count == 1
+
+    def test_to_dict_is_json_serializable(self, tmp_path):
+        (tmp_path / "doc.md").write_text("# S\nE001\n")
+        _write_log(tmp_path / "log.json", ["E001"])
+
+        data = json.loads(json.dumps(check_citations(tmp_path).to_dict()))
+
+        assert data["scopes"]["."]["uncited_ids"] == []
+        assert data["scopes"]["."]["citations"]["E001"][0] == {"path": "doc.md", "section": "S", "line": 2}
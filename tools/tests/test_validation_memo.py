@@ -0,0 +1,152 @@
+"""
+Tests for core/validation_memo.py cached validation verdicts.
+"""
+
+import pytest
+
+from core.validation_memo import (
+    ValidationMemo,
+    configure_validation_memo,
+    memoized_rule,
+    validation_memo_stats,
+)
+from core.utils import ValidationResult
+from core.validators import (
+    validate_no_vague_terms,
+    validate_quantification,
+    validate_solution_neutral,
+)
+from validators.validate_character_limits import CharacterLimitValidator
+
+
+@pytest.fixture
+def memo():
+    return ValidationMemo(maxsize=3)
+
+
+def verdict(name):
+    return ValidationResult(is_valid=True, field_name=name, message="ok", severity="info",
+                            details={"words": []})
+
+
+class TestValidationMemo:
+    """Tests for ValidationMemo class."""
+
+    def test_hit_relabels_field(self, memo):
+        calls = []
+
+        def compute(name):
+            calls.append(name)
+            return verdict(name)
+
+        first = memo.get_or_compute("rule", "text", "a", compute)
+        second = memo.get_or_compute("rule", "text", "b", compute)
+        assert calls == ["a"]
+        assert (first.field_name, second.field_name) == ("a", "b")
+        assert second.details is not first.details
+        assert memo.stats().hits == 1 and memo.stats().misses == 1
+
+    def test_nested_details_are_not_shared(self, memo):
+        first = memo.get_or_compute("rule", "text", "a", verdict)
+        first.details["words"].append("leak")
+        second = memo.get_or_compute("rule", "text", "b", verdict)
+        assert second.details["words"] == []
+
+    def test_rule_and_text_are_part_of_key(self, memo):
+        memo.get_or_compute(("limit", 60), "text", "a", verdict)
+        memo.get_or_compute(("limit", 250), "text", "a", verdict)
+        memo.get_or_compute(("limit", 60), "other", "a", verdict)
+        assert memo.stats().misses == 3
+
+    def test_lru_eviction(self, memo):
+        for text in ["a", "b", "c"]:
+            memo.get_or_compute("rule", text, "f", verdict)
+        memo.get_or_compute("rule", "a", "f", verdict)  # refresh "a"
+        memo.get_or_compute("rule", "d", "f", verdict)  # evicts "b"
+        stats = memo.stats()
+        assert (stats.size, stats.evictions) == (3, 1)
+        memo.get_or_compute("rule", "a", "f", verdict)
+        memo.get_or_compute("rule", "b", "f", verdict)
+        assert memo.stats().hits == 2
+
+    def test_disabled_and_non_string(self):
+        disabled = ValidationMemo(maxsize=0)
+        disabled.get_or_compute("rule", "text", "f", verdict)
+        disabled.get_or_compute("rule", "text", "f", verdict)
+        assert disabled.stats().hits == 0
+        enabled = ValidationMemo()
+        enabled.get_or_compute("rule", None, "f", verdict)
+        assert enabled.stats().size == 0
+
+    def test_hit_rate(self, memo):
+        assert memo.stats().hit_rate == 0.0
+        for _ in range(4):
+            memo.get_or_compute("rule", "same", "f", verdict)
+        assert memo.stats().hit_rate == pytest.approx(0.75)
+        assert "3/4 cached" in str(memo.stats())
+
+
+class TestMemoizedRules:
+    """The shared memo behind the content validators."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_memo(self):
+        configure_validation_memo(clear=True)
+        yield
+        configure_validation_memo(clear=True)
+
+    def test_decorated_rule_matches_uncached(self):
+        text = "Many schools report good results"
+        cached = validate_no_vague_terms(text, "first")
+        again = validate_no_vague_terms(text, "second")
+        direct = validate_no_vague_terms.uncached(text, "second")
+        assert (again.message, again.severity, again.field_name) == \
+            (direct.message, direct.severity, "second")
+        assert cached.details == direct.details
+        assert validation_memo_stats().hits == 1
+
+    def test_parameters_in_key(self):
+        memo = ValidationMemo()
+
+        @memoized_rule("min_words", memo=memo)
+        def min_words(text, field_name, minimum=2):
+            valid = len(text.split()) >= minimum
+            return ValidationResult(is_valid=valid, field_name=field_name,
+                                    message="", severity="info")
+
+        text = "Costs rose 40% to $2,000"
+        assert min_words(text, "f", minimum=2).is_valid
+        assert not min_words(text, "f", minimum=10).is_valid
+        assert memo.stats().misses == 2
+
+    def test_cheap_rules_run_directly(self):
+        validate_solution_neutral("Teachers lack time", "f")
+        validate_quantification("Costs rose 40% to $2,000", "f")
+        stats = validation_memo_stats()
+        assert (stats.hits, stats.misses) == (0, 0)
+
+    def test_custom_memo(self):
+        memo = ValidationMemo()
+
+        @memoized_rule("shout", memo=memo)
+        def shout(text, field_name):
+            return verdict(field_name)
+
+        shout("x", "a")
+        shout("x", "b")
+        assert memo.stats().hits == 1
+
+    def test_character_limits_bypass_memo(self):
+        validator = CharacterLimitValidator()
+        for i in range(3):
+            validator.validate_text("District Schools", "organization_name", f"Row[{i}].name")
+        fields = [result.field_name for result in validator.report.results]
+        assert fields == ["Row[0].name", "Row[1].name", "Row[2].name"]
+        stats = validation_memo_stats()
+        assert (stats.hits, stats.misses) == (0, 0)
+
+    def test_disable(self):
+        configure_validation_memo(0)
+        validate_no_vague_terms("text", "a")
+        validate_no_vague_terms("text", "a")
+        assert validation_memo_stats().hits == 0
@@ -0,0 +1,118 @@
+"""
+Tests for generators/value_chain_layout.py layout computation.
+"""
+
+import pytest
+from dataclasses import dataclass
+
+from generators import value_chain_layout
+from generators.value_chain_layout import (
+    NetworkLayout,
+    compute_network_layout,
+    clear_layout_cache,
+    network_content_hash,
+)
+
+
+@dataclass
+class Org:
+    name: str
+    requester: str = "Buyer"
+    acceptability: str = "neutral"
+    need_level: str = "None"
+
+
+@pytest.fixture
+def sample_tiers():
+    """Five tiers with two requester groups."""
+    return [
+        [Org("Funder", "Buyer"), Org("Regulator", "User")],
+        [Org("Vendor A", "User"), Org("Vendor B", "Buyer", "favorable")],
+        [Org("Reseller", "Buyer", "unfavorable", "Critical")],
+        [Org("District", "Buyer", "favorable", "Important")],
+        [Org("Teacher", "User"), Org("Student", "User"), Org("Admin", "Buyer")],
+    ]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_layout_cache()
+    yield
+    clear_layout_cache()
+
+
+class TestNetworkContentHash:
+    """Tests for network_content_hash function."""
+
+    def test_stable_for_same_content(self, sample_tiers):
+        assert network_content_hash(sample_tiers) == network_content_hash(sample_tiers)
+
+    def test_changes_with_content(self, sample_tiers):
+        before = network_content_hash(sample_tiers)
+        sample_tiers[0][0].acceptability = "favorable"
+        assert network_content_hash(sample_tiers) != before
+
+
+class TestComputeNetworkLayout:
+    """Tests for compute_network_layout function."""
+
+    def test_one_node_per_organization(self, sample_tiers):
+        layout = compute_network_layout(sample_tiers)
+        assert isinstance(layout, NetworkLayout)
+        assert len(layout.nodes) == sum(len(tier) for tier in sample_tiers)
+        assert len(layout.column_x) == 5
+
+    def test_nodes_sit_in_their_tier_column(self, sample_tiers):
+        layout = compute_network_layout(sample_tiers)
+        index = 0
+        for tier_index, tier in enumerate(sample_tiers):
+            for _ in tier:
+                assert layout.nodes[index][0] == layout.column_x[tier_index]
+                index += 1
+
+    def test_nodes_within_canvas(self, sample_tiers):
+        layout = compute_network_layout(sample_tiers)
+        for x, y in layout.nodes:
+            assert 0 < x < layout.width
+            assert 0 < y < layout.height
+
+    def test_deterministic_across_runs(self, sample_tiers):
+        first = compute_network_layout(sample_tiers)
+        clear_layout_cache()
+        second = compute_network_layout(sample_tiers)
+        assert first == second
+
+    def test_python_fallback_matches_numpy(self, sample_tiers, monkeypatch):
+        if not value_chain_layout.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        vectorized = compute_network_layout(sample_tiers)
+        clear_layout_cache()
+        monkeypatch.setattr(value_chain_layout, "NUMPY_AVAILABLE", False)
+        fallback = compute_network_layout(sample_tiers)
+        assert vectorized == fallback
+
+    def test_empty_network(self):
+        layout = compute_network_layout([[], [], [], [], []])
+        assert layout.nodes == []
+        assert layout.height > 0
+
+    def test_memory_cache_hit(self, sample_tiers):
+        first = compute_network_layout(sample_tiers)
+        assert compute_network_layout(sample_tiers) is first
+
+    def test_memory_cache_evicts_least_recently_used(self, sample_tiers, monkeypatch):
+        monkeypatch.setattr(value_chain_layout, "LAYOUT_CACHE_SIZE", 2)
+        networks = [sample_tiers[:i] for i in (3, 4, 5)]
+        first, second = (compute_network_layout(tiers) for tiers in networks[:2])
+        assert compute_network_layout(networks[0]) is first   # first is now most recent
+        compute_network_layout(networks[2])                    # evicts second
+        assert len(value_chain_layout._LAYOUT_CACHE) == 2
+        assert compute_network_layout(networks[0]) is first
+        assert compute_network_layout(networks[1]) is not second
+
+    def test_disk_cache_round_trip(self, sample_tiers, tmp_path):
+        first = compute_network_layout(sample_tiers, cache_dir=tmp_path)
+        assert (tmp_path / f"{first.content_hash}.json").exists()
+        clear_layout_cache()
+        second = compute_network_layout(sample_tiers, cache_dir=tmp_path)
+        assert second == first
@@ -0,0 +1,167 @@
+"""
+Tests for core/write_behind.py background output writing.
+"""
+
+import os
+import stat
+import threading
+
+import pytest
+
+from core.write_behind import WriteBehindError, WriteBehindQueue, atomic_write_bytes
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes function."""
+
+    def test_writes_and_replaces(self, tmp_path):
+        path = tmp_path / "out.md"
+        path.write_text("old")
+        atomic_write_bytes(path, b"new", fsync=True)
+        assert path.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.md"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_file_mode(self, tmp_path):
+        mask = os.umask(0o022)
+        os.umask(mask)
+        new = atomic_write_bytes(tmp_path / "new.md", b"x")
+        assert stat.S_IMODE(new.stat().st_mode) == 0o666 & ~mask
+
+        existing = tmp_path / "existing.md"
+        existing.write_bytes(b"old")
+        existing.chmod(0o640)
+        atomic_write_bytes(existing, b"new")
+        assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+
+    def test_failure_leaves_no_temp_file(self, tmp_path):
+        target = tmp_path / "dir"
+        target.mkdir()
+        with pytest.raises(OSError):
+            atomic_write_bytes(target, b"content")
+        assert [p.name for p in tmp_path.iterdir()] == ["dir"]
+
+
+class TestWriteBehindQueue:
+    """Tests for WriteBehindQueue class."""
+
+    def test_writes_text_and_bytes(self, tmp_path):
+        with WriteBehindQueue(workers=2) as writer:
+            text = writer.submit(tmp_path / "a.md", "café")
+            binary = writer.submit(tmp_path / "b.docx", b"\x00\x01")
+        assert text.result() == tmp_path / "a.md"
+        assert (tmp_path / "a.md").read_text(encoding="utf-8") == "café"
+        assert (tmp_path / "b.docx").read_bytes() == b"\x00\x01"
+        assert binary.done()
+
+    def test_flush_waits_for_writes(self, tmp_path):
+        writer = WriteBehindQueue(max_pending=2, workers=1)
+        for i in range(10):
+            writer.submit(tmp_path / f"{i}.txt", str(i))
+        writer.flush()
+        assert len(list(tmp_path.iterdir())) == 10
+        assert writer.close() == []
+
+    def test_submit_blocks_when_full(self, tmp_path, monkeypatch):
+        release = threading.Event()
+        original = atomic_write_bytes
+
+        def slow_write(path, content, fsync=False):
+            release.wait(5)
+            return original(path, content, fsync)
+
+        monkeypatch.setattr("core.write_behind.atomic_write_bytes", slow_write)
+        writer = WriteBehindQueue(max_pending=1, workers=1)
+        writer.submit(tmp_path / "first", b"1")   # picked up by the writer
+        writer.submit(tmp_path / "second", b"2")  # fills the queue
+
+        blocked = threading.Thread(target=writer.submit, args=(tmp_path / "third", b"3"))
+        blocked.start()
+        blocked.join(0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(5)
+        assert writer.close() == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["first", "second", "third"]
+
+    def test_failures_collected(self, tmp_path):
+        writer = WriteBehindQueue()
+        future = writer.submit(tmp_path / "missing" / "out.md", "text")
+        ok = writer.submit(tmp_path / "out.md", "text")
+        failures = writer.close()
+        assert [path for path, _ in failures] == [tmp_path / "missing" / "out.md"]
+        assert isinstance(future.exception(), OSError)
+        assert ok.result() == tmp_path / "out.md"
+
+    def test_context_exit_raises_failures(self, tmp_path):
+        with pytest.raises(WriteBehindError) as exc:
+            with WriteBehindQueue() as writer:
+                writer.submit(tmp_path / "missing" / "out.md", "text")
+                writer.submit(tmp_path / "out.md", "text")
+        assert [path for path, _ in exc.value.failures] == [tmp_path / "missing" / "out.md"]
+        assert (tmp_path / "out.md").exists()
+
+    def test_block_exception_wins_over_failures(self, tmp_path, capsys):
+        with pytest.raises(KeyError):
+            with WriteBehindQueue() as writer:
+                writer.submit(tmp_path / "missing" / "out.md", "text")
+                raise KeyError("render")
+        assert "missing" in capsys.readouterr().err
+
+    def test_submit_racing_close(self, tmp_path):
+        writer = WriteBehindQueue(max_pending=2)
+        futures, rejected = [], []
+
+        def submit_many(worker):
+            for i in range(50):
+                try:
+                    futures.append(writer.submit(tmp_path / f"{worker}-{i}", "x"))
+                except ValueError:
+                    rejected.append(i)
+                    return
+
+        threads = [threading.Thread(target=submit_many, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        writer.close()
+        for thread in threads:
+            thread.join(5)
+        assert all(future.done() for future in futures)
+        assert len(list(tmp_path.iterdir())) == len(futures)
+
+    def test_closed_queue_rejects_submit(self, tmp_path):
+        writer = WriteBehindQueue()
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.submit(tmp_path / "late.md", "text")
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            WriteBehindQueue(max_pending=0)
+        with pytest.raises(ValueError):
+            WriteBehindQueue(workers=0)
+
+
+class TestGeneratorsWithWriter:
+    """Generators hand their outputs to the queue."""
+
+    def test_matches_direct_output(self, tmp_path):
+        from generators.generate_diagnostic import generate_diagnostic, parse_diagnostic_data
+        data = parse_diagnostic_data({"project_name": "Queued"})
+        direct = generate_diagnostic(data=data, output_path=tmp_path / "direct",
+                                     deterministic=True)
+        with WriteBehindQueue() as writer:
+            queued = generate_diagnostic(data=data, output_path=tmp_path / "queued",
+                                         deterministic=True, writer=writer)
+        assert set(queued) == set(direct)
+        for fmt in direct:
+            assert queued[fmt].read_bytes() == direct[fmt].read_bytes()
+
+    def test_value_chain_html(self, tmp_path):
+        from generators.generate_value_chain import generate_value_chain, parse_value_chain_data
+        data = parse_value_chain_data({"project_name": "Queued"})
+        with WriteBehindQueue() as writer:
+            result = generate_value_chain(data=data, output_path=tmp_path / "vc", writer=writer)
+        assert result["html"].read_text(encoding="utf-8").lstrip().startswith("<!DOCTYPE")
+        assert result["md"].exists()
@@ -9,12 +9,14 @@ Available validators:
 - validate_score_thresholds: Check dimension minimums (>=3.0/>=3.5 thresholds)
 - validate_data_flow: Verify step dependencies and cross-step consistency
 - validate_evidence: Check citation formats and L1/L2/L3 confidence levels
+- validate_citations: Cross-check evidence IDs cited in deliverables against evidence logs
 """
 
 from .validate_character_limits import validate_character_limits, CharacterLimitValidator
 from .validate_score_thresholds import validate_score_thresholds, ScoreThresholdValidator
 from .validate_data_flow import validate_data_flow, DataFlowValidator
 from .validate_evidence import validate_evidence, EvidenceValidator
+from .validate_citations import validate_citations, check_citations
 
 __all__ = [
     'validate_character_limits',
@@ -24,5 +26,7 @@ __all__ = [
     'validate_data_flow',
     'DataFlowValidator',
     'validate_evidence',
-    'EvidenceValidator'
+    'EvidenceValidator',
+    'validate_citations',
+    'check_citations'
 ]
@@ -363,7 +363,8 @@ class CharacterLimitValidator:
 def validate_character_limits(
     input_path: Optional[Path] = None,
     data: Optional[Dict[str, Any]] = None,
-    doc_type: str = 'auto'
+    doc_type: str = 'auto',
+    markdown: Optional[str] = None
 ) -> ValidationReport:
     """
     Validate character limits in VIANEO document.
@@ -372,12 +373,16 @@ def validate_character_limits(
         input_path: Path to input file (YAML, JSON, or MD)
         data: Data dictionary (alternative to input_path)
         doc_type: Document type ('executive_brief', 'persona', 'value_network', 'needs', 'auto')
+        markdown: Markdown content already in memory (alternative to input_path)
 
     Returns:
         ValidationReport with all results
     """
     validator = CharacterLimitValidator()
 
+    if markdown is not None:
+        return validator.validate_markdown(markdown, doc_type)
+
     # Load data if path provided
     if data is None and input_path is not None:
         input_path = Path(input_path)
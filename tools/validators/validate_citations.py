@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+VIANEO Citation Validator
+=========================
+
+Cross-checks evidence citations in generated deliverables against the
+project evidence logs.
+
+Validates:
+- Every evidence ID cited in a deliverable (E001, E002, ...) exists in the
+  evidence log
+- Every evidence log entry is cited by at least one deliverable
+
+Deliverables (.md, .html, .txt) are read line by line in a single pass
+with one compiled regex, building a citation index (ID -> file, section,
+line). Evidence logs are YAML/JSON files with an "evidence_log" list, found
+inside the outputs tree or passed with --evidence. The two are joined with
+set differences.
+
+With --per-project, each first-level directory of the outputs tree is
+checked on its own against the logs inside it (and any --evidence file
+named after the directory).
+
+Usage:
+    python validate_citations.py --input outputs/ --evidence executive_brief.yaml
+    python validate_citations.py --input outputs/ --per-project --output citations.json
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterable, Set
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.constants import ValidationPatterns
+from core.utils import ValidationReport, load_data_file
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Evidence IDs anywhere in a line (same ID format as ValidationPatterns.EVIDENCE_ID).
+# No leading \b: it disables the literal-prefix search and makes scanning ~10x
+# slower; the preceding character is checked in scan_deliverable instead.
+CITATION_PATTERN = re.compile(ValidationPatterns.EVIDENCE_ID.strip('^$') + r'\b')
+
+# Markdown and HTML headings, used to attribute citations to sections
+HEADING_PATTERN = re.compile(r'^\s*(?:#{1,6}\s+(.+?)\s*#*\s*$|<h[1-6][^>]*>(.*?)</h[1-6]>)', re.IGNORECASE)
+
+DELIVERABLE_SUFFIXES = {'.md', '.markdown', '.html', '.htm', '.txt'}
+EVIDENCE_SUFFIXES = {'.yaml', '.yml', '.json'}
+
+# Root-level scope name when checking per project
+ROOT_SCOPE = "."
+
+# Citation locations listed per unknown ID in the report
+MAX_LOCATIONS_REPORTED = 3
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class Citation:
+    """One occurrence of an evidence ID in a deliverable."""
+    path: str
+    section: str
+    line: int
+
+    def __str__(self) -> str:
+        where = f"{self.path}:{self.line}"
+        return f"{where} ({self.section})" if self.section else where
+
+
+@dataclass
+class CitationScope:
+    """Citations and evidence log entries checked against each other."""
+    name: str
+    citations: Dict[str, List[Citation]] = field(default_factory=dict)
+    evidence_ids: Set[str] = field(default_factory=set)
+    evidence_sources: List[str] = field(default_factory=list)
+    deliverables: int = 0
+
+    @property
+    def unknown_ids(self) -> List[str]:
+        """Cited IDs missing from the evidence log."""
+        return sorted(self.citations.keys() - self.evidence_ids)
+
+    @property
+    def uncited_ids(self) -> List[str]:
+        """Evidence log IDs no deliverable cites."""
+        return sorted(self.evidence_ids - self.citations.keys())
+
+    def add_citations(self, index: Dict[str, List[Citation]]) -> None:
+        for evidence_id, locations in index.items():
+            self.citations.setdefault(evidence_id, []).extend(locations)
+
+
+@dataclass
+class CitationCheck:
+    """Result of a citation scan over an outputs tree."""
+    scopes: Dict[str, CitationScope]
+    files_scanned: int = 0
+    bytes_scanned: int = 0
+    elapsed: float = 0.0
+
+    def to_report(self) -> ValidationReport:
+        """Errors for unknown citations, warnings for uncited evidence."""
+        report = ValidationReport()
+        for scope in self.scopes.values():
+            prefix = "" if scope.name == ROOT_SCOPE else f"{scope.name}/"
+            if not scope.evidence_sources:
+                report.add_warning(
+                    field=f"{prefix}evidence_log",
+                    message=f"No evidence log found; {len(scope.citations)} cited ID(s) not checked"
+                )
+                continue
+
+            for evidence_id in scope.unknown_ids:
+                locations = scope.citations[evidence_id]
+                shown = ", ".join(str(c) for c in locations[:MAX_LOCATIONS_REPORTED])
+                more = len(locations) - MAX_LOCATIONS_REPORTED
+                report.add_error(
+                    field=f"{prefix}{evidence_id}",
+                    message=f"Cited but not in evidence log: {shown}"
+                            + (f" (+{more} more)" if more > 0 else ""),
+                    locations=[str(c) for c in locations]
+                )
+            for evidence_id in scope.uncited_ids:
+                report.add_warning(
+                    field=f"{prefix}{evidence_id}",
+                    message="Evidence log entry not cited by any deliverable"
+                )
+            cited = len(scope.evidence_ids) - len(scope.uncited_ids)
+            report.add_success(
+                field=f"{prefix}citations",
+                message=(f"{cited}/{len(scope.evidence_ids)} evidence entries cited "
+                         f"across {scope.deliverables} deliverable(s)")
+            )
+        return report
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Citation index and join results as plain data."""
+        return {
+            "files_scanned": self.files_scanned,
+            "bytes_scanned": self.bytes_scanned,
+            "scopes": {
+                name: {
+                    "deliverables": scope.deliverables,
+                    "evidence_sources": scope.evidence_sources,
+                    "unknown_ids": scope.unknown_ids,
+                    "uncited_ids": scope.uncited_ids,
+                    "citations": {
+                        evidence_id: [vars(c) for c in locations]
+                        for evidence_id, locations in sorted(scope.citations.items())
+                    },
+                }
+                for name, scope in self.scopes.items()
+            },
+        }
+
+
+# =============================================================================
+# SCANNING
+# =============================================================================
+
+def scan_deliverable(path: Path, label: Optional[str] = None) -> Dict[str, List[Citation]]:
+    """
+    Index the evidence IDs cited in one deliverable.
+
+    The file is streamed line by line; each citation records the nearest
+    preceding Markdown or HTML heading.
+
+    Args:
+        path: Deliverable file
+        label: Path recorded in citations (default: str(path))
+
+    Returns:
+        Dict mapping evidence ID to its citations, in file order
+    """
+    label = label or str(path)
+    index: Dict[str, List[Citation]] = {}
+    section = ""
+    find_ids = CITATION_PATTERN.finditer
+    match_heading = HEADING_PATTERN.match
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for number, line in enumerate(f, 1):
+            if line.lstrip()[:1] in ('#', '<'):
+                heading = match_heading(line)
+                if heading:
+                    section = (heading.group(1) or heading.group(2) or "").strip()
+            for match in find_ids(line):
+                start = match.start()
+                if start and (line[start - 1].isalnum() or line[start - 1] == '_'):
+                    continue
+                index.setdefault(match.group(), []).append(Citation(label, section, number))
+    return index
+
+
+def load_evidence_ids(path: Path) -> Optional[Set[str]]:
+    """
+    Evidence IDs of a data file's evidence_log.
+
+    Returns:
+        Set of IDs, or None if the file has no evidence_log list (or does
+        not parse)
+    """
+    try:
+        data = load_data_file(path)
+    except Exception:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get('evidence_log'), list):
+        return None
+    return {
+        str(entry['id']) for entry in data['evidence_log']
+        if isinstance(entry, dict) and entry.get('id') is not None
+    }
+
+
+def _walk(root: Path) -> Iterable[Path]:
+    """Files under root in a stable order (hidden entries skipped)."""
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith('.'))
+        for name in sorted(files):
+            if not name.startswith('.'):
+                yield Path(directory) / name
+
+
+def _expand(paths: Iterable[Path]) -> List[Path]:
+    files: List[Path] = []
+    for path in paths:
+        path = Path(path)
+        files.extend(_walk(path) if path.is_dir() else [path])
+    return files
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def check_citations(
+    outputs_root: Path,
+    evidence_paths: Optional[Iterable[Path]] = None,
+    per_project: bool = False
+) -> CitationCheck:
+    """
+    Scan an outputs tree and join its citations against evidence logs.
+
+    Args:
+        outputs_root: Directory of deliverables (or a single deliverable)
+        evidence_paths: Extra evidence log files/directories. Without
+            per_project they apply to the whole tree; with it, a file
+            applies to the project directory named like its stem.
+        per_project: Check each first-level directory separately
+
+    Returns:
+        CitationCheck
+    """
+    start = time.perf_counter()
+    outputs_root = Path(outputs_root)
+    base = outputs_root if outputs_root.is_dir() else outputs_root.parent
+    scopes: Dict[str, CitationScope] = {}
+    check = CitationCheck(scopes)
+
+    def scope_for(path: Path) -> CitationScope:
+        name = ROOT_SCOPE
+        if per_project:
+            parts = path.relative_to(base).parts
+            name = parts[0] if len(parts) > 1 else ROOT_SCOPE
+        if name not in scopes:
+            scopes[name] = CitationScope(name)
+        return scopes[name]
+
+    for path in _walk(outputs_root) if outputs_root.is_dir() else [outputs_root]:
+        suffix = path.suffix.lower()
+        if suffix in DELIVERABLE_SUFFIXES:
+            scope = scope_for(path)
+            scope.add_citations(scan_deliverable(path, str(path.relative_to(base))))
+            scope.deliverables += 1
+            check.files_scanned += 1
+            check.bytes_scanned += path.stat().st_size
+        elif suffix in EVIDENCE_SUFFIXES:
+            ids = load_evidence_ids(path)
+            if ids is not None:
+                scope = scope_for(path)
+                scope.evidence_ids |= ids
+                scope.evidence_sources.append(str(path))
+
+    for path in _expand(evidence_paths or []):
+        ids = load_evidence_ids(path)
+        if ids is None:
+            continue
+        name = path.stem if per_project else ROOT_SCOPE
+        if per_project and name not in scopes:
+            continue
+        scope = scopes.setdefault(name, CitationScope(name))
+        scope.evidence_ids |= ids
+        scope.evidence_sources.append(str(path))
+
+    check.elapsed = time.perf_counter() - start
+    return check
+
+
+def validate_citations(
+    input_path: Path,
+    evidence_paths: Optional[Iterable[Path]] = None,
+    per_project: bool = False
+) -> ValidationReport:
+    """
+    Validate evidence citations in an outputs tree.
+
+    Args:
+        input_path: Outputs directory (or a single deliverable)
+        evidence_paths: Extra evidence log files/directories
+        per_project: Check each first-level directory separately
+
+    Returns:
+        ValidationReport
+    """
+    return check_citations(input_path, evidence_paths, per_project).to_report()
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Check evidence citations in deliverables against evidence logs"
+    )
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        required=True,
+        help='Outputs directory (or a single deliverable)'
+    )
+    parser.add_argument(
+        '--evidence', '-e',
+        type=Path,
+        nargs='+',
+        help='Evidence log files/directories (YAML or JSON with evidence_log)'
+    )
+    parser.add_argument(
+        '--per-project',
+        action='store_true',
+        help='Check each first-level directory of the outputs tree separately'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='Write the citation index and join results as JSON'
+    )
+
+    args = parser.parse_args()
+
+    check = check_citations(args.input, args.evidence, args.per_project)
+    report = check.to_report()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(check.to_dict(), f, indent=2, ensure_ascii=False)
+
+    # Print results
+    print("\n" + "=" * 60)
+    print("VIANEO Citation Validation Report")
+    print("=" * 60)
+    print(f"Outputs: {args.input}")
+    print(f"Scanned {check.files_scanned} deliverable(s), "
+          f"{check.bytes_scanned / 1e6:.1f} MB in {check.elapsed:.2f}s")
+    print("-" * 60)
+
+    for result in report.results:
+        if result.severity != "info":
+            print(result)
+
+    print("-" * 60)
+    if report.is_valid:
+        print("PASSED: All cited evidence IDs exist in the evidence log")
+    else:
+        print(f"NEEDS ATTENTION: {report.error_count} unknown evidence ID(s) cited")
+
+    return 0 if report.is_valid else 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -253,7 +253,8 @@ def validate_score_thresholds(
     input_path: Optional[Path] = None,
     data: Optional[Dict[str, Any]] = None,
     scores: Optional[Dict[str, float]] = None,
-    threshold_level: str = 'viable'
+    threshold_level: str = 'viable',
+    markdown: Optional[str] = None
 ) -> ValidationReport:
     """
     Validate dimension score thresholds.
@@ -263,6 +264,7 @@ def validate_score_thresholds(
         data: Data dictionary
         scores: Direct scores dictionary
         threshold_level: 'viable' or 'investment'
+        markdown: Markdown content already in memory
 
     Returns:
         ValidationReport
@@ -273,6 +275,10 @@ def validate_score_thresholds(
     if scores is not None:
         return validator.validate_all_dimensions(scores)
 
+    # In-memory markdown provided
+    if markdown is not None:
+        return validator.validate_markdown(markdown)
+
     # Load data
     if data is None and input_path is not None:
         input_path = Path(input_path)